@@ -0,0 +1,371 @@
+"""
+Накладные расходы gateway-клиентов на один вызов: HTTP против gRPC.
+
+Для каждого метода, который есть и у *GatewayHTTPClient, и у *GatewayGRPCClient, замеряется:
+- roundtrip/plain — полный вызов высокоуровневого метода (Faker, сборка и сериализация запроса,
+  транспорт, разбор ответа в pydantic или protobuf) обычным клиентом;
+- roundtrip/locust — то же через Locust-клиент: разница с plain — стоимость хука или интерцептора
+  вместе с записью в статистику Locust;
+- decode — только разбор уже полученного тела ответа.
+
+Заглушки gateway (`stubs/`) запускаются отдельными процессами на loopback, поэтому CPU сервера
+в замер не попадает, а calls/sec/core считается по процессорному времени процесса клиента.
+Аллокации считаются отдельным проходом через tracemalloc: alloc_bytes — пик памяти внутри вызова,
+retained_bytes — сколько памяти осталось занято после вызова.
+
+Запуск:
+    python -m benchmarks.client_overhead
+    python -m benchmarks.client_overhead --transport grpc --method get_user --iterations 5000
+    python -m benchmarks.client_overhead --json reports/client_overhead.json --compare reports/previous.json
+"""
+import argparse
+import inspect
+import json
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+import grpc
+from httpx import Client, Limits, Response
+from locust.env import Environment
+
+from clients.grpc.client import init_gevent
+from clients.grpc.gateway.accounts.client import AccountsGatewayGRPCClient
+from clients.grpc.gateway.cards.client import CardsGatewayGRPCClient
+from clients.grpc.gateway.documents.client import DocumentsGatewayGRPCClient
+from clients.grpc.gateway.operations.client import OperationsGatewayGRPCClient
+from clients.grpc.gateway.users.client import UsersGatewayGRPCClient
+from clients.grpc.interceptors.locust_interceptor import LocustInterceptor, WireSizeChannel
+from clients.http.event_hooks.locust_event_hook import locust_request_event_hook, locust_response_event_hook
+from clients.http.gateway.account.client import AccountsGatewayHTTPClient
+from clients.http.gateway.cards.client import CardsGatewayHTTPClient
+from clients.http.gateway.documents.client import DocumentsGatewayHTTPClient
+from clients.http.gateway.operations.client import OperationsGatewayHTTPClient
+from clients.http.gateway.users.client import UsersGatewayHTTPClient
+from clients.http.transport import build_http_transport
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Пары клиентов одного сервиса: методы с одинаковыми именами сравниваются между собой
+CLIENT_PAIRS = {
+    "users": (UsersGatewayHTTPClient, UsersGatewayGRPCClient),
+    "accounts": (AccountsGatewayHTTPClient, AccountsGatewayGRPCClient),
+    "cards": (CardsGatewayHTTPClient, CardsGatewayGRPCClient),
+    "documents": (DocumentsGatewayHTTPClient, DocumentsGatewayGRPCClient),
+    "operations": (OperationsGatewayHTTPClient, OperationsGatewayGRPCClient),
+}
+
+# Сколько операций создаётся на счёте для методов чтения (get_operations, get_operations_summary)
+READ_OPERATIONS = 10
+
+
+@dataclass
+class Result:
+    transport: str
+    mode: str
+    method: str
+    iterations: int
+    ns_per_call: float
+    cpu_ns_per_call: float
+    calls_per_sec_core: float
+    alloc_bytes_per_call: float | None = None
+    retained_bytes_per_call: float | None = None
+
+
+def get_free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_port(port: int, timeout: float = 15) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.5).close()
+            return
+        except OSError:
+            time.sleep(0.05)
+
+    raise TimeoutError(f"Stub did not start on port {port}")
+
+
+@contextmanager
+def run_stub(module: str, port: int) -> Iterator[None]:
+    """
+    Запускает заглушку gateway отдельным процессом и останавливает её по выходу из контекста.
+
+    :param module: Модуль заглушки, например "stubs.http_gateway".
+    :param port: Порт, на котором заглушка принимает запросы.
+    """
+    process = subprocess.Popen(
+        [sys.executable, "-m", module, "--port", str(port), "--seed", "1"],
+        cwd=ROOT,
+        stdout=subprocess.DEVNULL
+    )
+    try:
+        wait_for_port(port)
+        yield
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def build_environment() -> Environment:
+    """
+    Окружение Locust, в котором события запросов пишутся в статистику, как в работающем раннере.
+    """
+    environment = Environment()
+
+    def on_request(request_type, name, response_time, response_length, exception=None, **kwargs):
+        environment.stats.log_request(request_type, name, response_time, response_length)
+        if exception is not None:
+            environment.stats.log_error(request_type, name, exception)
+
+    environment.events.request.add_listener(on_request)
+    return environment
+
+
+def build_http_clients(port: int, environment: Environment | None, trusted: bool) -> dict[str, Any]:
+    event_hooks = {}
+    if environment is not None:
+        event_hooks = {"request": [locust_request_event_hook], "response": [locust_response_event_hook(environment)]}
+
+    client = Client(
+        timeout=100,
+        base_url=f"http://127.0.0.1:{port}",
+        transport=build_http_transport(Limits(max_connections=10, max_keepalive_connections=10)),
+        event_hooks=event_hooks
+    )
+    return {service: http_class(client=client, trusted=trusted) for service, (http_class, _) in CLIENT_PAIRS.items()}
+
+
+def build_grpc_clients(port: int, environment: Environment | None) -> dict[str, Any]:
+    channel = grpc.insecure_channel(f"127.0.0.1:{port}")
+    if environment is not None:
+        channel = grpc.intercept_channel(WireSizeChannel(channel), LocustInterceptor(environment=environment))
+
+    return {service: grpc_class(channel) for service, (_, grpc_class) in CLIENT_PAIRS.items()}
+
+
+def get_shared_methods() -> list[tuple[str, str]]:
+    """
+    :return: Пары (сервис, метод) — высокоуровневые методы, общие для HTTP- и gRPC-клиента.
+    """
+    methods = []
+    for service, (http_class, grpc_class) in CLIENT_PAIRS.items():
+        for name in vars(http_class):
+            if name.startswith("_") or name.endswith(("_api", "_lazy")) or not callable(getattr(http_class, name)):
+                continue
+            if name in vars(grpc_class):
+                methods.append((service, name))
+
+    return methods
+
+
+def create_fixtures(clients: dict[str, Any], operations: int) -> dict[str, str]:
+    """
+    Создаёт пользователя, карточный счёт и операции, на которых выполняются замеры.
+
+    :return: Идентификаторы по именам параметров методов: user_id, account_id, card_id, operation_id.
+    """
+    user = clients["users"].create_user().user
+    account = clients["accounts"].open_debit_card_account(user.id).account
+    card_id = account.cards[0].id
+
+    operation = None
+    for _ in range(max(operations, 1)):
+        operation = clients["operations"].make_top_up_operation(card_id, account.id).operation
+
+    return {"user_id": user.id, "account_id": account.id, "card_id": card_id, "operation_id": operation.id}
+
+
+def bind_call(client: Any, method: str, fixtures: dict[str, str]) -> Callable[[], Any]:
+    function = getattr(client, method)
+    # Необязательные параметры (например, payload у make_*-методов) остаются по умолчанию
+    arguments = [
+        fixtures[name] for name, parameter in inspect.signature(function).parameters.items()
+        if parameter.default is inspect.Parameter.empty
+    ]
+    return lambda: function(*arguments)
+
+
+def bind_decode(transport: str, client: Any, call: Callable[[], Any]) -> Callable[[], Any]:
+    """
+    Возвращает функцию, которая разбирает заранее полученное тело ответа метода.
+    """
+    result = call()
+    if transport == "grpc":
+        message_class, payload = type(result), result.SerializeToString()
+        return lambda: message_class.FromString(payload)
+
+    schema, payload = type(result), result.__pydantic_serializer__.to_json(result, by_alias=True)
+    return lambda: client.parse_response(Response(200, content=payload), schema)
+
+
+def measure_time(call: Callable[[], Any], iterations: int, warmup: int) -> tuple[float, float]:
+    """
+    :return: Среднее время вызова (wall и CPU процесса) в наносекундах.
+    """
+    for _ in range(warmup):
+        call()
+
+    wall_start, cpu_start = time.perf_counter_ns(), time.process_time_ns()
+    for _ in range(iterations):
+        call()
+    wall, cpu = time.perf_counter_ns() - wall_start, time.process_time_ns() - cpu_start
+
+    return wall / iterations, cpu / iterations
+
+
+def measure_allocations(call: Callable[[], Any], iterations: int) -> tuple[float, float]:
+    """
+    :return: Средний пик аллоцированной за вызов памяти и средний прирост занятой памяти, в байтах.
+    """
+    peaks = []
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        for _ in range(iterations):
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            call()
+            peaks.append(tracemalloc.get_traced_memory()[1] - before)
+        end, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return statistics.fmean(peaks), (end - start) / iterations
+
+
+def benchmark(
+        transport: str,
+        mode: str,
+        method: str,
+        call: Callable[[], Any],
+        args: argparse.Namespace
+) -> Result:
+    ns_per_call, cpu_ns_per_call = measure_time(call, args.iterations, args.warmup)
+    result = Result(
+        transport=transport,
+        mode=mode,
+        method=method,
+        iterations=args.iterations,
+        ns_per_call=round(ns_per_call),
+        cpu_ns_per_call=round(cpu_ns_per_call),
+        calls_per_sec_core=round(1_000_000_000 / cpu_ns_per_call, 1) if cpu_ns_per_call else 0.0
+    )
+    if args.alloc_iterations:
+        alloc, retained = measure_allocations(call, args.alloc_iterations)
+        result.alloc_bytes_per_call, result.retained_bytes_per_call = round(alloc), round(retained, 1)
+
+    print(
+        f"{transport:5} {mode:16} {method:45} {result.ns_per_call / 1000:10.1f} us"
+        f" {result.calls_per_sec_core:10.0f} calls/s/core"
+        f" {result.alloc_bytes_per_call or 0:10} B/call"
+    )
+    return result
+
+
+def run_transport(transport: str, port: int, methods: list[tuple[str, str]], args: argparse.Namespace) -> list[Result]:
+    if transport == "http":
+        plain = build_http_clients(port, None, args.trusted)
+        locust = build_http_clients(port, build_environment(), args.trusted)
+    else:
+        plain = build_grpc_clients(port, None)
+        locust = build_grpc_clients(port, build_environment())
+
+    # Методы чтения и записи работают с разными данными, чтобы записи не раздували ответы чтения
+    read_fixtures = create_fixtures(plain, READ_OPERATIONS)
+    write_fixtures = create_fixtures(plain, 1)
+
+    results = []
+    for service, method in methods:
+        name = f"{service}.{method}"
+        fixtures = read_fixtures if method.startswith("get_") else write_fixtures
+
+        call = bind_call(plain[service], method, fixtures)
+        results.append(benchmark(transport, "roundtrip/plain", name, call, args))
+        results.append(benchmark(transport, "roundtrip/locust", name, bind_call(locust[service], method, fixtures), args))
+        results.append(benchmark(transport, "decode", name, bind_decode(transport, plain[service], call), args))
+
+    return results
+
+
+def compare(results: list[Result], previous_path: Path) -> None:
+    """
+    Печатает изменение ns/call относительно предыдущего отчёта.
+    """
+    previous = {
+        (item["transport"], item["mode"], item["method"]): item
+        for item in json.loads(previous_path.read_text())["results"]
+    }
+
+    print(f"\nСравнение с {previous_path}:")
+    for result in results:
+        old = previous.get((result.transport, result.mode, result.method))
+        if old is None or not old["ns_per_call"]:
+            continue
+
+        change = (result.ns_per_call - old["ns_per_call"]) / old["ns_per_call"] * 100
+        print(f"{result.transport:5} {result.mode:16} {result.method:45} {change:+7.1f} %")
+
+
+def get_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Накладные расходы HTTP- и gRPC-клиентов gateway на вызов")
+    parser.add_argument("--transport", choices=["http", "grpc"], action="append", help="Замерить только этот транспорт")
+    parser.add_argument("--method", action="append", help="Замерить только методы, содержащие подстроку")
+    parser.add_argument("--iterations", type=int, default=2000, help="Вызовов на замер времени")
+    parser.add_argument("--warmup", type=int, default=200, help="Вызовов на прогрев")
+    parser.add_argument("--alloc-iterations", type=int, default=200, help="Вызовов на замер аллокаций (0 — не мерить)")
+    parser.add_argument("--trusted", action="store_true", help="HTTP-клиенты не валидируют ответы, которые быстрее собрать (is_construct_faster)")
+    parser.add_argument("--json", type=Path, help="Сохранить результаты в JSON-файл")
+    parser.add_argument("--compare", type=Path, help="Сравнить с результатами из JSON-файла")
+    args = parser.parse_args()
+
+    init_gevent()
+
+    methods = [
+        (service, method) for service, method in get_shared_methods()
+        if not args.method or any(pattern in method for pattern in args.method)
+    ]
+
+    results = []
+    stubs = {"http": "stubs.http_gateway", "grpc": "stubs.grpc_gateway"}
+    for transport in args.transport or ["http", "grpc"]:
+        port = get_free_port()
+        with run_stub(stubs[transport], port):
+            results.extend(run_transport(transport, port, methods, args))
+
+    if args.compare:
+        compare(results, args.compare)
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps({
+            "python": sys.version,
+            "commit": get_commit(),
+            "iterations": args.iterations,
+            "trusted": args.trusted,
+            "results": [asdict(result) for result in results],
+        }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
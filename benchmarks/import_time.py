@@ -0,0 +1,91 @@
+"""
+Замер времени импорта gateway-клиентов.
+
+Каждый модуль импортируется в отдельном чистом процессе несколько раз, берётся медиана.
+Колонка "own" показывает время импорта без тяжёлых общих зависимостей (locust, grpc, httpx, pydantic):
+они импортируются заранее, как это уже сделано в рабочем процессе Locust.
+
+Запуск:
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --repeat 10 --json reports/import_time.json
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+GATEWAY_CLIENTS = [
+    "clients.grpc.gateway.users.client",
+    "clients.grpc.gateway.accounts.client",
+    "clients.grpc.gateway.cards.client",
+    "clients.grpc.gateway.documents.client",
+    "clients.grpc.gateway.operations.client",
+    "clients.http.gateway.users.client",
+    "clients.http.gateway.account.client",
+    "clients.http.gateway.cards.client",
+    "clients.http.gateway.documents.client",
+    "clients.http.gateway.operations.client",
+]
+
+# Зависимости, которые в процессе Locust уже импортированы к моменту импорта клиентов
+SHARED_DEPENDENCIES = ["locust", "grpc", "grpc.aio", "httpx", "pydantic", "faker"]
+
+MEASURE_SNIPPET = """
+import importlib, time
+for name in {preload!r}:
+    importlib.import_module(name)
+start = time.perf_counter_ns()
+importlib.import_module({module!r})
+print(time.perf_counter_ns() - start)
+"""
+
+
+def measure(module: str, preload: list[str]) -> float:
+    """
+    Импортирует модуль в новом процессе и возвращает время импорта.
+
+    :param module: Имя модуля.
+    :param preload: Модули, импортируемые до начала замера.
+    :return: Время импорта в миллисекундах.
+    """
+    output = subprocess.run(
+        [sys.executable, "-c", MEASURE_SNIPPET.format(preload=preload, module=module)],
+        cwd=ROOT,
+        env={**os.environ, "PYTHONPATH": str(ROOT), "PYTHONDONTWRITEBYTECODE": "1"},
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return int(output.stdout.strip().splitlines()[-1]) / 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Время импорта gateway-клиентов")
+    parser.add_argument("--repeat", type=int, default=5, help="Сколько раз импортировать каждый модуль")
+    parser.add_argument("--module", action="append", help="Замерить только указанные модули")
+    parser.add_argument("--json", type=Path, help="Сохранить результаты в JSON-файл")
+    args = parser.parse_args()
+
+    results = []
+    for module in args.module or GATEWAY_CLIENTS:
+        total = [measure(module, []) for _ in range(args.repeat)]
+        own = [measure(module, SHARED_DEPENDENCIES) for _ in range(args.repeat)]
+        results.append({
+            "module": module,
+            "total_ms": round(statistics.median(total), 2),
+            "own_ms": round(statistics.median(own), 2),
+        })
+        print(f"{module:45} total {results[-1]['total_ms']:9.2f} ms   own {results[-1]['own_ms']:8.2f} ms")
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps({"python": sys.version, "repeat": args.repeat, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
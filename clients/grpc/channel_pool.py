@@ -0,0 +1,198 @@
+import itertools
+import threading
+from typing import Literal
+
+from grpc import Channel, ChannelConnectivity, UnaryUnaryMultiCallable, insecure_channel
+
+# Стратегия выбора канала из пула для очередного вызова
+SelectionStrategy = Literal["round_robin", "least_loaded"]
+
+# Состояния, в которых канал считается нездоровым и пропускается при выборе
+UNHEALTHY_STATES = frozenset({ChannelConnectivity.TRANSIENT_FAILURE, ChannelConnectivity.SHUTDOWN})
+
+
+class PooledChannel:
+    """
+    Один канал пула вместе с его состоянием.
+
+    Состояние соединения отслеживается через подписку `channel.subscribe`,
+    а количество вызовов в полёте — счётчиком `in_flight` (нужен стратегии least_loaded).
+    """
+
+    def __init__(self, channel: Channel, try_to_connect: bool = True):
+        """
+        :param channel: gRPC-канал, которым владеет пул.
+        :param try_to_connect: Сразу инициировать подключение (прогрев до начала нагрузки).
+        """
+        self.channel = channel
+        self.state = ChannelConnectivity.IDLE
+        self.in_flight = 0
+        self._lock = threading.Lock()
+
+        channel.subscribe(self._on_state_change, try_to_connect=try_to_connect)
+
+    def _on_state_change(self, state: ChannelConnectivity) -> None:
+        self.state = state
+
+    @property
+    def healthy(self) -> bool:
+        return self.state not in UNHEALTHY_STATES
+
+    def acquire(self) -> None:
+        with self._lock:
+            self.in_flight += 1
+
+    def release(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+
+class PooledUnaryUnaryMultiCallable(UnaryUnaryMultiCallable):
+    """
+    Unary-unary вызов, который на каждый запрос выбирает канал из пула.
+
+    Multicallable-объекты нижележащих каналов создаются лениво и только для тех каналов,
+    которые действительно были выбраны.
+    """
+
+    def __init__(self, pool: "GRPCChannelPool", method: str, *args):
+        self._pool = pool
+        self._method = method
+        self._args = args
+        self._callables: dict[int, UnaryUnaryMultiCallable] = {}
+
+    def _select(self) -> tuple[PooledChannel, UnaryUnaryMultiCallable]:
+        index = self._pool.select()
+        member = self._pool.members[index]
+
+        multicallable = self._callables.get(index)
+        if multicallable is None:
+            multicallable = member.channel.unary_unary(self._method, *self._args)
+            self._callables[index] = multicallable
+
+        return member, multicallable
+
+    def __call__(self, request, *args, **kwargs):
+        member, multicallable = self._select()
+        member.acquire()
+        try:
+            return multicallable(request, *args, **kwargs)
+        finally:
+            member.release()
+
+    def with_call(self, request, *args, **kwargs):
+        member, multicallable = self._select()
+        member.acquire()
+        try:
+            return multicallable.with_call(request, *args, **kwargs)
+        finally:
+            member.release()
+
+    def future(self, request, *args, **kwargs):
+        member, multicallable = self._select()
+        member.acquire()
+        try:
+            future = multicallable.future(request, *args, **kwargs)
+        except BaseException:
+            member.release()
+            raise
+
+        future.add_done_callback(lambda _: member.release())
+        return future
+
+
+class GRPCChannelPool(Channel):
+    """
+    Пул gRPC-каналов к одному адресу, который сам является gRPC-каналом.
+
+    Пул можно передавать везде, где ожидается grpc.Channel: в stub-ы и в `intercept_channel`.
+    Каждый unary-unary вызов уходит в один из каналов пула по выбранной стратегии,
+    каналы в состоянии TRANSIENT_FAILURE/SHUTDOWN пропускаются.
+    Так тысячи виртуальных пользователей разделяют несколько TCP/HTTP2-соединений
+    вместо того, чтобы открывать по соединению на каждого клиента.
+    """
+
+    def __init__(
+            self,
+            target: str,
+            size: int = 4,
+            strategy: SelectionStrategy = "round_robin",
+            options: list[tuple[str, object]] | None = None
+    ):
+        """
+        :param target: Адрес сервиса, например "localhost:9003".
+        :param size: Количество каналов (соединений) в пуле.
+        :param strategy: "round_robin" — по кругу, "least_loaded" — канал с наименьшим числом вызовов в полёте.
+        :param options: Опции gRPC-канала, передаются в каждый канал пула.
+        """
+        if size < 1:
+            raise ValueError(f"Размер пула должен быть положительным, получено: {size}")
+
+        self.target = target
+        self.strategy = strategy
+        # Локальный пул subchannel-ов не даёт gRPC склеить каналы пула в одно соединение
+        channel_options = [*(options or []), ("grpc.use_local_subchannel_pool", 1)]
+        self.members = [PooledChannel(insecure_channel(target, options=channel_options)) for _ in range(size)]
+        self._counter = itertools.count()
+
+    def select(self) -> int:
+        """
+        Выбирает индекс канала для очередного вызова.
+
+        Если нездоровы все каналы, выбор идёт среди всех: gRPC сам попробует переподключиться.
+
+        :return: Индекс канала в `self.members`.
+        """
+        healthy = [index for index, member in enumerate(self.members) if member.healthy] or range(len(self.members))
+
+        if self.strategy == "least_loaded":
+            return min(healthy, key=lambda index: self.members[index].in_flight)
+
+        return healthy[next(self._counter) % len(healthy)]
+
+    def stats(self) -> list[dict]:
+        """
+        Снимок состояния каналов пула (для отладки и метрик).
+
+        :return: Список словарей с состоянием и количеством вызовов в полёте по каждому каналу.
+        """
+        return [
+            {"index": index, "state": member.state.name, "in_flight": member.in_flight}
+            for index, member in enumerate(self.members)
+        ]
+
+    def unary_unary(self, method, request_serializer=None, response_deserializer=None, _registered_method=False):
+        return PooledUnaryUnaryMultiCallable(
+            self, method, request_serializer, response_deserializer, _registered_method
+        )
+
+    def unary_stream(self, method, request_serializer=None, response_deserializer=None, _registered_method=False):
+        channel = self.members[self.select()].channel
+        return channel.unary_stream(method, request_serializer, response_deserializer, _registered_method)
+
+    def stream_unary(self, method, request_serializer=None, response_deserializer=None, _registered_method=False):
+        channel = self.members[self.select()].channel
+        return channel.stream_unary(method, request_serializer, response_deserializer, _registered_method)
+
+    def stream_stream(self, method, request_serializer=None, response_deserializer=None, _registered_method=False):
+        channel = self.members[self.select()].channel
+        return channel.stream_stream(method, request_serializer, response_deserializer, _registered_method)
+
+    def subscribe(self, callback, try_to_connect=False):
+        for member in self.members:
+            member.channel.subscribe(callback, try_to_connect=try_to_connect)
+
+    def unsubscribe(self, callback):
+        for member in self.members:
+            member.channel.unsubscribe(callback)
+
+    def close(self):
+        for member in self.members:
+            member.channel.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
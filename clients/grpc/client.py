@@ -1,9 +1,38 @@
 import grpc.experimental.gevent as grpc_gevent
 from grpc import Channel
+from grpc.aio import Channel as AsyncChannel
 
-grpc_gevent.init_gevent()
+_gevent_initialized = False
+
+
+def init_gevent() -> None:
+    """
+    Подготавливает gRPC к работе внутри gevent (Locust).
+
+    Раньше вызывалось как побочный эффект импорта модуля, из-за чего
+    grpc.aio-клиенты в том же процессе работали поверх пропатченного gRPC.
+    Теперь вызывается явно синхронными билдерами каналов и только один раз.
+    """
+    global _gevent_initialized
+
+    if not _gevent_initialized:
+        grpc_gevent.init_gevent()
+        _gevent_initialized = True
 
 
 class GRPCClient:
     def __init__(self, channel):
-        self.channel = channel
\ No newline at end of file
+        self.channel = channel
+
+
+class AsyncGRPCClient:
+    """
+    Базовый асинхронный gRPC клиент поверх grpc.aio-канала.
+
+    grpc.aio несовместим с gevent monkey patching, который Locust выполняет при импорте.
+    Процессы с асинхронными клиентами нужно запускать с LOCUST_SKIP_MONKEY_PATCH=1
+    либо вне Locust (обычный asyncio-скрипт).
+    """
+
+    def __init__(self, channel: AsyncChannel):
+        self.channel = channel
@@ -0,0 +1,115 @@
+import importlib
+import importlib.util
+import re
+import sys
+from types import ModuleType
+
+from grpc import Channel
+
+
+def to_snake_case(name: str) -> str:
+    """
+    Переводит имя gRPC-метода в имя модуля контракта: "GetOperationsSummary" -> "get_operations_summary".
+    """
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Возвращает модуль, который реально загрузится только при первом обращении к его атрибуту.
+
+    Используется для модулей контрактов, нужных не в каждом процессе (например, enum-ов).
+
+    :param name: Полное имя модуля, например "contracts.services.operations.operation_pb2".
+    :return: Модуль (ленивый, если ещё не был импортирован).
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+class GatewayContract:
+    """
+    Ленивый реестр контрактов одного сервиса grpc-gateway.
+
+    Классы сообщений разрешаются при первом обращении по соглашению об именовании контрактов:
+    `contract.GetUserRequest` загружает модуль `contracts.services.gateway.users.rpc_get_user_pb2`.
+    Модули `*_pb2_grpc` со stub-ами не импортируются вовсе: stub собирается из тех же соглашений.
+    """
+
+    def __init__(self, package: str, service: str):
+        """
+        :param package: Пакет контрактов, например "users".
+        :param service: Имя сервиса, например "UsersGatewayService".
+        """
+        self.package = package
+        self.service = service
+        self.module_prefix = f"contracts.services.gateway.{package}"
+
+    def __getattr__(self, name: str):
+        # Вызывается только для ещё не разрешённых имён: после загрузки класс кешируется атрибутом
+        for suffix in ("Request", "Response"):
+            if name.endswith(suffix) and name != suffix:
+                method = name[:-len(suffix)]
+                break
+        else:
+            raise AttributeError(name)
+
+        module = importlib.import_module(f"{self.module_prefix}.rpc_{to_snake_case(method)}_pb2")
+        message = getattr(module, name)
+        setattr(self, name, message)
+        return message
+
+    def method_path(self, method: str) -> str:
+        """
+        :param method: Имя gRPC-метода, например "GetUser".
+        :return: Полный путь метода, например "/contracts.services.gateway.users.UsersGatewayService/GetUser".
+        """
+        return f"/{self.module_prefix}.{self.service}/{method}"
+
+    def stub(self, channel: Channel) -> "LazyStub":
+        """
+        Создаёт stub сервиса, методы которого инициализируются при первом вызове.
+
+        :param channel: gRPC-канал (синхронный или grpc.aio).
+        :return: LazyStub.
+        """
+        return LazyStub(channel, self)
+
+
+class LazyStub:
+    """
+    Аналог сгенерированного `*GatewayServiceStub`: `stub.GetUser(request)`.
+
+    Multicallable метода создаётся при первом обращении и кешируется на экземпляре,
+    поэтому дальше вызов стоит столько же, сколько у сгенерированного stub-а.
+    Поддерживаются unary-unary методы — других в сервисах grpc-gateway нет.
+    """
+
+    def __init__(self, channel: Channel, contract: GatewayContract):
+        self.channel = channel
+        self.contract = contract
+
+    def __getattr__(self, method: str):
+        if not method[:1].isupper():
+            raise AttributeError(method)
+
+        request = getattr(self.contract, f"{method}Request")
+        response = getattr(self.contract, f"{method}Response")
+        multicallable = self.channel.unary_unary(
+            self.contract.method_path(method),
+            request_serializer=request.SerializeToString,
+            response_deserializer=response.FromString,
+            _registered_method=True
+        )
+        setattr(self, method, multicallable)
+        return multicallable
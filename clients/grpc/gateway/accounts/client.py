@@ -1,30 +1,41 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from grpc import Channel
+from grpc.aio import Channel as AsyncChannel
 from locust.env import Environment  # Импорт окружения Locust
 
-from clients.grpc.client import GRPCClient
+from clients.grpc.client import AsyncGRPCClient, GRPCClient
 from clients.grpc.gateway.client import (
     build_gateway_grpc_client,
+    build_gateway_async_grpc_client,
+    build_gateway_async_locust_grpc_client,
     build_gateway_locust_grpc_client  # Импорт билдера для нагрузочного тестирования
 )
-from contracts.services.gateway.accounts.accounts_gateway_service_pb2_grpc import AccountsGatewayServiceStub
-from contracts.services.gateway.accounts.rpc_get_accounts_pb2 import GetAccountsRequest, GetAccountsResponse
-from contracts.services.gateway.accounts.rpc_open_credit_card_account_pb2 import (
-    OpenCreditCardAccountRequest,
-    OpenCreditCardAccountResponse
-)
-from contracts.services.gateway.accounts.rpc_open_debit_card_account_pb2 import (
-    OpenDebitCardAccountRequest,
-    OpenDebitCardAccountResponse
-)
-from contracts.services.gateway.accounts.rpc_open_deposit_account_pb2 import (
-    OpenDepositAccountRequest,
-    OpenDepositAccountResponse
-)
-from contracts.services.gateway.accounts.rpc_open_savings_account_pb2 import (
-    OpenSavingsAccountRequest,
-    OpenSavingsAccountResponse
-)
-
+from clients.grpc.contracts import GatewayContract
+
+if TYPE_CHECKING:
+    from contracts.services.gateway.accounts.rpc_get_accounts_pb2 import GetAccountsRequest, GetAccountsResponse
+    from contracts.services.gateway.accounts.rpc_open_credit_card_account_pb2 import (
+        OpenCreditCardAccountRequest,
+        OpenCreditCardAccountResponse
+    )
+    from contracts.services.gateway.accounts.rpc_open_debit_card_account_pb2 import (
+        OpenDebitCardAccountRequest,
+        OpenDebitCardAccountResponse
+    )
+    from contracts.services.gateway.accounts.rpc_open_deposit_account_pb2 import (
+        OpenDepositAccountRequest,
+        OpenDepositAccountResponse
+    )
+    from contracts.services.gateway.accounts.rpc_open_savings_account_pb2 import (
+        OpenSavingsAccountRequest,
+        OpenSavingsAccountResponse
+    )
+
+# Классы сообщений и stub разрешаются лениво, при первом использовании
+contract = GatewayContract("accounts", "AccountsGatewayService")
 
 
 class AccountsGatewayGRPCClient(GRPCClient):
@@ -41,7 +52,7 @@ class AccountsGatewayGRPCClient(GRPCClient):
         """
         super().__init__(channel)
 
-        self.stub = AccountsGatewayServiceStub(channel)
+        self.stub = contract.stub(channel)
 
     def get_accounts_api(self, request: GetAccountsRequest) -> GetAccountsResponse:
         """
@@ -89,26 +100,73 @@ class AccountsGatewayGRPCClient(GRPCClient):
         return self.stub.OpenCreditCardAccount(request)
 
     def get_accounts(self, user_id: str) -> GetAccountsResponse:
-        request = GetAccountsRequest(user_id=user_id)
+        request = contract.GetAccountsRequest(user_id=user_id)
         return self.get_accounts_api(request)
 
     def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponse:
-        request = OpenDepositAccountRequest(user_id=user_id)
+        request = contract.OpenDepositAccountRequest(user_id=user_id)
         return self.open_deposit_account_api(request)
 
     def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponse:
-        request = OpenSavingsAccountRequest(user_id=user_id)
+        request = contract.OpenSavingsAccountRequest(user_id=user_id)
         return self.open_savings_account_api(request)
 
     def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponse:
-        request = OpenDebitCardAccountRequest(user_id=user_id)
+        request = contract.OpenDebitCardAccountRequest(user_id=user_id)
         return self.open_debit_card_account_api(request)
 
     def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponse:
-        request = OpenCreditCardAccountRequest(user_id=user_id)
+        request = contract.OpenCreditCardAccountRequest(user_id=user_id)
         return self.open_credit_card_account_api(request)
 
 
+class AsyncAccountsGatewayGRPCClient(AsyncGRPCClient):
+    """
+    Асинхронный gRPC-клиент для взаимодействия с AccountsGatewayService поверх grpc.aio-канала.
+    Повторяет методы AccountsGatewayGRPCClient, но все вызовы выполняются через await.
+    """
+
+    def __init__(self, channel: AsyncChannel):
+        super().__init__(channel)
+
+        self.stub = contract.stub(channel)
+
+    async def get_accounts_api(self, request: GetAccountsRequest) -> GetAccountsResponse:
+        return await self.stub.GetAccounts(request)
+
+    async def open_deposit_account_api(self, request: OpenDepositAccountRequest) -> OpenDepositAccountResponse:
+        return await self.stub.OpenDepositAccount(request)
+
+    async def open_savings_account_api(self, request: OpenSavingsAccountRequest) -> OpenSavingsAccountResponse:
+        return await self.stub.OpenSavingsAccount(request)
+
+    async def open_debit_card_account_api(self, request: OpenDebitCardAccountRequest) -> OpenDebitCardAccountResponse:
+        return await self.stub.OpenDebitCardAccount(request)
+
+    async def open_credit_card_account_api(self, request: OpenCreditCardAccountRequest) -> OpenCreditCardAccountResponse:
+        return await self.stub.OpenCreditCardAccount(request)
+
+    async def get_accounts(self, user_id: str) -> GetAccountsResponse:
+        request = contract.GetAccountsRequest(user_id=user_id)
+        return await self.get_accounts_api(request)
+
+    async def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponse:
+        request = contract.OpenDepositAccountRequest(user_id=user_id)
+        return await self.open_deposit_account_api(request)
+
+    async def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponse:
+        request = contract.OpenSavingsAccountRequest(user_id=user_id)
+        return await self.open_savings_account_api(request)
+
+    async def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponse:
+        request = contract.OpenDebitCardAccountRequest(user_id=user_id)
+        return await self.open_debit_card_account_api(request)
+
+    async def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponse:
+        request = contract.OpenCreditCardAccountRequest(user_id=user_id)
+        return await self.open_credit_card_account_api(request)
+
+
 def build_accounts_gateway_grpc_client() -> AccountsGatewayGRPCClient:
     """
     Фабрика для создания экземпляра AccountsGatewayGRPCClient.
@@ -127,4 +185,27 @@ def build_accounts_gateway_locust_grpc_client(environment: Environment) -> Accou
     :param environment: объект окружения Locust.
     :return: экземпляр AccountsGatewayGRPCClient с хуками сбора метрик.
     """
-    return AccountsGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment))
\ No newline at end of file
+    return AccountsGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment))
+
+
+def build_accounts_gateway_async_grpc_client() -> AsyncAccountsGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра AsyncAccountsGatewayGRPCClient.
+
+    Вызывать нужно внутри запущенного event loop: grpc.aio-канал привязывается к нему.
+
+    :return: Инициализированный асинхронный клиент для AccountsGatewayService.
+    """
+    return AsyncAccountsGatewayGRPCClient(channel=build_gateway_async_grpc_client())
+
+
+def build_accounts_gateway_async_locust_grpc_client(environment: Environment) -> AsyncAccountsGatewayGRPCClient:
+    """
+    Функция создаёт экземпляр AsyncAccountsGatewayGRPCClient адаптированного под Locust.
+
+    Вызовы регистрируются в метриках Locust через AsyncLocustInterceptor.
+
+    :param environment: объект окружения Locust.
+    :return: экземпляр AsyncAccountsGatewayGRPCClient с интерцептором сбора метрик.
+    """
+    return AsyncAccountsGatewayGRPCClient(channel=build_gateway_async_locust_grpc_client(environment))
@@ -1,21 +1,32 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from grpc import Channel
+from grpc.aio import Channel as AsyncChannel
 from locust.env import Environment
 
-from clients.grpc.client import GRPCClient
+from clients.grpc.client import AsyncGRPCClient, GRPCClient
 from clients.grpc.gateway.client import (
     build_gateway_grpc_client,
+    build_gateway_async_grpc_client,
+    build_gateway_async_locust_grpc_client,
     build_gateway_locust_grpc_client
 )
-from contracts.services.gateway.cards.cards_gateway_service_pb2_grpc import CardsGatewayServiceStub
-from contracts.services.gateway.cards.rpc_issue_physical_card_pb2 import (
-    IssuePhysicalCardRequest,
-    IssuePhysicalCardResponse
-)
-from contracts.services.gateway.cards.rpc_issue_virtual_card_pb2 import (
-    IssueVirtualCardRequest,
-    IssueVirtualCardResponse
-)
+from clients.grpc.contracts import GatewayContract
 
+if TYPE_CHECKING:
+    from contracts.services.gateway.cards.rpc_issue_physical_card_pb2 import (
+        IssuePhysicalCardRequest,
+        IssuePhysicalCardResponse
+    )
+    from contracts.services.gateway.cards.rpc_issue_virtual_card_pb2 import (
+        IssueVirtualCardRequest,
+        IssueVirtualCardResponse
+    )
+
+# Классы сообщений и stub разрешаются лениво, при первом использовании
+contract = GatewayContract("cards", "CardsGatewayService")
 
 
 class CardsGatewayGRPCClient(GRPCClient):
@@ -38,7 +49,7 @@ class CardsGatewayGRPCClient(GRPCClient):
         :param channel: общий gRPC-канал до grpc-gateway.
         """
         super().__init__(channel)
-        self.stub: CardsGatewayServiceStub = CardsGatewayServiceStub(channel)
+        self.stub = contract.stub(channel)
 
     # ---------- Низкоуровневые API-методы (прямой вызов stub) ----------
 
@@ -80,7 +91,7 @@ class CardsGatewayGRPCClient(GRPCClient):
         :param account_id: идентификатор счёта.
         :return: gRPC-ответ IssueVirtualCardResponse.
         """
-        request = IssueVirtualCardRequest(user_id=user_id, account_id=account_id)
+        request = contract.IssueVirtualCardRequest(user_id=user_id, account_id=account_id)
         return self.issue_virtual_card_api(request)
 
     def issue_physical_card(
@@ -95,10 +106,35 @@ class CardsGatewayGRPCClient(GRPCClient):
         :param account_id: идентификатор счёта.
         :return: gRPC-ответ IssuePhysicalCardResponse.
         """
-        request = IssuePhysicalCardRequest(user_id=user_id, account_id=account_id)
+        request = contract.IssuePhysicalCardRequest(user_id=user_id, account_id=account_id)
         return self.issue_physical_card_api(request)
 
 
+class AsyncCardsGatewayGRPCClient(AsyncGRPCClient):
+    """
+    Асинхронный gRPC-клиент для взаимодействия с CardsGatewayService поверх grpc.aio-канала.
+    Повторяет методы CardsGatewayGRPCClient, но все вызовы выполняются через await.
+    """
+
+    def __init__(self, channel: AsyncChannel) -> None:
+        super().__init__(channel)
+        self.stub = contract.stub(channel)
+
+    async def issue_virtual_card_api(self, request: IssueVirtualCardRequest) -> IssueVirtualCardResponse:
+        return await self.stub.IssueVirtualCard(request)
+
+    async def issue_physical_card_api(self, request: IssuePhysicalCardRequest) -> IssuePhysicalCardResponse:
+        return await self.stub.IssuePhysicalCard(request)
+
+    async def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponse:
+        request = contract.IssueVirtualCardRequest(user_id=user_id, account_id=account_id)
+        return await self.issue_virtual_card_api(request)
+
+    async def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponse:
+        request = contract.IssuePhysicalCardRequest(user_id=user_id, account_id=account_id)
+        return await self.issue_physical_card_api(request)
+
+
 def build_cards_gateway_grpc_client() -> CardsGatewayGRPCClient:
     """
     Фабрика для создания экземпляра CardsGatewayGRPCClient.
@@ -120,3 +156,26 @@ def build_cards_gateway_locust_grpc_client(environment: Environment) -> CardsGat
     :return: экземпляр CardsGatewayGRPCClient с хуками сбора метрик.
     """
     return CardsGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment))
+
+
+def build_cards_gateway_async_grpc_client() -> AsyncCardsGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра AsyncCardsGatewayGRPCClient.
+
+    Вызывать нужно внутри запущенного event loop: grpc.aio-канал привязывается к нему.
+
+    :return: Инициализированный асинхронный клиент для CardsGatewayService.
+    """
+    return AsyncCardsGatewayGRPCClient(channel=build_gateway_async_grpc_client())
+
+
+def build_cards_gateway_async_locust_grpc_client(environment: Environment) -> AsyncCardsGatewayGRPCClient:
+    """
+    Функция создаёт экземпляр AsyncCardsGatewayGRPCClient адаптированного под Locust.
+
+    Вызовы регистрируются в метриках Locust через AsyncLocustInterceptor.
+
+    :param environment: объект окружения Locust.
+    :return: экземпляр AsyncCardsGatewayGRPCClient с интерцептором сбора метрик.
+    """
+    return AsyncCardsGatewayGRPCClient(channel=build_gateway_async_locust_grpc_client(environment))
@@ -1,16 +1,72 @@
-from grpc import Channel, insecure_channel, intercept_channel
+from grpc import Channel, intercept_channel
+from grpc import aio
 from locust.env import Environment
 
-from clients.grpc.interceptors.locust_interceptor import LocustInterceptor
+from clients.grpc.channel_pool import GRPCChannelPool, SelectionStrategy
+from clients.grpc.client import init_gevent
+from clients.grpc.interceptors.locust_interceptor import (
+    AsyncLocustInterceptor,
+    AsyncWireSizeChannel,
+    LocustInterceptor,
+    WireSizeChannel
+)
+from clients.grpc.interceptors.recording_interceptor import AsyncRecordingInterceptor, RecordingInterceptor
+from tools.recorder import get_active_recorder
+
+# Общий на процесс пул каналов к grpc-gateway, создаётся при первом обращении
+_gateway_channel_pool: GRPCChannelPool | None = None
+
+
+def configure_gateway_grpc_channel_pool(
+        size: int = 4,
+        strategy: SelectionStrategy = "round_robin"
+) -> GRPCChannelPool:
+    """
+    Создаёт (или пересоздаёт) общий на процесс пул каналов к grpc-gateway.
+
+    Вызывается до старта нагрузки и до создания клиентов, например в обработчике `events.init` Locust.
+    Прежний пул закрывается вместе с его соединениями, поэтому клиенты, созданные до вызова,
+    перестают работать.
+
+    :param size: Количество каналов (TCP/HTTP2-соединений) в пуле.
+    :param strategy: Стратегия выбора канала: "round_robin" или "least_loaded".
+    :return: Новый пул каналов.
+    """
+    global _gateway_channel_pool
+
+    init_gevent()
+    if _gateway_channel_pool is not None:
+        _gateway_channel_pool.close()
+    _gateway_channel_pool = GRPCChannelPool("localhost:9003", size=size, strategy=strategy)
+    return _gateway_channel_pool
+
+
+def get_gateway_grpc_channel_pool() -> GRPCChannelPool:
+    """
+    Возвращает общий пул каналов к grpc-gateway, создавая его с настройками по умолчанию.
+
+    :return: Пул каналов, разделяемый всеми gateway gRPC-клиентами процесса.
+    """
+    if _gateway_channel_pool is None:
+        return configure_gateway_grpc_channel_pool()
+
+    return _gateway_channel_pool
 
 
 def build_gateway_grpc_client() -> Channel:
     """
     Фабричная функция (билдер) для создания gRPC-канала к сервису grpc-gateway.
 
+    Возвращает общий пул каналов: новые соединения на каждый клиент не открываются.
+
     :return: gRPC-канал (Channel), настроенный на адрес localhost:9003.
     """
-    return insecure_channel("localhost:9003")
+    recorder = get_active_recorder()
+    if recorder is not None:
+        # Запись запросов для tools/replay.py (см. tools/recorder.py)
+        return intercept_channel(get_gateway_grpc_channel_pool(), RecordingInterceptor(recorder))
+
+    return get_gateway_grpc_channel_pool()
 
 
 def build_gateway_locust_grpc_client(environment: Environment) -> Channel:
@@ -25,8 +81,46 @@ def build_gateway_locust_grpc_client(environment: Environment) -> Channel:
     # Создаём экземпляр интерцептора, передаём в него окружение Locust
     locust_interceptor = LocustInterceptor(environment=environment)
 
-    # Создаём обычный канал
-    channel = insecure_channel("localhost:9003")
+    # Берём общий пул каналов вместо отдельного соединения на каждого пользователя;
+    # WireSizeChannel передаёт интерцептору размер ответа на проводе
+    channel = WireSizeChannel(get_gateway_grpc_channel_pool())
 
     # Оборачиваем канал интерцептором, чтобы все запросы проходили через него
-    return intercept_channel(channel, locust_interceptor)
\ No newline at end of file
+    interceptors = [locust_interceptor]
+    recorder = get_active_recorder()
+    if recorder is not None:
+        # Запись запросов для tools/replay.py (см. tools/recorder.py)
+        interceptors.append(RecordingInterceptor(recorder))
+
+    return intercept_channel(channel, *interceptors)
+
+
+def build_gateway_async_grpc_client() -> aio.Channel:
+    """
+    Фабричная функция для создания grpc.aio-канала к сервису grpc-gateway.
+
+    Канал должен создаваться внутри запущенного event loop, в котором он будет использоваться.
+
+    :return: Асинхронный gRPC-канал, настроенный на адрес localhost:9003.
+    """
+    recorder = get_active_recorder()
+    interceptors = [AsyncRecordingInterceptor(recorder)] if recorder is not None else None
+    return aio.insecure_channel("localhost:9003", interceptors=interceptors)
+
+
+def build_gateway_async_locust_grpc_client(environment: Environment) -> aio.Channel:
+    """
+    Фабричная функция для создания grpc.aio-канала, адаптированного для Locust.
+    В канал встраивается AsyncLocustInterceptor, который регистрирует вызовы в системе метрик Locust.
+
+    :param environment: Среда выполнения Locust (необходима для отправки событий).
+    :return: Асинхронный gRPC-канал с интерцептором, пригодный для нагрузочного тестирования.
+    """
+    interceptors = [AsyncLocustInterceptor(environment=environment)]
+    recorder = get_active_recorder()
+    if recorder is not None:
+        interceptors.append(AsyncRecordingInterceptor(recorder))
+
+    channel = aio.insecure_channel("localhost:9003", interceptors=interceptors)
+    # AsyncWireSizeChannel передаёт интерцептору размер ответа на проводе
+    return AsyncWireSizeChannel(channel)
@@ -1,20 +1,34 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from grpc import Channel
+from grpc.aio import Channel as AsyncChannel
 
-from clients.grpc.client import GRPCClient
-from clients.grpc.gateway.client import build_gateway_grpc_client
-from contracts.services.gateway.documents.documents_gateway_service_pb2_grpc import DocumentsGatewayServiceStub
-from contracts.services.gateway.documents.rpc_get_contract_document_pb2 import (
-    GetContractDocumentRequest,
-    GetContractDocumentResponse
-)
-from contracts.services.gateway.documents.rpc_get_tariff_document_pb2 import (
-    GetTariffDocumentRequest,
-    GetTariffDocumentResponse
+from clients.grpc.client import AsyncGRPCClient, GRPCClient
+from clients.grpc.gateway.client import (
+    build_gateway_grpc_client,
+    build_gateway_async_grpc_client,
+    build_gateway_async_locust_grpc_client
 )
+from clients.grpc.contracts import GatewayContract
 
 from locust.env import Environment
 from clients.grpc.gateway.client import build_gateway_locust_grpc_client
 
+if TYPE_CHECKING:
+    from contracts.services.gateway.documents.rpc_get_contract_document_pb2 import (
+        GetContractDocumentRequest,
+        GetContractDocumentResponse
+    )
+    from contracts.services.gateway.documents.rpc_get_tariff_document_pb2 import (
+        GetTariffDocumentRequest,
+        GetTariffDocumentResponse
+    )
+
+# Классы сообщений и stub разрешаются лениво, при первом использовании
+contract = GatewayContract("documents", "DocumentsGatewayService")
+
 
 class DocumentsGatewayGRPCClient(GRPCClient):
     """
@@ -30,7 +44,7 @@ class DocumentsGatewayGRPCClient(GRPCClient):
         """
         super().__init__(channel)
 
-        self.stub = DocumentsGatewayServiceStub(channel)
+        self.stub = contract.stub(channel)
 
     def get_tariff_document_api(self, request: GetTariffDocumentRequest) -> GetTariffDocumentResponse:
         """
@@ -51,14 +65,40 @@ class DocumentsGatewayGRPCClient(GRPCClient):
         return self.stub.GetContractDocument(request)
 
     def get_tariff_document(self, account_id: str) -> GetTariffDocumentResponse:
-        request = GetTariffDocumentRequest(account_id=account_id)
+        request = contract.GetTariffDocumentRequest(account_id=account_id)
         return self.get_tariff_document_api(request)
 
     def get_contract_document(self, account_id: str) -> GetContractDocumentResponse:
-        request = GetContractDocumentRequest(account_id=account_id)
+        request = contract.GetContractDocumentRequest(account_id=account_id)
         return self.get_contract_document_api(request)
 
 
+class AsyncDocumentsGatewayGRPCClient(AsyncGRPCClient):
+    """
+    Асинхронный gRPC-клиент для взаимодействия с DocumentsGatewayService поверх grpc.aio-канала.
+    Повторяет методы DocumentsGatewayGRPCClient, но все вызовы выполняются через await.
+    """
+
+    def __init__(self, channel: AsyncChannel):
+        super().__init__(channel)
+
+        self.stub = contract.stub(channel)
+
+    async def get_tariff_document_api(self, request: GetTariffDocumentRequest) -> GetTariffDocumentResponse:
+        return await self.stub.GetTariffDocument(request)
+
+    async def get_contract_document_api(self, request: GetContractDocumentRequest) -> GetContractDocumentResponse:
+        return await self.stub.GetContractDocument(request)
+
+    async def get_tariff_document(self, account_id: str) -> GetTariffDocumentResponse:
+        request = contract.GetTariffDocumentRequest(account_id=account_id)
+        return await self.get_tariff_document_api(request)
+
+    async def get_contract_document(self, account_id: str) -> GetContractDocumentResponse:
+        request = contract.GetContractDocumentRequest(account_id=account_id)
+        return await self.get_contract_document_api(request)
+
+
 def build_documents_gateway_grpc_client() -> DocumentsGatewayGRPCClient:
     """
     Фабрика для создания экземпляра DocumentsGatewayGRPCClient.
@@ -78,4 +118,27 @@ def build_documents_gateway_locust_grpc_client(environment: Environment) -> Docu
     :param environment: Экземпляр среды Locust (для регистрации метрик).
     :return: Экземпляр DocumentsGatewayGRPCClient с подключённым LocustInterceptor.
     """
-    return DocumentsGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment))
\ No newline at end of file
+    return DocumentsGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment))
+
+
+def build_documents_gateway_async_grpc_client() -> AsyncDocumentsGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра AsyncDocumentsGatewayGRPCClient.
+
+    Вызывать нужно внутри запущенного event loop: grpc.aio-канал привязывается к нему.
+
+    :return: Инициализированный асинхронный клиент для DocumentsGatewayService.
+    """
+    return AsyncDocumentsGatewayGRPCClient(channel=build_gateway_async_grpc_client())
+
+
+def build_documents_gateway_async_locust_grpc_client(environment: Environment) -> AsyncDocumentsGatewayGRPCClient:
+    """
+    Функция создаёт экземпляр AsyncDocumentsGatewayGRPCClient адаптированного под Locust.
+
+    Вызовы регистрируются в метриках Locust через AsyncLocustInterceptor.
+
+    :param environment: объект окружения Locust.
+    :return: экземпляр AsyncDocumentsGatewayGRPCClient с интерцептором сбора метрик.
+    """
+    return AsyncDocumentsGatewayGRPCClient(channel=build_gateway_async_locust_grpc_client(environment))
@@ -1,60 +1,107 @@
-from grpc import Channel
+from __future__ import annotations
 
-from clients.grpc.client import GRPCClient
-from clients.grpc.gateway.client import build_gateway_grpc_client
+from typing import TYPE_CHECKING
 
-from contracts.services.gateway.operations.operations_gateway_service_pb2_grpc import OperationsGatewayServiceStub
-from contracts.services.gateway.operations.rpc_get_operation_pb2 import (
-    GetOperationRequest,
-    GetOperationResponse
-)
-from contracts.services.gateway.operations.rpc_get_operation_receipt_pb2 import (
-    GetOperationReceiptRequest,
-    GetOperationReceiptResponse
-)
-from contracts.services.gateway.operations.rpc_get_operations_pb2 import (
-    GetOperationsRequest,
-    GetOperationsResponse
-)
-from contracts.services.gateway.operations.rpc_get_operations_summary_pb2 import (
-    GetOperationsSummaryRequest,
-    GetOperationsSummaryResponse
-)
-from contracts.services.gateway.operations.rpc_make_fee_operation_pb2 import (
-    MakeFeeOperationRequest,
-    MakeFeeOperationResponse
-)
-from contracts.services.gateway.operations.rpc_make_top_up_operation_pb2 import (
-    MakeTopUpOperationRequest,
-    MakeTopUpOperationResponse
-)
-from contracts.services.gateway.operations.rpc_make_cashback_operation_pb2 import (
-    MakeCashbackOperationRequest,
-    MakeCashbackOperationResponse
-)
-from contracts.services.gateway.operations.rpc_make_transfer_operation_pb2 import (
-    MakeTransferOperationRequest,
-    MakeTransferOperationResponse
-)
-from contracts.services.gateway.operations.rpc_make_purchase_operation_pb2 import (
-    MakePurchaseOperationRequest,
-    MakePurchaseOperationResponse
-)
-from contracts.services.gateway.operations.rpc_make_bill_payment_operation_pb2 import (
-    MakeBillPaymentOperationRequest,
-    MakeBillPaymentOperationResponse
-)
-from contracts.services.gateway.operations.rpc_make_cash_withdrawal_operation_pb2 import (
-    MakeCashWithdrawalOperationRequest,
-    MakeCashWithdrawalOperationResponse
+from grpc import Channel
+from grpc.aio import Channel as AsyncChannel
+
+from clients.grpc.client import AsyncGRPCClient, GRPCClient
+from clients.grpc.gateway.client import (
+    build_gateway_grpc_client,
+    build_gateway_async_grpc_client,
+    build_gateway_async_locust_grpc_client
 )
-from contracts.services.operations.operation_pb2 import OperationStatus
+
+from clients.grpc.contracts import GatewayContract, lazy_import
 
 from tools.fakers import fake
 
 from locust.env import Environment
 from clients.grpc.gateway.client import build_gateway_locust_grpc_client
 
+if TYPE_CHECKING:
+    # tools.payloads тянет NumPy: при обычных вызовах клиента он не нужен
+    from tools.payloads import OperationPayload
+    from contracts.services.gateway.operations.rpc_get_operation_pb2 import (
+        GetOperationRequest,
+        GetOperationResponse
+    )
+    from contracts.services.gateway.operations.rpc_get_operation_receipt_pb2 import (
+        GetOperationReceiptRequest,
+        GetOperationReceiptResponse
+    )
+    from contracts.services.gateway.operations.rpc_get_operations_pb2 import (
+        GetOperationsRequest,
+        GetOperationsResponse
+    )
+    from contracts.services.gateway.operations.rpc_get_operations_summary_pb2 import (
+        GetOperationsSummaryRequest,
+        GetOperationsSummaryResponse
+    )
+    from contracts.services.gateway.operations.rpc_make_fee_operation_pb2 import (
+        MakeFeeOperationRequest,
+        MakeFeeOperationResponse
+    )
+    from contracts.services.gateway.operations.rpc_make_top_up_operation_pb2 import (
+        MakeTopUpOperationRequest,
+        MakeTopUpOperationResponse
+    )
+    from contracts.services.gateway.operations.rpc_make_cashback_operation_pb2 import (
+        MakeCashbackOperationRequest,
+        MakeCashbackOperationResponse
+    )
+    from contracts.services.gateway.operations.rpc_make_transfer_operation_pb2 import (
+        MakeTransferOperationRequest,
+        MakeTransferOperationResponse
+    )
+    from contracts.services.gateway.operations.rpc_make_purchase_operation_pb2 import (
+        MakePurchaseOperationRequest,
+        MakePurchaseOperationResponse
+    )
+    from contracts.services.gateway.operations.rpc_make_bill_payment_operation_pb2 import (
+        MakeBillPaymentOperationRequest,
+        MakeBillPaymentOperationResponse
+    )
+    from contracts.services.gateway.operations.rpc_make_cash_withdrawal_operation_pb2 import (
+        MakeCashWithdrawalOperationRequest,
+        MakeCashWithdrawalOperationResponse
+    )
+
+# Enum статусов нужен только при создании операций: модуль загрузится при первом обращении
+operation_pb2 = lazy_import("contracts.services.operations.operation_pb2")
+
+# Классы сообщений и stub разрешаются лениво, при первом использовании
+contract = GatewayContract("operations", "OperationsGatewayService")
+
+
+def build_operation_fields(
+        card_id: str,
+        account_id: str,
+        payload: OperationPayload | None = None,
+        category: bool = False
+) -> dict:
+    """
+    Собирает поля запроса на создание операции.
+
+    :param card_id: Идентификатор карты.
+    :param account_id: Идентификатор счёта.
+    :param payload: Заранее сгенерированные статус, сумма и категория (см. tools/payloads.py);
+        None — значения генерирует Faker.
+    :param category: Добавить поле category (есть только у MakePurchaseOperationRequest).
+    :return: Аргументы конструктора сообщения.
+    """
+    if payload is None:
+        fields = {"status": fake.proto_enum(operation_pb2.OperationStatus), "amount": fake.amount()}
+        if category:
+            fields["category"] = fake.category()
+    else:
+        # Конструктор protobuf принимает значение enum по имени
+        fields = {"status": payload.proto_status, "amount": payload.amount}
+        if category:
+            fields["category"] = payload.category
+
+    return {**fields, "card_id": card_id, "account_id": account_id}
+
 
 class OperationsGatewayGRPCClient(GRPCClient):
     """
@@ -69,7 +116,7 @@ class OperationsGatewayGRPCClient(GRPCClient):
         :param channel: gRPC-канал для подключения к OperationsGatewayService.
         """
         super().__init__(channel)
-        self.stub = OperationsGatewayServiceStub(channel)
+        self.stub = contract.stub(channel)
 
     def get_operation_api(self, request: GetOperationRequest) -> GetOperationResponse:
         """
@@ -171,87 +218,212 @@ class OperationsGatewayGRPCClient(GRPCClient):
         return self.stub.MakeCashWithdrawalOperation(request)
 
     def get_operation(self, operation_id: str) -> GetOperationResponse:
-        request = GetOperationRequest(operation_id=operation_id)
+        request = contract.GetOperationRequest(id=operation_id)
         return self.get_operation_api(request)
 
     def get_operation_receipt(self, operation_id: str) -> GetOperationReceiptResponse:
-        request = GetOperationReceiptRequest(operation_id=operation_id)
+        request = contract.GetOperationReceiptRequest(operation_id=operation_id)
         return self.get_operation_receipt_api(request)
 
     def get_operations(self, account_id: str) -> GetOperationsResponse:
-        request = GetOperationsRequest(account_id=account_id)
+        request = contract.GetOperationsRequest(account_id=account_id)
         return self.get_operations_api(request)
 
     def get_operations_summary(self, account_id: str) -> GetOperationsSummaryResponse:
-        request = GetOperationsSummaryRequest(account_id=account_id)
+        request = contract.GetOperationsSummaryRequest(account_id=account_id)
         return self.get_operations_summary_api(request)
 
-    def make_fee_operation(self, card_id: str, account_id: str) -> MakeFeeOperationResponse:
-        request = MakeFeeOperationRequest(
-            status=fake.proto_enum(OperationStatus),
-            amount=fake.amount(),
-            card_id=card_id,
-            account_id=account_id
-        )
+    def make_fee_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            payload: OperationPayload | None = None
+    ) -> MakeFeeOperationResponse:
+        request = contract.MakeFeeOperationRequest(**build_operation_fields(card_id, account_id, payload))
         return self.make_fee_operation_api(request)
 
-    def make_top_up_operation(self, card_id: str, account_id: str) -> MakeTopUpOperationResponse:
-        request = MakeTopUpOperationRequest(
-            status=fake.proto_enum(OperationStatus),
-            amount=fake.amount(),
-            card_id=card_id,
-            account_id=account_id
-        )
+    def make_top_up_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            payload: OperationPayload | None = None
+    ) -> MakeTopUpOperationResponse:
+        request = contract.MakeTopUpOperationRequest(**build_operation_fields(card_id, account_id, payload))
         return self.make_top_up_operation_api(request)
 
-    def make_cashback_operation(self, card_id: str, account_id: str) -> MakeCashbackOperationResponse:
-        request = MakeCashbackOperationRequest(
-            status=fake.proto_enum(OperationStatus),
-            amount=fake.amount(),
-            card_id=card_id,
-            account_id=account_id
-        )
+    def make_cashback_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            payload: OperationPayload | None = None
+    ) -> MakeCashbackOperationResponse:
+        request = contract.MakeCashbackOperationRequest(**build_operation_fields(card_id, account_id, payload))
         return self.make_cashback_operation_api(request)
 
-    def make_transfer_operation(self, card_id: str, account_id: str) -> MakeTransferOperationResponse:
-        request = MakeTransferOperationRequest(
-            status=fake.proto_enum(OperationStatus),
-            amount=fake.amount(),
-            card_id=card_id,
-            account_id=account_id
-        )
+    def make_transfer_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            payload: OperationPayload | None = None
+    ) -> MakeTransferOperationResponse:
+        request = contract.MakeTransferOperationRequest(**build_operation_fields(card_id, account_id, payload))
         return self.make_transfer_operation_api(request)
 
-    def make_purchase_operation(self, card_id: str, account_id: str) -> MakePurchaseOperationResponse:
-        request = MakePurchaseOperationRequest(
-            status=fake.proto_enum(OperationStatus),
-            amount=fake.amount(),
-            card_id=card_id,
-            category=fake.category(),
-            account_id=account_id
+    def make_purchase_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            payload: OperationPayload | None = None
+    ) -> MakePurchaseOperationResponse:
+        request = contract.MakePurchaseOperationRequest(
+            **build_operation_fields(card_id, account_id, payload, category=True)
         )
         return self.make_purchase_operation_api(request)
 
-    def make_bill_payment_operation(self, card_id: str, account_id: str) -> MakeBillPaymentOperationResponse:
-        request = MakeBillPaymentOperationRequest(
-            status=fake.proto_enum(OperationStatus),
-            amount=fake.amount(),
-            card_id=card_id,
-            category=fake.category(),
-            account_id=account_id
-        )
+    def make_bill_payment_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            payload: OperationPayload | None = None
+    ) -> MakeBillPaymentOperationResponse:
+        request = contract.MakeBillPaymentOperationRequest(**build_operation_fields(card_id, account_id, payload))
         return self.make_bill_payment_operation_api(request)
 
-    def make_cash_withdrawal_operation(self, card_id: str, account_id: str) -> MakeCashWithdrawalOperationResponse:
-        request = MakeCashWithdrawalOperationRequest(
-            status=fake.proto_enum(OperationStatus),
-            amount=fake.amount(),
-            card_id=card_id,
-            account_id=account_id
-        )
+    def make_cash_withdrawal_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            payload: OperationPayload | None = None
+    ) -> MakeCashWithdrawalOperationResponse:
+        request = contract.MakeCashWithdrawalOperationRequest(**build_operation_fields(card_id, account_id, payload))
         return self.make_cash_withdrawal_operation_api(request)
 
 
+class AsyncOperationsGatewayGRPCClient(AsyncGRPCClient):
+    """
+    Асинхронный gRPC-клиент для взаимодействия с OperationsGatewayService поверх grpc.aio-канала.
+    Повторяет методы OperationsGatewayGRPCClient, но все вызовы выполняются через await.
+    """
+
+    def __init__(self, channel: AsyncChannel):
+        super().__init__(channel)
+        self.stub = contract.stub(channel)
+
+    async def get_operation_api(self, request: GetOperationRequest) -> GetOperationResponse:
+        return await self.stub.GetOperation(request)
+
+    async def get_operation_receipt_api(self, request: GetOperationReceiptRequest) -> GetOperationReceiptResponse:
+        return await self.stub.GetOperationReceipt(request)
+
+    async def get_operations_api(self, request: GetOperationsRequest) -> GetOperationsResponse:
+        return await self.stub.GetOperations(request)
+
+    async def get_operations_summary_api(self, request: GetOperationsSummaryRequest) -> GetOperationsSummaryResponse:
+        return await self.stub.GetOperationsSummary(request)
+
+    async def make_fee_operation_api(self, request: MakeFeeOperationRequest) -> MakeFeeOperationResponse:
+        return await self.stub.MakeFeeOperation(request)
+
+    async def make_top_up_operation_api(self, request: MakeTopUpOperationRequest) -> MakeTopUpOperationResponse:
+        return await self.stub.MakeTopUpOperation(request)
+
+    async def make_cashback_operation_api(self, request: MakeCashbackOperationRequest) -> MakeCashbackOperationResponse:
+        return await self.stub.MakeCashbackOperation(request)
+
+    async def make_transfer_operation_api(self, request: MakeTransferOperationRequest) -> MakeTransferOperationResponse:
+        return await self.stub.MakeTransferOperation(request)
+
+    async def make_purchase_operation_api(self, request: MakePurchaseOperationRequest) -> MakePurchaseOperationResponse:
+        return await self.stub.MakePurchaseOperation(request)
+
+    async def make_bill_payment_operation_api(self, request: MakeBillPaymentOperationRequest) -> MakeBillPaymentOperationResponse:
+        return await self.stub.MakeBillPaymentOperation(request)
+
+    async def make_cash_withdrawal_operation_api(self, request: MakeCashWithdrawalOperationRequest) -> MakeCashWithdrawalOperationResponse:
+        return await self.stub.MakeCashWithdrawalOperation(request)
+
+    async def get_operation(self, operation_id: str) -> GetOperationResponse:
+        request = contract.GetOperationRequest(id=operation_id)
+        return await self.get_operation_api(request)
+
+    async def get_operation_receipt(self, operation_id: str) -> GetOperationReceiptResponse:
+        request = contract.GetOperationReceiptRequest(operation_id=operation_id)
+        return await self.get_operation_receipt_api(request)
+
+    async def get_operations(self, account_id: str) -> GetOperationsResponse:
+        request = contract.GetOperationsRequest(account_id=account_id)
+        return await self.get_operations_api(request)
+
+    async def get_operations_summary(self, account_id: str) -> GetOperationsSummaryResponse:
+        request = contract.GetOperationsSummaryRequest(account_id=account_id)
+        return await self.get_operations_summary_api(request)
+
+    async def make_fee_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            payload: OperationPayload | None = None
+    ) -> MakeFeeOperationResponse:
+        request = contract.MakeFeeOperationRequest(**build_operation_fields(card_id, account_id, payload))
+        return await self.make_fee_operation_api(request)
+
+    async def make_top_up_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            payload: OperationPayload | None = None
+    ) -> MakeTopUpOperationResponse:
+        request = contract.MakeTopUpOperationRequest(**build_operation_fields(card_id, account_id, payload))
+        return await self.make_top_up_operation_api(request)
+
+    async def make_cashback_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            payload: OperationPayload | None = None
+    ) -> MakeCashbackOperationResponse:
+        request = contract.MakeCashbackOperationRequest(**build_operation_fields(card_id, account_id, payload))
+        return await self.make_cashback_operation_api(request)
+
+    async def make_transfer_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            payload: OperationPayload | None = None
+    ) -> MakeTransferOperationResponse:
+        request = contract.MakeTransferOperationRequest(**build_operation_fields(card_id, account_id, payload))
+        return await self.make_transfer_operation_api(request)
+
+    async def make_purchase_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            payload: OperationPayload | None = None
+    ) -> MakePurchaseOperationResponse:
+        request = contract.MakePurchaseOperationRequest(
+            **build_operation_fields(card_id, account_id, payload, category=True)
+        )
+        return await self.make_purchase_operation_api(request)
+
+    async def make_bill_payment_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            payload: OperationPayload | None = None
+    ) -> MakeBillPaymentOperationResponse:
+        request = contract.MakeBillPaymentOperationRequest(**build_operation_fields(card_id, account_id, payload))
+        return await self.make_bill_payment_operation_api(request)
+
+    async def make_cash_withdrawal_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            payload: OperationPayload | None = None
+    ) -> MakeCashWithdrawalOperationResponse:
+        request = contract.MakeCashWithdrawalOperationRequest(**build_operation_fields(card_id, account_id, payload))
+        return await self.make_cash_withdrawal_operation_api(request)
+
+
 def build_operations_gateway_grpc_client() -> OperationsGatewayGRPCClient:
     """
     Фабрика для создания экземпляра OperationsGatewayGRPCClient.
@@ -274,4 +446,24 @@ def build_operations_gateway_locust_grpc_client(environment: Environment) -> Ope
     return OperationsGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment))
 
 
+def build_operations_gateway_async_grpc_client() -> AsyncOperationsGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра AsyncOperationsGatewayGRPCClient.
+
+    Вызывать нужно внутри запущенного event loop: grpc.aio-канал привязывается к нему.
+
+    :return: Инициализированный асинхронный клиент для OperationsGatewayService.
+    """
+    return AsyncOperationsGatewayGRPCClient(channel=build_gateway_async_grpc_client())
+
+
+def build_operations_gateway_async_locust_grpc_client(environment: Environment) -> AsyncOperationsGatewayGRPCClient:
+    """
+    Функция создаёт экземпляр AsyncOperationsGatewayGRPCClient адаптированного под Locust.
 
+    Вызовы регистрируются в метриках Locust через AsyncLocustInterceptor.
+
+    :param environment: объект окружения Locust.
+    :return: экземпляр AsyncOperationsGatewayGRPCClient с интерцептором сбора метрик.
+    """
+    return AsyncOperationsGatewayGRPCClient(channel=build_gateway_async_locust_grpc_client(environment))
@@ -1,16 +1,28 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from grpc import Channel
+from grpc.aio import Channel as AsyncChannel
 from locust.env import Environment
 
-from clients.grpc.client import GRPCClient
+from clients.grpc.client import AsyncGRPCClient, GRPCClient
 from clients.grpc.gateway.client import (
     build_gateway_grpc_client,
+    build_gateway_async_grpc_client,
+    build_gateway_async_locust_grpc_client,
     build_gateway_locust_grpc_client
 )
-from contracts.services.gateway.users.rpc_create_user_pb2 import CreateUserRequest, CreateUserResponse
-from contracts.services.gateway.users.rpc_get_user_pb2 import GetUserRequest, GetUserResponse
-from contracts.services.gateway.users.users_gateway_service_pb2_grpc import UsersGatewayServiceStub
+from clients.grpc.contracts import GatewayContract
 from tools.fakers import fake
 
+if TYPE_CHECKING:
+    from contracts.services.gateway.users.rpc_create_user_pb2 import CreateUserRequest, CreateUserResponse
+    from contracts.services.gateway.users.rpc_get_user_pb2 import GetUserRequest, GetUserResponse
+
+# Классы сообщений и stub разрешаются лениво, при первом использовании
+contract = GatewayContract("users", "UsersGatewayService")
+
 
 class UsersGatewayGRPCClient(GRPCClient):
     """
@@ -25,7 +37,7 @@ class UsersGatewayGRPCClient(GRPCClient):
         :param channel: gRPC-канал для подключения к UsersGatewayService.
         """
         super().__init__(channel)
-        self.stub = UsersGatewayServiceStub(channel)
+        self.stub = contract.stub(channel)
 
     def get_user_api(self, request: GetUserRequest) -> GetUserResponse:
         """
@@ -52,7 +64,7 @@ class UsersGatewayGRPCClient(GRPCClient):
         :param user_id: UUID пользователя.
         :return: Ответ с данными пользователя.
         """
-        request = GetUserRequest(id=user_id)
+        request = contract.GetUserRequest(id=user_id)
         return self.get_user_api(request)
 
     def create_user(self) -> CreateUserResponse:
@@ -61,7 +73,7 @@ class UsersGatewayGRPCClient(GRPCClient):
 
         :return: Ответ с данными созданного пользователя.
         """
-        request = CreateUserRequest(
+        request = contract.CreateUserRequest(
             email=fake.email(),
             first_name=fake.first_name(),
             last_name=fake.last_name(),
@@ -71,6 +83,37 @@ class UsersGatewayGRPCClient(GRPCClient):
         return self.create_user_api(request)
 
 
+class AsyncUsersGatewayGRPCClient(AsyncGRPCClient):
+    """
+    Асинхронный gRPC-клиент для взаимодействия с UsersGatewayService поверх grpc.aio-канала.
+    Повторяет методы UsersGatewayGRPCClient, но все вызовы выполняются через await.
+    """
+
+    def __init__(self, channel: AsyncChannel):
+        super().__init__(channel)
+        self.stub = contract.stub(channel)
+
+    async def get_user_api(self, request: GetUserRequest) -> GetUserResponse:
+        return await self.stub.GetUser(request)
+
+    async def create_user_api(self, request: CreateUserRequest) -> CreateUserResponse:
+        return await self.stub.CreateUser(request)
+
+    async def get_user(self, user_id: str) -> GetUserResponse:
+        request = contract.GetUserRequest(id=user_id)
+        return await self.get_user_api(request)
+
+    async def create_user(self) -> CreateUserResponse:
+        request = contract.CreateUserRequest(
+            email=fake.email(),
+            first_name=fake.first_name(),
+            last_name=fake.last_name(),
+            middle_name=fake.middle_name(),
+            phone_number=fake.phone_number()
+        )
+        return await self.create_user_api(request)
+
+
 def build_users_gateway_grpc_client() -> UsersGatewayGRPCClient:
     """
     Фабрика для создания экземпляра UsersGatewayGRPCClient.
@@ -92,3 +135,26 @@ def build_users_gateway_locust_grpc_client(environment: Environment) -> UsersGat
     :return: экземпляр UsersGatewayGRPCClient с хуками сбора метрик.
     """
     return UsersGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment))
+
+
+def build_users_gateway_async_grpc_client() -> AsyncUsersGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра AsyncUsersGatewayGRPCClient.
+
+    Вызывать нужно внутри запущенного event loop: grpc.aio-канал привязывается к нему.
+
+    :return: Инициализированный асинхронный клиент для UsersGatewayService.
+    """
+    return AsyncUsersGatewayGRPCClient(channel=build_gateway_async_grpc_client())
+
+
+def build_users_gateway_async_locust_grpc_client(environment: Environment) -> AsyncUsersGatewayGRPCClient:
+    """
+    Функция создаёт экземпляр AsyncUsersGatewayGRPCClient адаптированного под Locust.
+
+    Вызовы регистрируются в метриках Locust через AsyncLocustInterceptor.
+
+    :param environment: объект окружения Locust.
+    :return: экземпляр AsyncUsersGatewayGRPCClient с интерцептором сбора метрик.
+    """
+    return AsyncUsersGatewayGRPCClient(channel=build_gateway_async_locust_grpc_client(environment))
@@ -1,13 +1,296 @@
 import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, NamedTuple
 
-from grpc import RpcError, UnaryUnaryClientInterceptor
+from grpc import (
+    Channel,
+    RpcError,
+    StreamUnaryClientInterceptor,
+    UnaryStreamClientInterceptor,
+    UnaryUnaryClientInterceptor
+)
+from grpc import aio
 from locust.env import Environment
 
+from tools.open_loop import take_start_delay_ns
 
-class LocustInterceptor(UnaryUnaryClientInterceptor):
+
+class CallTimer(NamedTuple):
+    """
+    Время начала gRPC-вызова и опоздание запуска задачи в открытой модели нагрузки (tools/open_loop.py);
+    опоздание ненулевое только у первого вызова задачи.
+    """
+    start: float
+    start_delay: float
+
+    @classmethod
+    def begin(cls) -> "CallTimer":
+        return cls(time.perf_counter(), take_start_delay_ns() / 1_000_000_000)
+
+    def measure(self) -> tuple[float, dict | None]:
+        """
+        :return: Время ответа в миллисекундах и context события Locust.
+            С поправкой на coordinated omission время считается от планового запуска задачи,
+            а время работы сервиса передаётся в context["service_time_ms"].
+        """
+        service_time = (time.perf_counter() - self.start) * 1000
+        if not self.start_delay:
+            return service_time, None
+
+        return service_time + self.start_delay * 1000, {"service_time_ms": service_time}
+
+
+class WireSize:
+    """
+    Размер ответа одного вызова в байтах на проводе.
+
+    Десериализатор ответа получает готовые байты, поэтому их длина известна бесплатно —
+    не нужно повторно обходить дерево сообщения через `ByteSize()`. Интерцептор создаёт WireSize
+    на каждый вызов и публикует его в контекстной переменной на время `continuation`; канал
+    (WireSizeChannel, AsyncWireSizeChannel) передаёт длины байтов именно этому экземпляру.
+    Размер живёт вместе с вызовом: общего словаря, который нужно чистить, нет.
+    """
+
+    __slots__ = ("length", "recorded")
+
+    def __init__(self):
+        self.length = 0
+        self.recorded = False
+
+    def add(self, length: int) -> None:
+        self.length += length
+        self.recorded = True
+
+    def get(self, message: Any) -> int:
+        """
+        :param message: Десериализованное сообщение.
+        :return: Длина на проводе, а если канал её не записал — `ByteSize()` (или длина сырых байтов).
+        """
+        if self.recorded:
+            return self.length
+
+        return get_message_size(message)
+
+    @classmethod
+    @contextmanager
+    def track(cls) -> Iterator["WireSize"]:
+        """
+        Публикует новый WireSize для вызова, который делается внутри блока `with`.
+        """
+        wire_size = cls()
+        token = _current_wire_size.set(wire_size)
+        try:
+            yield wire_size
+        finally:
+            _current_wire_size.reset(token)
+
+
+# WireSize вызова, который сейчас выполняет интерцептор (у каждого greenlet и asyncio-задачи свой)
+_current_wire_size: ContextVar[WireSize | None] = ContextVar("wire_size", default=None)
+
+
+def get_message_size(message: Any) -> int:
+    if isinstance(message, bytes):
+        return len(message)
+
+    return message.ByteSize() if message is not None else 0
+
+
+def wrap_call_deserializer(deserializer: Callable[[bytes], Any] | None) -> Callable[[bytes], Any] | None:
+    """
+    Оборачивает десериализатор ответа для текущего вызова: длины байтов пишутся в его WireSize.
+
+    Вызывается синхронно из `continuation` интерцептора, поэтому WireSize берётся из контекста сразу
+    и замыкается в обёртке: десериализация `.future()`-вызова идёт в другом потоке, где контекста нет.
+
+    :param deserializer: Исходный десериализатор (например, `GetUserResponse.FromString`).
+    :return: Десериализатор с учётом размера; исходный, если размер никто не ждёт.
+    """
+    wire_size = _current_wire_size.get()
+    if deserializer is None or wire_size is None:
+        return deserializer
+
+    def deserialize(data: bytes):
+        wire_size.add(len(data))
+        return deserializer(data)
+
+    return deserialize
+
+
+def wrap_async_deserializer(deserializer: Callable[[bytes], Any] | None) -> Callable[[bytes], Any] | None:
+    """
+    Оборачивает десериализатор ответа grpc.aio: WireSize берётся из контекста в момент десериализации.
+
+    Задача grpc.aio-вызова создаётся внутри интерцептора и наследует его контекст.
+
+    :param deserializer: Исходный десериализатор.
+    :return: Десериализатор с учётом размера или None, если десериализатора нет.
+    """
+    if deserializer is None:
+        return None
+
+    def deserialize(data: bytes):
+        wire_size = _current_wire_size.get()
+        if wire_size is not None:
+            wire_size.add(len(data))
+        return deserializer(data)
+
+    return deserialize
+
+
+class WireSizeChannel(Channel):
+    """
+    Прокси над gRPC-каналом, который подменяет десериализаторы ответов так, чтобы длина байтов
+    попадала в WireSize вызова. Остальное поведение канала не меняется.
+
+    Канал оборачивается интерцепторами через `intercept_channel`: они запрашивают multicallable
+    у этого канала на каждый вызов, поэтому обёртка десериализатора создаётся тоже на каждый вызов.
+    stream-stream вызовы LocustInterceptor не перехватывает, и их десериализатор не подменяется.
+    """
+
+    def __init__(self, channel: Channel):
+        """
+        :param channel: Исходный канал (например, общий пул каналов).
+        """
+        self.channel = channel
+
+    def unary_unary(self, method, request_serializer=None, response_deserializer=None, *args, **kwargs):
+        return self.channel.unary_unary(
+            method, request_serializer, wrap_call_deserializer(response_deserializer), *args, **kwargs
+        )
+
+    def unary_stream(self, method, request_serializer=None, response_deserializer=None, *args, **kwargs):
+        return self.channel.unary_stream(
+            method, request_serializer, wrap_call_deserializer(response_deserializer), *args, **kwargs
+        )
+
+    def stream_unary(self, method, request_serializer=None, response_deserializer=None, *args, **kwargs):
+        return self.channel.stream_unary(
+            method, request_serializer, wrap_call_deserializer(response_deserializer), *args, **kwargs
+        )
+
+    def stream_stream(self, *args, **kwargs):
+        return self.channel.stream_stream(*args, **kwargs)
+
+    def subscribe(self, callback, try_to_connect=False):
+        self.channel.subscribe(callback, try_to_connect=try_to_connect)
+
+    def unsubscribe(self, callback):
+        self.channel.unsubscribe(callback)
+
+    def close(self):
+        self.channel.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+class AsyncWireSizeChannel(aio.Channel):
+    """
+    grpc.aio-аналог WireSizeChannel. Подменяется только десериализатор unary-unary вызовов:
+    остальные типы вызовов AsyncLocustInterceptor не перехватывает.
+    """
+
+    def __init__(self, channel: aio.Channel):
+        """
+        :param channel: Исходный grpc.aio-канал (с интерцепторами).
+        """
+        self.channel = channel
+
+    def unary_unary(self, method, request_serializer=None, response_deserializer=None, *args, **kwargs):
+        return self.channel.unary_unary(
+            method, request_serializer, wrap_async_deserializer(response_deserializer), *args, **kwargs
+        )
+
+    def unary_stream(self, *args, **kwargs):
+        return self.channel.unary_stream(*args, **kwargs)
+
+    def stream_unary(self, *args, **kwargs):
+        return self.channel.stream_unary(*args, **kwargs)
+
+    def stream_stream(self, *args, **kwargs):
+        return self.channel.stream_stream(*args, **kwargs)
+
+    def get_state(self, try_to_connect: bool = False):
+        return self.channel.get_state(try_to_connect)
+
+    async def wait_for_state_change(self, last_observed_state):
+        return await self.channel.wait_for_state_change(last_observed_state)
+
+    async def channel_ready(self):
+        return await self.channel.channel_ready()
+
+    async def close(self, grace: float | None = None):
+        await self.channel.close(grace)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+        return False
+
+
+class LocustResponseStream:
+    """
+    Обёртка над потоком ответов unary-stream вызова.
+
+    Считает суммарный размер сообщений и отправляет событие Locust один раз:
+    когда поток закончился или оборвался ошибкой. Методы Call (code, details, cancel и т.д.)
+    делегируются исходному объекту.
+    """
+
+    def __init__(self, call, on_done: Callable[[int, RpcError | None], None], wire_size: WireSize):
+        self.call = call
+        self.on_done = on_done
+        self.wire_size = wire_size
+        # Размер сообщений через ByteSize(), если канал не записал длину на проводе
+        self.fallback_length = 0
+        self.done = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            message = next(self.call)
+        except StopIteration:
+            self.finish(None)
+            raise
+        except RpcError as error:
+            self.finish(error)
+            raise
+
+        if not self.wire_size.recorded:
+            self.fallback_length += get_message_size(message)
+        return message
+
+    def finish(self, exception: RpcError | None) -> None:
+        if not self.done:
+            self.done = True
+            self.on_done(self.wire_size.length + self.fallback_length, exception)
+
+    def __getattr__(self, name):
+        return getattr(self.call, name)
+
+
+class LocustInterceptor(
+    UnaryUnaryClientInterceptor,
+    UnaryStreamClientInterceptor,
+    StreamUnaryClientInterceptor
+):
     """
     gRPC-интерцептор для сбора метрик Locust.
     Используется для измерения времени выполнения вызовов и регистрации успехов/ошибок.
+
+    Интерцептор не ждёт ответ сам: событие отправляется из done-callback future-объекта,
+    поэтому `.future()`-вызовы остаются неблокирующими. Размер ответа берётся из длины
+    сериализованных байтов, если канал обёрнут WireSizeChannel, иначе — через `ByteSize()`.
     """
 
     def __init__(self, environment: Environment):
@@ -16,6 +299,41 @@ class LocustInterceptor(UnaryUnaryClientInterceptor):
         """
         self.environment = environment
 
+    def fire(self, method: str, timer: CallTimer, response, exception: RpcError | None, response_length: int):
+        response_time, context = timer.measure()
+
+        # Регистрируем вызов в системе метрик Locust
+        self.environment.events.request.fire(
+            name=method,  # Имя метода (например, "/users.UsersService/CreateUser")
+            context=context,  # Время работы сервиса, если время ответа скорректировано на опоздание запуска
+            response=response,  # Объект ответа (если нужен для контекста)
+            exception=exception,  # Если произошла ошибка — передаём её сюда
+            request_type="gRPC",  # Тип запроса (например, "HTTP", "gRPC")
+            response_time=response_time,  # Время выполнения в миллисекундах
+            response_length=response_length,  # Размер ответа в байтах
+        )
+
+    def track_future(self, method: str, timer: CallTimer, wire_size: WireSize, response) -> None:
+        """
+        Подписывается на завершение future-объекта ответа и отправляет событие Locust.
+
+        Для блокирующих вызовов future уже завершён, и callback выполняется сразу.
+        """
+
+        def on_done(future) -> None:
+            if future.cancelled():
+                self.fire(method, timer, future, None, 0)
+                return
+
+            exception = future.exception()
+            if exception is not None:
+                self.fire(method, timer, future, exception, 0)
+                return
+
+            self.fire(method, timer, future, None, wire_size.get(future.result()))
+
+        response.add_done_callback(on_done)
+
     def intercept_unary_unary(self, continuation, client_call_details, request):
         """
         Метод-перехватчик для unary-unary gRPC вызовов.
@@ -25,31 +343,122 @@ class LocustInterceptor(UnaryUnaryClientInterceptor):
         :param request: Объект запроса, отправляемый на сервер.
         :return: gRPC response (future объект).
         """
+        timer = CallTimer.begin()  # Засекаем время начала запроса
+
+        try:
+            # Выполняем gRPC вызов и получаем response future
+            with WireSize.track() as wire_size:
+                response = continuation(client_call_details, request)
+        except RpcError as error:
+            self.fire(client_call_details.method, timer, None, error, 0)
+            raise
+
+        self.track_future(client_call_details.method, timer, wire_size, response)
+
+        # Возвращаем результат вызова (future-объект)
+        return response
+
+    def intercept_stream_unary(self, continuation, client_call_details, request_iterator):
+        """
+        Метод-перехватчик для stream-unary gRPC вызовов.
+
+        :param continuation: Функция, вызывающая фактический gRPC метод.
+        :param client_call_details: Детали запроса.
+        :param request_iterator: Итератор запросов, отправляемых на сервер.
+        :return: gRPC response (future объект).
+        """
+        timer = CallTimer.begin()
+
+        try:
+            with WireSize.track() as wire_size:
+                response = continuation(client_call_details, request_iterator)
+        except RpcError as error:
+            self.fire(client_call_details.method, timer, None, error, 0)
+            raise
+
+        self.track_future(client_call_details.method, timer, wire_size, response)
+        return response
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        """
+        Метод-перехватчик для unary-stream gRPC вызовов.
+
+        Событие отправляется, когда поток ответов дочитан до конца или оборвался ошибкой.
+
+        :param continuation: Функция, вызывающая фактический gRPC метод.
+        :param client_call_details: Детали запроса.
+        :param request: Объект запроса, отправляемый на сервер.
+        :return: Итератор ответов, одновременно являющийся gRPC Call.
+        """
+        timer = CallTimer.begin()
+        method = client_call_details.method
+
+        try:
+            with WireSize.track() as wire_size:
+                call = continuation(client_call_details, request)
+        except RpcError as error:
+            self.fire(method, timer, None, error, 0)
+            raise
+
+        def on_done(response_length: int, exception: RpcError | None) -> None:
+            self.fire(method, timer, call, exception, response_length)
+
+        return LocustResponseStream(call, on_done, wire_size)
+
+
+class AsyncLocustInterceptor(aio.UnaryUnaryClientInterceptor):
+    """
+    grpc.aio-интерцептор для сбора метрик Locust.
+    Асинхронный аналог LocustInterceptor: ожидание ответа не блокирует event loop,
+    поэтому в одном процессе могут выполняться тысячи одновременных вызовов.
+    Размер ответа, как и в LocustInterceptor, берётся из длины сериализованных байтов,
+    если канал обёрнут AsyncWireSizeChannel, иначе — через `ByteSize()`.
+    """
+
+    def __init__(self, environment: Environment):
+        """
+        :param environment: Экземпляр среды Locust, содержащий события сбора метрик.
+        """
+        self.environment = environment
+
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        """
+        Метод-перехватчик для асинхронных unary-unary gRPC вызовов.
+
+        :param continuation: Корутина, вызывающая фактический gRPC метод.
+        :param client_call_details: Детали запроса (метод, метаданные, таймаут и т.д.).
+        :param request: Объект запроса, отправляемый на сервер.
+        :return: Объект вызова grpc.aio (его можно повторно await-ить для получения ответа).
+        """
         response = None
         exception: RpcError | None = None
-        start_time = time.perf_counter()  # Засекаем время начала запроса
+        timer = CallTimer.begin()
         response_length = 0
 
-        try:
-            # Выполняем gRPC вызов и получаем response future
-            response = continuation(client_call_details, request)
+        # Задача вызова создаётся внутри continuation и наследует контекст с wire_size
+        with WireSize.track() as wire_size:
+            call = await continuation(client_call_details, request)
 
-            # Получаем размер ответа, если он уже доступен (для метрик)
-            response_length = response.result().ByteSize()
+        try:
+            response = await call
+            response_length = wire_size.get(response)
         except RpcError as error:
-            # В случае ошибки сохраняем исключение для метрик
             exception = error
 
-        # Регистрируем вызов в системе метрик Locust
+        # В grpc.aio имя метода передаётся в виде bytes
+        method = client_call_details.method
+        if isinstance(method, bytes):
+            method = method.decode()
+
+        response_time, context = timer.measure()
         self.environment.events.request.fire(
-            name=client_call_details.method,  # Имя метода (например, "/users.UsersService/CreateUser")
-            context=None,  # Можно использовать для передачи кастомных данных
-            response=response,  # Объект ответа (если нужен для контекста)
-            exception=exception,  # Если произошла ошибка — передаём её сюда
-            request_type="gRPC",  # Тип запроса (например, "HTTP", "gRPC")
-            response_time=(time.perf_counter() - start_time) * 1000,  # Время выполнения в миллисекундах
-            response_length=response_length,  # Размер ответа в байтах
+            name=method,
+            context=context,
+            response=response,
+            exception=exception,
+            request_type="gRPC",
+            response_time=response_time,
+            response_length=response_length,
         )
 
-        # Возвращаем результат вызова (future-объект)
-        return response
+        return call
@@ -0,0 +1,89 @@
+import time
+
+from grpc import RpcError, StatusCode, UnaryUnaryClientInterceptor
+from grpc import aio
+
+from tools.recorder import NO_RESPONSE, RecordedRequest, RequestRecorder
+
+
+def get_status(error: RpcError | None) -> int:
+    """
+    :return: Числовой код gRPC (0 — OK) или NO_RESPONSE, если у ошибки нет кода.
+    """
+    if error is None:
+        return StatusCode.OK.value[0]
+
+    code = error.code() if callable(getattr(error, "code", None)) else None
+    return code.value[0] if code is not None else NO_RESPONSE
+
+
+class RecordingInterceptor(UnaryUnaryClientInterceptor):
+    """
+    gRPC-интерцептор, который отдаёт каждый unary-вызов в RequestRecorder (см. tools/recorder.py).
+
+    Запрос записывается в сериализованном виде, поэтому реплеер отправляет те же байты,
+    не зная классов сообщений. Как и LocustInterceptor, запись делается из done-callback,
+    поэтому `.future()`-вызовы остаются неблокирующими.
+    """
+
+    def __init__(self, recorder: RequestRecorder):
+        self.recorder = recorder
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        """
+        Метод-перехватчик для unary-unary gRPC вызовов.
+
+        :param continuation: Функция, вызывающая фактический gRPC метод.
+        :param client_call_details: Детали запроса (метод, метаданные, таймаут и т.д.).
+        :param request: Объект запроса, отправляемый на сервер.
+        :return: gRPC response (future объект).
+        """
+        method = client_call_details.method
+        payload = request.SerializeToString()
+        timestamp, start = time.time(), time.perf_counter()
+
+        def record(error: RpcError | None) -> None:
+            latency_ms = (time.perf_counter() - start) * 1000
+            self.recorder.put(
+                RecordedRequest(timestamp, latency_ms, "grpc", "UNARY", method, method, payload, get_status(error))
+            )
+
+        try:
+            response = continuation(client_call_details, request)
+        except RpcError as error:
+            record(error)
+            raise
+
+        response.add_done_callback(lambda future: record(None if future.cancelled() else future.exception()))
+        return response
+
+
+class AsyncRecordingInterceptor(aio.UnaryUnaryClientInterceptor):
+    """
+    grpc.aio-аналог RecordingInterceptor.
+    """
+
+    def __init__(self, recorder: RequestRecorder):
+        self.recorder = recorder
+
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        # В grpc.aio имя метода передаётся в виде bytes
+        method = client_call_details.method
+        if isinstance(method, bytes):
+            method = method.decode()
+        payload = request.SerializeToString()
+        timestamp, start = time.time(), time.perf_counter()
+        error: RpcError | None = None
+
+        call = await continuation(client_call_details, request)
+        try:
+            await call
+        except RpcError as call_error:
+            error = call_error
+        finally:
+            latency_ms = (time.perf_counter() - start) * 1000
+            self.recorder.put(
+                RecordedRequest(timestamp, latency_ms, "grpc", "UNARY", method, method, payload, get_status(error))
+            )
+
+        return call
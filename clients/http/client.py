@@ -1,12 +1,21 @@
-from typing import Any, TypedDict
+from typing import Any, TypedDict, TypeVar
 
-from httpx import Client, Response, QueryParams, URL
+from httpx import AsyncClient, Client, Response, QueryParams, URL
+from pydantic import BaseModel
+
+from clients.http.encoding import JSON_HEADERS, JSONBody, encode_json_body
+from clients.http.parsing import LazyModelList, parse_lazy_list, parse_response
+from tools.recorder import get_active_recorder
+
+T = TypeVar("T", bound=BaseModel)
 
 
 # Тип расширений, которые можно передать в запрос
-# В нашем случае мы используем только параметр "route", но можно добавить и другие
+# route — шаблон маршрута для метрик, response_length_mode — режим подсчёта длины ответа для Locust
+# (значение ResponseLengthMode, например "headers-only" для больших документов)
 class HTTPClientExtensions(TypedDict, total=False):
     route: str
+    response_length_mode: str
 
 
 class HTTPClient:
@@ -14,10 +23,34 @@ class HTTPClient:
     Базовый HTTP API клиент, принимающий объект httpx.Client.
 
     :param client: экземпляр httpx.Client для выполнения HTTP-запросов
+    :param trusted: не валидировать ответы со схемами, которые быстрее собрать через `model_construct`
+        (пользователи с EmailStr, см. `is_construct_faster`), только для нагрузочных прогонов
     """
 
-    def __init__(self, client: Client) -> None:
+    def __init__(self, client: Client, trusted: bool = False) -> None:
         self.client = client
+        self.trusted = trusted
+
+    def parse_response(self, response: Response, schema: type[T]) -> T:
+        """
+        Разбирает тело ответа в pydantic-схему из байтов `response.content`.
+
+        :param response: Объект Response.
+        :param schema: Pydantic-схема ответа.
+        :return: Экземпляр схемы.
+        """
+        return parse_response(response, schema, self.trusted)
+
+    def parse_lazy_list(self, response: Response, key: str, schema: type[T]) -> LazyModelList[T]:
+        """
+        Возвращает ленивый список моделей из массива `key` ответа: элементы разбираются при обращении.
+
+        :param response: Объект Response.
+        :param key: Ключ массива в ответе, например "operations".
+        :param schema: Pydantic-схема элемента.
+        :return: LazyModelList.
+        """
+        return parse_lazy_list(response, key, schema, self.trusted)
 
     def get(
             self,
@@ -33,20 +66,144 @@ class HTTPClient:
         :param extensions: Дополнительные данные, передаваемые через HTTPX extensions.
         :return: Объект Response с данными ответа.
         """
+        recorder = get_active_recorder()
+        if recorder is not None:
+            # Запись запросов для tools/replay.py (см. tools/recorder.py)
+            with recorder.http_exchange(extensions and extensions.get("route")) as exchange:
+                exchange.response = self.client.get(url=url, params=params, extensions=extensions)
+                return exchange.response
+
         return self.client.get(url=url, params=params, extensions=extensions)  # Передаём extensions в httpx.Client
 
     def post(
             self,
             url: str | URL,
-            json: Any | None = None,
+            json: BaseModel | JSONBody | Any | None = None,
             extensions: HTTPClientExtensions | None = None  # Поддержка extensions для POST-запросов
     ) -> Response:
         """
         Выполняет POST-запрос.
 
         :param url: URL-адрес эндпоинта.
-        :param json: Данные в формате JSON.
+        :param json: Данные в формате JSON: pydantic-модель, готовое тело JSONBody или обычные данные.
         :param extensions: Дополнительные данные, передаваемые через HTTPX extensions.
         :return: Объект Response с данными ответа.
         """
+        recorder = get_active_recorder()
+        if recorder is not None:
+            # Запись запросов для tools/replay.py (см. tools/recorder.py)
+            with recorder.http_exchange(extensions and extensions.get("route")) as exchange:
+                exchange.response = self.send_post(url, json, extensions)
+                return exchange.response
+
+        return self.send_post(url, json, extensions)
+
+    def send_post(
+            self,
+            url: str | URL,
+            json: BaseModel | JSONBody | Any | None,
+            extensions: HTTPClientExtensions | None
+    ) -> Response:
+        if isinstance(json, (BaseModel, JSONBody)):
+            # Модель сериализуется сразу в байты, без промежуточного dict и повторного кодирования в httpx
+            return self.client.post(
+                url=url, content=encode_json_body(json), headers=JSON_HEADERS, extensions=extensions
+            )
+
         return self.client.post(url=url, json=json, extensions=extensions)  # extensions передаётся в httpx.Client
+
+
+class AsyncHTTPClient:
+    """
+    Базовый асинхронный HTTP API клиент, принимающий объект httpx.AsyncClient.
+
+    Позволяет держать множество одновременных запросов в одном процессе
+    без отдельного greenlet на каждого виртуального пользователя.
+
+    :param client: экземпляр httpx.AsyncClient для выполнения HTTP-запросов
+    :param trusted: не валидировать ответы со схемами, которые быстрее собрать через `model_construct`
+        (пользователи с EmailStr, см. `is_construct_faster`), только для нагрузочных прогонов
+    """
+
+    def __init__(self, client: AsyncClient, trusted: bool = False) -> None:
+        self.client = client
+        self.trusted = trusted
+
+    def parse_response(self, response: Response, schema: type[T]) -> T:
+        """
+        Разбирает тело ответа в pydantic-схему из байтов `response.content`.
+
+        :param response: Объект Response.
+        :param schema: Pydantic-схема ответа.
+        :return: Экземпляр схемы.
+        """
+        return parse_response(response, schema, self.trusted)
+
+    def parse_lazy_list(self, response: Response, key: str, schema: type[T]) -> LazyModelList[T]:
+        """
+        Возвращает ленивый список моделей из массива `key` ответа: элементы разбираются при обращении.
+
+        :param response: Объект Response.
+        :param key: Ключ массива в ответе, например "operations".
+        :param schema: Pydantic-схема элемента.
+        :return: LazyModelList.
+        """
+        return parse_lazy_list(response, key, schema, self.trusted)
+
+    async def get(
+            self,
+            url: str | URL,
+            params: QueryParams | None = None,
+            extensions: HTTPClientExtensions | None = None
+    ) -> Response:
+        """
+        Выполняет асинхронный GET-запрос.
+
+        :param url: URL-адрес эндпоинта.
+        :param params: GET-параметры запроса (например, ?key=value).
+        :param extensions: Дополнительные данные, передаваемые через HTTPX extensions.
+        :return: Объект Response с данными ответа.
+        """
+        recorder = get_active_recorder()
+        if recorder is not None:
+            with recorder.http_exchange(extensions and extensions.get("route")) as exchange:
+                exchange.response = await self.client.get(url=url, params=params, extensions=extensions)
+                return exchange.response
+
+        return await self.client.get(url=url, params=params, extensions=extensions)
+
+    async def post(
+            self,
+            url: str | URL,
+            json: BaseModel | JSONBody | Any | None = None,
+            extensions: HTTPClientExtensions | None = None
+    ) -> Response:
+        """
+        Выполняет асинхронный POST-запрос.
+
+        :param url: URL-адрес эндпоинта.
+        :param json: Данные в формате JSON: pydantic-модель, готовое тело JSONBody или обычные данные.
+        :param extensions: Дополнительные данные, передаваемые через HTTPX extensions.
+        :return: Объект Response с данными ответа.
+        """
+        recorder = get_active_recorder()
+        if recorder is not None:
+            with recorder.http_exchange(extensions and extensions.get("route")) as exchange:
+                exchange.response = await self.send_post(url, json, extensions)
+                return exchange.response
+
+        return await self.send_post(url, json, extensions)
+
+    async def send_post(
+            self,
+            url: str | URL,
+            json: BaseModel | JSONBody | Any | None,
+            extensions: HTTPClientExtensions | None
+    ) -> Response:
+        if isinstance(json, (BaseModel, JSONBody)):
+            # Модель сериализуется сразу в байты, без промежуточного dict и повторного кодирования в httpx
+            return await self.client.post(
+                url=url, content=encode_json_body(json), headers=JSON_HEADERS, extensions=extensions
+            )
+
+        return await self.client.post(url=url, json=json, extensions=extensions)
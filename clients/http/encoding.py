@@ -0,0 +1,86 @@
+from json import dumps
+from typing import Any
+
+from pydantic import BaseModel
+
+# Заголовки для тела, уже сериализованного в JSON
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+class JSONBody(bytes):
+    """
+    Тело запроса, уже сериализованное в JSON.
+
+    HTTPClient.post отправляет такие байты как есть, без повторной сериализации.
+    """
+
+
+def encode_json_body(value: BaseModel | JSONBody) -> JSONBody:
+    """
+    Сериализует pydantic-модель в байты JSON одним вызовом pydantic-core, с алиасами полей.
+
+    В отличие от `model_dump(by_alias=True)` + `json=` в httpx не создаётся промежуточный dict
+    и не выполняется повторное кодирование стандартным модулем json.
+
+    :param value: Pydantic-модель запроса или уже готовое тело.
+    :return: Тело запроса в виде JSONBody.
+    """
+    if isinstance(value, JSONBody):
+        return value
+
+    return JSONBody(value.__pydantic_serializer__.to_json(value, by_alias=True))
+
+
+class JSONBodyTemplate:
+    """
+    Шаблон тела запроса, в котором меняются только строковые идентификаторы.
+
+    Модель сериализуется один раз с маркерами вместо полей, после чего тело собирается
+    склейкой готовых байтов: `template.render(user_id="...")`.
+    Подходит только для схем без генерируемых значений (default_factory), например
+    OpenDebitCardAccountRequestSchema или IssueVirtualCardRequestSchema.
+    """
+
+    def __init__(self, schema: type[BaseModel], *fields: str):
+        """
+        :param schema: Pydantic-схема запроса.
+        :param fields: Имена строковых полей, которые подставляются при каждом запросе.
+        """
+        markers = {field: f"__template_{field}__" for field in fields}
+        body = encode_json_body(schema.model_construct(**markers))
+
+        self.fields = fields
+        self.parts: list[bytes] = []
+        self.order: list[str] = []
+
+        # Разрезаем сериализованное тело по маркерам в порядке их появления
+        positions = sorted((body.index(marker.encode()), field) for field, marker in markers.items())
+        cursor = 0
+        for position, field in positions:
+            self.parts.append(body[cursor:position])
+            self.order.append(field)
+            cursor = position + len(markers[field].encode())
+        self.parts.append(body[cursor:])
+
+    @staticmethod
+    def encode_value(value: Any) -> bytes:
+        # Идентификаторы (uuid) не требуют экранирования; остальные строки экранируем как в JSON
+        text = str(value)
+        if text.isascii() and text.isprintable() and '"' not in text and "\\" not in text:
+            return text.encode()
+
+        return dumps(text)[1:-1].encode()
+
+    def render(self, **values: Any) -> JSONBody:
+        """
+        Собирает тело запроса с подставленными значениями.
+
+        :param values: Значения полей шаблона, например user_id="...".
+        :return: Готовое тело запроса.
+        """
+        chunks = [self.parts[0]]
+        for field, part in zip(self.order, self.parts[1:]):
+            chunks.append(self.encode_value(values[field]))
+            chunks.append(part)
+
+        return JSONBody(b"".join(chunks))
@@ -1,55 +1,350 @@
+import logging
 import time
+from enum import StrEnum
+from functools import cache
+from typing import Any, Callable
 
-from httpx import Request, Response, HTTPStatusError, HTTPError
+from httpx import AsyncByteStream, Request, Response, HTTPStatusError, HTTPError, SyncByteStream
 from locust.env import Environment
 
+from tools.open_loop import take_start_delay_ns
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseLengthMode(StrEnum):
+    """
+    Способ определения `response_length` для метрик Locust.
+
+    - CONTENT_LENGTH — берётся из заголовка Content-Length, а при его отсутствии считается по потоку;
+    - STREAM — всегда считается по байтам, проходящим через поток тела ответа;
+    - HEADERS_ONLY — событие отправляется сразу после получения заголовков, тело не учитывается
+      (для больших документов и чеков, где важна задержка до первого байта).
+    """
+    CONTENT_LENGTH = "content-length"
+    STREAM = "stream"
+    HEADERS_ONLY = "headers-only"
+
+
+class RequestTimer:
+    """
+    Callback для HTTPX extension `trace`, который запоминает моменты сетевых событий запроса.
+
+    Время берётся из `time.perf_counter_ns()`: монотонные часы с наносекундным разрешением,
+    не подверженные скачкам системного времени (NTP).
+    Ключи — имена событий httpcore без префикса версии протокола,
+    например "connect_tcp.started" или "receive_response_headers.complete".
+    `start_delay` — опоздание запуска задачи в открытой модели нагрузки (см. tools/open_loop.py);
+    ненулевое только у первого запроса задачи.
+    """
+
+    __slots__ = ("start", "start_delay", "events", "trace")
+
+    def __init__(self, trace: Callable[[str, dict], Any] | None = None):
+        """
+        :param trace: Пользовательский trace-callback, если он уже был задан в запросе. Вызывается следом.
+        """
+        self.start = time.perf_counter_ns()
+        self.start_delay = take_start_delay_ns()
+        self.events: dict[str, int] = {}
+        self.trace = trace
+
+    def record(self, name: str) -> None:
+        # "connection.connect_tcp.started" / "http11.receive_response_headers.complete" -> без префикса
+        self.events[name.partition(".")[2]] = time.perf_counter_ns()
+
+    def __call__(self, name: str, info: dict) -> None:
+        self.record(name)
+        if self.trace is not None:
+            self.trace(name, info)
+
+    def phase(self, started: str, completed: str) -> float | None:
+        """
+        Длительность фазы между двумя событиями.
+
+        :param started: Событие начала фазы.
+        :param completed: Событие окончания фазы.
+        :return: Длительность в миллисекундах или None, если фаза не наблюдалась.
+        """
+        start, end = self.events.get(started), self.events.get(completed)
+        if start is None or end is None:
+            return None
+
+        return (end - start) / 1_000_000
+
+    def phases(self) -> dict[str, float | None]:
+        """
+        Разбивает время запроса на фазы:
+        - connect_ms — установка TCP (и TLS) соединения; None, если соединение взято из пула;
+        - ttfb_ms — от начала отправки запроса до получения заголовков ответа;
+        - download_ms — чтение тела ответа.
+
+        :return: Словарь с длительностями фаз в миллисекундах.
+        """
+        connect_completed = "start_tls.complete" if "start_tls.complete" in self.events else "connect_tcp.complete"
+
+        return {
+            "connect_ms": self.phase("connect_tcp.started", connect_completed),
+            "ttfb_ms": self.phase("send_request_headers.started", "receive_response_headers.complete"),
+            "download_ms": self.phase("receive_response_body.started", "receive_response_body.complete"),
+        }
+
+
+class AsyncRequestTimer(RequestTimer):
+    """
+    Вариант RequestTimer для httpx.AsyncClient: httpcore ожидает trace-callback в виде корутины.
+    """
+
+    __slots__ = ()
+
+    async def __call__(self, name: str, info: dict) -> None:
+        self.record(name)
+        if self.trace is not None:
+            await self.trace(name, info)
+
+
+class CountingByteStream(SyncByteStream):
+    """
+    Обёртка над потоком тела ответа: считает байты по мере чтения, не копируя их,
+    и сообщает итоговую длину при закрытии потока.
+    """
+
+    def __init__(self, stream: SyncByteStream, on_close: Callable[[int], None]):
+        self.stream = stream
+        self.on_close = on_close
+        self.length = 0
+        self.closed = False
+
+    def __iter__(self):
+        for chunk in self.stream:
+            self.length += len(chunk)
+            yield chunk
+
+    def close(self) -> None:
+        try:
+            self.stream.close()
+        finally:
+            if not self.closed:
+                self.closed = True
+                self.on_close(self.length)
+
+
+class AsyncCountingByteStream(AsyncByteStream):
+    """
+    Асинхронный аналог CountingByteStream.
+    """
+
+    def __init__(self, stream: AsyncByteStream, on_close: Callable[[int], None]):
+        self.stream = stream
+        self.on_close = on_close
+        self.length = 0
+        self.closed = False
+
+    async def __aiter__(self):
+        async for chunk in self.stream:
+            self.length += len(chunk)
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self.stream.aclose()
+        finally:
+            if not self.closed:
+                self.closed = True
+                self.on_close(self.length)
+
+
+def get_content_length(response: Response) -> int | None:
+    """
+    Возвращает значение заголовка Content-Length или None, если его нет либо он некорректен.
+    """
+    try:
+        return int(response.headers["content-length"])
+    except (KeyError, ValueError):
+        return None
+
 
 def locust_request_event_hook(request: Request) -> None:
     """
     HTTPX event hook, вызываемый перед отправкой запроса.
 
-    Сохраняет текущее время в `request.extensions["start_time"]`,
-    чтобы потом использовать его для расчёта времени ответа.
+    Сохраняет в `request.extensions["timer"]` объект RequestTimer с моментом начала запроса
+    и подключает его как trace-callback, чтобы потом разбить время ответа на фазы.
+    """
+    timer = RequestTimer(request.extensions.get("trace"))
+    request.extensions["timer"] = timer
+    request.extensions["trace"] = timer
+
+
+async def locust_async_request_event_hook(request: Request) -> None:
+    """
+    Асинхронный вариант `locust_request_event_hook` для httpx.AsyncClient.
+
+    httpx.AsyncClient требует, чтобы все event hooks были корутинами.
+    """
+    timer = AsyncRequestTimer(request.extensions.get("trace"))
+    request.extensions["timer"] = timer
+    request.extensions["trace"] = timer
+
+
+def fire_locust_request_event(environment: Environment, response: Response, response_length: int) -> None:
+    """
+    Вычисляет метрики ответа и отправляет их в Locust.
+
+    Общая часть для синхронного и асинхронного response event hook.
+    Фазы запроса (connect_ms, ttfb_ms, download_ms) передаются в `context` события.
+
+    :param environment: Объект окружения Locust, через который отправляются метрики.
+    :param response: Ответ httpx (тело к этому моменту прочитано, если режим не HEADERS_ONLY).
+    :param response_length: Размер ответа в байтах.
+    """
+    end = time.perf_counter_ns()
+    exception: HTTPError | HTTPStatusError | None = None
+
+    try:
+        response = response.raise_for_status()
+    except (HTTPError, HTTPStatusError) as error:
+        exception = error
+
+    request = response.request
+
+    route = request.extensions.get("route", request.url.path)
+    timer: RequestTimer | None = request.extensions.get("timer")
+    if timer is not None:
+        response_time = (end - timer.start) / 1_000_000
+        context = timer.phases()
+        if timer.start_delay:
+            # Поправка на coordinated omission: время от планового запуска задачи, а не от отправки запроса
+            context["service_time_ms"] = response_time
+            response_time += timer.start_delay / 1_000_000
+    else:
+        # Запрос ушёл без request-хука: берём время, измеренное самим httpx (событие отправляется
+        # после закрытия ответа, см. track_response_length)
+        response_time = response.elapsed.total_seconds() * 1000
+        context = {}
+
+    # Отправляем событие в Locust
+    environment.events.request.fire(
+        name=f"{request.method} {route}",
+        context=context,
+        response=response,
+        exception=exception,
+        request_type="HTTP",
+        response_time=response_time,
+        response_length=response_length,
+    )
+
+
+def resolve_response_length_mode(
+        response: Response,
+        mode: ResponseLengthMode,
+        route_modes: dict[str, ResponseLengthMode]
+) -> ResponseLengthMode:
+    """
+    Определяет режим подсчёта длины ответа для запроса.
+
+    Приоритет: `request.extensions["response_length_mode"]`, затем режим маршрута, затем режим по умолчанию.
     """
-    request.extensions["start_time"] = time.time()
+    request = response.request
+    requested = request.extensions.get("response_length_mode")
+    if requested is not None:
+        return ResponseLengthMode(requested)
 
+    return route_modes.get(request.extensions.get("route", request.url.path), mode)
 
-def locust_response_event_hook(environment: Environment):
+
+def track_response_length(
+        environment: Environment,
+        response: Response,
+        mode: ResponseLengthMode,
+        wrap_stream: Callable[[Any, Callable[[int], None]], Any]
+) -> None:
+    """
+    Планирует отправку события Locust в зависимости от режима подсчёта длины ответа.
+
+    В режиме HEADERS_ONLY событие отправляется сразу. В остальных режимах поток тела ответа
+    оборачивается счётчиком, и событие отправляется при его закрытии — то есть после того,
+    как клиент сам прочитает тело (например, для `model_validate_json`). Хук тело не буферизует.
+
+    Без request-хука (нет RequestTimer) время известно только из `response.elapsed`, а его httpx
+    заполняет при закрытии ответа. Поэтому HEADERS_ONLY в этом случае работает как CONTENT_LENGTH.
+
+    :param environment: Объект окружения Locust.
+    :param response: Ответ httpx, тело которого ещё не прочитано.
+    :param mode: Режим подсчёта длины ответа.
+    :param wrap_stream: Обёртка потока тела (синхронная или асинхронная).
+    """
+    if mode == ResponseLengthMode.HEADERS_ONLY:
+        if "timer" in response.request.extensions:
+            fire_locust_request_event(environment, response, get_content_length(response) or 0)
+            return
+
+        warn_headers_only_without_timer()
+        mode = ResponseLengthMode.CONTENT_LENGTH
+
+    def on_close(streamed_length: int) -> None:
+        content_length = get_content_length(response) if mode == ResponseLengthMode.CONTENT_LENGTH else None
+        fire_locust_request_event(environment, response, streamed_length if content_length is None else content_length)
+
+    response.stream = wrap_stream(response.stream, on_close)
+
+
+@cache
+def warn_headers_only_without_timer() -> None:
+    logger.warning(
+        "Response length mode headers-only needs locust_request_event_hook to time requests; "
+        "without it events are fired when the response is closed"
+    )
+
+
+def locust_response_event_hook(
+        environment: Environment,
+        mode: ResponseLengthMode = ResponseLengthMode.CONTENT_LENGTH,
+        route_modes: dict[str, ResponseLengthMode] | None = None
+):
     """
     Возвращает HTTPX event hook, вызываемый после получения ответа.
 
-    Использует `request.extensions["start_time"]` для вычисления времени отклика.
+    Использует `request.extensions["timer"]` для вычисления времени отклика и его фаз.
     Извлекает route из `request.extensions["route"]`, если задан.
     Отправляет собранные метрики в `environment.events.request`, чтобы Locust мог агрегировать статистику.
 
+    Тело ответа хук не читает: событие отправляется, когда клиент дочитает и закроет поток ответа.
+
     :param environment: Объект окружения Locust, через который отправляются метрики.
+    :param mode: Режим подсчёта длины ответа по умолчанию.
+    :param route_modes: Режимы для отдельных маршрутов, например HEADERS_ONLY для больших документов.
+        Отдельный запрос может переопределить режим через `extensions["response_length_mode"]`.
     :return: Функция-хук для HTTPX response event hook.
     """
+    route_modes = route_modes or {}
 
     def inner(response: Response) -> None:
-        exception: HTTPError | HTTPStatusError | None = None
+        track_response_length(
+            environment, response, resolve_response_length_mode(response, mode, route_modes), CountingByteStream
+        )
 
-        try:
-            response = response.raise_for_status()
-        except (HTTPError, HTTPStatusError) as error:
-            exception = error
-
-        request = response.request
-
-        route = request.extensions.get("route", request.url.path)
-        start_time = request.extensions.get("start_time", time.time())
-        response_time = (time.time() - start_time) * 1000
-        response_length = len(response.read())
-
-        # Отправляем событие в Locust
-        environment.events.request.fire(
-            name=f"{request.method} {route}",
-            context=None,
-            response=response,
-            exception=exception,
-            request_type="HTTP",
-            response_time=response_time,
-            response_length=response_length,
+    return inner
+
+
+def locust_async_response_event_hook(
+        environment: Environment,
+        mode: ResponseLengthMode = ResponseLengthMode.CONTENT_LENGTH,
+        route_modes: dict[str, ResponseLengthMode] | None = None
+):
+    """
+    Асинхронный вариант `locust_response_event_hook` для httpx.AsyncClient.
+
+    :param environment: Объект окружения Locust, через который отправляются метрики.
+    :param mode: Режим подсчёта длины ответа по умолчанию.
+    :param route_modes: Режимы для отдельных маршрутов.
+    :return: Корутина-хук для HTTPX response event hook.
+    """
+    route_modes = route_modes or {}
+
+    async def inner(response: Response) -> None:
+        track_response_length(
+            environment, response, resolve_response_length_mode(response, mode, route_modes), AsyncCountingByteStream
         )
 
-    return inner
\ No newline at end of file
+    return inner
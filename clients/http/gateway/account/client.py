@@ -1,12 +1,17 @@
 from locust.env import Environment
 from httpx import Response, QueryParams
 
-from clients.http.client import HTTPClient, HTTPClientExtensions
+from clients.http.client import AsyncHTTPClient, HTTPClient, HTTPClientExtensions
+from clients.http.encoding import JSONBody, JSONBodyTemplate
+from clients.http.parsing import LazyModelList
 from clients.http.gateway.client import (
     build_gateway_http_client,
-    build_gateway_locust_http_client
+    build_gateway_locust_http_client,
+    build_gateway_async_http_client,
+    build_gateway_async_locust_http_client
 )
 from clients.http.gateway.account.schema import (
+    AccountSchema,
     GetAccountsQuerySchema,
     GetAccountsResponseSchema,
     OpenDepositAccountRequestSchema,
@@ -20,6 +25,13 @@ from clients.http.gateway.account.schema import (
 )
 
 
+# Тела запросов открытия счетов различаются только user_id: сериализуем их один раз
+OPEN_DEPOSIT_ACCOUNT_BODY = JSONBodyTemplate(OpenDepositAccountRequestSchema, "user_id")
+OPEN_SAVINGS_ACCOUNT_BODY = JSONBodyTemplate(OpenSavingsAccountRequestSchema, "user_id")
+OPEN_DEBIT_CARD_ACCOUNT_BODY = JSONBodyTemplate(OpenDebitCardAccountRequestSchema, "user_id")
+OPEN_CREDIT_CARD_ACCOUNT_BODY = JSONBodyTemplate(OpenCreditCardAccountRequestSchema, "user_id")
+
+
 class AccountsGatewayHTTPClient(HTTPClient):
     """
     Клиент для взаимодействия с /api/v1/accounts сервиса http-gateway.
@@ -38,71 +50,139 @@ class AccountsGatewayHTTPClient(HTTPClient):
             extensions=HTTPClientExtensions(route='/api/v1/accounts')
         )
 
-    def open_deposit_account_api(self, request: OpenDepositAccountRequestSchema) -> Response:
+    def open_deposit_account_api(self, request: OpenDepositAccountRequestSchema | JSONBody) -> Response:
         """
         Выполняет POST-запрос для открытия депозитного счёта.
 
         :param request: Словарь с userId.
         :return: Объект httpx.Response с результатом операции.
         """
-        return self.post("/api/v1/accounts/open-deposit-account", json=request.model_dump(by_alias=True))
+        return self.post("/api/v1/accounts/open-deposit-account", json=request)
 
-    def open_savings_account_api(self, request: OpenSavingsAccountRequestSchema) -> Response:
+    def open_savings_account_api(self, request: OpenSavingsAccountRequestSchema | JSONBody) -> Response:
         """
         Выполняет POST-запрос для открытия сберегательного счёта.
 
         :param request: Словарь с userId.
         :return: Объект httpx.Response.
         """
-        return self.post("/api/v1/accounts/open-savings-account", json=request.model_dump(by_alias=True))
+        return self.post("/api/v1/accounts/open-savings-account", json=request)
 
-    def open_debit_card_account_api(self, request: OpenDebitCardAccountRequestSchema) -> Response:
+    def open_debit_card_account_api(self, request: OpenDebitCardAccountRequestSchema | JSONBody) -> Response:
         """
         Выполняет POST-запрос для открытия дебетовой карты.
 
         :param request: Словарь с userId.
         :return: Объект httpx.Response.
         """
-        return self.post("/api/v1/accounts/open-debit-card-account", json=request.model_dump(by_alias=True))
+        return self.post("/api/v1/accounts/open-debit-card-account", json=request)
 
-    def open_credit_card_account_api(self, request: OpenCreditCardAccountRequestSchema) -> Response:
+    def open_credit_card_account_api(self, request: OpenCreditCardAccountRequestSchema | JSONBody) -> Response:
         """
         Выполняет POST-запрос для открытия кредитной карты.
 
         :param request: Словарь с userId.
         :return: Объект httpx.Response.
         """
-        return self.post("/api/v1/accounts/open-credit-card-account", json=request.model_dump(by_alias=True))
+        return self.post("/api/v1/accounts/open-credit-card-account", json=request)
 
     # Добавили новый метод
     def get_accounts(self, user_id: str) -> GetAccountsResponseSchema:
         query = GetAccountsQuerySchema(user_id=user_id)
         response = self.get_accounts_api(query)
-        return GetAccountsResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, GetAccountsResponseSchema)
+
+    def get_accounts_lazy(self, user_id: str) -> LazyModelList[AccountSchema]:
+        """
+        Как get_accounts, но счета разбираются по одному при обращении к ним.
+        """
+        query = GetAccountsQuerySchema(user_id=user_id)
+        response = self.get_accounts_api(query)
+        return self.parse_lazy_list(response, "accounts", AccountSchema)
 
     # Добавили новый метод
     def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponseSchema:
-        request = OpenDepositAccountRequestSchema(user_id=user_id)
+        request = OPEN_DEPOSIT_ACCOUNT_BODY.render(user_id=user_id)
         response = self.open_deposit_account_api(request)
-        return OpenDepositAccountResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, OpenDepositAccountResponseSchema)
 
     # Добавили новый метод
     def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponseSchema:
-        request = OpenSavingsAccountRequestSchema(user_id=user_id)
+        request = OPEN_SAVINGS_ACCOUNT_BODY.render(user_id=user_id)
         response = self.open_savings_account_api(request)
-        return OpenSavingsAccountResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, OpenSavingsAccountResponseSchema)
 
     # Добавили новый метод
     def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponseSchema:
-        request = OpenDebitCardAccountRequestSchema(user_id=user_id)
+        request = OPEN_DEBIT_CARD_ACCOUNT_BODY.render(user_id=user_id)
         response = self.open_debit_card_account_api(request)
-        return OpenDebitCardAccountResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, OpenDebitCardAccountResponseSchema)
 
     # Добавили новый метод
     def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponseSchema:
-        request = OpenCreditCardAccountRequestSchema(user_id=user_id)
+        request = OPEN_CREDIT_CARD_ACCOUNT_BODY.render(user_id=user_id)
         response = self.open_credit_card_account_api(request)
-        return OpenCreditCardAccountResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, OpenCreditCardAccountResponseSchema)
+
+
+class AsyncAccountsGatewayHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/accounts сервиса http-gateway.
+
+    Повторяет методы AccountsGatewayHTTPClient и возвращает те же pydantic-схемы.
+    """
+
+    async def get_accounts_api(self, query: GetAccountsQuerySchema) -> Response:
+        return await self.get(
+            "/api/v1/accounts",
+            params=QueryParams(**query.model_dump(by_alias=True)),
+            extensions=HTTPClientExtensions(route='/api/v1/accounts')
+        )
+
+    async def open_deposit_account_api(self, request: OpenDepositAccountRequestSchema | JSONBody) -> Response:
+        return await self.post("/api/v1/accounts/open-deposit-account", json=request)
+
+    async def open_savings_account_api(self, request: OpenSavingsAccountRequestSchema | JSONBody) -> Response:
+        return await self.post("/api/v1/accounts/open-savings-account", json=request)
+
+    async def open_debit_card_account_api(self, request: OpenDebitCardAccountRequestSchema | JSONBody) -> Response:
+        return await self.post("/api/v1/accounts/open-debit-card-account", json=request)
+
+    async def open_credit_card_account_api(self, request: OpenCreditCardAccountRequestSchema | JSONBody) -> Response:
+        return await self.post("/api/v1/accounts/open-credit-card-account", json=request)
+
+    async def get_accounts(self, user_id: str) -> GetAccountsResponseSchema:
+        query = GetAccountsQuerySchema(user_id=user_id)
+        response = await self.get_accounts_api(query)
+        return self.parse_response(response, GetAccountsResponseSchema)
+
+    async def get_accounts_lazy(self, user_id: str) -> LazyModelList[AccountSchema]:
+        """
+        Как get_accounts, но счета разбираются по одному при обращении к ним.
+        """
+        query = GetAccountsQuerySchema(user_id=user_id)
+        response = await self.get_accounts_api(query)
+        return self.parse_lazy_list(response, "accounts", AccountSchema)
+
+    async def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponseSchema:
+        request = OPEN_DEPOSIT_ACCOUNT_BODY.render(user_id=user_id)
+        response = await self.open_deposit_account_api(request)
+        return self.parse_response(response, OpenDepositAccountResponseSchema)
+
+    async def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponseSchema:
+        request = OPEN_SAVINGS_ACCOUNT_BODY.render(user_id=user_id)
+        response = await self.open_savings_account_api(request)
+        return self.parse_response(response, OpenSavingsAccountResponseSchema)
+
+    async def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponseSchema:
+        request = OPEN_DEBIT_CARD_ACCOUNT_BODY.render(user_id=user_id)
+        response = await self.open_debit_card_account_api(request)
+        return self.parse_response(response, OpenDebitCardAccountResponseSchema)
+
+    async def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponseSchema:
+        request = OPEN_CREDIT_CARD_ACCOUNT_BODY.render(user_id=user_id)
+        response = await self.open_credit_card_account_api(request)
+        return self.parse_response(response, OpenCreditCardAccountResponseSchema)
 
 
 def build_accounts_gateway_http_client() -> AccountsGatewayHTTPClient:
@@ -125,4 +205,23 @@ def build_accounts_gateway_locust_http_client(environment: Environment) -> Accou
        :param environment: Объект окружения Locust.
        :return: Экземпляр AccountsGatewayHTTPClient с хуками сбора метрик.
        """
-    return AccountsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
\ No newline at end of file
+    return AccountsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+
+
+def build_accounts_gateway_async_http_client() -> AsyncAccountsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncAccountsGatewayHTTPClient с уже настроенным httpx.AsyncClient.
+
+    :return: Готовый к использованию AsyncAccountsGatewayHTTPClient.
+    """
+    return AsyncAccountsGatewayHTTPClient(client=build_gateway_async_http_client())
+
+
+def build_accounts_gateway_async_locust_http_client(environment: Environment) -> AsyncAccountsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncAccountsGatewayHTTPClient адаптированного под Locust.
+
+    :param environment: Объект окружения Locust.
+    :return: Экземпляр AsyncAccountsGatewayHTTPClient с асинхронными хуками сбора метрик.
+    """
+    return AsyncAccountsGatewayHTTPClient(client=build_gateway_async_locust_http_client(environment))
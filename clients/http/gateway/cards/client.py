@@ -2,8 +2,14 @@ from locust.env import Environment
 
 from httpx import Response
 
-from clients.http.client import HTTPClient
-from clients.http.gateway.client import build_gateway_http_client, build_gateway_locust_http_client
+from clients.http.client import AsyncHTTPClient, HTTPClient
+from clients.http.encoding import JSONBody, JSONBodyTemplate
+from clients.http.gateway.client import (
+    build_gateway_http_client,
+    build_gateway_locust_http_client,
+    build_gateway_async_http_client,
+    build_gateway_async_locust_http_client
+)
 from clients.http.gateway.cards.schema import (
     IssueVirtualCardRequestSchema,
     IssueVirtualCardResponseSchema,
@@ -11,41 +17,69 @@ from clients.http.gateway.cards.schema import (
     IssuePhysicalCardResponseSchema
 )
 
+# Тела запросов выпуска карт различаются только идентификаторами: сериализуем их один раз
+ISSUE_VIRTUAL_CARD_BODY = JSONBodyTemplate(IssueVirtualCardRequestSchema, "user_id", "account_id")
+ISSUE_PHYSICAL_CARD_BODY = JSONBodyTemplate(IssuePhysicalCardRequestSchema, "user_id", "account_id")
+
 
 class CardsGatewayHTTPClient(HTTPClient):
     """
     Клиент для взаимодействия с /api/v1/cards сервиса http-gateway.
     """
 
-    def issue_virtual_card_api(self, request: IssueVirtualCardRequestSchema) -> Response:
+    def issue_virtual_card_api(self, request: IssueVirtualCardRequestSchema | JSONBody) -> Response:
         """
         Выпуск виртуальной карты.
 
         :param request: Словарь с данными для выпуска виртуальной карты.
         :return: Ответ от сервера (объект httpx.Response).
         """
-        return self.post("/api/v1/cards/issue-virtual-card", json=request.model_dump(by_alias=True))
+        return self.post("/api/v1/cards/issue-virtual-card", json=request)
 
-    def issue_physical_card_api(self, request: IssuePhysicalCardRequestSchema) -> Response:
+    def issue_physical_card_api(self, request: IssuePhysicalCardRequestSchema | JSONBody) -> Response:
         """
         Выпуск физической карты.
 
         :param request: Словарь с данными для выпуска физической карты.
         :return: Ответ от сервера (объект httpx.Response).
         """
-        return self.post("/api/v1/cards/issue-physical-card", json=request.model_dump(by_alias=True))
+        return self.post("/api/v1/cards/issue-physical-card", json=request)
 
     # Добавили новый метод
     def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponseSchema:
-        request = IssueVirtualCardRequestSchema(user_id=user_id, account_id=account_id)
+        request = ISSUE_VIRTUAL_CARD_BODY.render(user_id=user_id, account_id=account_id)
         response = self.issue_virtual_card_api(request)
-        return IssueVirtualCardResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, IssueVirtualCardResponseSchema)
 
     # Добавили новый метод
     def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponseSchema:
-        request = IssuePhysicalCardRequestSchema(user_id=user_id, account_id=account_id)
+        request = ISSUE_PHYSICAL_CARD_BODY.render(user_id=user_id, account_id=account_id)
         response = self.issue_physical_card_api(request)
-        return IssuePhysicalCardResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, IssuePhysicalCardResponseSchema)
+
+
+class AsyncCardsGatewayHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/cards сервиса http-gateway.
+
+    Повторяет методы CardsGatewayHTTPClient и возвращает те же pydantic-схемы.
+    """
+
+    async def issue_virtual_card_api(self, request: IssueVirtualCardRequestSchema | JSONBody) -> Response:
+        return await self.post("/api/v1/cards/issue-virtual-card", json=request)
+
+    async def issue_physical_card_api(self, request: IssuePhysicalCardRequestSchema | JSONBody) -> Response:
+        return await self.post("/api/v1/cards/issue-physical-card", json=request)
+
+    async def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponseSchema:
+        request = ISSUE_VIRTUAL_CARD_BODY.render(user_id=user_id, account_id=account_id)
+        response = await self.issue_virtual_card_api(request)
+        return self.parse_response(response, IssueVirtualCardResponseSchema)
+
+    async def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponseSchema:
+        request = ISSUE_PHYSICAL_CARD_BODY.render(user_id=user_id, account_id=account_id)
+        response = await self.issue_physical_card_api(request)
+        return self.parse_response(response, IssuePhysicalCardResponseSchema)
 
 
 def build_cards_gateway_http_client() -> CardsGatewayHTTPClient:
@@ -58,4 +92,17 @@ def build_cards_gateway_http_client() -> CardsGatewayHTTPClient:
 
 
 def build_cards_gateway_locust_http_client(environment: Environment) -> CardsGatewayHTTPClient:
-    return CardsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
\ No newline at end of file
+    return CardsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+
+
+def build_cards_gateway_async_http_client() -> AsyncCardsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncCardsGatewayHTTPClient с уже настроенным httpx.AsyncClient.
+
+    :return: Готовый к использованию AsyncCardsGatewayHTTPClient.
+    """
+    return AsyncCardsGatewayHTTPClient(client=build_gateway_async_http_client())
+
+
+def build_cards_gateway_async_locust_http_client(environment: Environment) -> AsyncCardsGatewayHTTPClient:
+    return AsyncCardsGatewayHTTPClient(client=build_gateway_async_locust_http_client(environment))
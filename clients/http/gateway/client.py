@@ -1,24 +1,154 @@
 import logging
+from weakref import WeakKeyDictionary
 
-from httpx import Client
+from httpx import AsyncClient, BaseTransport, Client, Limits
 from locust.env import Environment  # Импорт окружения Locust для передачи в хуки
 
 from clients.http.event_hooks.locust_event_hook import (
+    ResponseLengthMode,
     locust_request_event_hook,  # Хук для отслеживания начала запроса
-    locust_response_event_hook  # Хук для сбора метрик по завершении запроса
+    locust_response_event_hook,  # Хук для сбора метрик по завершении запроса
+    locust_async_request_event_hook,
+    locust_async_response_event_hook
 )
+from clients.http.transport import RouteLimitedTransport, build_async_http_transport, build_http_transport
 
+# Настройки общего транспорта http-gateway: лимиты пула и лимиты маршрутов
+_gateway_transport_limits = Limits(max_connections=1000, max_keepalive_connections=200, keepalive_expiry=30)
+_gateway_route_limits: dict[str, int] = {}
 
-def build_gateway_http_client() -> Client:
+_gateway_max_concurrent_streams: int | None = None
+
+# Режим подсчёта длины ответа в метриках Locust: по умолчанию и по маршрутам
+_gateway_response_length_mode = ResponseLengthMode.CONTENT_LENGTH
+_gateway_route_length_modes: dict[str, ResponseLengthMode] = {}
+
+# Маршруты с большими ответами (документы, чеки), для которых обычно достаточно HEADERS_ONLY
+GATEWAY_LARGE_RESPONSE_ROUTES = (
+    "/api/v1/documents/tariff-document/{account_id}",
+    "/api/v1/documents/contract-document/{account_id}",
+    "/api/v1/operations/operation-receipt/{operation_id}",
+)
+
+# Общие на процесс транспорты (пулы соединений) по версии протокола: False — HTTP/1.1, True — HTTP/2
+_gateway_transports: dict[bool, BaseTransport] = {}
+
+# Один Locust-клиент на окружение и версию протокола: все пользователи процесса делят пул и хуки
+_gateway_locust_clients: WeakKeyDictionary[Environment, dict[bool, Client]] = WeakKeyDictionary()
+
+
+def configure_gateway_http_transport(
+        max_connections: int = 1000,
+        max_keepalive_connections: int = 200,
+        keepalive_expiry: float = 30,
+        route_limits: dict[str, int] | None = None,
+        max_concurrent_streams: int | None = None
+) -> None:
+    """
+    Настраивает общий на процесс транспорт для всех *GatewayHTTPClient.
+
+    Вызывается до старта нагрузки и до создания клиентов, например в обработчике `events.init` Locust.
+    Прежние транспорты и Locust-клиенты закрываются вместе с пулами соединений, поэтому клиенты,
+    созданные до вызова, перестают работать.
+
+    :param max_connections: Максимальное количество соединений в пуле.
+    :param max_keepalive_connections: Сколько простаивающих соединений держать открытыми.
+    :param keepalive_expiry: Через сколько секунд простоя закрывать keep-alive соединение.
+    :param route_limits: Лимиты одновременных запросов по маршрутам, например {"/api/v1/users": 50}.
+    :param max_concurrent_streams: Лимит одновременных HTTP/2-потоков на пул (действует только в режиме HTTP/2).
+    """
+    global _gateway_transport_limits, _gateway_route_limits, _gateway_max_concurrent_streams
+
+    _gateway_transport_limits = Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry
+    )
+    _gateway_route_limits = dict(route_limits or {})
+    _gateway_max_concurrent_streams = max_concurrent_streams
+
+    for clients in _gateway_locust_clients.values():
+        for client in clients.values():
+            client.close()
+    _gateway_locust_clients.clear()
+
+    for transport in _gateway_transports.values():
+        transport.close()
+    _gateway_transports.clear()
+
+
+def configure_gateway_locust_metrics(
+        response_length_mode: ResponseLengthMode = ResponseLengthMode.CONTENT_LENGTH,
+        route_length_modes: dict[str, ResponseLengthMode] | None = None
+) -> None:
+    """
+    Настраивает, как Locust-клиенты http-gateway считают `response_length`.
+
+    Пример — не учитывать тело больших документов и чеков, а мерить время до заголовков:
+    configure_gateway_locust_metrics(
+        route_length_modes=dict.fromkeys(GATEWAY_LARGE_RESPONSE_ROUTES, ResponseLengthMode.HEADERS_ONLY)
+    )
+
+    :param response_length_mode: Режим по умолчанию для всех маршрутов.
+    :param route_length_modes: Режимы для отдельных маршрутов (ключ — шаблон route).
+    """
+    global _gateway_response_length_mode, _gateway_route_length_modes
+
+    _gateway_response_length_mode = response_length_mode
+    _gateway_route_length_modes = dict(route_length_modes or {})
+    # Своего пула у Locust-клиентов нет: close() закрыл бы общий транспорт, которым пользуются и другие клиенты
+    _gateway_locust_clients.clear()
+
+
+def get_gateway_http_transport(http2: bool = False) -> BaseTransport:
+    """
+    Возвращает общий транспорт http-gateway, создавая его при первом обращении.
+
+    :param http2: Вернуть транспорт HTTP/2 вместо HTTP/1.1.
+    :return: Транспорт с общим пулом соединений.
+    """
+    transport = _gateway_transports.get(http2)
+    if transport is None:
+        transport = build_http_transport(
+            _gateway_transport_limits,
+            _gateway_route_limits,
+            http2=http2,
+            max_concurrent_streams=_gateway_max_concurrent_streams
+        )
+        _gateway_transports[http2] = transport
+
+    return transport
+
+
+def get_gateway_http2_stream_metrics() -> dict:
+    """
+    Возвращает метрики HTTP/2-потоков общего транспорта: сколько потоков активно и сколько
+    прошло через каждое соединение. Позволяет сравнить мультиплексирование с HTTP/1.1.
+
+    :return: Снимок метрик или пустой словарь, если HTTP/2-транспорт ещё не создавался.
+    """
+    transport = _gateway_transports.get(True)
+    if transport is None:
+        return {}
+
+    # Лимиты маршрутов оборачивают транспорт учёта потоков
+    if isinstance(transport, RouteLimitedTransport):
+        transport = transport.transport
+
+    return transport.stream_metrics()
+
+
+def build_gateway_http_client(http2: bool = False) -> Client:
     """
     Функция создаёт экземпляр httpx.Client с базовыми настройками для сервиса http-gateway.
 
+    :param http2: Включить HTTP/2: запросы мультиплексируются поверх нескольких соединений.
     :return: Готовый к использованию объект httpx.Client.
     """
-    return Client(timeout=100, base_url="http://localhost:8003")
+    return Client(timeout=100, base_url="http://localhost:8003", transport=get_gateway_http_transport(http2))
 
 
-def build_gateway_locust_http_client(environment: Environment) -> Client:
+def build_gateway_locust_http_client(environment: Environment, http2: bool = False) -> Client:
     """
     HTTP-клиент, предназначенный специально для нагрузочного тестирования с помощью Locust.
 
@@ -26,22 +156,82 @@ def build_gateway_locust_http_client(environment: Environment) -> Client:
     - добавляет хук `locust_request_event_hook` для фиксации времени начала запроса,
     - добавляет хук `locust_response_event_hook`, который вычисляет метрики
     (время ответа, длину ответа и т.д.) и отправляет их в Locust через `environment.events.request`.
+    Тело ответа хук не буферизует: длина берётся из Content-Length или считается по потоку
+    (см. `configure_gateway_locust_metrics`).
 
     Таким образом, данный клиент автоматически репортит статистику в Locust
     при каждом выполненном HTTP-запросе.
 
+    Клиент создаётся один раз на окружение и разделяется всеми виртуальными пользователями
+    процесса: у них общий пул соединений и общий набор хуков.
+
     :param environment: Объект окружения Locust, необходим для генерации событий метрик.
+    :param http2: Включить HTTP/2, чтобы сравнить пропускную способность с HTTP/1.1 в одном сценарии.
     :return: httpx.Client с подключёнными хуками под нагрузочное тестирование.
     """
     # Подавляем INFO-логи httpx (например: "HTTP Request: GET ... 200 OK")
     # Это избавляет консоль от лишнего вывода при высоконагруженных тестах
     logging.getLogger("httpx").setLevel(logging.WARNING)
 
-    return Client(
+    clients = _gateway_locust_clients.setdefault(environment, {})
+    client = clients.get(http2)
+    if client is None:
+        client = Client(
+            timeout=100,
+            base_url="http://localhost:8003",
+            transport=get_gateway_http_transport(http2),
+            event_hooks={
+                "request": [locust_request_event_hook],
+                "response": [
+                    locust_response_event_hook(
+                        environment, _gateway_response_length_mode, _gateway_route_length_modes
+                    )
+                ]
+            }
+        )
+        clients[http2] = client
+
+    return client
+
+
+def build_gateway_async_http_client() -> AsyncClient:
+    """
+    Функция создаёт экземпляр httpx.AsyncClient с базовыми настройками для сервиса http-gateway.
+
+    :return: Готовый к использованию объект httpx.AsyncClient.
+    """
+    return AsyncClient(
+        timeout=100,
+        base_url="http://localhost:8003",
+        transport=build_async_http_transport(_gateway_transport_limits, _gateway_route_limits)
+    )
+
+
+def build_gateway_async_locust_http_client(environment: Environment) -> AsyncClient:
+    """
+    Асинхронный HTTP-клиент для нагрузочного тестирования с помощью Locust.
+
+    Аналог `build_gateway_locust_http_client`, но на базе httpx.AsyncClient:
+    один процесс может держать тысячи одновременных запросов в полёте,
+    а метрики по-прежнему отправляются в Locust через асинхронные хуки.
+    Лимиты пула берутся из `configure_gateway_http_transport`, но сам пул у клиента свой:
+    асинхронный транспорт привязан к event loop.
+
+    :param environment: Объект окружения Locust, необходим для генерации событий метрик.
+    :return: httpx.AsyncClient с подключёнными хуками под нагрузочное тестирование.
+    """
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    return AsyncClient(
         timeout=100,
         base_url="http://localhost:8003",
+        transport=build_async_http_transport(_gateway_transport_limits, _gateway_route_limits),
         event_hooks={
-            "request": [locust_request_event_hook],
-            "response": [locust_response_event_hook(environment)]
+            "request": [locust_async_request_event_hook],
+            "response": [
+                locust_async_response_event_hook(
+                    environment, _gateway_response_length_mode, _gateway_route_length_modes
+                )
+            ]
         }
     )
@@ -1,10 +1,12 @@
 from locust.env import Environment
 from httpx import Response
 
-from clients.http.client import HTTPClient, HTTPClientExtensions
+from clients.http.client import AsyncHTTPClient, HTTPClient, HTTPClientExtensions
 from clients.http.gateway.client import (
     build_gateway_http_client,
-    build_gateway_locust_http_client
+    build_gateway_locust_http_client,
+    build_gateway_async_http_client,
+    build_gateway_async_locust_http_client
 )
 from clients.http.gateway.documents.schema import (
     GetTariffDocumentResponseSchema,
@@ -37,7 +39,7 @@ class DocumentsGatewayHTTPClient(HTTPClient):
         :param account_id: Идентификатор счёта.
         """
         response = self.get_tariff_document_api(account_id)
-        return GetTariffDocumentResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, GetTariffDocumentResponseSchema)
 
     def get_contract_document(self, account_id: str) -> GetContractDocumentResponseSchema:
         """
@@ -45,7 +47,35 @@ class DocumentsGatewayHTTPClient(HTTPClient):
         :param account_id: Идентификатор счёта.
         """
         response = self.get_contract_document_api(account_id)
-        return GetContractDocumentResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, GetContractDocumentResponseSchema)
+
+
+class AsyncDocumentsGatewayHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/documents сервиса http-gateway.
+    """
+
+    async def get_tariff_document_api(self, account_id: str) -> Response:
+        """GET /api/v1/documents/tariff-document/{account_id} — получить тариф по счёту."""
+        return await self.get(
+            f"/api/v1/documents/tariff-document/{account_id}",
+            extensions=HTTPClientExtensions(route="/api/v1/documents/tariff-document/{account_id}")
+        )
+
+    async def get_contract_document_api(self, account_id: str) -> Response:
+        """GET /api/v1/documents/contract-document/{account_id} — получить контракт по счёту."""
+        return await self.get(
+            f"/api/v1/documents/contract-document/{account_id}",
+            extensions=HTTPClientExtensions(route="/api/v1/documents/contract-document/{account_id}")
+        )
+
+    async def get_tariff_document(self, account_id: str) -> GetTariffDocumentResponseSchema:
+        response = await self.get_tariff_document_api(account_id)
+        return self.parse_response(response, GetTariffDocumentResponseSchema)
+
+    async def get_contract_document(self, account_id: str) -> GetContractDocumentResponseSchema:
+        response = await self.get_contract_document_api(account_id)
+        return self.parse_response(response, GetContractDocumentResponseSchema)
 
 
 def build_documents_gateway_http_client() -> DocumentsGatewayHTTPClient:
@@ -67,3 +97,21 @@ def build_documents_gateway_locust_http_client(environment: Environment) -> Docu
         :return: Экземпляр DocumentsGatewayHTTPClient с хуками сбора метрик.
         """
     return DocumentsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+
+
+def build_documents_gateway_async_http_client() -> AsyncDocumentsGatewayHTTPClient:
+    """
+    Возвращает готовый к использованию AsyncDocumentsGatewayHTTPClient.
+    """
+    return AsyncDocumentsGatewayHTTPClient(client=build_gateway_async_http_client())
+
+
+def build_documents_gateway_async_locust_http_client(environment: Environment) -> AsyncDocumentsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncDocumentsGatewayHTTPClient,
+    адаптированный под нагрузочное тестирование с помощью Locust.
+
+    :param environment: Объект окружения Locust.
+    :return: Экземпляр AsyncDocumentsGatewayHTTPClient с асинхронными хуками сбора метрик.
+    """
+    return AsyncDocumentsGatewayHTTPClient(client=build_gateway_async_locust_http_client(environment))
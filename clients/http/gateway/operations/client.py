@@ -1,10 +1,15 @@
+from typing import TYPE_CHECKING, TypeVar
+
 from locust.env import Environment
 from httpx import Response, QueryParams
 
-from clients.http.client import HTTPClient, HTTPClientExtensions
+from clients.http.client import AsyncHTTPClient, HTTPClient, HTTPClientExtensions
+from clients.http.parsing import LazyModelList
 from clients.http.gateway.client import (
     build_gateway_http_client,
-    build_gateway_locust_http_client)
+    build_gateway_locust_http_client,
+    build_gateway_async_http_client,
+    build_gateway_async_locust_http_client)
 from clients.http.gateway.operations.schema import (
     GetOperationResponseSchema,
     GetOperationReceiptResponseSchema,
@@ -12,6 +17,7 @@ from clients.http.gateway.operations.schema import (
     GetOperationsResponseSchema,
     GetOperationsSummaryQuerySchema,
     GetOperationsSummaryResponseSchema,
+    OperationSchema,
     MakeFeeOperationRequestSchema,
     MakeFeeOperationResponseSchema,
     MakeTopUpOperationRequestSchema,
@@ -26,8 +32,41 @@ from clients.http.gateway.operations.schema import (
     MakeBillPaymentOperationResponseSchema,
     MakeCashWithdrawalOperationRequestSchema,
     MakeCashWithdrawalOperationResponseSchema,
+    MakeOperationRequestSchema,
 )
 
+if TYPE_CHECKING:
+    # tools.payloads тянет NumPy: при обычных вызовах клиента он не нужен
+    from tools.payloads import OperationPayload
+
+RequestSchema = TypeVar("RequestSchema", bound=MakeOperationRequestSchema)
+
+
+def build_operation_request(
+        schema: type[RequestSchema],
+        card_id: str,
+        account_id: str,
+        payload: "OperationPayload | None" = None
+) -> RequestSchema:
+    """
+    Собирает тело запроса на создание операции.
+
+    :param schema: Схема запроса, например MakeTopUpOperationRequestSchema.
+    :param card_id: Идентификатор карты.
+    :param account_id: Идентификатор счёта.
+    :param payload: Заранее сгенерированные статус, сумма и категория (см. tools/payloads.py);
+        None — значения генерирует Faker в фабриках полей схемы.
+    :return: Экземпляр схемы.
+    """
+    if payload is None:
+        return schema(card_id=card_id, account_id=account_id)
+
+    values = {"status": payload.status, "amount": payload.amount}
+    if "category" in schema.model_fields:
+        values["category"] = payload.category
+
+    return schema(card_id=card_id, account_id=account_id, **values)
+
 
 class OperationsGatewayHTTPClient(HTTPClient):
     """
@@ -63,98 +102,314 @@ class OperationsGatewayHTTPClient(HTTPClient):
     def make_fee_operation_api(self, request: MakeFeeOperationRequestSchema) -> Response:
         return self.post(
             "/api/v1/operations/make-fee-operation",
-            json=request.model_dump(by_alias=True)
+            json=request
         )
 
     def make_top_up_operation_api(self, request: MakeTopUpOperationRequestSchema) -> Response:
         return self.post(
             "/api/v1/operations/make-top-up-operation",
-            json=request.model_dump(by_alias=True)
+            json=request
         )
 
     def make_cashback_operation_api(self, request: MakeCashbackOperationRequestSchema) -> Response:
         return self.post(
             "/api/v1/operations/make-cashback-operation",
-            json=request.model_dump(by_alias=True)
+            json=request
         )
 
     def make_transfer_operation_api(self, request: MakeTransferOperationRequestSchema) -> Response:
         return self.post(
             "/api/v1/operations/make-transfer-operation",
-            json=request.model_dump(by_alias=True)
+            json=request
         )
 
     def make_purchase_operation_api(self, request: MakePurchaseOperationRequestSchema) -> Response:
         return self.post(
             "/api/v1/operations/make-purchase-operation",
-            json=request.model_dump(by_alias=True)
+            json=request
         )
 
     def make_bill_payment_operation_api(self, request: MakeBillPaymentOperationRequestSchema) -> Response:
         return self.post(
             "/api/v1/operations/make-bill-payment-operation",
-            json=request.model_dump(by_alias=True)
+            json=request
         )
 
     def make_cash_withdrawal_operation_api(self, request: MakeCashWithdrawalOperationRequestSchema) -> Response:
         return self.post(
             "/api/v1/operations/make-cash-withdrawal-operation",
-            json=request.model_dump(by_alias=True)
+            json=request
         )
 
     def get_operation(self, operation_id: str) -> GetOperationResponseSchema:
         response = self.get_operation_api(operation_id)
-        return GetOperationResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, GetOperationResponseSchema)
 
     def get_operation_receipt(self, operation_id: str) -> GetOperationReceiptResponseSchema:
         response = self.get_operation_receipt_api(operation_id)
-        return GetOperationReceiptResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, GetOperationReceiptResponseSchema)
 
     def get_operations(self, account_id: str) -> GetOperationsResponseSchema:
         query = GetOperationsQuerySchema(account_id=account_id)
         response = self.get_operations_api(query)
-        return GetOperationsResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, GetOperationsResponseSchema)
+
+    def get_operations_lazy(self, account_id: str) -> LazyModelList[OperationSchema]:
+        """
+        Как get_operations, но операции разбираются по одной при обращении к ним.
+        Подходит, когда сценарию нужна только первая операция или проход без накопления списка.
+        """
+        query = GetOperationsQuerySchema(account_id=account_id)
+        response = self.get_operations_api(query)
+        return self.parse_lazy_list(response, "operations", OperationSchema)
 
     def get_operations_summary(self, account_id: str) -> GetOperationsSummaryResponseSchema:
         query = GetOperationsSummaryQuerySchema(account_id=account_id)
         response = self.get_operations_summary_api(query)
-        return GetOperationsSummaryResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, GetOperationsSummaryResponseSchema)
 
-    def make_fee_operation(self, card_id: str, account_id: str) -> MakeFeeOperationResponseSchema:
-        request = MakeFeeOperationRequestSchema(card_id=card_id, account_id=account_id)
+    def make_fee_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            payload: "OperationPayload | None" = None
+    ) -> MakeFeeOperationResponseSchema:
+        request = build_operation_request(MakeFeeOperationRequestSchema, card_id, account_id, payload)
         response = self.make_fee_operation_api(request)
-        return MakeFeeOperationResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, MakeFeeOperationResponseSchema)
 
-    def make_top_up_operation(self, card_id: str, account_id: str) -> MakeTopUpOperationResponseSchema:
-        request = MakeTopUpOperationRequestSchema(card_id=card_id, account_id=account_id)
+    def make_top_up_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            payload: "OperationPayload | None" = None
+    ) -> MakeTopUpOperationResponseSchema:
+        request = build_operation_request(MakeTopUpOperationRequestSchema, card_id, account_id, payload)
         response = self.make_top_up_operation_api(request)
-        return MakeTopUpOperationResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, MakeTopUpOperationResponseSchema)
 
-    def make_cashback_operation(self, card_id: str, account_id: str) -> MakeCashbackOperationResponseSchema:
-        request = MakeCashbackOperationRequestSchema(card_id=card_id, account_id=account_id)
+    def make_cashback_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            payload: "OperationPayload | None" = None
+    ) -> MakeCashbackOperationResponseSchema:
+        request = build_operation_request(MakeCashbackOperationRequestSchema, card_id, account_id, payload)
         response = self.make_cashback_operation_api(request)
-        return MakeCashbackOperationResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, MakeCashbackOperationResponseSchema)
 
-    def make_transfer_operation(self, card_id: str, account_id: str) -> MakeTransferOperationResponseSchema:
-        request = MakeTransferOperationRequestSchema(card_id=card_id, account_id=account_id)
+    def make_transfer_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            payload: "OperationPayload | None" = None
+    ) -> MakeTransferOperationResponseSchema:
+        request = build_operation_request(MakeTransferOperationRequestSchema, card_id, account_id, payload)
         response = self.make_transfer_operation_api(request)
-        return MakeTransferOperationResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, MakeTransferOperationResponseSchema)
 
-    def make_purchase_operation(self, card_id: str, account_id: str) -> MakePurchaseOperationResponseSchema:
-        # category генерируется в модели через fake.category()
-        request = MakePurchaseOperationRequestSchema(card_id=card_id, account_id=account_id)
+    def make_purchase_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            payload: "OperationPayload | None" = None
+    ) -> MakePurchaseOperationResponseSchema:
+        request = build_operation_request(MakePurchaseOperationRequestSchema, card_id, account_id, payload)
         response = self.make_purchase_operation_api(request)
-        return MakePurchaseOperationResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, MakePurchaseOperationResponseSchema)
 
-    def make_bill_payment_operation(self, card_id: str, account_id: str) -> MakeBillPaymentOperationResponseSchema:
-        request = MakeBillPaymentOperationRequestSchema(card_id=card_id, account_id=account_id)
+    def make_bill_payment_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            payload: "OperationPayload | None" = None
+    ) -> MakeBillPaymentOperationResponseSchema:
+        request = build_operation_request(MakeBillPaymentOperationRequestSchema, card_id, account_id, payload)
         response = self.make_bill_payment_operation_api(request)
-        return MakeBillPaymentOperationResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, MakeBillPaymentOperationResponseSchema)
 
-    def make_cash_withdrawal_operation(self, card_id: str, account_id: str) -> MakeCashWithdrawalOperationResponseSchema:
-        request = MakeCashWithdrawalOperationRequestSchema(card_id=card_id, account_id=account_id)
+    def make_cash_withdrawal_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            payload: "OperationPayload | None" = None
+    ) -> MakeCashWithdrawalOperationResponseSchema:
+        request = build_operation_request(MakeCashWithdrawalOperationRequestSchema, card_id, account_id, payload)
         response = self.make_cash_withdrawal_operation_api(request)
-        return MakeCashWithdrawalOperationResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, MakeCashWithdrawalOperationResponseSchema)
+
+
+class AsyncOperationsGatewayHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/operations сервиса http-gateway.
+
+    Повторяет методы OperationsGatewayHTTPClient и возвращает те же pydantic-схемы.
+    """
+
+    async def get_operation_api(self, operation_id: str) -> Response:
+        return await self.get(
+            f"/api/v1/operations/{operation_id}",
+            extensions=HTTPClientExtensions(route="/api/v1/operations/{operation_id}")
+        )
+
+    async def get_operation_receipt_api(self, operation_id: str) -> Response:
+        return await self.get(
+            f"/api/v1/operations/operation-receipt/{operation_id}",
+            extensions=HTTPClientExtensions(route="/api/v1/operations/operation-receipt/{operation_id}")
+        )
+
+    async def get_operations_api(self, query: GetOperationsQuerySchema) -> Response:
+        return await self.get(
+            "/api/v1/operations",
+            params=QueryParams(**query.model_dump(by_alias=True)),
+            extensions=HTTPClientExtensions(route="/api/v1/operations")
+        )
+
+    async def get_operations_summary_api(self, query: GetOperationsSummaryQuerySchema) -> Response:
+        return await self.get(
+            "/api/v1/operations/operations-summary",
+            params=QueryParams(**query.model_dump(by_alias=True)),
+            extensions=HTTPClientExtensions(route="/api/v1/operations/operations-summary")
+        )
+
+    async def make_fee_operation_api(self, request: MakeFeeOperationRequestSchema) -> Response:
+        return await self.post(
+            "/api/v1/operations/make-fee-operation",
+            json=request
+        )
+
+    async def make_top_up_operation_api(self, request: MakeTopUpOperationRequestSchema) -> Response:
+        return await self.post(
+            "/api/v1/operations/make-top-up-operation",
+            json=request
+        )
+
+    async def make_cashback_operation_api(self, request: MakeCashbackOperationRequestSchema) -> Response:
+        return await self.post(
+            "/api/v1/operations/make-cashback-operation",
+            json=request
+        )
+
+    async def make_transfer_operation_api(self, request: MakeTransferOperationRequestSchema) -> Response:
+        return await self.post(
+            "/api/v1/operations/make-transfer-operation",
+            json=request
+        )
+
+    async def make_purchase_operation_api(self, request: MakePurchaseOperationRequestSchema) -> Response:
+        return await self.post(
+            "/api/v1/operations/make-purchase-operation",
+            json=request
+        )
+
+    async def make_bill_payment_operation_api(self, request: MakeBillPaymentOperationRequestSchema) -> Response:
+        return await self.post(
+            "/api/v1/operations/make-bill-payment-operation",
+            json=request
+        )
+
+    async def make_cash_withdrawal_operation_api(self, request: MakeCashWithdrawalOperationRequestSchema) -> Response:
+        return await self.post(
+            "/api/v1/operations/make-cash-withdrawal-operation",
+            json=request
+        )
+
+    async def get_operation(self, operation_id: str) -> GetOperationResponseSchema:
+        response = await self.get_operation_api(operation_id)
+        return self.parse_response(response, GetOperationResponseSchema)
+
+    async def get_operation_receipt(self, operation_id: str) -> GetOperationReceiptResponseSchema:
+        response = await self.get_operation_receipt_api(operation_id)
+        return self.parse_response(response, GetOperationReceiptResponseSchema)
+
+    async def get_operations(self, account_id: str) -> GetOperationsResponseSchema:
+        query = GetOperationsQuerySchema(account_id=account_id)
+        response = await self.get_operations_api(query)
+        return self.parse_response(response, GetOperationsResponseSchema)
+
+    async def get_operations_lazy(self, account_id: str) -> LazyModelList[OperationSchema]:
+        """
+        Как get_operations, но операции разбираются по одной при обращении к ним.
+        Подходит, когда сценарию нужна только первая операция или проход без накопления списка.
+        """
+        query = GetOperationsQuerySchema(account_id=account_id)
+        response = await self.get_operations_api(query)
+        return self.parse_lazy_list(response, "operations", OperationSchema)
+
+    async def get_operations_summary(self, account_id: str) -> GetOperationsSummaryResponseSchema:
+        query = GetOperationsSummaryQuerySchema(account_id=account_id)
+        response = await self.get_operations_summary_api(query)
+        return self.parse_response(response, GetOperationsSummaryResponseSchema)
+
+    async def make_fee_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            payload: "OperationPayload | None" = None
+    ) -> MakeFeeOperationResponseSchema:
+        request = build_operation_request(MakeFeeOperationRequestSchema, card_id, account_id, payload)
+        response = await self.make_fee_operation_api(request)
+        return self.parse_response(response, MakeFeeOperationResponseSchema)
+
+    async def make_top_up_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            payload: "OperationPayload | None" = None
+    ) -> MakeTopUpOperationResponseSchema:
+        request = build_operation_request(MakeTopUpOperationRequestSchema, card_id, account_id, payload)
+        response = await self.make_top_up_operation_api(request)
+        return self.parse_response(response, MakeTopUpOperationResponseSchema)
+
+    async def make_cashback_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            payload: "OperationPayload | None" = None
+    ) -> MakeCashbackOperationResponseSchema:
+        request = build_operation_request(MakeCashbackOperationRequestSchema, card_id, account_id, payload)
+        response = await self.make_cashback_operation_api(request)
+        return self.parse_response(response, MakeCashbackOperationResponseSchema)
+
+    async def make_transfer_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            payload: "OperationPayload | None" = None
+    ) -> MakeTransferOperationResponseSchema:
+        request = build_operation_request(MakeTransferOperationRequestSchema, card_id, account_id, payload)
+        response = await self.make_transfer_operation_api(request)
+        return self.parse_response(response, MakeTransferOperationResponseSchema)
+
+    async def make_purchase_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            payload: "OperationPayload | None" = None
+    ) -> MakePurchaseOperationResponseSchema:
+        request = build_operation_request(MakePurchaseOperationRequestSchema, card_id, account_id, payload)
+        response = await self.make_purchase_operation_api(request)
+        return self.parse_response(response, MakePurchaseOperationResponseSchema)
+
+    async def make_bill_payment_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            payload: "OperationPayload | None" = None
+    ) -> MakeBillPaymentOperationResponseSchema:
+        request = build_operation_request(MakeBillPaymentOperationRequestSchema, card_id, account_id, payload)
+        response = await self.make_bill_payment_operation_api(request)
+        return self.parse_response(response, MakeBillPaymentOperationResponseSchema)
+
+    async def make_cash_withdrawal_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            payload: "OperationPayload | None" = None
+    ) -> MakeCashWithdrawalOperationResponseSchema:
+        request = build_operation_request(MakeCashWithdrawalOperationRequestSchema, card_id, account_id, payload)
+        response = await self.make_cash_withdrawal_operation_api(request)
+        return self.parse_response(response, MakeCashWithdrawalOperationResponseSchema)
 
 
 def build_operations_gateway_http_client() -> OperationsGatewayHTTPClient:
@@ -173,3 +428,18 @@ def build_operations_gateway_locust_http_client(environment: Environment) -> Ope
         :return: Экземпляр OperationsGatewayHTTPClient с подключёнными хуками метрик.
         """
     return OperationsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+
+
+def build_operations_gateway_async_http_client() -> AsyncOperationsGatewayHTTPClient:
+    return AsyncOperationsGatewayHTTPClient(client=build_gateway_async_http_client())
+
+
+def build_operations_gateway_async_locust_http_client(environment: Environment) -> AsyncOperationsGatewayHTTPClient:
+    """
+        Функция создаёт экземпляр AsyncOperationsGatewayHTTPClient,
+        адаптированный под нагрузочное тестирование с Locust.
+
+        :param environment: Объект окружения Locust.
+        :return: Экземпляр AsyncOperationsGatewayHTTPClient с асинхронными хуками метрик.
+        """
+    return AsyncOperationsGatewayHTTPClient(client=build_gateway_async_locust_http_client(environment))
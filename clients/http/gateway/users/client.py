@@ -1,10 +1,12 @@
 from locust.env import Environment
 from httpx import Response
 
-from clients.http.client import HTTPClient, HTTPClientExtensions
+from clients.http.client import AsyncHTTPClient, HTTPClient, HTTPClientExtensions
 from clients.http.gateway.client import (
     build_gateway_http_client,
-    build_gateway_locust_http_client
+    build_gateway_locust_http_client,
+    build_gateway_async_http_client,
+    build_gateway_async_locust_http_client
 )
 
 from clients.http.gateway.users.schema import (
@@ -24,18 +26,48 @@ class UsersGatewayHTTPClient(HTTPClient):
     def create_user_api(self, request) -> Response:
         return self.post(
             "/api/v1/users",
-            json=request.model_dump(by_alias=True),
+            json=request,
             extensions=HTTPClientExtensions(route="/api/v1/users")
         )
 
     def get_user(self, user_id: str) -> GetUserResponseSchema:
         response = self.get_user_api(user_id)
-        return GetUserResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, GetUserResponseSchema)
 
     def create_user(self) -> CreateUserResponseSchema:
         request = CreateUserRequestSchema()
         response = self.create_user_api(request)
-        return CreateUserResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, CreateUserResponseSchema)
+
+
+class AsyncUsersGatewayHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/users сервиса http-gateway.
+
+    Повторяет методы UsersGatewayHTTPClient и возвращает те же pydantic-схемы.
+    """
+
+    async def get_user_api(self, user_id: str) -> Response:
+        return await self.get(
+            f"/api/v1/users/{user_id}",
+            extensions=HTTPClientExtensions(route="/api/v1/users/{user_id}")
+        )
+
+    async def create_user_api(self, request: CreateUserRequestSchema) -> Response:
+        return await self.post(
+            "/api/v1/users",
+            json=request,
+            extensions=HTTPClientExtensions(route="/api/v1/users")
+        )
+
+    async def get_user(self, user_id: str) -> GetUserResponseSchema:
+        response = await self.get_user_api(user_id)
+        return self.parse_response(response, GetUserResponseSchema)
+
+    async def create_user(self) -> CreateUserResponseSchema:
+        request = CreateUserRequestSchema()
+        response = await self.create_user_api(request)
+        return self.parse_response(response, CreateUserResponseSchema)
 
 
 def build_users_gateway_http_client() -> UsersGatewayHTTPClient:
@@ -47,7 +79,7 @@ def build_users_gateway_http_client() -> UsersGatewayHTTPClient:
     return UsersGatewayHTTPClient(client=build_gateway_http_client())
 
 
-def build_users_gateway_locust_http_client(environment: Environment) -> UsersGatewayHTTPClient:
+def build_users_gateway_locust_http_client(environment: Environment, trusted: bool = False) -> UsersGatewayHTTPClient:
     """
     Функция создаёт экземпляр UsersGatewayHTTPClient адаптированного под Locust.
 
@@ -55,6 +87,28 @@ def build_users_gateway_locust_http_client(environment: Environment) -> UsersGat
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param trusted: собирать ответы через `model_construct` без проверки EmailStr (быстрее под нагрузкой).
     :return: экземпляр UsersGatewayHTTPClient с хуками сбора метрик.
     """
-    return UsersGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+    return UsersGatewayHTTPClient(client=build_gateway_locust_http_client(environment), trusted=trusted)
+
+
+
+def build_users_gateway_async_http_client() -> AsyncUsersGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncUsersGatewayHTTPClient с уже настроенным httpx.AsyncClient.
+
+    :return: Готовый к использованию AsyncUsersGatewayHTTPClient.
+    """
+    return AsyncUsersGatewayHTTPClient(client=build_gateway_async_http_client())
+
+
+def build_users_gateway_async_locust_http_client(environment: Environment, trusted: bool = False) -> AsyncUsersGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncUsersGatewayHTTPClient адаптированного под Locust.
+
+    :param environment: объект окружения Locust.
+    :param trusted: собирать ответы через `model_construct` без проверки EmailStr (быстрее под нагрузкой).
+    :return: экземпляр AsyncUsersGatewayHTTPClient с асинхронными хуками сбора метрик.
+    """
+    return AsyncUsersGatewayHTTPClient(client=build_gateway_async_locust_http_client(environment), trusted=trusted)
@@ -0,0 +1,334 @@
+import json
+import re
+import types
+import typing
+from collections.abc import Iterator, Sequence
+from functools import cache
+from typing import Any, TypeVar
+
+from httpx import Response
+from pydantic import BaseModel, EmailStr, TypeAdapter
+from pydantic_core import from_json
+
+T = TypeVar("T", bound=BaseModel)
+
+
+@cache
+def get_type_adapter(schema: type[T]) -> TypeAdapter[T]:
+    """
+    Возвращает закешированный TypeAdapter для схемы ответа.
+
+    :param schema: Pydantic-схема ответа.
+    :return: TypeAdapter, создаваемый один раз на схему.
+    """
+    return TypeAdapter(schema)
+
+
+def get_nested_model(annotation: Any) -> tuple[type[BaseModel] | None, bool]:
+    """
+    Определяет, содержит ли аннотация поля вложенную модель.
+
+    :param annotation: Аннотация поля, например `AccountSchema`, `list[CardSchema]` или `CardSchema | None`.
+    :return: Кортеж (вложенная модель или None, является ли поле списком моделей).
+    """
+    origin = typing.get_origin(annotation)
+    if origin in (typing.Union, types.UnionType):
+        for argument in typing.get_args(annotation):
+            model, is_list = get_nested_model(argument)
+            if model is not None:
+                return model, is_list
+
+        return None, False
+
+    if origin is list:
+        arguments = typing.get_args(annotation)
+        model = arguments[0] if arguments else None
+        if isinstance(model, type) and issubclass(model, BaseModel):
+            return model, True
+
+        return None, False
+
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation, False
+
+    return None, False
+
+
+@cache
+def get_construct_plan(schema: type[BaseModel]) -> tuple[tuple[str, str, type[BaseModel] | None, bool], ...]:
+    """
+    Строит и кеширует план сборки модели без валидации.
+
+    :param schema: Pydantic-схема.
+    :return: Кортеж (имя поля, ключ в JSON, вложенная модель, список ли это) для каждого поля.
+    """
+    plan = []
+    for name, field in schema.model_fields.items():
+        model, is_list = get_nested_model(field.annotation)
+        plan.append((name, field.alias or name, model, is_list))
+
+    return tuple(plan)
+
+
+def is_email_annotation(annotation: Any) -> bool:
+    if typing.get_origin(annotation) in (typing.Union, types.UnionType):
+        return any(is_email_annotation(argument) for argument in typing.get_args(annotation))
+
+    return annotation is EmailStr
+
+
+@cache
+def is_construct_faster(schema: type[BaseModel]) -> bool:
+    """
+    Определяет, быстрее ли собрать схему через `model_construct`, чем провалидировать.
+
+    Валидатор pydantic-core на Rust обгоняет сборку моделей на Python почти для всех схем gateway
+    (списки операций и счетов валидируются в несколько раз быстрее, чем собираются).
+    Исключение — поля EmailStr: их проверяет email-validator на Python, и ответ с пользователем
+    собирается примерно в 8 раз быстрее, чем валидируется. Другие поля в таких схемах — строки,
+    поэтому собранная модель не отличается от провалидированной.
+
+    :param schema: Pydantic-схема.
+    :return: True, если в схеме или во вложенных моделях есть поле EmailStr.
+    """
+    for name, field in schema.model_fields.items():
+        if is_email_annotation(field.annotation):
+            return True
+
+        model, _ = get_nested_model(field.annotation)
+        if model is not None and is_construct_faster(model):
+            return True
+
+    return False
+
+
+def construct_model(schema: type[T], data: dict) -> T:
+    """
+    Рекурсивно собирает модель через `model_construct`, без валидации и приведения типов.
+
+    Вложенные модели и списки моделей тоже собираются, остальные значения остаются
+    такими, как пришли в JSON (например, enum и datetime остаются строками).
+
+    :param schema: Pydantic-схема.
+    :param data: Разобранный JSON-объект.
+    :return: Экземпляр схемы.
+    """
+    values = {}
+    for name, key, model, is_list in get_construct_plan(schema):
+        if key not in data:
+            continue
+
+        value = data[key]
+        if model is not None and value is not None:
+            value = [construct_model(model, item) for item in value] if is_list else construct_model(model, value)
+
+        values[name] = value
+
+    return schema.model_construct(**values)
+
+
+def parse_response(response: Response, schema: type[T], trusted: bool = False) -> T:
+    """
+    Разбирает тело ответа в pydantic-схему прямо из байтов, без промежуточного `response.text`.
+
+    :param response: Ответ httpx.
+    :param schema: Pydantic-схема ответа.
+    :param trusted: Доверять ответу и не валидировать схемы, которые быстрее собрать
+        через `model_construct` (см. `is_construct_faster`); остальные схемы валидируются всегда.
+    :return: Экземпляр схемы.
+    """
+    if trusted and is_construct_faster(schema):
+        return construct_model(schema, from_json(response.content))
+
+    return get_type_adapter(schema).validate_json(response.content)
+
+
+# Строка JSON целиком, с учётом экранированных символов
+_STRING = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"')
+# Всё до ближайшей скобки вне строки: строки и остальные символы проходятся одним вызовом
+_SKIP_TO_BRACKET = re.compile(rb'(?:[^"{}\[\]]+|"[^"\\]*(?:\\.[^"\\]*)*")*')
+# Число, true, false или null — до ближайшего разделителя
+_SCALAR = re.compile(rb'[^,\]}\s]+')
+_WHITESPACE = re.compile(rb'[ \t\n\r]*')
+
+
+def skip_whitespace(data: bytes, index: int) -> int:
+    return _WHITESPACE.match(data, index).end()
+
+
+def skip_string(data: bytes, index: int) -> int:
+    match = _STRING.match(data, index)
+    if match is None:
+        raise ValueError(f"Незакрытая строка на позиции {index}")
+
+    return match.end()
+
+
+def skip_value(data: bytes, index: int) -> int:
+    """
+    Пропускает одно значение JSON, не создавая объектов Python.
+
+    Объекты и массивы проходятся по скобкам: регулярное выражение перескакивает к следующей скобке
+    вне строки, так что скобки внутри строк не учитываются.
+
+    :param data: JSON-документ.
+    :param index: Позиция первого символа значения.
+    :return: Позиция сразу после значения.
+    """
+    first = data[index:index + 1]
+    if first == b'"':
+        return skip_string(data, index)
+
+    if first not in (b"{", b"["):
+        match = _SCALAR.match(data, index)
+        if match is None:
+            raise ValueError(f"Ожидалось значение на позиции {index}")
+
+        return match.end()
+
+    depth = 0
+    while True:
+        index = _SKIP_TO_BRACKET.match(data, index).end()
+        char = data[index:index + 1]
+        if char in (b"{", b"["):
+            depth += 1
+        elif char in (b"}", b"]"):
+            depth -= 1
+        else:
+            # Конец документа или незакрытая строка
+            raise ValueError(f"Неожиданный конец JSON на позиции {index}")
+
+        index += 1
+        if depth == 0:
+            return index
+
+
+def find_array(data: bytes, key: str) -> int:
+    """
+    Находит начало массива `key` в JSON-объекте верхнего уровня, не разбирая сам массив.
+
+    Значения других ключей пропускаются через `skip_value`.
+
+    :param data: JSON-документ.
+    :param key: Ключ массива, например "operations".
+    :return: Позиция сразу после открывающей скобки `[`.
+    """
+    index = skip_whitespace(data, 0)
+    if data[index:index + 1] != b"{":
+        raise ValueError("Ожидался JSON-объект")
+
+    index = skip_whitespace(data, index + 1)
+    while data[index:index + 1] != b"}":
+        end = skip_string(data, index)
+        name = json.loads(data[index:end])
+        index = skip_whitespace(data, end)
+        if data[index:index + 1] != b":":
+            raise ValueError(f"Ожидался ':' на позиции {index}")
+
+        index = skip_whitespace(data, index + 1)
+        if name == key:
+            if data[index:index + 1] != b"[":
+                raise ValueError(f"Значение '{key}' не является массивом")
+
+            return index + 1
+
+        index = skip_whitespace(data, skip_value(data, index))
+        if data[index:index + 1] == b",":
+            index = skip_whitespace(data, index + 1)
+
+    raise KeyError(key)
+
+
+class LazyModelList(Sequence[T]):
+    """
+    Ленивое представление списка моделей в JSON-ответе.
+
+    Хранит исходные байты ответа и валидирует элемент только при обращении к нему:
+    `items[0]` валидирует лишь первый элемент, итерация выдаёт элементы потоком.
+    Элементы, до которых нужно дойти, пропускаются по скобкам без построения объектов Python.
+    Границы уже найденных элементов кешируются, сами модели — нет, чтобы не держать их в памяти.
+    """
+
+    def __init__(self, data: bytes, start: int, schema: type[T], trusted: bool = False):
+        """
+        :param data: JSON-документ (тело ответа, без копирования).
+        :param start: Позиция сразу после `[` нужного массива.
+        :param schema: Pydantic-схема элемента, например OperationSchema.
+        :param trusted: Собирать элементы без валидации, если так быстрее (см. `is_construct_faster`).
+        """
+        self.data = data
+        self.schema = schema
+        self.trusted = trusted and is_construct_faster(schema)
+        self.spans: list[tuple[int, int]] = []
+        self.position = skip_whitespace(data, start)
+        self.exhausted = data[self.position:self.position + 1] == b"]"
+
+    def parse_item(self, span: tuple[int, int]) -> T:
+        item = self.data[span[0]:span[1]]
+        if self.trusted:
+            return construct_model(self.schema, from_json(item))
+
+        return get_type_adapter(self.schema).validate_json(item)
+
+    def scan_next(self) -> tuple[int, int] | None:
+        """
+        Находит границы следующего ещё не просмотренного элемента массива, не разбирая его.
+
+        :return: Начало и конец элемента или None, если массив закончился.
+        """
+        if self.exhausted:
+            return None
+
+        span = (self.position, skip_value(self.data, self.position))
+        self.spans.append(span)
+
+        index = skip_whitespace(self.data, span[1])
+        if self.data[index:index + 1] == b",":
+            self.position = skip_whitespace(self.data, index + 1)
+        elif self.data[index:index + 1] == b"]":
+            self.exhausted = True
+        else:
+            raise ValueError(f"Ожидался ',' или ']' на позиции {index}")
+
+        return span
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+
+        while index >= len(self.spans) and self.scan_next() is not None:
+            pass
+
+        if index < 0 or index >= len(self.spans):
+            raise IndexError("LazyModelList index out of range")
+
+        return self.parse_item(self.spans[index])
+
+    def __iter__(self) -> Iterator[T]:
+        for span in list(self.spans):
+            yield self.parse_item(span)
+
+        while (span := self.scan_next()) is not None:
+            yield self.parse_item(span)
+
+    def __len__(self) -> int:
+        while self.scan_next() is not None:
+            pass
+
+        return len(self.spans)
+
+
+def parse_lazy_list(response: Response, key: str, schema: type[T], trusted: bool = False) -> LazyModelList[T]:
+    """
+    Возвращает ленивый список моделей из массива `key` ответа.
+
+    :param response: Ответ httpx, например на GET /api/v1/operations.
+    :param key: Ключ массива в ответе, например "operations".
+    :param schema: Pydantic-схема элемента.
+    :param trusted: Собирать элементы без валидации, если так быстрее.
+    :return: LazyModelList.
+    """
+    return LazyModelList(response.content, find_array(response.content, key), schema, trusted)
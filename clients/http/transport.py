@@ -0,0 +1,276 @@
+import asyncio
+import itertools
+import threading
+from dataclasses import asdict, dataclass
+from typing import Callable
+from weakref import WeakKeyDictionary
+
+from httpx import (
+    AsyncBaseTransport,
+    AsyncByteStream,
+    AsyncHTTPTransport,
+    BaseTransport,
+    HTTPTransport,
+    Limits,
+    Request,
+    Response,
+    SyncByteStream
+)
+
+
+class ReleasingByteStream(SyncByteStream):
+    """
+    Обёртка над потоком тела ответа, которая освобождает слот маршрута при закрытии потока.
+
+    Соединение возвращается в пул только после чтения тела, поэтому и лимит
+    маршрута освобождается не раньше этого момента.
+    """
+
+    def __init__(self, stream: SyncByteStream, release: Callable[[], None]):
+        self.stream = stream
+        self.release = release
+        self.released = False
+
+    def __iter__(self):
+        yield from self.stream
+
+    def close(self) -> None:
+        try:
+            self.stream.close()
+        finally:
+            if not self.released:
+                self.released = True
+                self.release()
+
+
+class AsyncReleasingByteStream(AsyncByteStream):
+    """
+    Асинхронный аналог ReleasingByteStream.
+    """
+
+    def __init__(self, stream: AsyncByteStream, release: Callable[[], None]):
+        self.stream = stream
+        self.release = release
+        self.released = False
+
+    async def __aiter__(self):
+        async for chunk in self.stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self.stream.aclose()
+        finally:
+            if not self.released:
+                self.released = True
+                self.release()
+
+
+class RouteLimitedTransport(BaseTransport):
+    """
+    HTTPX-транспорт, ограничивающий количество одновременных запросов (а значит и соединений)
+    на отдельные маршруты поверх общего пула соединений.
+
+    Маршрут берётся из `request.extensions["route"]`, а если он не задан — из пути URL.
+    Маршруты без лимита проходят без ожидания.
+    """
+
+    def __init__(self, transport: BaseTransport, route_limits: dict[str, int] | None = None):
+        """
+        :param transport: Транспорт с пулом соединений, через который уходят запросы.
+        :param route_limits: Лимиты одновременных запросов по маршрутам, например {"/api/v1/users": 50}.
+        """
+        self.transport = transport
+        self.semaphores = {
+            route: threading.BoundedSemaphore(limit) for route, limit in (route_limits or {}).items()
+        }
+
+    def handle_request(self, request: Request) -> Response:
+        semaphore = self.semaphores.get(request.extensions.get("route", request.url.path))
+        if semaphore is None:
+            return self.transport.handle_request(request)
+
+        semaphore.acquire()
+        try:
+            response = self.transport.handle_request(request)
+        except BaseException:
+            semaphore.release()
+            raise
+
+        response.stream = ReleasingByteStream(response.stream, semaphore.release)
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncRouteLimitedTransport(AsyncBaseTransport):
+    """
+    Асинхронный аналог RouteLimitedTransport для httpx.AsyncClient.
+    """
+
+    def __init__(self, transport: AsyncBaseTransport, route_limits: dict[str, int] | None = None):
+        """
+        :param transport: Асинхронный транспорт с пулом соединений.
+        :param route_limits: Лимиты одновременных запросов по маршрутам.
+        """
+        self.transport = transport
+        self.semaphores = {
+            route: asyncio.BoundedSemaphore(limit) for route, limit in (route_limits or {}).items()
+        }
+
+    async def handle_async_request(self, request: Request) -> Response:
+        semaphore = self.semaphores.get(request.extensions.get("route", request.url.path))
+        if semaphore is None:
+            return await self.transport.handle_async_request(request)
+
+        await semaphore.acquire()
+        try:
+            response = await self.transport.handle_async_request(request)
+        except BaseException:
+            semaphore.release()
+            raise
+
+        response.stream = AsyncReleasingByteStream(response.stream, semaphore.release)
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+@dataclass
+class ConnectionStreamStats:
+    """
+    Счётчики HTTP/2-потоков одного соединения.
+    """
+    connection: int
+    active_streams: int = 0
+    total_streams: int = 0
+    peak_streams: int = 0
+
+
+class HTTP2StreamAccountingTransport(BaseTransport):
+    """
+    HTTPX-транспорт, ограничивающий количество одновременных HTTP/2-потоков
+    и ведущий учёт потоков по каждому соединению пула.
+
+    Соединение определяется по `response.extensions["network_stream"]`: для HTTP/2
+    httpcore отдаёт в нём сокет соединения, общий для всех мультиплексированных запросов.
+    Поток считается активным до закрытия тела ответа.
+    """
+
+    def __init__(self, transport: BaseTransport, max_concurrent_streams: int | None = None):
+        """
+        :param transport: Транспорт с включённым HTTP/2.
+        :param max_concurrent_streams: Лимит одновременных потоков на весь пул; None — без лимита.
+        """
+        self.transport = transport
+        self.semaphore = threading.BoundedSemaphore(max_concurrent_streams) if max_concurrent_streams else None
+        self.connections: WeakKeyDictionary[object, ConnectionStreamStats] = WeakKeyDictionary()
+        self.connection_ids = itertools.count(1)
+        self.lock = threading.Lock()
+
+    def get_connection_stats(self, network_stream: object) -> ConnectionStreamStats:
+        stats = self.connections.get(network_stream)
+        if stats is None:
+            stats = ConnectionStreamStats(connection=next(self.connection_ids))
+            self.connections[network_stream] = stats
+
+        return stats
+
+    def handle_request(self, request: Request) -> Response:
+        if self.semaphore is not None:
+            self.semaphore.acquire()
+
+        try:
+            response = self.transport.handle_request(request)
+        except BaseException:
+            if self.semaphore is not None:
+                self.semaphore.release()
+            raise
+
+        network_stream = response.extensions.get("network_stream")
+        with self.lock:
+            stats = self.get_connection_stats(network_stream) if network_stream is not None else None
+            if stats is not None:
+                stats.active_streams += 1
+                stats.total_streams += 1
+                stats.peak_streams = max(stats.peak_streams, stats.active_streams)
+
+        def release() -> None:
+            if stats is not None:
+                with self.lock:
+                    stats.active_streams -= 1
+            if self.semaphore is not None:
+                self.semaphore.release()
+
+        response.stream = ReleasingByteStream(response.stream, release)
+        return response
+
+    def stream_metrics(self) -> dict:
+        """
+        Снимок метрик HTTP/2-потоков.
+
+        :return: Словарь с суммарными счётчиками и счётчиками по каждому живому соединению.
+        """
+        with self.lock:
+            connections = [asdict(stats) for stats in self.connections.values()]
+
+        return {
+            "connections": connections,
+            "active_streams": sum(stats["active_streams"] for stats in connections),
+            "total_streams": sum(stats["total_streams"] for stats in connections),
+        }
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+def build_http_transport(
+        limits: Limits,
+        route_limits: dict[str, int] | None = None,
+        http2: bool = False,
+        max_concurrent_streams: int | None = None
+) -> BaseTransport:
+    """
+    Создаёт синхронный транспорт с явными лимитами пула и, при необходимости, лимитами маршрутов.
+
+    В режиме HTTP/2 транспорт работает без HTTP/1.1 (prior knowledge): для http:// адресов
+    httpx иначе никогда не переключится на HTTP/2. Требуется установленный пакет h2.
+
+    :param limits: Лимиты пула соединений httpx (размер пула, keep-alive, время жизни keep-alive).
+    :param route_limits: Лимиты одновременных запросов по маршрутам.
+    :param http2: Использовать HTTP/2 с мультиплексированием запросов.
+    :param max_concurrent_streams: Лимит одновременных HTTP/2-потоков на весь пул (только для http2).
+    :return: Транспорт для передачи в httpx.Client(transport=...).
+    """
+    if http2:
+        transport = HTTP2StreamAccountingTransport(
+            HTTPTransport(limits=limits, http1=False, http2=True),
+            max_concurrent_streams=max_concurrent_streams
+        )
+    else:
+        transport = HTTPTransport(limits=limits)
+
+    if route_limits:
+        return RouteLimitedTransport(transport, route_limits)
+
+    return transport
+
+
+def build_async_http_transport(
+        limits: Limits,
+        route_limits: dict[str, int] | None = None
+) -> AsyncBaseTransport:
+    """
+    Создаёт асинхронный транспорт с явными лимитами пула и, при необходимости, лимитами маршрутов.
+
+    :param limits: Лимиты пула соединений httpx.
+    :param route_limits: Лимиты одновременных запросов по маршрутам.
+    :return: Транспорт для передачи в httpx.AsyncClient(transport=...).
+    """
+    transport = AsyncHTTPTransport(limits=limits)
+    if route_limits:
+        return AsyncRouteLimitedTransport(transport, route_limits)
+
+    return transport
@@ -0,0 +1,53 @@
+from locust import between, task
+
+from clients.grpc.gateway.users.client import UsersGatewayGRPCClient, build_users_gateway_locust_grpc_client
+from clients.grpc.gateway.accounts.client import AccountsGatewayGRPCClient, build_accounts_gateway_locust_grpc_client
+from tools.fixtures import Fixture, FixtureKind, FixtureProvider, build_fixture_provider
+from tools.open_loop import OpenLoopUser
+from tools.pacing import pacing
+from tools.scenario import register_scenario_options
+
+register_scenario_options(fixtures=True)
+
+
+class GetUserFixtureScenarioUser(OpenLoopUser):
+    """
+    gRPC-версия сценария чтения на заранее созданных данных (см. locust_get_user_fixture_scenario.py).
+    """
+
+    # Атрибут host обязателен для Locust, даже если он не используется напрямую в gRPC.
+    host = "localhost"
+    wait_time = pacing(fallback=between(1, 3))
+
+    users_gateway_client: UsersGatewayGRPCClient
+    accounts_gateway_client: AccountsGatewayGRPCClient
+
+    fixtures: FixtureProvider
+    fixture: Fixture | None
+
+    def on_start(self) -> None:
+        """
+        Забирает из Redis свободного пользователя вместо создания нового через gateway.
+        """
+        self.users_gateway_client = build_users_gateway_locust_grpc_client(self.environment)
+        self.accounts_gateway_client = build_accounts_gateway_locust_grpc_client(self.environment)
+
+        self.fixtures = build_fixture_provider(self.environment, FixtureKind.DEBIT_CARD_ACCOUNTS)
+        # Если свободных записей нет, checkout бросит FixturesExhausted и on_stop нечего возвращать
+        self.fixture = None
+        self.fixture = self.fixtures.checkout()
+
+    def on_stop(self) -> None:
+        """
+        Возвращает пользователя в Redis, чтобы следующий запуск теста мог его использовать.
+        """
+        if self.fixture is not None:
+            self.fixtures.release(self.fixture)
+
+    @task(3)
+    def get_user(self):
+        self.users_gateway_client.get_user(self.fixture.user_id)
+
+    @task(1)
+    def get_accounts(self):
+        self.accounts_gateway_client.get_accounts(self.fixture.user_id)
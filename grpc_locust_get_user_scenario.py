@@ -1,14 +1,19 @@
-from locust import User, between, task
+from locust import between, task
 
 from clients.grpc.gateway.users.client import UsersGatewayGRPCClient, build_users_gateway_locust_grpc_client
 from contracts.services.gateway.users.rpc_create_user_pb2 import CreateUserResponse
+from tools.open_loop import OpenLoopUser
+from tools.pacing import pacing
+from tools.scenario import register_scenario_options
 
+register_scenario_options()
 
-class GetUserScenarioUser(User):
+
+class GetUserScenarioUser(OpenLoopUser):
     # Атрибут host обязателен для Locust, даже если он не используется напрямую в gRPC.
     host = "localhost"
     # Время ожидания между задачами от 1 до 3 секунд.
-    wait_time = between(1, 3)
+    wait_time = pacing(fallback=between(1, 3))
 
     # Аннотации для клиентов и ответов
     users_gateway_client: UsersGatewayGRPCClient
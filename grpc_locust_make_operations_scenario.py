@@ -0,0 +1,67 @@
+from locust import between, task
+
+from clients.grpc.gateway.users.client import (
+    UsersGatewayGRPCClient,
+    build_users_gateway_locust_grpc_client,
+)
+from clients.grpc.gateway.accounts.client import (
+    AccountsGatewayGRPCClient,
+    build_accounts_gateway_locust_grpc_client,
+)
+from clients.grpc.gateway.operations.client import (
+    OperationsGatewayGRPCClient,
+    build_operations_gateway_locust_grpc_client,
+)
+from tools.open_loop import OpenLoopUser
+from tools.pacing import pacing
+from tools.payloads import OperationPayloadGenerator, OperationPayloadRingBuffer
+from tools.scenario import register_scenario_options
+
+register_scenario_options()
+
+# Буфер небольшой: на каждого виртуального пользователя свой, перегенерируется после полного прохода
+PAYLOAD_BUFFER_SIZE = 256
+
+
+class MakeOperationsScenarioUser(OpenLoopUser):
+
+    host = "localhost"
+    wait_time = pacing(fallback=between(1, 3))
+
+    operations_gateway_client: OperationsGatewayGRPCClient
+    payloads: OperationPayloadRingBuffer
+
+    def on_start(self) -> None:
+        """
+        Создаёт пользователя, открывает ему дебетовый счёт и заполняет буфер данных операций
+        (tools/payloads.py) для пары (карта, счёт)
+        """
+        users_gateway_client: UsersGatewayGRPCClient = build_users_gateway_locust_grpc_client(self.environment)
+        accounts_gateway_client: AccountsGatewayGRPCClient = build_accounts_gateway_locust_grpc_client(
+            self.environment
+        )
+        self.operations_gateway_client = build_operations_gateway_locust_grpc_client(self.environment)
+
+        create_user_response = users_gateway_client.create_user()
+        account = accounts_gateway_client.open_debit_card_account(user_id=create_user_response.user.id).account
+
+        self.payloads = OperationPayloadRingBuffer(
+            OperationPayloadGenerator(amount_distribution="lognormal"),
+            pairs=[(account.cards[0].id, account.id)],
+            size=PAYLOAD_BUFFER_SIZE
+        )
+
+    @task(3)
+    def make_purchase_operation(self) -> None:
+        payload = self.payloads.next()
+        self.operations_gateway_client.make_purchase_operation(payload.card_id, payload.account_id, payload)
+
+    @task(2)
+    def make_top_up_operation(self) -> None:
+        payload = self.payloads.next()
+        self.operations_gateway_client.make_top_up_operation(payload.card_id, payload.account_id, payload)
+
+    @task(1)
+    def make_cash_withdrawal_operation(self) -> None:
+        payload = self.payloads.next()
+        self.operations_gateway_client.make_cash_withdrawal_operation(payload.card_id, payload.account_id, payload)
@@ -1,4 +1,4 @@
-from locust import User, between, task
+from locust import between, task
 
 from clients.grpc.gateway.users.client import (
     UsersGatewayGRPCClient,
@@ -13,12 +13,17 @@ from contracts.services.gateway.users.rpc_create_user_pb2 import CreateUserRespo
 from contracts.services.gateway.accounts.rpc_open_debit_card_account_pb2 import (
     OpenDebitCardAccountResponse,
 )
+from tools.open_loop import OpenLoopUser
+from tools.pacing import pacing
+from tools.scenario import register_scenario_options
 
+register_scenario_options()
 
-class OpenDebitCardAccountScenarioUser(User):
+
+class OpenDebitCardAccountScenarioUser(OpenLoopUser):
 
     host = "localhost"
-    wait_time = between(1, 3)
+    wait_time = pacing(fallback=between(1, 3))
 
     users_gateway_client: UsersGatewayGRPCClient
     accounts_gateway_client: AccountsGatewayGRPCClient
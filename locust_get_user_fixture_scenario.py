@@ -0,0 +1,54 @@
+from locust import between, task
+
+from clients.http.gateway.users.client import UsersGatewayHTTPClient, build_users_gateway_locust_http_client
+from clients.http.gateway.account.client import AccountsGatewayHTTPClient, build_accounts_gateway_locust_http_client
+from tools.fixtures import Fixture, FixtureKind, FixtureProvider, build_fixture_provider
+from tools.open_loop import OpenLoopUser
+from tools.pacing import pacing
+from tools.scenario import register_scenario_options
+
+register_scenario_options(fixtures=True)
+
+
+class GetUserFixtureScenarioUser(OpenLoopUser):
+    """
+    Нагрузочный сценарий чтения на заранее созданных данных:
+    пользователь с дебетовым счётом берётся из Redis, а не создаётся в on_start,
+    поэтому разгон не нагружает gateway операциями записи.
+    """
+
+    host = "localhost"
+    wait_time = pacing(fallback=between(1, 3))
+
+    users_gateway_client: UsersGatewayHTTPClient
+    accounts_gateway_client: AccountsGatewayHTTPClient
+
+    fixtures: FixtureProvider
+    fixture: Fixture | None
+
+    def on_start(self) -> None:
+        """
+        Забирает из Redis свободного пользователя: одна команда LMOVE вместо запросов на создание.
+        """
+        self.users_gateway_client = build_users_gateway_locust_http_client(self.environment)
+        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.environment)
+
+        self.fixtures = build_fixture_provider(self.environment, FixtureKind.DEBIT_CARD_ACCOUNTS)
+        # Если свободных записей нет, checkout бросит FixturesExhausted и on_stop нечего возвращать
+        self.fixture = None
+        self.fixture = self.fixtures.checkout()
+
+    def on_stop(self) -> None:
+        """
+        Возвращает пользователя в Redis, чтобы следующий запуск теста мог его использовать.
+        """
+        if self.fixture is not None:
+            self.fixtures.release(self.fixture)
+
+    @task(3)
+    def get_user(self):
+        self.users_gateway_client.get_user(self.fixture.user_id)
+
+    @task(1)
+    def get_accounts(self):
+        self.accounts_gateway_client.get_accounts(self.fixture.user_id)
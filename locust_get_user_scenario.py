@@ -1,13 +1,18 @@
-from locust import User, between, task
+from locust import between, task
 
 from clients.http.gateway.users.client import UsersGatewayHTTPClient, build_users_gateway_locust_http_client
 from clients.http.gateway.users.schema import CreateUserResponseSchema
+from tools.open_loop import OpenLoopUser
+from tools.pacing import pacing
+from tools.scenario import register_scenario_options
 
+register_scenario_options()
 
-class GetUserScenarioUser(User):  # Наследуемся от User вместо HttpUser
+
+class GetUserScenarioUser(OpenLoopUser):  # OpenLoopUser наследуется от User, а не HttpUser: запросы шлёт наш API клиент
     # Обязательное поле, требуемое Locust. Будет проигнорировано, но его нужно указать, иначе будет ошибка запуска.
     host = "localhost"
-    wait_time = between(1, 3)
+    wait_time = pacing(fallback=between(1, 3))
 
     # Поле, в котором будет храниться экземпляр нашего API клиента
     users_gateway_client: UsersGatewayHTTPClient
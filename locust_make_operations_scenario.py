@@ -0,0 +1,75 @@
+from locust import between, task
+
+from clients.http.gateway.users.client import (
+    UsersGatewayHTTPClient,
+    build_users_gateway_locust_http_client
+)
+from clients.http.gateway.account.client import (
+    AccountsGatewayHTTPClient,
+    build_accounts_gateway_locust_http_client
+)
+from clients.http.gateway.operations.client import (
+    OperationsGatewayHTTPClient,
+    build_operations_gateway_locust_http_client
+)
+from tools.open_loop import OpenLoopUser
+from tools.pacing import pacing
+from tools.payloads import OperationPayloadGenerator, OperationPayloadRingBuffer
+from tools.scenario import register_scenario_options
+
+register_scenario_options()
+
+# Буфер небольшой: на каждого виртуального пользователя свой, перегенерируется после полного прохода
+PAYLOAD_BUFFER_SIZE = 256
+
+
+class MakeOperationsScenarioUser(OpenLoopUser):
+    """
+    Нагрузочный сценарий:
+    1. Создаёт пользователя и открывает ему дебетовый счёт
+    2. Проводит по карте счёта операции пополнения, покупки и снятия наличных
+
+    Статусы, суммы и категории операций берутся из кольцевого буфера (tools/payloads.py),
+    а не генерируются Faker на каждый запрос.
+    """
+
+    host = "localhost"
+    wait_time = pacing(fallback=between(1, 3))
+
+    operations_gateway_client: OperationsGatewayHTTPClient
+    payloads: OperationPayloadRingBuffer
+
+    def on_start(self) -> None:
+        """
+        Создаёт пользователя, открывает ему дебетовый счёт и заполняет буфер данных операций
+        для пары (карта, счёт).
+        """
+        users_gateway_client: UsersGatewayHTTPClient = build_users_gateway_locust_http_client(self.environment)
+        accounts_gateway_client: AccountsGatewayHTTPClient = build_accounts_gateway_locust_http_client(
+            self.environment
+        )
+        self.operations_gateway_client = build_operations_gateway_locust_http_client(self.environment)
+
+        create_user_response = users_gateway_client.create_user()
+        account = accounts_gateway_client.open_debit_card_account(create_user_response.user.id).account
+
+        self.payloads = OperationPayloadRingBuffer(
+            OperationPayloadGenerator(amount_distribution="lognormal"),
+            pairs=[(account.cards[0].id, account.id)],
+            size=PAYLOAD_BUFFER_SIZE
+        )
+
+    @task(3)
+    def make_purchase_operation(self):
+        payload = self.payloads.next()
+        self.operations_gateway_client.make_purchase_operation(payload.card_id, payload.account_id, payload)
+
+    @task(2)
+    def make_top_up_operation(self):
+        payload = self.payloads.next()
+        self.operations_gateway_client.make_top_up_operation(payload.card_id, payload.account_id, payload)
+
+    @task(1)
+    def make_cash_withdrawal_operation(self):
+        payload = self.payloads.next()
+        self.operations_gateway_client.make_cash_withdrawal_operation(payload.card_id, payload.account_id, payload)
@@ -1,4 +1,4 @@
-from locust import User, between, task
+from locust import between, task
 
 from clients.http.gateway.users.client import (
     UsersGatewayHTTPClient,
@@ -10,9 +10,14 @@ from clients.http.gateway.account.client import (
 )
 from clients.http.gateway.users.schema import CreateUserResponseSchema
 from clients.http.gateway.account.schema import OpenDebitCardAccountResponseSchema
+from tools.open_loop import OpenLoopUser
+from tools.pacing import pacing
+from tools.scenario import register_scenario_options
 
+register_scenario_options()
 
-class OpenDebitCardAccountScenarioUser(User):
+
+class OpenDebitCardAccountScenarioUser(OpenLoopUser):
     """
     Нагрузочный сценарий:
     1. Создаёт нового пользователя (через UsersGatewayHTTPClient)
@@ -20,7 +25,7 @@ class OpenDebitCardAccountScenarioUser(User):
     """
 
     host = "localhost"
-    wait_time = between(1, 3)
+    wait_time = pacing(fallback=between(1, 3))
 
     users_gateway_client: UsersGatewayHTTPClient
     accounts_gateway_client: AccountsGatewayHTTPClient
@@ -0,0 +1,425 @@
+"""
+Фейковый grpc-gateway для замера gRPC-сценариев без реального бэкенда.
+
+Реализует сервисы UsersGatewayService, AccountsGatewayService, CardsGatewayService,
+DocumentsGatewayService и OperationsGatewayService из `contracts/services/gateway/*_pb2_grpc.py`.
+Данные хранятся в памяти (`stubs/state.py`, то же хранилище, что и у http-заглушки).
+Задержка и ошибки добавляются серверным интерсептором, общие или по имени метода.
+
+Запуск:
+    python -m stubs.grpc_gateway --port 9003
+    python -m stubs.grpc_gateway --max-workers 128 --latency-ms 20 --error-rate 0.01
+    python -m stubs.grpc_gateway --route-latency "GetContractDocument=200" --error-code UNAVAILABLE
+"""
+import argparse
+import random
+import time
+from base64 import b64decode
+from concurrent import futures
+from dataclasses import dataclass
+
+import grpc
+
+from clients.http.gateway.account.schema import AccountSchema, AccountType
+from clients.http.gateway.cards.schema import CardSchema, CardType
+from clients.http.gateway.operations.schema import OperationSchema, OperationStatus, OperationType
+from clients.http.gateway.users.schema import UserSchema
+from contracts.services.accounts import account_pb2
+from contracts.services.cards import card_pb2
+from contracts.services.documents.contracts.contract_pb2 import Contract
+from contracts.services.documents.receipts.receipt_pb2 import Receipt
+from contracts.services.documents.tariffs.tariff_pb2 import Tariff
+from contracts.services.gateway.accounts import accounts_gateway_service_pb2_grpc
+from contracts.services.gateway.accounts.account_pb2 import AccountView
+from contracts.services.gateway.accounts.rpc_get_accounts_pb2 import GetAccountsResponse
+from contracts.services.gateway.accounts.rpc_open_credit_card_account_pb2 import OpenCreditCardAccountResponse
+from contracts.services.gateway.accounts.rpc_open_debit_card_account_pb2 import OpenDebitCardAccountResponse
+from contracts.services.gateway.accounts.rpc_open_deposit_account_pb2 import OpenDepositAccountResponse
+from contracts.services.gateway.accounts.rpc_open_savings_account_pb2 import OpenSavingsAccountResponse
+from contracts.services.gateway.cards import cards_gateway_service_pb2_grpc
+from contracts.services.gateway.cards.rpc_issue_physical_card_pb2 import IssuePhysicalCardResponse
+from contracts.services.gateway.cards.rpc_issue_virtual_card_pb2 import IssueVirtualCardResponse
+from contracts.services.gateway.documents import documents_gateway_service_pb2_grpc
+from contracts.services.gateway.documents.rpc_get_contract_document_pb2 import GetContractDocumentResponse
+from contracts.services.gateway.documents.rpc_get_tariff_document_pb2 import GetTariffDocumentResponse
+from contracts.services.gateway.operations import operations_gateway_service_pb2_grpc
+from contracts.services.gateway.operations.rpc_get_operation_pb2 import GetOperationResponse
+from contracts.services.gateway.operations.rpc_get_operation_receipt_pb2 import GetOperationReceiptResponse
+from contracts.services.gateway.operations.rpc_get_operations_pb2 import GetOperationsResponse
+from contracts.services.gateway.operations.rpc_get_operations_summary_pb2 import GetOperationsSummaryResponse
+from contracts.services.gateway.operations.rpc_make_bill_payment_operation_pb2 import MakeBillPaymentOperationResponse
+from contracts.services.gateway.operations.rpc_make_cash_withdrawal_operation_pb2 import (
+    MakeCashWithdrawalOperationResponse
+)
+from contracts.services.gateway.operations.rpc_make_cashback_operation_pb2 import MakeCashbackOperationResponse
+from contracts.services.gateway.operations.rpc_make_fee_operation_pb2 import MakeFeeOperationResponse
+from contracts.services.gateway.operations.rpc_make_purchase_operation_pb2 import MakePurchaseOperationResponse
+from contracts.services.gateway.operations.rpc_make_top_up_operation_pb2 import MakeTopUpOperationResponse
+from contracts.services.gateway.operations.rpc_make_transfer_operation_pb2 import MakeTransferOperationResponse
+from contracts.services.gateway.users import users_gateway_service_pb2_grpc
+from contracts.services.gateway.users.rpc_create_user_pb2 import CreateUserResponse
+from contracts.services.gateway.users.rpc_get_user_pb2 import GetUserResponse
+from contracts.services.operations import operation_pb2
+from contracts.services.operations.operations_summary_pb2 import OperationsSummary
+from contracts.services.users.user_pb2 import User
+from stubs.http_gateway import FaultConfig, parse_route_values
+from stubs.state import GatewayState
+
+
+# ---------- Перевод pydantic-схем в proto-сообщения ----------
+
+def to_proto_user(user: UserSchema) -> User:
+    return User(
+        id=user.id,
+        email=user.email,
+        last_name=user.last_name,
+        first_name=user.first_name,
+        middle_name=user.middle_name,
+        phone_number=user.phone_number
+    )
+
+
+def to_proto_card(card: CardSchema) -> card_pb2.Card:
+    return card_pb2.Card(
+        id=card.id,
+        pin=card.pin,
+        cvv=card.cvv,
+        type=card_pb2.CardType.Value(f"CARD_TYPE_{card.type}"),
+        status=card_pb2.CardStatus.Value(f"CARD_STATUS_{card.status}"),
+        account_id=card.account_id,
+        card_number=card.card_number,
+        card_holder=card.card_holder,
+        expiry_date=card.expiry_date,
+        payment_system=card_pb2.CardPaymentSystem.Value(f"CARD_PAYMENT_SYSTEM_{card.payment_system}")
+    )
+
+
+def to_proto_account(account: AccountSchema) -> AccountView:
+    return AccountView(
+        id=account.id,
+        type=account_pb2.AccountType.Value(f"ACCOUNT_TYPE_{account.type}"),
+        cards=[to_proto_card(card) for card in account.cards],
+        status=account_pb2.AccountStatus.Value(f"ACCOUNT_STATUS_{account.status}"),
+        balance=account.balance
+    )
+
+
+def to_proto_operation(operation: OperationSchema) -> operation_pb2.Operation:
+    return operation_pb2.Operation(
+        id=operation.id,
+        type=operation_pb2.OperationType.Value(f"OPERATION_TYPE_{operation.type}"),
+        status=operation_pb2.OperationStatus.Value(f"OPERATION_STATUS_{operation.status}"),
+        amount=operation.amount,
+        card_id=operation.card_id,
+        category=operation.category,
+        created_at=operation.created_at.isoformat(),
+        account_id=operation.account_id
+    )
+
+
+def from_proto_operation_status(status: int) -> OperationStatus:
+    return OperationStatus(operation_pb2.OperationStatus.Name(status).removeprefix("OPERATION_STATUS_"))
+
+
+# ---------- Сервисы ----------
+
+class UsersGatewayServicer(users_gateway_service_pb2_grpc.UsersGatewayServiceServicer):
+    def __init__(self, state: GatewayState):
+        self.state = state
+
+    def GetUser(self, request, context):
+        user = self.state.get_user(request.id)
+        if user is None:
+            context.abort(grpc.StatusCode.NOT_FOUND, "User not found")
+
+        return GetUserResponse(user=to_proto_user(user))
+
+    def CreateUser(self, request, context):
+        user = self.state.create_user(
+            email=request.email,
+            last_name=request.last_name,
+            first_name=request.first_name,
+            middle_name=request.middle_name,
+            phone_number=request.phone_number
+        )
+        return CreateUserResponse(user=to_proto_user(user))
+
+
+class AccountsGatewayServicer(accounts_gateway_service_pb2_grpc.AccountsGatewayServiceServicer):
+    def __init__(self, state: GatewayState):
+        self.state = state
+
+    def GetAccounts(self, request, context):
+        return GetAccountsResponse(accounts=[to_proto_account(account) for account in self.state.get_accounts(request.user_id)])
+
+    def OpenDepositAccount(self, request, context):
+        account = self.state.open_account(request.user_id, AccountType.DEPOSIT)
+        return OpenDepositAccountResponse(account=to_proto_account(account))
+
+    def OpenSavingsAccount(self, request, context):
+        account = self.state.open_account(request.user_id, AccountType.SAVINGS)
+        return OpenSavingsAccountResponse(account=to_proto_account(account))
+
+    def OpenDebitCardAccount(self, request, context):
+        account = self.state.open_account(request.user_id, AccountType.DEBIT_CARD)
+        return OpenDebitCardAccountResponse(account=to_proto_account(account))
+
+    def OpenCreditCardAccount(self, request, context):
+        account = self.state.open_account(request.user_id, AccountType.CREDIT_CARD)
+        return OpenCreditCardAccountResponse(account=to_proto_account(account))
+
+
+class CardsGatewayServicer(cards_gateway_service_pb2_grpc.CardsGatewayServiceServicer):
+    def __init__(self, state: GatewayState):
+        self.state = state
+
+    def IssueVirtualCard(self, request, context):
+        card = self.state.issue_card(request.account_id, CardType.VIRTUAL)
+        return IssueVirtualCardResponse(card=to_proto_card(card))
+
+    def IssuePhysicalCard(self, request, context):
+        card = self.state.issue_card(request.account_id, CardType.PHYSICAL)
+        return IssuePhysicalCardResponse(card=to_proto_card(card))
+
+
+class DocumentsGatewayServicer(documents_gateway_service_pb2_grpc.DocumentsGatewayServiceServicer):
+    def __init__(self, state: GatewayState):
+        self.state = state
+        # В proto документ передаётся байтами, а в хранилище он лежит в base64 для HTTP
+        self.document = b64decode(state.document)
+
+    def GetTariffDocument(self, request, context):
+        tariff = self.state.get_document(request.account_id, "tariff")
+        return GetTariffDocumentResponse(tariff=Tariff(url=str(tariff.url), document=self.document))
+
+    def GetContractDocument(self, request, context):
+        contract = self.state.get_document(request.account_id, "contract")
+        return GetContractDocumentResponse(contract=Contract(url=str(contract.url), document=self.document))
+
+
+class OperationsGatewayServicer(operations_gateway_service_pb2_grpc.OperationsGatewayServiceServicer):
+    def __init__(self, state: GatewayState):
+        self.state = state
+        self.document = b64decode(state.document)
+
+    def GetOperation(self, request, context):
+        operation = self.state.get_operation(request.id)
+        if operation is None:
+            context.abort(grpc.StatusCode.NOT_FOUND, "Operation not found")
+
+        return GetOperationResponse(operation=to_proto_operation(operation))
+
+    def GetOperations(self, request, context):
+        operations = self.state.get_operations(request.account_id)
+        return GetOperationsResponse(operations=[to_proto_operation(operation) for operation in operations])
+
+    def GetOperationReceipt(self, request, context):
+        receipt = self.state.get_operation_receipt(request.operation_id)
+        if receipt is None:
+            context.abort(grpc.StatusCode.NOT_FOUND, "Operation not found")
+
+        return GetOperationReceiptResponse(receipt=Receipt(url=str(receipt.url), document=self.document))
+
+    def GetOperationsSummary(self, request, context):
+        summary = self.state.get_operations_summary(request.account_id)
+        return GetOperationsSummaryResponse(summary=OperationsSummary(
+            spent_amount=summary.spent_amount,
+            received_amount=summary.received_amount,
+            cashback_amount=summary.cashback_amount
+        ))
+
+    def make_operation(self, request, operation_type: OperationType) -> operation_pb2.Operation:
+        operation = self.state.make_operation(
+            operation_type=operation_type,
+            status=from_proto_operation_status(request.status),
+            amount=request.amount,
+            card_id=request.card_id,
+            account_id=request.account_id,
+            category=getattr(request, "category", "")
+        )
+        return to_proto_operation(operation)
+
+    def MakeFeeOperation(self, request, context):
+        return MakeFeeOperationResponse(operation=self.make_operation(request, OperationType.FEE))
+
+    def MakeTopUpOperation(self, request, context):
+        return MakeTopUpOperationResponse(operation=self.make_operation(request, OperationType.TOP_UP))
+
+    def MakeCashbackOperation(self, request, context):
+        return MakeCashbackOperationResponse(operation=self.make_operation(request, OperationType.CASHBACK))
+
+    def MakeTransferOperation(self, request, context):
+        return MakeTransferOperationResponse(operation=self.make_operation(request, OperationType.TRANSFER))
+
+    def MakePurchaseOperation(self, request, context):
+        return MakePurchaseOperationResponse(operation=self.make_operation(request, OperationType.PURCHASE))
+
+    def MakeBillPaymentOperation(self, request, context):
+        return MakeBillPaymentOperationResponse(operation=self.make_operation(request, OperationType.BILL_PAYMENT))
+
+    def MakeCashWithdrawalOperation(self, request, context):
+        return MakeCashWithdrawalOperationResponse(
+            operation=self.make_operation(request, OperationType.CASH_WITHDRAWAL)
+        )
+
+
+# ---------- Задержка и ошибки ----------
+
+@dataclass
+class GRPCFaultConfig(FaultConfig):
+    """
+    Настройки задержки и ошибок для gRPC. Маршрут — короткое имя метода, например "GetUser".
+    """
+    error_code: grpc.StatusCode = grpc.StatusCode.UNAVAILABLE
+
+
+class FaultInjectionInterceptor(grpc.ServerInterceptor):
+    """
+    Серверный интерсептор, который задерживает ответы и возвращает ошибки по настройкам GRPCFaultConfig.
+
+    Задержка выполняется в потоке обработчика: пока запрос "спит", он занимает воркер пула,
+    как и в настоящем блокирующем сервисе.
+    """
+
+    def __init__(self, faults: GRPCFaultConfig, seed: int | None = None):
+        self.faults = faults
+        self.random = random.Random(seed)
+
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        if handler is None or handler.unary_unary is None:
+            return handler
+
+        method = handler_call_details.method.rpartition("/")[2]
+        behavior = handler.unary_unary
+
+        def unary_unary(request, context):
+            delay = self.faults.latency(method, self.random)
+            if delay > 0:
+                time.sleep(delay)
+
+            if self.faults.should_fail(method, self.random):
+                context.abort(self.faults.error_code, "Injected error")
+
+            return behavior(request, context)
+
+        return grpc.unary_unary_rpc_method_handler(
+            unary_unary,
+            request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer
+        )
+
+
+class GRPCGatewayStub:
+    """
+    gRPC-сервер с сервисами grpc-gateway на пуле потоков.
+
+    `start()` не блокирует текущий поток, поэтому заглушку можно поднять прямо в процессе замера.
+    """
+
+    def __init__(
+            self,
+            state: GatewayState | None = None,
+            faults: GRPCFaultConfig | None = None,
+            max_workers: int = 64,
+            seed: int | None = None
+    ):
+        """
+        :param state: Хранилище данных; по умолчанию создаётся новое.
+        :param faults: Настройки задержки и ошибок.
+        :param max_workers: Размер пула потоков, то есть максимум одновременно обрабатываемых запросов.
+        :param seed: Seed для задержек и ошибок.
+        """
+        self.state = state or GatewayState(seed=seed)
+        self.faults = faults or GRPCFaultConfig()
+
+        interceptors = [FaultInjectionInterceptor(self.faults, seed)] if self.has_faults() else []
+        self.server = grpc.server(
+            futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="grpc-gateway-stub"),
+            interceptors=interceptors
+        )
+
+        users_gateway_service_pb2_grpc.add_UsersGatewayServiceServicer_to_server(
+            UsersGatewayServicer(self.state), self.server
+        )
+        accounts_gateway_service_pb2_grpc.add_AccountsGatewayServiceServicer_to_server(
+            AccountsGatewayServicer(self.state), self.server
+        )
+        cards_gateway_service_pb2_grpc.add_CardsGatewayServiceServicer_to_server(
+            CardsGatewayServicer(self.state), self.server
+        )
+        documents_gateway_service_pb2_grpc.add_DocumentsGatewayServiceServicer_to_server(
+            DocumentsGatewayServicer(self.state), self.server
+        )
+        operations_gateway_service_pb2_grpc.add_OperationsGatewayServiceServicer_to_server(
+            OperationsGatewayServicer(self.state), self.server
+        )
+
+    def has_faults(self) -> bool:
+        # Без задержек и ошибок интерсептор не ставится, чтобы не добавлять лишний вызов на каждый запрос
+        faults = self.faults
+        return bool(
+            faults.latency_ms or faults.jitter_ms or faults.error_rate
+            or faults.route_latency_ms or faults.route_error_rate
+        )
+
+    def start(self, host: str = "127.0.0.1", port: int = 9003) -> int:
+        """
+        :return: Фактический порт (при port=0 выбирается свободный).
+        """
+        bound_port = self.server.add_insecure_port(f"{host}:{port}")
+        self.server.start()
+        return bound_port
+
+    def stop(self, grace: float | None = None) -> None:
+        self.server.stop(grace).wait()
+
+    def wait_for_termination(self) -> None:
+        self.server.wait_for_termination()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Фейковый grpc-gateway")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9003)
+    parser.add_argument("--max-workers", type=int, default=64, help="Размер пула потоков сервера")
+    parser.add_argument("--latency-ms", type=float, default=0, help="Задержка каждого ответа")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="Стандартное отклонение задержки")
+    parser.add_argument("--error-rate", type=float, default=0, help="Доля ответов с ошибкой, от 0 до 1")
+    parser.add_argument(
+        "--error-code",
+        default="UNAVAILABLE",
+        choices=[code.name for code in grpc.StatusCode if code != grpc.StatusCode.OK],
+        help="Статус инъецированных ошибок"
+    )
+    parser.add_argument("--route-latency", action="append", help="Задержка метода: METHOD=MS")
+    parser.add_argument("--route-error-rate", action="append", help="Доля ошибок метода: METHOD=RATE")
+    parser.add_argument("--document-size", type=int, default=1024, help="Размер документов и чеков в байтах")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    faults = GRPCFaultConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        error_code=grpc.StatusCode[args.error_code],
+        route_latency_ms=parse_route_values(args.route_latency),
+        route_error_rate=parse_route_values(args.route_error_rate)
+    )
+    stub = GRPCGatewayStub(
+        GatewayState(seed=args.seed, document_size=args.document_size),
+        faults,
+        max_workers=args.max_workers,
+        seed=args.seed
+    )
+
+    port = stub.start(args.host, args.port)
+    print(f"grpc-gateway stub listening on {args.host}:{port}")
+    try:
+        stub.wait_for_termination()
+    except KeyboardInterrupt:
+        stub.stop(grace=1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,484 @@
+"""
+Фейковый http-gateway для замера пропускной способности клиентского стека без реального бэкенда.
+
+Обслуживает все маршруты, которые используют клиенты `clients/http/gateway/*`, и отдаёт ответы,
+валидные по схемам из `clients/http/gateway/*/schema.py`. Поддерживает keep-alive и pipelining,
+задержку ответа и инъекцию ошибок.
+
+Запуск:
+    python -m stubs.http_gateway --port 8003
+    python -m stubs.http_gateway --latency-ms 20 --jitter-ms 5 --error-rate 0.01
+    python -m stubs.http_gateway --route-latency "/api/v1/documents/contract-document/{account_id}=200"
+"""
+import argparse
+import asyncio
+import json
+import random
+import re
+import threading
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from typing import Callable
+from urllib.parse import parse_qs, urlsplit
+
+from pydantic import BaseModel, ValidationError
+
+from clients.http.gateway.account.schema import (
+    AccountType,
+    GetAccountsResponseSchema,
+    OpenCreditCardAccountRequestSchema,
+    OpenCreditCardAccountResponseSchema,
+    OpenDebitCardAccountRequestSchema,
+    OpenDebitCardAccountResponseSchema,
+    OpenDepositAccountRequestSchema,
+    OpenDepositAccountResponseSchema,
+    OpenSavingsAccountRequestSchema,
+    OpenSavingsAccountResponseSchema
+)
+from clients.http.gateway.cards.schema import (
+    CardType,
+    IssuePhysicalCardRequestSchema,
+    IssuePhysicalCardResponseSchema,
+    IssueVirtualCardRequestSchema,
+    IssueVirtualCardResponseSchema
+)
+from clients.http.gateway.documents.schema import GetContractDocumentResponseSchema, GetTariffDocumentResponseSchema
+from clients.http.gateway.operations.schema import (
+    GetOperationReceiptResponseSchema,
+    GetOperationResponseSchema,
+    GetOperationsResponseSchema,
+    GetOperationsSummaryResponseSchema,
+    MakeBillPaymentOperationRequestSchema,
+    MakeCashbackOperationRequestSchema,
+    MakeCashWithdrawalOperationRequestSchema,
+    MakeFeeOperationRequestSchema,
+    MakeOperationRequestSchema,
+    MakePurchaseOperationRequestSchema,
+    MakeTopUpOperationRequestSchema,
+    MakeTransferOperationRequestSchema,
+    OperationType
+)
+from clients.http.gateway.users.schema import CreateUserRequestSchema, CreateUserResponseSchema, GetUserResponseSchema
+from stubs.state import GatewayState
+
+
+class HTTPError(Exception):
+    """
+    Ошибка обработки запроса, которая превращается в JSON-ответ с указанным статусом.
+    """
+
+    def __init__(self, status: HTTPStatus, detail):
+        super().__init__(detail)
+        self.status = status
+        self.detail = detail
+
+
+@dataclass
+class Request:
+    method: str
+    path: str
+    query: dict[str, list[str]]
+    body: bytes
+    params: dict[str, str] = field(default_factory=dict)
+
+    def query_param(self, name: str) -> str:
+        values = self.query.get(name)
+        if not values:
+            raise HTTPError(HTTPStatus.UNPROCESSABLE_ENTITY, f"Query parameter '{name}' is required")
+
+        return values[0]
+
+    def parse(self, schema: type[BaseModel]):
+        try:
+            return schema.model_validate_json(self.body)
+        except ValidationError as error:
+            raise HTTPError(HTTPStatus.UNPROCESSABLE_ENTITY, json.loads(error.json()))
+
+
+@dataclass
+class FaultConfig:
+    """
+    Настройки задержки и ошибок: общие и по шаблонам маршрутов.
+    """
+    latency_ms: float = 0
+    jitter_ms: float = 0
+    error_rate: float = 0
+    error_status: int = HTTPStatus.INTERNAL_SERVER_ERROR
+    route_latency_ms: dict[str, float] = field(default_factory=dict)
+    route_error_rate: dict[str, float] = field(default_factory=dict)
+
+    def latency(self, route: str, rng: random.Random) -> float:
+        """
+        :return: Задержка ответа в секундах.
+        """
+        latency = self.route_latency_ms.get(route, self.latency_ms)
+        if self.jitter_ms:
+            latency = max(0.0, rng.gauss(latency, self.jitter_ms))
+
+        return latency / 1000
+
+    def should_fail(self, route: str, rng: random.Random) -> bool:
+        rate = self.route_error_rate.get(route, self.error_rate)
+        return rate > 0 and rng.random() < rate
+
+
+Handler = Callable[[Request], BaseModel]
+
+
+class HTTPGatewayStub:
+    """
+    Асинхронный HTTP/1.1-сервер с маршрутами http-gateway.
+
+    Можно запустить как отдельный процесс (`python -m stubs.http_gateway`)
+    или в фоновом потоке текущего процесса через `start_in_thread()` — только без locust
+    в том же процессе (см. `start_in_thread`).
+    """
+
+    def __init__(self, state: GatewayState | None = None, faults: FaultConfig | None = None, seed: int | None = None):
+        """
+        :param state: Хранилище данных; по умолчанию создаётся новое.
+        :param faults: Настройки задержки и ошибок.
+        :param seed: Seed для задержек и ошибок.
+        """
+        self.state = state or GatewayState(seed=seed)
+        self.faults = faults or FaultConfig()
+        self.random = random.Random(seed)
+
+        self.exact_routes: dict[tuple[str, str], tuple[str, Handler]] = {}
+        self.template_routes: list[tuple[str, re.Pattern, str, Handler]] = []
+        self.register_routes()
+
+        self.server: asyncio.AbstractServer | None = None
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.thread: threading.Thread | None = None
+
+    # ---------- Маршрутизация ----------
+
+    def route(self, method: str, template: str, handler: Handler) -> None:
+        """
+        Регистрирует обработчик. Шаблоны с параметрами ("/api/v1/users/{user_id}") проверяются
+        в порядке регистрации после точных маршрутов.
+        """
+        if "{" not in template:
+            self.exact_routes[(method, template)] = (template, handler)
+            return
+
+        pattern = re.compile("^" + re.sub(r"\{(\w+)}", r"(?P<\1>[^/]+)", template) + "$")
+        self.template_routes.append((method, pattern, template, handler))
+
+    def resolve(self, request: Request) -> tuple[str, Handler]:
+        exact = self.exact_routes.get((request.method, request.path))
+        if exact is not None:
+            return exact
+
+        for method, pattern, template, handler in self.template_routes:
+            match = pattern.match(request.path)
+            if match and method == request.method:
+                request.params = match.groupdict()
+                return template, handler
+
+        raise HTTPError(HTTPStatus.NOT_FOUND, "Not Found")
+
+    def register_routes(self) -> None:
+        state = self.state
+
+        # ---------- users ----------
+        def create_user(request: Request):
+            body = request.parse(CreateUserRequestSchema)
+            user = state.create_user(
+                email=body.email,
+                last_name=body.last_name,
+                first_name=body.first_name,
+                middle_name=body.middle_name,
+                phone_number=body.phone_number
+            )
+            return CreateUserResponseSchema(user=user)
+
+        def get_user(request: Request):
+            user = state.get_user(request.params["user_id"])
+            if user is None:
+                raise HTTPError(HTTPStatus.NOT_FOUND, "User not found")
+
+            return GetUserResponseSchema(user=user)
+
+        self.route("POST", "/api/v1/users", create_user)
+        self.route("GET", "/api/v1/users/{user_id}", get_user)
+
+        # ---------- accounts ----------
+        def get_accounts(request: Request):
+            return GetAccountsResponseSchema(accounts=state.get_accounts(request.query_param("userId")))
+
+        def open_account(request_schema, response_schema, account_type: AccountType):
+            def handler(request: Request):
+                body = request.parse(request_schema)
+                return response_schema(account=state.open_account(body.user_id, account_type))
+
+            return handler
+
+        self.route("GET", "/api/v1/accounts", get_accounts)
+        self.route("POST", "/api/v1/accounts/open-deposit-account", open_account(
+            OpenDepositAccountRequestSchema, OpenDepositAccountResponseSchema, AccountType.DEPOSIT
+        ))
+        self.route("POST", "/api/v1/accounts/open-savings-account", open_account(
+            OpenSavingsAccountRequestSchema, OpenSavingsAccountResponseSchema, AccountType.SAVINGS
+        ))
+        self.route("POST", "/api/v1/accounts/open-debit-card-account", open_account(
+            OpenDebitCardAccountRequestSchema, OpenDebitCardAccountResponseSchema, AccountType.DEBIT_CARD
+        ))
+        self.route("POST", "/api/v1/accounts/open-credit-card-account", open_account(
+            OpenCreditCardAccountRequestSchema, OpenCreditCardAccountResponseSchema, AccountType.CREDIT_CARD
+        ))
+
+        # ---------- cards ----------
+        def issue_card(request_schema, response_schema, card_type: CardType):
+            def handler(request: Request):
+                body = request.parse(request_schema)
+                return response_schema(card=state.issue_card(body.account_id, card_type))
+
+            return handler
+
+        self.route("POST", "/api/v1/cards/issue-virtual-card", issue_card(
+            IssueVirtualCardRequestSchema, IssueVirtualCardResponseSchema, CardType.VIRTUAL
+        ))
+        self.route("POST", "/api/v1/cards/issue-physical-card", issue_card(
+            IssuePhysicalCardRequestSchema, IssuePhysicalCardResponseSchema, CardType.PHYSICAL
+        ))
+
+        # ---------- documents ----------
+        self.route(
+            "GET",
+            "/api/v1/documents/tariff-document/{account_id}",
+            lambda request: GetTariffDocumentResponseSchema(
+                tariff=state.get_document(request.params["account_id"], "tariff")
+            )
+        )
+        self.route(
+            "GET",
+            "/api/v1/documents/contract-document/{account_id}",
+            lambda request: GetContractDocumentResponseSchema(
+                contract=state.get_document(request.params["account_id"], "contract")
+            )
+        )
+
+        # ---------- operations ----------
+        def get_operations(request: Request):
+            return GetOperationsResponseSchema(operations=state.get_operations(request.query_param("accountId")))
+
+        def get_operations_summary(request: Request):
+            return GetOperationsSummaryResponseSchema(
+                summary=state.get_operations_summary(request.query_param("accountId"))
+            )
+
+        def get_operation(request: Request):
+            operation = state.get_operation(request.params["operation_id"])
+            if operation is None:
+                raise HTTPError(HTTPStatus.NOT_FOUND, "Operation not found")
+
+            return GetOperationResponseSchema(operation=operation)
+
+        def get_operation_receipt(request: Request):
+            receipt = state.get_operation_receipt(request.params["operation_id"])
+            if receipt is None:
+                raise HTTPError(HTTPStatus.NOT_FOUND, "Operation not found")
+
+            return GetOperationReceiptResponseSchema(receipt=receipt)
+
+        def make_operation(request_schema: type[MakeOperationRequestSchema], operation_type: OperationType):
+            def handler(request: Request):
+                body = request.parse(request_schema)
+                operation = state.make_operation(
+                    operation_type=operation_type,
+                    status=body.status,
+                    amount=body.amount,
+                    card_id=body.card_id,
+                    account_id=body.account_id,
+                    category=getattr(body, "category", "")
+                )
+                return GetOperationResponseSchema(operation=operation)
+
+            return handler
+
+        self.route("GET", "/api/v1/operations", get_operations)
+        self.route("GET", "/api/v1/operations/operations-summary", get_operations_summary)
+        self.route("GET", "/api/v1/operations/operation-receipt/{operation_id}", get_operation_receipt)
+        self.route("GET", "/api/v1/operations/{operation_id}", get_operation)
+
+        for request_schema, operation_type in (
+                (MakeFeeOperationRequestSchema, OperationType.FEE),
+                (MakeTopUpOperationRequestSchema, OperationType.TOP_UP),
+                (MakeCashbackOperationRequestSchema, OperationType.CASHBACK),
+                (MakeTransferOperationRequestSchema, OperationType.TRANSFER),
+                (MakePurchaseOperationRequestSchema, OperationType.PURCHASE),
+                (MakeBillPaymentOperationRequestSchema, OperationType.BILL_PAYMENT),
+                (MakeCashWithdrawalOperationRequestSchema, OperationType.CASH_WITHDRAWAL),
+        ):
+            route = f"/api/v1/operations/make-{operation_type.lower().replace('_', '-')}-operation"
+            self.route("POST", route, make_operation(request_schema, operation_type))
+
+    # ---------- HTTP ----------
+
+    @staticmethod
+    def render(status: HTTPStatus, body: bytes, keep_alive: bool) -> bytes:
+        headers = (
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        return headers.encode() + body
+
+    async def dispatch(self, request: Request) -> tuple[HTTPStatus, bytes]:
+        try:
+            route, handler = self.resolve(request)
+
+            delay = self.faults.latency(route, self.random)
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            if self.faults.should_fail(route, self.random):
+                raise HTTPError(HTTPStatus(self.faults.error_status), "Injected error")
+
+            response = handler(request)
+            return HTTPStatus.OK, response.__pydantic_serializer__.to_json(response, by_alias=True)
+        except HTTPError as error:
+            return error.status, json.dumps({"detail": error.detail}).encode()
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    return
+
+                request_line, *header_lines = head.decode("latin-1").split("\r\n")
+                method, target, version = request_line.split(" ", 2)
+
+                headers = {}
+                for line in header_lines:
+                    if line:
+                        name, _, value = line.partition(":")
+                        headers[name.strip().lower()] = value.strip()
+
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+                keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+
+                url = urlsplit(target)
+                status, payload = await self.dispatch(Request(method, url.path, parse_qs(url.query), body))
+
+                writer.write(self.render(status, payload, keep_alive))
+                await writer.drain()
+
+                if not keep_alive:
+                    return
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError, asyncio.CancelledError):
+            # CancelledError — закрытие сервера через shutdown(): соединение просто закрывается
+            return
+        finally:
+            writer.close()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8003) -> asyncio.AbstractServer:
+        self.server = await asyncio.start_server(self.handle_connection, host, port, reuse_address=True, backlog=4096)
+        return self.server
+
+    async def serve_forever(self, host: str = "127.0.0.1", port: int = 8003) -> None:
+        server = await self.start(host, port)
+        async with server:
+            await server.serve_forever()
+
+    def start_in_thread(self, host: str = "127.0.0.1", port: int = 8003) -> None:
+        """
+        Запускает сервер в фоновом потоке со своим event loop (для замеров в одном процессе).
+        Возвращает управление, когда сервер уже принимает соединения.
+
+        Не подходит для процесса с locust: импорт locust делает gevent monkey patching. Если locust
+        импортирован после запуска, сервер зависает на первом же запросе: его поток работает
+        с неподменёнными примитивами, а клиент — с подменёнными. Если до запуска, поток сервера
+        становится greenlet-ом и обслуживает запросы, только пока остальные greenlet-ы уступают
+        управление, а его CPU попадает в замеры клиента. Сценарии Locust и бенчмарки с Locust-клиентами
+        запускают заглушку отдельным процессом (`python -m stubs.http_gateway`), как benchmarks/client_overhead.py.
+        """
+        started = threading.Event()
+
+        def run() -> None:
+            self.loop = asyncio.new_event_loop()
+            self.loop.run_until_complete(self.start(host, port))
+            started.set()
+            self.loop.run_forever()
+            self.loop.close()
+
+        self.thread = threading.Thread(target=run, name="http-gateway-stub", daemon=True)
+        self.thread.start()
+        started.wait()
+
+    async def shutdown(self) -> None:
+        """
+        Закрывает сервер и открытые keep-alive соединения.
+        """
+        if self.server is not None:
+            self.server.close()
+
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stop(self) -> None:
+        """
+        Останавливает сервер, запущенный через `start_in_thread()`.
+        """
+        if self.loop is None:
+            return
+
+        asyncio.run_coroutine_threadsafe(self.shutdown(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        if self.thread is not None:
+            self.thread.join()
+
+
+def parse_route_values(values: list[str] | None) -> dict[str, float]:
+    """
+    Разбирает аргументы вида "ROUTE=VALUE", например "/api/v1/users=0.5".
+    """
+    result = {}
+    for value in values or []:
+        route, _, number = value.rpartition("=")
+        result[route] = float(number)
+
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Фейковый http-gateway")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8003)
+    parser.add_argument("--latency-ms", type=float, default=0, help="Задержка каждого ответа")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="Стандартное отклонение задержки")
+    parser.add_argument("--error-rate", type=float, default=0, help="Доля ответов с ошибкой, от 0 до 1")
+    parser.add_argument("--error-status", type=int, default=500, help="HTTP-статус инъецированных ошибок")
+    parser.add_argument("--route-latency", action="append", help="Задержка маршрута: ROUTE=MS")
+    parser.add_argument("--route-error-rate", action="append", help="Доля ошибок маршрута: ROUTE=RATE")
+    parser.add_argument("--document-size", type=int, default=1024, help="Размер документов и чеков в байтах")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    faults = FaultConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        route_latency_ms=parse_route_values(args.route_latency),
+        route_error_rate=parse_route_values(args.route_error_rate)
+    )
+    stub = HTTPGatewayStub(GatewayState(seed=args.seed, document_size=args.document_size), faults, seed=args.seed)
+
+    print(f"http-gateway stub listening on http://{args.host}:{args.port}")
+    try:
+        asyncio.run(stub.serve_forever(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
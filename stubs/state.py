@@ -0,0 +1,193 @@
+import random
+import threading
+import uuid
+from base64 import b64encode
+from datetime import datetime, timezone
+
+from clients.http.gateway.account.schema import AccountSchema, AccountStatus, AccountType
+from clients.http.gateway.cards.schema import CardPaymentSystem, CardSchema, CardStatus, CardType
+from clients.http.gateway.documents.schema import DocumentSchema
+from clients.http.gateway.operations.schema import (
+    OperationReceiptSchema,
+    OperationSchema,
+    OperationsSummarySchema,
+    OperationStatus,
+    OperationType
+)
+from clients.http.gateway.users.schema import UserSchema
+
+# Типы операций, уменьшающие и увеличивающие баланс (для статистики по счёту)
+SPENT_OPERATION_TYPES = frozenset({
+    OperationType.FEE,
+    OperationType.PURCHASE,
+    OperationType.TRANSFER,
+    OperationType.BILL_PAYMENT,
+    OperationType.CASH_WITHDRAWAL,
+})
+RECEIVED_OPERATION_TYPES = frozenset({OperationType.TOP_UP})
+
+# Для счетов этих типов при открытии сразу выпускается виртуальная карта
+CARD_ACCOUNT_TYPES = frozenset({AccountType.DEBIT_CARD, AccountType.CREDIT_CARD})
+
+
+class GatewayState:
+    """
+    Хранилище данных фейкового gateway в памяти процесса.
+
+    Сущности хранятся в виде pydantic-схем из `clients/http/gateway/*/schema.py`,
+    поэтому HTTP-заглушка отдаёт ровно те структуры, которые ожидают клиенты,
+    а gRPC-заглушка переводит их в proto-сообщения.
+    Неизвестные user_id/account_id при создании сущностей не считаются ошибкой:
+    заглушка должна выдерживать нагрузку с произвольными идентификаторами.
+    """
+
+    def __init__(self, seed: int | None = None, document_size: int = 1024):
+        """
+        :param seed: Seed для генерации номеров карт, PIN, CVV и т.д.
+        :param document_size: Размер содержимого документов и чеков в байтах (до base64).
+        """
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+
+        self.users: dict[str, UserSchema] = {}
+        self.accounts: dict[str, AccountSchema] = {}
+        self.user_accounts: dict[str, list[str]] = {}
+        self.cards: dict[str, CardSchema] = {}
+        self.operations: dict[str, OperationSchema] = {}
+        self.account_operations: dict[str, list[str]] = {}
+
+        # Содержимое документов одинаковое для всех счетов: генерируется один раз
+        self.document = b64encode(self.random.randbytes(document_size)).decode()
+
+    def create_user(
+            self,
+            email: str,
+            last_name: str,
+            first_name: str,
+            middle_name: str,
+            phone_number: str
+    ) -> UserSchema:
+        user = UserSchema.model_validate({
+            "id": str(uuid.uuid4()),
+            "email": email,
+            "lastName": last_name,
+            "firstName": first_name,
+            "middleName": middle_name,
+            "phoneNumber": phone_number,
+        })
+        with self.lock:
+            self.users[user.id] = user
+
+        return user
+
+    def get_user(self, user_id: str) -> UserSchema | None:
+        return self.users.get(user_id)
+
+    def build_card(self, account_id: str, card_type: CardType) -> CardSchema:
+        holder = "CARD HOLDER"
+        return CardSchema.model_validate({
+            "id": str(uuid.uuid4()),
+            "pin": f"{self.random.randrange(10_000):04d}",
+            "cvv": f"{self.random.randrange(1_000):03d}",
+            "type": card_type,
+            "status": CardStatus.ACTIVE,
+            "accountId": account_id,
+            "cardNumber": "".join(str(self.random.randrange(10)) for _ in range(16)),
+            "cardHolder": holder,
+            "expiryDate": f"{self.random.randint(1, 12):02d}/{datetime.now().year % 100 + 3:02d}",
+            "paymentSystem": self.random.choice(list(CardPaymentSystem)),
+        })
+
+    def open_account(self, user_id: str, account_type: AccountType) -> AccountSchema:
+        account_id = str(uuid.uuid4())
+        cards = [self.build_card(account_id, CardType.VIRTUAL)] if account_type in CARD_ACCOUNT_TYPES else []
+        account = AccountSchema.model_validate({
+            "id": account_id,
+            "type": account_type,
+            "cards": cards,
+            "status": AccountStatus.ACTIVE,
+            "balance": 0.0,
+        })
+        with self.lock:
+            self.accounts[account.id] = account
+            self.user_accounts.setdefault(user_id, []).append(account.id)
+            for card in cards:
+                self.cards[card.id] = card
+
+        return account
+
+    def get_accounts(self, user_id: str) -> list[AccountSchema]:
+        return [self.accounts[account_id] for account_id in self.user_accounts.get(user_id, [])]
+
+    def issue_card(self, account_id: str, card_type: CardType) -> CardSchema:
+        card = self.build_card(account_id, card_type)
+        with self.lock:
+            self.cards[card.id] = card
+            account = self.accounts.get(account_id)
+            if account is not None:
+                account.cards.append(card)
+
+        return card
+
+    def make_operation(
+            self,
+            operation_type: OperationType,
+            status: OperationStatus,
+            amount: float,
+            card_id: str,
+            account_id: str,
+            category: str = ""
+    ) -> OperationSchema:
+        operation = OperationSchema.model_validate({
+            "id": str(uuid.uuid4()),
+            "type": operation_type,
+            "status": status,
+            "amount": amount,
+            "cardId": card_id,
+            "category": category,
+            "createdAt": datetime.now(timezone.utc),
+            "accountId": account_id,
+        })
+        with self.lock:
+            self.operations[operation.id] = operation
+            self.account_operations.setdefault(account_id, []).append(operation.id)
+
+        return operation
+
+    def get_operation(self, operation_id: str) -> OperationSchema | None:
+        return self.operations.get(operation_id)
+
+    def get_operations(self, account_id: str) -> list[OperationSchema]:
+        return [self.operations[operation_id] for operation_id in self.account_operations.get(account_id, [])]
+
+    def get_operations_summary(self, account_id: str) -> OperationsSummarySchema:
+        spent = received = cashback = 0.0
+        for operation in self.get_operations(account_id):
+            if operation.type in SPENT_OPERATION_TYPES:
+                spent += operation.amount
+            elif operation.type in RECEIVED_OPERATION_TYPES:
+                received += operation.amount
+            elif operation.type == OperationType.CASHBACK:
+                cashback += operation.amount
+
+        return OperationsSummarySchema.model_validate({
+            "spentAmount": round(spent, 2),
+            "receivedAmount": round(received, 2),
+            "cashbackAmount": round(cashback, 2),
+        })
+
+    def get_operation_receipt(self, operation_id: str) -> OperationReceiptSchema | None:
+        if operation_id not in self.operations:
+            return None
+
+        return OperationReceiptSchema(
+            url=f"http://localhost:8003/static/receipts/{operation_id}.pdf",
+            document=self.document
+        )
+
+    def get_document(self, account_id: str, kind: str) -> DocumentSchema:
+        """
+        :param account_id: Идентификатор счёта.
+        :param kind: Вид документа: "tariff" или "contract".
+        """
+        return DocumentSchema(url=f"http://localhost:8003/static/{kind}s/{account_id}.pdf", document=self.document)
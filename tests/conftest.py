@@ -0,0 +1,53 @@
+import os
+
+# Locust при импорте патчит стандартную библиотеку gevent'ом, а тестам нужны обычные потоки и asyncio
+os.environ.setdefault("LOCUST_SKIP_MONKEY_PATCH", "1")
+
+import pytest
+from locust.env import Environment
+
+
+@pytest.fixture
+def environment() -> Environment:
+    return Environment()
+
+
+@pytest.fixture
+def request_events(environment: Environment) -> list[dict]:
+    """
+    События `environment.events.request`, отправленные во время теста.
+    """
+    events = []
+    environment.events.request.add_listener(lambda **kwargs: events.append(kwargs))
+    return events
+
+
+@pytest.fixture(scope="session")
+def grpc_gateway() -> str:
+    """
+    Фейковый grpc-gateway (stubs/grpc_gateway.py) на свободном порту.
+
+    :return: Адрес сервера для grpc.insecure_channel.
+    """
+    from stubs.grpc_gateway import GRPCGatewayStub
+
+    stub = GRPCGatewayStub(max_workers=8, seed=1)
+    port = stub.start(port=0)
+    yield f"127.0.0.1:{port}"
+    stub.stop(grace=None)
+
+
+@pytest.fixture(scope="session")
+def http_gateway() -> str:
+    """
+    Фейковый http-gateway (stubs/http_gateway.py) на свободном порту в фоновом потоке.
+
+    :return: base_url для httpx.Client.
+    """
+    from stubs.http_gateway import HTTPGatewayStub
+
+    stub = HTTPGatewayStub(seed=1)
+    stub.start_in_thread(port=0)
+    port = stub.server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}"
+    stub.stop()
@@ -0,0 +1,66 @@
+import pytest
+from grpc import ChannelConnectivity
+
+from clients.grpc.channel_pool import GRPCChannelPool
+from clients.grpc.gateway.users.client import UsersGatewayGRPCClient, contract
+
+
+def set_states(pool: GRPCChannelPool, *states: ChannelConnectivity) -> None:
+    """
+    Отписывает каналы пула от настоящих событий подключения и выставляет им состояния.
+    """
+    for member, state in zip(pool.members, states, strict=True):
+        member.channel.unsubscribe(member._on_state_change)
+        member.state = state
+
+
+@pytest.fixture
+def pool(grpc_gateway):
+    with GRPCChannelPool(grpc_gateway, size=3) as pool:
+        yield pool
+
+
+def test_rejects_empty_pool():
+    with pytest.raises(ValueError):
+        GRPCChannelPool("localhost:1", size=0)
+
+
+def test_round_robin_cycles_over_channels(pool):
+    set_states(pool, *[ChannelConnectivity.READY] * 3)
+
+    assert [pool.select() for _ in range(6)] == [0, 1, 2, 0, 1, 2]
+
+
+def test_round_robin_skips_unhealthy_channels(pool):
+    set_states(pool, ChannelConnectivity.READY, ChannelConnectivity.TRANSIENT_FAILURE, ChannelConnectivity.IDLE)
+
+    assert {pool.select() for _ in range(6)} == {0, 2}
+
+
+def test_all_unhealthy_channels_are_still_selected(pool):
+    set_states(pool, *[ChannelConnectivity.SHUTDOWN] * 3)
+
+    assert {pool.select() for _ in range(3)} == {0, 1, 2}
+
+
+def test_least_loaded_picks_channel_with_fewest_calls(pool):
+    pool.strategy = "least_loaded"
+    set_states(pool, ChannelConnectivity.READY, ChannelConnectivity.READY, ChannelConnectivity.TRANSIENT_FAILURE)
+    pool.members[0].in_flight = 2
+    pool.members[1].in_flight = 1
+
+    assert pool.select() == 1
+
+
+def test_calls_are_spread_over_channels_and_released(pool):
+    set_states(pool, *[ChannelConnectivity.READY] * 3)
+    client = UsersGatewayGRPCClient(pool)
+
+    user_id = client.create_user().user.id
+    assert client.get_user(user_id).user.id == user_id
+    futures = [client.stub.GetUser.future(contract.GetUserRequest(id=user_id)) for _ in range(4)]
+    assert all(future.result().user.id == user_id for future in futures)
+
+    assert [member.in_flight for member in pool.members] == [0, 0, 0]
+    # Пять вызовов GetUser прошли через все три канала
+    assert len(client.stub.GetUser._callables) == 3
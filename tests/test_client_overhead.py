@@ -0,0 +1,62 @@
+import argparse
+import json
+from dataclasses import asdict
+
+import pytest
+
+from benchmarks.client_overhead import (
+    Result,
+    compare,
+    get_shared_methods,
+    measure_allocations,
+    measure_time,
+    run_transport
+)
+
+ARGS = argparse.Namespace(iterations=2, warmup=1, alloc_iterations=1, trusted=False)
+
+
+def get_port(address: str) -> int:
+    return int(address.rpartition(":")[2])
+
+
+def test_shared_methods():
+    methods = get_shared_methods()
+
+    assert ("users", "get_user") in methods
+    assert ("operations", "make_bill_payment_operation") in methods
+    assert ("documents", "get_contract_document") in methods
+    assert not [method for _, method in methods if method.endswith(("_api", "_lazy"))]
+
+
+@pytest.mark.parametrize("transport", ["http", "grpc"])
+def test_runs_every_shared_method(transport, http_gateway, grpc_gateway):
+    port = get_port(http_gateway if transport == "http" else grpc_gateway)
+
+    results = run_transport(transport, port, get_shared_methods(), ARGS)
+
+    assert len(results) == len(get_shared_methods()) * 3
+    assert {result.mode for result in results} == {"roundtrip/plain", "roundtrip/locust", "decode"}
+    assert all(result.ns_per_call > 0 and result.alloc_bytes_per_call is not None for result in results)
+
+
+def test_measurements():
+    wall, cpu = measure_time(lambda: sum(range(100)), iterations=10, warmup=1)
+    assert wall > 0 and cpu >= 0
+
+    allocated, retained = measure_allocations(lambda: [0] * 1000, iterations=5)
+    assert allocated >= 8000
+    assert retained < 1000
+
+
+def test_compare_prints_change(tmp_path, capsys):
+    previous = Result("http", "decode", "users.get_user", 10, 1000, 1000, 1_000_000)
+    current = Result("http", "decode", "users.get_user", 10, 1500, 1500, 666_666)
+    path = tmp_path / "previous.json"
+    path.write_text(json.dumps({"results": [asdict(previous)]}))
+
+    compare([current, Result("grpc", "decode", "users.get_user", 10, 1, 1, 1)], path)
+
+    output = capsys.readouterr().out
+    assert "+50.0 %" in output
+    assert "grpc" not in output
@@ -0,0 +1,90 @@
+import importlib
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from clients.grpc.contracts import GatewayContract, to_snake_case
+
+SERVICES = [
+    ("accounts", "AccountsGatewayService"),
+    ("cards", "CardsGatewayService"),
+    ("documents", "DocumentsGatewayService"),
+    ("operations", "OperationsGatewayService"),
+    ("users", "UsersGatewayService"),
+]
+
+
+class RecordingChannel:
+    """
+    Канал, который вместо вызовов запоминает, какие multicallable у него запросили.
+    """
+
+    def __init__(self):
+        self.methods = {}
+
+    def unary_unary(self, method, request_serializer=None, response_deserializer=None, _registered_method=False):
+        self.methods[method] = (request_serializer, response_deserializer)
+        return method
+
+
+@pytest.mark.parametrize(("name", "expected"), [
+    ("GetUser", "get_user"),
+    ("GetOperationsSummary", "get_operations_summary"),
+    ("MakeTopUpOperation", "make_top_up_operation"),
+])
+def test_to_snake_case(name, expected):
+    assert to_snake_case(name) == expected
+
+
+def test_contract_resolves_and_caches_messages():
+    contract = GatewayContract("users", "UsersGatewayService")
+
+    message = contract.GetUserRequest
+
+    assert message.__module__ == "contracts.services.gateway.users.rpc_get_user_pb2"
+    assert vars(contract)["GetUserRequest"] is message
+    assert contract.method_path("GetUser") == "/contracts.services.gateway.users.UsersGatewayService/GetUser"
+
+
+@pytest.mark.parametrize("name", ["Request", "GetUser", "get_user_request"])
+def test_contract_rejects_other_names(name):
+    with pytest.raises(AttributeError):
+        getattr(GatewayContract("users", "UsersGatewayService"), name)
+
+
+@pytest.mark.parametrize(("package", "service"), SERVICES)
+def test_lazy_stub_matches_generated_stub(package, service):
+    module = importlib.import_module(f"contracts.services.gateway.{package}.{package}_gateway_service_pb2_grpc")
+    generated = RecordingChannel()
+    getattr(module, f"{service}Stub")(generated)
+
+    lazy = RecordingChannel()
+    stub = GatewayContract(package, service).stub(lazy)
+    for path in generated.methods:
+        getattr(stub, path.rpartition("/")[2])
+
+    assert lazy.methods == generated.methods
+
+
+def test_lazy_stub_caches_multicallables():
+    channel = RecordingChannel()
+    stub = GatewayContract("users", "UsersGatewayService").stub(channel)
+
+    assert stub.GetUser is stub.GetUser
+    assert len(channel.methods) == 1
+    with pytest.raises(AttributeError):
+        stub.get_user
+
+
+def test_importing_clients_does_not_load_contracts():
+    code = (
+        "import sys, clients.grpc.gateway.operations.client, clients.grpc.gateway.users.client\n"
+        "print(sorted(name for name in sys.modules if '.rpc_' in name or name.endswith('_pb2_grpc')))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], cwd=Path(__file__).parents[1], capture_output=True, text=True, check=True
+    )
+
+    assert output.stdout.strip() == "[]"
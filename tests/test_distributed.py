@@ -0,0 +1,60 @@
+import os
+import signal
+import subprocess
+import sys
+
+import pytest
+
+from tools.distributed import get_available_cpus, get_cpu_layout, print_summary, start_process, stop_process
+
+
+def test_cpu_layout_reserves_first_cpu_for_master():
+    assert get_cpu_layout(3, [2, 3, 5]) == (2, [3, 5, 3])
+
+
+def test_cpu_layout_does_not_pin_on_single_cpu():
+    assert get_cpu_layout(2, [0]) == (None, [None, None])
+    assert get_cpu_layout(2, []) == (None, [None, None])
+
+
+@pytest.mark.skipif(not hasattr(os, "sched_getaffinity"), reason="affinity is not supported")
+def test_available_cpus_match_affinity():
+    assert get_available_cpus() == sorted(os.sched_getaffinity(0))
+
+
+def test_start_process_writes_log_and_pins_cpu(tmp_path):
+    cpu = get_available_cpus()[0] if get_available_cpus() else None
+    log_path = tmp_path / "worker.log"
+
+    process = start_process([sys.executable, "-c", "print('started')"], log_path, cpu)
+
+    assert process.wait(10) == 0
+    assert log_path.read_text() == "started\n"
+
+
+def test_stop_process_kills_process_ignoring_signal():
+    code = "import signal, time; signal.signal(signal.SIGTERM, signal.SIG_IGN); print(flush=True); time.sleep(60)"
+    process = subprocess.Popen([sys.executable, "-c", code], stdout=subprocess.PIPE)
+    process.stdout.readline()  # Обработчик сигнала установлен
+
+    stop_process(process, signal.SIGTERM, timeout=0.2)
+
+    assert process.returncode == -signal.SIGKILL
+    process.stdout.close()
+
+
+def test_print_summary(tmp_path, capsys):
+    stats_path = tmp_path / "scenario_stats.csv"
+    stats_path.write_text(
+        "Type,Name,Request Count,Failure Count,Median Response Time,95%,99%,Requests/s\n"
+        "GET,/api/v1/users/{user_id},100,2,12,30,45,50.5\n"
+        ",Aggregated,100,2,12,30,45,\n"
+    )
+
+    print_summary(stats_path)
+    print_summary(tmp_path / "missing.csv")
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[1].split() == ["GET", "/api/v1/users/{user_id}", "100.0", "2.0", "12.0", "30.0", "45.0", "50.5"]
+    assert lines[2].split()[-1] == "0.0"
+    assert lines[3].startswith("No stats file")
@@ -0,0 +1,68 @@
+import json
+
+import pytest
+from httpx import Client, MockTransport, Request, Response
+
+from clients.http.encoding import JSONBody, JSONBodyTemplate, encode_json_body
+from clients.http.gateway.account.schema import OpenDebitCardAccountRequestSchema
+from clients.http.gateway.cards.client import ISSUE_VIRTUAL_CARD_BODY, CardsGatewayHTTPClient
+from clients.http.gateway.cards.schema import IssueVirtualCardRequestSchema
+from clients.http.gateway.users.schema import CreateUserRequestSchema
+
+
+def test_encode_json_body_uses_aliases():
+    request = CreateUserRequestSchema()
+
+    body = encode_json_body(request)
+
+    assert isinstance(body, JSONBody)
+    assert json.loads(body) == request.model_dump(by_alias=True)
+    assert encode_json_body(body) is body
+
+
+def test_template_splits_body_by_fields():
+    template = JSONBodyTemplate(IssueVirtualCardRequestSchema, "account_id", "user_id")
+
+    # Части идут в порядке полей в теле, а не в порядке аргументов
+    assert template.order == ["user_id", "account_id"]
+    assert template.parts == [b'{"userId":"', b'","accountId":"', b'"}']
+
+
+def test_template_renders_same_body_as_model():
+    template = JSONBodyTemplate(IssueVirtualCardRequestSchema, "user_id", "account_id")
+
+    body = template.render(user_id="user-1", account_id="account-1")
+
+    assert isinstance(body, JSONBody)
+    assert body == encode_json_body(IssueVirtualCardRequestSchema(user_id="user-1", account_id="account-1"))
+
+
+@pytest.mark.parametrize("value", ['quote " and \\ slash', "новый\nпользователь", "tab\there"])
+def test_template_escapes_values(value):
+    template = JSONBodyTemplate(OpenDebitCardAccountRequestSchema, "user_id")
+
+    assert json.loads(template.render(user_id=value)) == {"userId": value}
+
+
+def test_template_requires_all_values():
+    template = JSONBodyTemplate(IssueVirtualCardRequestSchema, "user_id", "account_id")
+
+    with pytest.raises(KeyError):
+        template.render(user_id="user-1")
+
+
+def test_client_posts_model_and_template_bodies_alike():
+    requests = []
+
+    def handler(request: Request) -> Response:
+        requests.append(request)
+        return Response(500)
+
+    with Client(transport=MockTransport(handler), base_url="http://gateway") as client:
+        cards_client = CardsGatewayHTTPClient(client)
+        cards_client.issue_virtual_card_api(IssueVirtualCardRequestSchema(user_id="user-1", account_id="account-1"))
+        cards_client.issue_virtual_card_api(ISSUE_VIRTUAL_CARD_BODY.render(user_id="user-1", account_id="account-1"))
+
+    assert [request.headers["content-type"] for request in requests] == ["application/json"] * 2
+    assert requests[0].content == requests[1].content
+    assert json.loads(requests[0].content) == {"userId": "user-1", "accountId": "account-1"}
@@ -0,0 +1,62 @@
+import itertools
+from enum import Enum
+
+import pytest
+from faker import Faker
+
+from tools.fakers import CATEGORIES, Fake, PooledFake, ValuePool, build_fake
+
+
+class Color(Enum):
+    RED = "red"
+    GREEN = "green"
+
+
+def test_value_pool_fills_by_chunks_and_cycles():
+    counter = itertools.count()
+    pool = ValuePool(lambda: next(counter), size=5, chunk_size=2)
+
+    values = [pool.next() for _ in range(7)]
+
+    assert values == [0, 1, 2, 3, 4, 0, 1]
+    assert pool.values == [0, 1, 2, 3, 4]
+
+
+def test_value_pool_fill_stops_at_size():
+    pool = ValuePool(object, size=3, chunk_size=1)
+    pool.fill(10)
+    pool.fill()
+
+    assert len(pool.values) == 3
+
+
+def test_pooled_fake_reuses_pooled_values():
+    fake = PooledFake(Faker(), pool_size=3, chunk_size=3)
+
+    names = [fake.first_name() for _ in range(6)]
+
+    assert names[:3] == names[3:]
+    assert fake.category() in CATEGORIES
+    assert 1 <= fake.amount() <= 1000
+
+
+def test_pooled_fake_emails_stay_unique():
+    fake = PooledFake(Faker(), pool_size=2, chunk_size=2)
+
+    emails = [fake.email() for _ in range(10)]
+
+    assert len(set(emails)) == 10
+
+
+def test_pooled_fake_prefill_and_enums():
+    fake = PooledFake(Faker(), pool_size=4, chunk_size=1, prefill=True)
+
+    assert all(len(pool.values) == 4 for pool in fake.pools.values())
+    assert {fake.enum(Color) for _ in range(50)} == set(Color)
+
+
+@pytest.mark.parametrize(("pool_size", "expected"), [("0", Fake), ("100", PooledFake)])
+def test_build_fake_reads_environment(monkeypatch, pool_size, expected):
+    monkeypatch.setenv("FAKE_POOL_SIZE", pool_size)
+
+    assert type(build_fake()) is expected
@@ -0,0 +1,87 @@
+import uuid
+
+import pytest
+
+from tools.fixture_file import (
+    HEADER_SIZE,
+    FileFixtureProvider,
+    FixtureFile,
+    SharedCursor,
+    build_fixture_file,
+    get_cursor_path
+)
+from tools.fixtures import Fixture, FixtureKind, FixturesExhausted
+from tools.seeder import RECORD
+
+ROWS = [tuple(str(uuid.uuid4()) for _ in range(3)) for _ in range(5)]
+
+
+@pytest.fixture
+def fixture_path(tmp_path, monkeypatch):
+    # Несколько проходов сборки, последний неполный
+    monkeypatch.setattr("tools.fixture_file.BUILD_BATCH_ROWS", 2)
+    seed_path = tmp_path / "seed.bin"
+    seed_path.write_bytes(b"".join(RECORD.pack(*(uuid.UUID(value).bytes for value in row)) for row in ROWS))
+
+    path = tmp_path / "seed.fixtures"
+    assert build_fixture_file(seed_path, path) == len(ROWS)
+    return path
+
+
+def test_build_and_read_round_trip(fixture_path):
+    fixture_file = FixtureFile(fixture_path)
+
+    assert len(fixture_file) == len(ROWS)
+    assert [fixture_file[index] for index in range(len(ROWS))] == [
+        Fixture(user_id, account_id, (card_id,)) for user_id, account_id, card_id in ROWS
+    ]
+    with pytest.raises(IndexError):
+        fixture_file[len(ROWS)]
+    fixture_file.close()
+
+
+def test_file_is_column_oriented(fixture_path):
+    data = fixture_path.read_bytes()
+
+    user_ids = data[HEADER_SIZE:HEADER_SIZE + 16 * len(ROWS)]
+    assert user_ids == b"".join(uuid.UUID(row[0]).bytes for row in ROWS)
+
+
+def test_rejects_foreign_and_truncated_files(fixture_path, tmp_path):
+    foreign = tmp_path / "foreign"
+    foreign.write_bytes(b"\0" * HEADER_SIZE)
+    with pytest.raises(ValueError, match="not a fixture file"):
+        FixtureFile(foreign)
+
+    truncated = tmp_path / "truncated"
+    truncated.write_bytes(fixture_path.read_bytes()[:-1])
+    with pytest.raises(ValueError, match="truncated"):
+        FixtureFile(truncated)
+
+
+def test_shared_cursor_hands_out_disjoint_blocks(tmp_path):
+    path = tmp_path / "cursor"
+    first, second = SharedCursor(path, block=3), SharedCursor(path, block=3)
+
+    claimed = [first.claim(), second.claim(), first.claim(), second.claim(), first.claim(), first.claim()]
+
+    assert claimed == [0, 3, 1, 4, 2, 6]
+    assert first.position() == 9
+
+    first.reset()
+    assert SharedCursor(path, block=3).claim() == 0
+
+
+def test_provider_exhausts_and_wraps(fixture_path):
+    fixture_file = FixtureFile(fixture_path)
+    cursor = SharedCursor(get_cursor_path(fixture_path), block=2)
+    provider = FileFixtureProvider(fixture_file, cursor, kind=FixtureKind.DEBIT_CARD_ACCOUNTS)
+
+    assert [provider.checkout().user_id for _ in ROWS] == [row[0] for row in ROWS]
+    with pytest.raises(FixturesExhausted):
+        provider.checkout()
+
+    wrapping = FileFixtureProvider(fixture_file, cursor, kind=FixtureKind.USERS, wrap=True)
+    fixture = wrapping.checkout()
+    assert fixture == Fixture(ROWS[1][0])
+    wrapping.release(fixture)
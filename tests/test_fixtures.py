@@ -0,0 +1,116 @@
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+import tools.fixtures
+from locust_get_user_fixture_scenario import GetUserFixtureScenarioUser
+from tools.fixtures import (
+    Fixture,
+    FixtureKind,
+    FixtureProvider,
+    FixturesExhausted,
+    FixtureStore,
+    build_fixture_provider,
+    get_available_key
+)
+
+USERS = FixtureKind.USERS
+ACCOUNTS = FixtureKind.DEBIT_CARD_ACCOUNTS
+
+
+@pytest.fixture
+def redis():
+    return fakeredis.FakeRedis()
+
+
+@pytest.fixture
+def store(redis) -> FixtureStore:
+    return FixtureStore(redis)
+
+
+@pytest.fixture
+def fake_redis_url(monkeypatch, redis):
+    monkeypatch.setattr(tools.fixtures.Redis, "from_url", lambda url: redis)
+
+
+def test_fixture_round_trip():
+    fixture = Fixture("user-1", "account-1", ("card-1", "card-2"))
+
+    assert Fixture.load(fixture.dump()) == fixture
+    assert Fixture.load(Fixture("user-2").dump()) == Fixture("user-2")
+
+
+def test_checkout_moves_fixtures_in_order(store, monkeypatch):
+    monkeypatch.setattr(tools.fixtures, "SEED_BATCH_SIZE", 2)
+    assert store.push(USERS, [Fixture(f"user-{index}") for index in range(5)]) == 5
+
+    first, second = store.checkout(USERS), store.checkout(USERS)
+
+    assert (first.user_id, second.user_id) == ("user-0", "user-1")
+    assert store.stats(USERS) == (3, 2)
+    assert store.stats(ACCOUNTS) == (0, 0)
+
+
+def test_checkout_from_empty_store(store):
+    with pytest.raises(FixturesExhausted):
+        store.checkout(USERS)
+
+
+def test_release_returns_fixture_to_the_end(store):
+    store.push(USERS, [Fixture("user-0"), Fixture("user-1")])
+    fixture = store.checkout(USERS)
+
+    store.release(USERS, fixture)
+
+    assert store.stats(USERS) == (2, 0)
+    assert [store.checkout(USERS).user_id for _ in range(2)] == ["user-1", "user-0"]
+
+
+def test_fixtures_are_never_handed_out_twice(store):
+    store.push(ACCOUNTS, [Fixture(f"user-{index}", f"account-{index}", ("card",)) for index in range(50)])
+
+    handed_out = [store.checkout(ACCOUNTS) for _ in range(50)]
+
+    assert len(set(handed_out)) == 50
+    with pytest.raises(FixturesExhausted):
+        store.checkout(ACCOUNTS)
+
+
+def test_reset_and_clear(store, redis):
+    store.push(USERS, [Fixture(f"user-{index}") for index in range(3)])
+    store.checkout(USERS)
+    store.checkout(USERS)
+
+    assert store.reset(USERS) == 2
+    assert store.stats(USERS) == (3, 0)
+
+    store.clear(USERS)
+    assert store.stats(USERS) == (0, 0)
+    assert not redis.exists(get_available_key(USERS))
+
+
+def test_provider_shares_store_per_environment(environment, fake_redis_url):
+    provider = build_fixture_provider(environment, USERS)
+
+    assert isinstance(provider, FixtureProvider)
+    assert build_fixture_provider(environment, ACCOUNTS).store is provider.store
+
+    provider.store.push(USERS, [Fixture("user-0")])
+    fixture = provider.checkout()
+    provider.release(fixture)
+    assert provider.store.stats(USERS) == (1, 0)
+
+
+def test_scenario_stops_cleanly_when_fixtures_are_exhausted(environment, fake_redis_url):
+    user = GetUserFixtureScenarioUser(environment)
+    with pytest.raises(FixturesExhausted):
+        user.on_start()
+    user.on_stop()
+
+    user.fixtures.store.push(ACCOUNTS, [Fixture("user-0", "account-0", ("card-0",))])
+    user.on_start()
+    assert user.fixture.user_id == "user-0"
+    assert user.fixtures.store.stats(ACCOUNTS) == (0, 1)
+
+    user.on_stop()
+    assert user.fixtures.store.stats(ACCOUNTS) == (1, 0)
@@ -0,0 +1,43 @@
+import asyncio
+
+import pytest
+from grpc import StatusCode, aio
+
+from clients.grpc.gateway.users.client import AsyncUsersGatewayGRPCClient
+from clients.grpc.interceptors.locust_interceptor import AsyncLocustInterceptor, AsyncWireSizeChannel
+
+
+def test_async_client_creates_and_gets_user(grpc_gateway):
+    async def run():
+        async with aio.insecure_channel(grpc_gateway) as channel:
+            client = AsyncUsersGatewayGRPCClient(channel)
+            created = await client.create_user()
+            return created, await client.get_user(created.user.id)
+
+    created, response = asyncio.run(run())
+
+    assert response.user == created.user
+    assert response.user.email
+
+
+def test_async_locust_interceptor_fires_request_events(grpc_gateway, environment, request_events):
+    async def run():
+        channel = aio.insecure_channel(grpc_gateway, interceptors=[AsyncLocustInterceptor(environment)])
+        async with AsyncWireSizeChannel(channel) as channel:
+            client = AsyncUsersGatewayGRPCClient(channel)
+            created = await client.create_user()
+            with pytest.raises(aio.AioRpcError) as error:
+                await client.get_user("missing")
+            return created, error.value
+
+    created, error = asyncio.run(run())
+
+    assert error.code() == StatusCode.NOT_FOUND
+    create_event, get_event = request_events
+    assert create_event["name"] == "/contracts.services.gateway.users.UsersGatewayService/CreateUser"
+    assert create_event["request_type"] == "gRPC"
+    assert create_event["exception"] is None
+    assert create_event["response_length"] == created.ByteSize()
+    assert get_event["name"] == "/contracts.services.gateway.users.UsersGatewayService/GetUser"
+    assert get_event["exception"] is not None
+    assert get_event["response_length"] == 0
@@ -0,0 +1,69 @@
+import grpc
+import pytest
+
+from clients.grpc.gateway.accounts.client import AccountsGatewayGRPCClient
+from clients.grpc.gateway.cards.client import CardsGatewayGRPCClient
+from clients.grpc.gateway.documents.client import DocumentsGatewayGRPCClient
+from clients.grpc.gateway.operations.client import OperationsGatewayGRPCClient
+from clients.grpc.gateway.users.client import UsersGatewayGRPCClient
+from stubs.grpc_gateway import GRPCFaultConfig, GRPCGatewayStub
+
+
+@pytest.fixture
+def channel(grpc_gateway):
+    with grpc.insecure_channel(grpc_gateway) as channel:
+        yield channel
+
+
+def test_serves_gateway_clients(channel):
+    user = UsersGatewayGRPCClient(channel).create_user().user
+    accounts = AccountsGatewayGRPCClient(channel)
+    account = accounts.open_debit_card_account(user.id).account
+    card = CardsGatewayGRPCClient(channel).issue_virtual_card(user.id, account.id).card
+    assert [item.id for item in accounts.get_accounts(user.id).accounts] == [account.id]
+
+    operations = OperationsGatewayGRPCClient(channel)
+    operation = operations.make_purchase_operation(card.id, account.id).operation
+    operations.make_bill_payment_operation(card.id, account.id)
+    assert operations.get_operation(operation.id).operation == operation
+    assert len(operations.get_operations(account.id).operations) == 2
+    assert operations.get_operations_summary(account.id).ListFields()
+    assert operations.get_operation_receipt(operation.id).ListFields()
+
+    documents = DocumentsGatewayGRPCClient(channel)
+    assert documents.get_tariff_document(account.id).ListFields()
+    assert documents.get_contract_document(account.id).ListFields()
+
+
+def test_unknown_user(channel):
+    with pytest.raises(grpc.RpcError) as error:
+        UsersGatewayGRPCClient(channel).get_user("missing")
+
+    assert error.value.code() == grpc.StatusCode.NOT_FOUND
+
+
+def test_injects_method_errors():
+    stub = GRPCGatewayStub(
+        faults=GRPCFaultConfig(route_error_rate={"CreateUser": 1.0}, error_code=grpc.StatusCode.RESOURCE_EXHAUSTED),
+        max_workers=2,
+        seed=1
+    )
+    port = stub.start(port=0)
+    try:
+        with grpc.insecure_channel(f"127.0.0.1:{port}") as channel:
+            client = UsersGatewayGRPCClient(channel)
+            with pytest.raises(grpc.RpcError) as error:
+                client.create_user()
+            assert error.value.code() == grpc.StatusCode.RESOURCE_EXHAUSTED
+
+            # Остальные методы работают без ошибок
+            with pytest.raises(grpc.RpcError) as error:
+                client.get_user("missing")
+            assert error.value.code() == grpc.StatusCode.NOT_FOUND
+    finally:
+        stub.stop()
+
+
+def test_fault_interceptor_only_when_configured():
+    assert not GRPCGatewayStub(max_workers=1).has_faults()
+    assert GRPCGatewayStub(faults=GRPCFaultConfig(latency_ms=1), max_workers=1).has_faults()
@@ -0,0 +1,85 @@
+import gc
+
+import pytest
+from httpx import ByteStream, Client, MockTransport, Request, Response
+
+import clients.http.gateway.client as gateway
+from clients.http.transport import HTTP2StreamAccountingTransport
+
+
+class Connection:
+    """
+    Заменяет сокет соединения в `response.extensions["network_stream"]`.
+    """
+
+
+def build_client(connections: list[Connection], max_concurrent_streams: int | None = None):
+    def handler(request: Request) -> Response:
+        connection = connections[int(request.url.params["connection"])]
+        return Response(200, stream=ByteStream(b"ok"), extensions={"network_stream": connection})
+
+    transport = HTTP2StreamAccountingTransport(MockTransport(handler), max_concurrent_streams)
+    return transport, Client(transport=transport, base_url="http://gateway")
+
+
+def open_stream(client: Client, connection: int) -> Response:
+    return client.send(client.build_request("GET", "/", params={"connection": connection}), stream=True)
+
+
+@pytest.fixture
+def reset_gateway_transport():
+    yield
+    gateway.configure_gateway_http_transport()
+
+
+def test_counts_streams_per_connection():
+    connections = [Connection(), Connection()]
+    transport, client = build_client(connections)
+
+    responses = [open_stream(client, 0), open_stream(client, 0), open_stream(client, 1)]
+    metrics = transport.stream_metrics()
+    assert metrics["active_streams"] == 3
+    assert sorted(
+        (stats["active_streams"], stats["peak_streams"]) for stats in metrics["connections"]
+    ) == [(1, 1), (2, 2)]
+
+    for response in responses:
+        response.close()
+    open_stream(client, 0).close()
+
+    metrics = transport.stream_metrics()
+    assert metrics["active_streams"] == 0
+    assert metrics["total_streams"] == 4
+    first = transport.connections[connections[0]]
+    assert (first.connection, first.total_streams, first.peak_streams) == (1, 3, 2)
+
+
+def test_closed_connections_leave_metrics():
+    connections = [Connection()]
+    transport, client = build_client(connections)
+    open_stream(client, 0).close()
+
+    connections.clear()
+    gc.collect()  # ответ ссылается на соединение через цикл ссылок с потоком тела
+
+    assert transport.stream_metrics() == {"connections": [], "active_streams": 0, "total_streams": 0}
+
+
+def test_limits_concurrent_streams():
+    transport, client = build_client([Connection()], max_concurrent_streams=2)
+
+    responses = [open_stream(client, 0), open_stream(client, 0)]
+    assert transport.semaphore._value == 0
+
+    responses[0].close()
+    assert transport.semaphore._value == 1
+
+
+def test_gateway_metrics_unwrap_route_limits(reset_gateway_transport):
+    assert gateway.get_gateway_http2_stream_metrics() == {}
+
+    gateway.configure_gateway_http_transport(route_limits={"/api/v1/users": 2}, max_concurrent_streams=8)
+    transport = gateway.get_gateway_http_transport(http2=True)
+
+    assert transport.transport.semaphore is not None
+    assert gateway.get_gateway_http2_stream_metrics() == {"connections": [], "active_streams": 0, "total_streams": 0}
@@ -0,0 +1,84 @@
+import asyncio
+import json
+
+from httpx import AsyncClient, ByteStream, MockTransport, Request, Response
+
+from clients.http.event_hooks.locust_event_hook import (
+    locust_async_request_event_hook,
+    locust_async_response_event_hook
+)
+from clients.http.gateway.users.client import AsyncUsersGatewayHTTPClient
+from clients.http.gateway.users.schema import CreateUserRequestSchema
+
+USER = {
+    "id": "user-1",
+    "email": "user@example.com",
+    "lastName": "Ivanov",
+    "firstName": "Ivan",
+    "middleName": "Ivanovich",
+    "phoneNumber": "+79990000000",
+}
+BODY = json.dumps({"user": USER}).encode()
+
+
+def build_client(requests: list[Request], **kwargs) -> AsyncClient:
+    async def handler(request: Request) -> Response:
+        requests.append(request)
+        # Тело потоком, как из сети: Response(json=...) уже прочитан, и хуки не увидят закрытия потока
+        return Response(200, headers={"content-type": "application/json"}, stream=ByteStream(BODY))
+
+    return AsyncClient(base_url="http://gateway", transport=MockTransport(handler), **kwargs)
+
+
+def test_get_user_sends_request_and_parses_response():
+    requests = []
+
+    async def run():
+        async with build_client(requests) as client:
+            return await AsyncUsersGatewayHTTPClient(client).get_user("user-1")
+
+    response = asyncio.run(run())
+
+    assert [(request.method, request.url.path) for request in requests] == [("GET", "/api/v1/users/user-1")]
+    assert requests[0].extensions["route"] == "/api/v1/users/{user_id}"
+    assert response.user.id == "user-1"
+    assert response.user.first_name == "Ivan"
+
+
+def test_create_user_posts_serialized_schema():
+    requests = []
+
+    async def run():
+        async with build_client(requests) as client:
+            return await AsyncUsersGatewayHTTPClient(client).create_user()
+
+    response = asyncio.run(run())
+
+    request, = requests
+    assert (request.method, request.url.path) == ("POST", "/api/v1/users")
+    assert request.headers["content-type"] == "application/json"
+    body = json.loads(request.content)
+    assert CreateUserRequestSchema.model_validate(body).email == body["email"]
+    assert "lastName" in body
+    assert response.user.email == "user@example.com"
+
+
+def test_async_locust_hooks_fire_request_event(environment, request_events):
+    requests = []
+
+    async def run():
+        event_hooks = {
+            "request": [locust_async_request_event_hook],
+            "response": [locust_async_response_event_hook(environment)],
+        }
+        async with build_client(requests, event_hooks=event_hooks) as client:
+            await AsyncUsersGatewayHTTPClient(client).get_user("user-1")
+
+    asyncio.run(run())
+
+    event, = request_events
+    assert event["name"] == "GET /api/v1/users/{user_id}"
+    assert event["request_type"] == "HTTP"
+    assert event["exception"] is None
+    assert event["response_length"] == len(BODY)
+    assert event["response_time"] > 0
@@ -0,0 +1,86 @@
+import asyncio
+import random
+from http import HTTPStatus
+
+import pytest
+from httpx import Client
+
+from clients.http.gateway.account.client import AccountsGatewayHTTPClient
+from clients.http.gateway.cards.client import CardsGatewayHTTPClient
+from clients.http.gateway.documents.client import DocumentsGatewayHTTPClient
+from clients.http.gateway.operations.client import OperationsGatewayHTTPClient
+from clients.http.gateway.users.client import UsersGatewayHTTPClient
+from stubs.http_gateway import FaultConfig, HTTPGatewayStub, Request, parse_route_values
+
+
+@pytest.fixture
+def client(http_gateway):
+    with Client(base_url=http_gateway) as client:
+        yield client
+
+
+def dispatch(stub: HTTPGatewayStub, method: str, path: str, body: bytes = b"", **query: str):
+    request = Request(method, path, {name: [value] for name, value in query.items()}, body)
+    return asyncio.run(stub.dispatch(request))
+
+
+def test_serves_gateway_clients(client):
+    user = UsersGatewayHTTPClient(client).create_user().user
+    assert UsersGatewayHTTPClient(client).get_user(user.id).user == user
+
+    account = AccountsGatewayHTTPClient(client).open_debit_card_account(user.id).account
+    card = CardsGatewayHTTPClient(client).issue_virtual_card(user.id, account.id).card
+    assert [item.id for item in AccountsGatewayHTTPClient(client).get_accounts(user.id).accounts] == [account.id]
+
+    operations = OperationsGatewayHTTPClient(client)
+    operation = operations.make_purchase_operation(card.id, account.id).operation
+    operations.make_top_up_operation(card.id, account.id)
+    assert operations.get_operation(operation.id).operation == operation
+    assert len(operations.get_operations(account.id).operations) == 2
+    assert operations.get_operations_summary(account.id).summary
+    assert operations.get_operation_receipt(operation.id).receipt
+
+    documents = DocumentsGatewayHTTPClient(client)
+    assert documents.get_tariff_document(account.id).tariff
+    assert documents.get_contract_document(account.id).contract
+
+
+def test_unknown_user_and_route(client):
+    assert UsersGatewayHTTPClient(client).get_user_api("missing").status_code == HTTPStatus.NOT_FOUND
+
+    assert client.get("/api/v1/unknown").status_code == HTTPStatus.NOT_FOUND
+
+
+def test_validates_requests():
+    stub = HTTPGatewayStub(seed=1)
+
+    status, _ = dispatch(stub, "POST", "/api/v1/users", b'{"email": "not-an-email"}')
+    assert status == HTTPStatus.UNPROCESSABLE_ENTITY
+
+    status, body = dispatch(stub, "GET", "/api/v1/accounts")
+    assert status == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert b"userId" in body
+
+
+def test_injects_route_errors():
+    stub = HTTPGatewayStub(
+        faults=FaultConfig(error_status=503, route_error_rate={"/api/v1/accounts": 1.0}),
+        seed=1
+    )
+
+    assert dispatch(stub, "GET", "/api/v1/accounts", userId="user-1")[0] == HTTPStatus.SERVICE_UNAVAILABLE
+    assert dispatch(stub, "GET", "/api/v1/users/missing")[0] == HTTPStatus.NOT_FOUND
+
+
+def test_fault_latency():
+    faults = FaultConfig(latency_ms=20, jitter_ms=5, route_latency_ms={"/slow": 200})
+    rng = random.Random(1)
+
+    assert 0.1 < faults.latency("/slow", rng) < 0.3
+    assert all(faults.latency("/fast", rng) >= 0 for _ in range(100))
+    assert FaultConfig(latency_ms=20).latency("/fast", rng) == 0.02
+
+
+def test_parse_route_values():
+    assert parse_route_values(["/api/v1/users/{user_id}=0.5", "/a=b=2"]) == {"/api/v1/users/{user_id}": 0.5, "/a=b": 2.0}
+    assert parse_route_values(None) == {}
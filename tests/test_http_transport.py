@@ -0,0 +1,77 @@
+import pytest
+from httpx import ByteStream, Client, ConnectError, MockTransport, Request, Response
+
+import clients.http.gateway.client as gateway
+from clients.http.transport import RouteLimitedTransport
+
+
+def handler(request: Request) -> Response:
+    if request.url.path == "/fail":
+        raise ConnectError("connection refused", request=request)
+
+    return Response(200, stream=ByteStream(b"ok"))
+
+
+@pytest.fixture
+def reset_gateway_transport():
+    yield
+    gateway.configure_gateway_http_transport()
+
+
+def test_route_slot_is_held_until_response_is_closed():
+    transport = RouteLimitedTransport(MockTransport(handler), {"/api/v1/users/{user_id}": 1})
+    semaphore = transport.semaphores["/api/v1/users/{user_id}"]
+
+    with Client(transport=transport, base_url="http://gateway") as client:
+        request = client.build_request("GET", "/api/v1/users/1", extensions={"route": "/api/v1/users/{user_id}"})
+        response = client.send(request, stream=True)
+        assert semaphore._value == 0
+
+        response.read()
+        response.close()
+        assert semaphore._value == 1
+
+
+def test_route_without_limit_and_path_routes():
+    transport = RouteLimitedTransport(MockTransport(handler), {"/limited": 1})
+
+    with Client(transport=transport, base_url="http://gateway") as client:
+        assert client.get("/other").content == b"ok"
+        # Без extensions["route"] маршрутом считается путь URL
+        response = client.send(client.build_request("GET", "/limited"), stream=True)
+        assert transport.semaphores["/limited"]._value == 0
+        response.close()
+
+    assert transport.semaphores["/limited"]._value == 1
+
+
+def test_route_slot_is_released_on_transport_error():
+    transport = RouteLimitedTransport(MockTransport(handler), {"/fail": 1})
+
+    with Client(transport=transport, base_url="http://gateway") as client:
+        with pytest.raises(ConnectError):
+            client.get("/fail")
+
+    assert transport.semaphores["/fail"]._value == 1
+
+
+def test_gateway_clients_share_transport(reset_gateway_transport):
+    gateway.configure_gateway_http_transport(max_connections=10, route_limits={"/api/v1/users": 2})
+
+    transport = gateway.get_gateway_http_transport()
+    assert isinstance(transport, RouteLimitedTransport)
+    assert gateway.get_gateway_http_transport() is transport
+    assert gateway.build_gateway_http_client()._transport is transport
+    assert gateway.build_gateway_http_client()._transport is transport
+
+
+def test_reconfigure_closes_transport_and_locust_clients(reset_gateway_transport, environment):
+    transport = gateway.get_gateway_http_transport()
+    locust_client = gateway.build_gateway_locust_http_client(environment)
+    assert gateway.build_gateway_locust_http_client(environment) is locust_client
+
+    gateway.configure_gateway_http_transport(max_connections=10)
+
+    assert locust_client.is_closed
+    assert gateway.get_gateway_http_transport() is not transport
+    assert gateway.build_gateway_locust_http_client(environment) is not locust_client
@@ -0,0 +1,91 @@
+from locust.env import Environment
+
+from tools.latency import (
+    HOUR_MICROSECONDS,
+    REPORT_KEY,
+    LatencyRecorder,
+    format_summary,
+    read_log,
+    register_latency_recorder
+)
+
+
+def test_windows_are_aligned_to_epoch():
+    recorder = LatencyRecorder(window=10)
+
+    recorder.record("GET /users", 1, timestamp=1001.5)
+    recorder.record("GET /users", 2, timestamp=1009.9)
+    recorder.record("GET /users", 3, timestamp=1010.0)
+
+    assert {start: histogram.get_total_count() for (start, _), histogram in recorder.windows.items()} == {
+        1000: 2,
+        1010: 1,
+    }
+
+
+def test_records_microseconds_with_precision_and_clamps():
+    recorder = LatencyRecorder()
+
+    recorder.record("GET /users", 1234.5, timestamp=0)
+    recorder.record("GET /slow", 10 * HOUR_MICROSECONDS, timestamp=0)
+    recorder.record("GET /fast", 0, timestamp=0)
+
+    totals = recorder.totals()
+    assert abs(totals["GET /users"].get_max_value() - 1_234_500) <= 1_234_500 * 0.001
+    assert totals["GET /slow"].get_max_value() >= HOUR_MICROSECONDS * 0.999
+    assert totals["GET /fast"].get_min_value() == 1
+
+
+def test_drain_and_merge_keep_counts():
+    workers = [LatencyRecorder(window=10), LatencyRecorder(window=10)]
+    for index, worker in enumerate(workers):
+        for value in range(1, 101):
+            worker.record("GET /users", value * (index + 1), timestamp=5)
+        worker.record("GET /accounts", 5, timestamp=15)
+
+    master = LatencyRecorder(window=10)
+    for worker in workers:
+        master.merge(worker.drain())
+        assert worker.windows == {}
+
+    totals = master.totals()
+    assert totals["GET /users"].get_total_count() == 200
+    assert totals["GET /accounts"].get_total_count() == 2
+    assert totals["GET /users"].get_max_value() >= 200_000 * 0.999
+
+
+def test_log_round_trip(tmp_path):
+    recorder = LatencyRecorder(window=10)
+    for value in (1, 2, 3):
+        recorder.record("HTTP GET /api/v1/users/{user_id}", value, timestamp=100)
+        recorder.record("gRPC /Users/GetUser, v2", value, timestamp=110)
+
+    path = tmp_path / "reports" / "latency.hlog"
+    recorder.write_log(path)
+
+    lines = path.read_text().splitlines()
+    assert lines[0] == "#[Histogram log format version 1.3]"
+    totals = read_log(path)
+    assert {tag: histogram.get_total_count() for tag, histogram in totals.items()} == {
+        "HTTP_GET_/api/v1/users/{user_id}": 3,
+        "gRPC_/Users/GetUser;_v2": 3,
+    }
+    assert "gRPC_/Users/GetUser;_v2" in format_summary(totals)
+
+
+def test_registered_recorder_exchanges_histograms(environment):
+    worker = register_latency_recorder(environment)
+    environment.events.request.fire(
+        request_type="HTTP", name="GET /users", response_time=12.5, response_length=0, exception=None, context={}
+    )
+
+    data = {}
+    environment.events.report_to_master.fire(client_id="worker", data=data)
+    assert worker.windows == {}
+
+    master_environment = Environment()
+    master = register_latency_recorder(master_environment)
+    master_environment.events.worker_report.fire(client_id="worker", data=data)
+
+    assert len(data[REPORT_KEY]) == 1
+    assert master.totals()["HTTP GET /users"].get_total_count() == 1
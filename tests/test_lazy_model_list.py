@@ -0,0 +1,129 @@
+import json
+
+import pytest
+from httpx import Response
+from pydantic import ValidationError
+
+from clients.http.gateway.operations.schema import OperationSchema
+from clients.http.gateway.users.schema import UserSchema
+from clients.http.parsing import LazyModelList, find_array, parse_lazy_list
+
+
+def build_operation(index: int) -> dict:
+    return {
+        "id": f"operation-{index}",
+        "type": "PURCHASE",
+        "status": "COMPLETED",
+        "amount": index + 0.5,
+        "cardId": "card-1",
+        "category": f"shop [{index}] {{\"quoted\"}}",
+        "createdAt": "2025-01-01T00:00:00",
+        "accountId": "account-1",
+    }
+
+
+def build_list(count: int, **extra) -> LazyModelList[OperationSchema]:
+    data = json.dumps({**extra, "operations": [build_operation(index) for index in range(count)]}).encode()
+    return LazyModelList(data, find_array(data, "operations"), OperationSchema)
+
+
+def test_indexing_and_negative_index():
+    operations = build_list(5)
+
+    assert operations[0].id == "operation-0"
+    assert operations[3].amount == 3.5
+    assert operations[-1].id == "operation-4"
+    assert operations[-5].id == "operation-0"
+    assert len(operations) == 5
+
+
+def test_out_of_range_index():
+    operations = build_list(2)
+
+    with pytest.raises(IndexError):
+        operations[2]
+    with pytest.raises(IndexError):
+        operations[-3]
+
+
+def test_slicing():
+    operations = build_list(6)
+
+    assert [item.id for item in operations[1:4]] == ["operation-1", "operation-2", "operation-3"]
+    assert [item.id for item in operations[::-2]] == ["operation-5", "operation-3", "operation-1"]
+    assert operations[10:] == []
+
+
+def test_iteration_after_partial_access():
+    operations = build_list(4)
+    operations[1]
+
+    assert [item.id for item in operations] == [f"operation-{index}" for index in range(4)]
+    assert [item.id for item in operations] == [f"operation-{index}" for index in range(4)]
+
+
+def test_empty_array():
+    operations = build_list(0)
+
+    assert len(operations) == 0
+    assert list(operations) == []
+
+
+def test_skips_other_keys_with_brackets_in_strings():
+    operations = build_list(2, meta={"note": "a ] b } \"c\" [", "nested": [[1, {"x": "]"}], None]}, total=2)
+
+    assert operations[1].category == "shop [1] {\"quoted\"}"
+
+
+def test_validates_only_accessed_element():
+    data = json.dumps({"operations": [build_operation(0), {"id": "broken"}]}).encode()
+    operations = LazyModelList(data, find_array(data, "operations"), OperationSchema)
+
+    assert operations[0].id == "operation-0"
+    with pytest.raises(ValidationError):
+        operations[1]
+
+
+def test_trusted_list_constructs_email_schemas():
+    user = {
+        "id": "user-1",
+        "email": "not-an-email",
+        "lastName": "Ivanov",
+        "firstName": "Ivan",
+        "middleName": "Ivanovich",
+        "phoneNumber": "+79990000000",
+    }
+    data = json.dumps({"users": [user]}).encode()
+
+    users = LazyModelList(data, find_array(data, "users"), UserSchema, trusted=True)
+
+    assert users[0].email == "not-an-email"
+
+
+@pytest.mark.parametrize("data", [
+    b'{"operations": [{"id": "1"',
+    b'{"operations": [{"id": "1"} {"id": "2"}]}',
+    b'{"operations": ["unterminated',
+])
+def test_malformed_array(data):
+    operations = LazyModelList(data, find_array(data, "operations"), OperationSchema)
+
+    with pytest.raises(ValueError):
+        len(operations)
+
+
+def test_find_array_errors():
+    with pytest.raises(KeyError):
+        find_array(b'{"accounts": []}', "operations")
+    with pytest.raises(ValueError):
+        find_array(b'{"operations": {}}', "operations")
+    with pytest.raises(ValueError):
+        find_array(b'[]', "operations")
+
+
+def test_parse_lazy_list_from_response():
+    response = Response(200, content=json.dumps({"operations": [build_operation(7)]}).encode())
+
+    operations = parse_lazy_list(response, "operations", OperationSchema)
+
+    assert operations[0].id == "operation-7"
@@ -0,0 +1,88 @@
+from httpx import ByteStream, Client, MockTransport, Request, Response
+
+from clients.http.event_hooks.locust_event_hook import (
+    CountingByteStream,
+    ResponseLengthMode,
+    locust_request_event_hook,
+    locust_response_event_hook
+)
+
+BODY = b"x" * 10
+
+
+def handler(request: Request) -> Response:
+    # Content-Length намеренно не совпадает с телом: по длине видно, откуда она взята
+    headers = {"content-length": "999"} if request.url.path != "/chunked" else {}
+    return Response(200, headers=headers, stream=ByteStream(BODY))
+
+
+def build_client(environment, mode=ResponseLengthMode.CONTENT_LENGTH, route_modes=None) -> Client:
+    return Client(
+        transport=MockTransport(handler),
+        base_url="http://gateway",
+        event_hooks={
+            "request": [locust_request_event_hook],
+            "response": [locust_response_event_hook(environment, mode, route_modes)]
+        }
+    )
+
+
+def test_content_length_mode_prefers_header(environment, request_events):
+    with build_client(environment) as client:
+        client.get("/sized")
+        client.get("/chunked")
+
+    assert [event["response_length"] for event in request_events] == [999, len(BODY)]
+
+
+def test_stream_mode_counts_body_bytes(environment, request_events):
+    with build_client(environment, ResponseLengthMode.STREAM) as client:
+        client.get("/sized")
+
+    assert request_events[0]["response_length"] == len(BODY)
+
+
+def test_headers_only_fires_before_body_is_read(environment, request_events):
+    with build_client(environment, ResponseLengthMode.HEADERS_ONLY) as client:
+        response = client.send(client.build_request("GET", "/sized"), stream=True)
+        assert [event["response_length"] for event in request_events] == [999]
+
+        response.read()
+        response.close()
+
+    assert len(request_events) == 1
+
+
+def test_event_is_fired_when_body_is_closed(environment, request_events):
+    with build_client(environment) as client:
+        response = client.send(client.build_request("GET", "/chunked"), stream=True)
+        assert request_events == []
+
+        response.read()
+        response.close()
+
+    assert len(request_events) == 1
+
+
+def test_request_mode_overrides_route_mode(environment, request_events):
+    route_modes = {"/documents/{id}": ResponseLengthMode.STREAM}
+    with build_client(environment, route_modes=route_modes) as client:
+        client.get("/documents/1", extensions={"route": "/documents/{id}"})
+        client.get(
+            "/documents/1",
+            extensions={"route": "/documents/{id}", "response_length_mode": ResponseLengthMode.CONTENT_LENGTH}
+        )
+
+    assert [event["response_length"] for event in request_events] == [len(BODY), 999]
+    assert request_events[0]["name"] == "GET /documents/{id}"
+
+
+def test_counting_stream_reports_length_once():
+    lengths = []
+    stream = CountingByteStream(ByteStream(b"abc"), lengths.append)
+
+    assert b"".join(stream) == b"abc"
+    stream.close()
+    stream.close()
+
+    assert lengths == [3]
@@ -0,0 +1,80 @@
+import logging
+
+from httpx import ByteStream, Client, MockTransport, Request, Response
+
+from clients.http.event_hooks.locust_event_hook import (
+    ResponseLengthMode,
+    RequestTimer,
+    locust_request_event_hook,
+    locust_response_event_hook,
+    warn_headers_only_without_timer
+)
+
+
+def handler(request: Request) -> Response:
+    return Response(200, stream=ByteStream(b"{}"))
+
+
+def test_timer_strips_protocol_prefix_and_chains_trace():
+    calls = []
+    timer = RequestTimer(lambda name, info: calls.append(name))
+
+    timer("http11.send_request_headers.started", {})
+
+    assert set(timer.events) == {"send_request_headers.started"}
+    assert calls == ["http11.send_request_headers.started"]
+
+
+def test_timer_phases():
+    timer = RequestTimer()
+    timer.events = {
+        "connect_tcp.started": 1_000_000,
+        "connect_tcp.complete": 2_000_000,
+        "send_request_headers.started": 3_000_000,
+        "receive_response_headers.complete": 7_500_000,
+    }
+
+    assert timer.phases() == {"connect_ms": 1.0, "ttfb_ms": 4.5, "download_ms": None}
+
+    # С TLS соединение считается установленным после рукопожатия
+    timer.events["start_tls.complete"] = 4_000_000
+    assert timer.phases()["connect_ms"] == 3.0
+
+
+def test_hooks_report_phases_of_real_request(http_gateway, environment, request_events):
+    event_hooks = {"request": [locust_request_event_hook], "response": [locust_response_event_hook(environment)]}
+    with Client(base_url=http_gateway, event_hooks=event_hooks) as client:
+        client.get("/api/v1/users/missing")
+
+    event, = request_events
+    assert event["response_time"] > 0
+    assert event["exception"] is not None
+    context = event["context"]
+    assert context["connect_ms"] is not None
+    assert 0 < context["ttfb_ms"] <= event["response_time"]
+    assert context["download_ms"] is not None
+
+
+def test_hook_without_timer_uses_elapsed(environment, request_events):
+    event_hooks = {"response": [locust_response_event_hook(environment)]}
+    with Client(transport=MockTransport(handler), base_url="http://gateway", event_hooks=event_hooks) as client:
+        response = client.get("/")
+
+    event, = request_events
+    assert event["context"] == {}
+    assert event["response_time"] == response.elapsed.total_seconds() * 1000
+    assert event["response_time"] > 0
+
+
+def test_headers_only_without_timer_falls_back_to_content_length(environment, request_events, caplog):
+    warn_headers_only_without_timer.cache_clear()
+    event_hooks = {"response": [locust_response_event_hook(environment, ResponseLengthMode.HEADERS_ONLY)]}
+
+    with caplog.at_level(logging.WARNING):
+        with Client(transport=MockTransport(handler), base_url="http://gateway", event_hooks=event_hooks) as client:
+            client.get("/")
+            client.get("/")
+
+    assert [event["response_length"] for event in request_events] == [2, 2]
+    assert all(event["response_time"] > 0 for event in request_events)
+    assert len([record for record in caplog.records if "headers-only" in record.message]) == 1
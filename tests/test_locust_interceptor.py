@@ -0,0 +1,92 @@
+import grpc
+import pytest
+
+from clients.grpc.gateway.users.client import UsersGatewayGRPCClient, contract
+from clients.grpc.interceptors.locust_interceptor import (
+    LocustInterceptor,
+    WireSize,
+    WireSizeChannel,
+    _current_wire_size,
+    wrap_call_deserializer
+)
+
+CREATE_USER = "/contracts.services.gateway.users.UsersGatewayService/CreateUser"
+GET_USER = "/contracts.services.gateway.users.UsersGatewayService/GetUser"
+
+
+class FailedCall(grpc.RpcError):
+    pass
+
+
+@pytest.fixture
+def client(grpc_gateway, environment):
+    channel = grpc.insecure_channel(grpc_gateway)
+    yield UsersGatewayGRPCClient(grpc.intercept_channel(WireSizeChannel(channel), LocustInterceptor(environment)))
+    channel.close()
+
+
+def test_wire_size_falls_back_to_byte_size():
+    message = contract.GetUserRequest(id="user-1")
+    wire_size = WireSize()
+
+    assert wire_size.get(message) == message.ByteSize()
+
+    wire_size.add(3)
+    assert wire_size.get(message) == 3
+
+
+def test_wire_size_is_published_only_inside_track():
+    deserializer = contract.GetUserRequest.FromString
+    assert wrap_call_deserializer(deserializer) is deserializer
+
+    with WireSize.track() as wire_size:
+        wrapped = wrap_call_deserializer(deserializer)
+    assert _current_wire_size.get() is None
+
+    data = contract.GetUserRequest(id="user-1").SerializeToString()
+    assert wrapped(data).id == "user-1"
+    assert (wire_size.length, wire_size.recorded) == (len(data), True)
+
+
+def test_blocking_calls_report_wire_size(client, request_events):
+    created = client.create_user()
+    response = client.get_user(created.user.id)
+
+    assert [event["name"] for event in request_events] == [CREATE_USER, GET_USER]
+    assert [event["response_length"] for event in request_events] == [created.ByteSize(), response.ByteSize()]
+    assert all(event["exception"] is None and event["response_time"] > 0 for event in request_events)
+
+
+def test_future_calls_report_their_own_sizes(client, request_events):
+    user_ids = [client.create_user().user.id for _ in range(5)]
+    request_events.clear()
+
+    # Ответы разного размера в полёте одновременно: у каждого вызова свой WireSize
+    futures = [client.stub.GetUser.future(contract.GetUserRequest(id=user_id)) for user_id in user_ids]
+    sizes = sorted(future.result().ByteSize() for future in futures)
+
+    assert sorted(event["response_length"] for event in request_events) == sizes
+
+
+def test_failed_call_reports_exception(client, request_events):
+    with pytest.raises(grpc.RpcError):
+        client.get_user("missing")
+
+    event, = request_events
+    assert event["name"] == GET_USER
+    assert event["exception"].code() == grpc.StatusCode.NOT_FOUND
+    assert event["response_length"] == 0
+
+
+def test_continuation_error_is_reported(environment, request_events):
+    class Details:
+        method = GET_USER
+
+    def continuation(details, request):
+        raise FailedCall()
+
+    with pytest.raises(FailedCall):
+        LocustInterceptor(environment).intercept_unary_unary(continuation, Details(), None)
+
+    event, = request_events
+    assert isinstance(event["exception"], FailedCall)
@@ -0,0 +1,125 @@
+import time
+
+import gevent
+import pytest
+from locust import task
+
+from tools.open_loop import OpenLoopUser, ScheduledStart, scheduled_start, take_start_delay_ns
+
+
+class StartsUser(OpenLoopUser):
+    abstract = True
+
+    def __init__(self, environment):
+        super().__init__(environment)
+        self.starts: list[tuple[int, int, int]] = []
+
+    def record_start(self):
+        # Плановое время, опоздание первого запроса и второго запроса той же задачи
+        intended = scheduled_start.get().intended
+        self.starts.append((intended, take_start_delay_ns(), take_start_delay_ns()))
+
+
+class RecordingUser(StartsUser):
+    arrival_rate = 50
+
+    @task
+    def record(self):
+        self.record_start()
+
+
+class SlowUser(StartsUser):
+    arrival_rate = 100
+    max_in_flight = 1
+
+    @task
+    def record(self):
+        self.record_start()
+        gevent.sleep(0.05)
+
+
+def run_for(user: OpenLoopUser, seconds: float) -> None:
+    greenlet = gevent.spawn(user.run)
+    gevent.sleep(seconds)
+    greenlet.kill()
+
+
+def test_delay_is_clamped():
+    assert ScheduledStart(intended=100, actual=50).delay == 0
+    assert ScheduledStart(intended=100, actual=175).delay == 75
+
+
+def test_delay_is_taken_once():
+    assert take_start_delay_ns() == 0
+
+    token = scheduled_start.set(ScheduledStart(intended=0, actual=500))
+    try:
+        assert take_start_delay_ns() == 500
+        assert take_start_delay_ns() == 0
+    finally:
+        scheduled_start.reset(token)
+
+
+def test_tasks_are_moved_to_scheduler():
+    class ChildUser(RecordingUser):
+        @task(3)
+        def other(self):
+            pass
+
+    assert RecordingUser.tasks == [OpenLoopUser.run_schedule]
+    assert [function.__name__ for function in RecordingUser.open_loop_tasks] == ["record"]
+    # Наследник получает задачи родителя и свои, с учётом весов
+    assert ChildUser.tasks == [OpenLoopUser.run_schedule]
+    assert sorted(function.__name__ for function in ChildUser.open_loop_tasks) == ["other"] * 3 + ["record"]
+
+
+def test_starts_tasks_at_constant_rate(environment):
+    user = RecordingUser(environment)
+
+    run_for(user, 0.5)
+
+    assert 20 <= len(user.starts) <= 26
+    intervals = {second[0] - first[0] for first, second in zip(user.starts, user.starts[1:])}
+    assert intervals == {20_000_000}
+    assert all(second_delay == 0 for _, _, second_delay in user.starts)
+
+
+def test_late_starts_carry_delay(environment):
+    user = SlowUser(environment)
+
+    run_for(user, 0.3)
+
+    # Задача длится 50 мс при расписании раз в 10 мс: каждый следующий запуск опаздывает сильнее
+    delays = [delay for _, delay, _ in user.starts]
+    assert len(delays) >= 4
+    assert delays[-1] > delays[1] > 0
+    assert delays[-1] >= 100_000_000
+
+
+def test_task_errors_fire_user_error(environment):
+    errors = []
+    environment.events.user_error.add_listener(lambda exception, **kwargs: errors.append(exception))
+    user = RecordingUser(environment)
+
+    def failing(user):
+        raise RuntimeError("boom")
+
+    user.execute(failing, time.perf_counter_ns())
+
+    assert [str(error) for error in errors] == ["boom"]
+    assert scheduled_start.get() is None
+
+
+def test_closed_loop_without_rate(environment):
+    class ClosedUser(StartsUser):
+        wait_time = staticmethod(lambda: 0.05)
+
+        @task
+        def record(self):
+            self.starts.append(scheduled_start.get())
+
+    user = ClosedUser(environment)
+    run_for(user, 0.2)
+
+    assert 2 <= len(user.starts) <= 5
+    assert set(user.starts) == {None}
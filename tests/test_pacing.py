@@ -0,0 +1,105 @@
+from types import SimpleNamespace
+
+import pytest
+
+import tools.pacing
+from tools.pacing import PacingController, get_pacing_state, pacing
+
+
+class Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def perf_counter(self) -> float:
+        return self.now
+
+
+class PacedUser:
+    def __init__(self, environment):
+        self.environment = environment
+
+
+@pytest.fixture
+def clock(monkeypatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(tools.pacing, "time", clock)
+    # Без случайной фазы первая задача запускается сразу
+    monkeypatch.setattr(tools.pacing.random, "uniform", lambda start, end: start)
+    return clock
+
+
+@pytest.fixture
+def paced_environment(environment):
+    environment.runner = SimpleNamespace(user_classes_count={"PacedUser": 10})
+    return environment
+
+
+def test_interval_splits_target_between_users():
+    controller = PacingController(target_rps=100)
+
+    assert controller.interval(10) == pytest.approx(0.1)
+    assert controller.interval(0) == pytest.approx(0.01)
+
+
+def test_route_target_accounts_for_requests_per_task():
+    controller = PacingController(target_rps=100, route="GET /users")
+    assert controller.requests_per_task == 1.0
+
+    controller.tasks = 2
+    for name in ("GET /users", "GET /users", "GET /users", "POST /users"):
+        controller.on_request(name=name)
+
+    assert controller.requests_per_task == 1.5
+    assert controller.interval(10) == pytest.approx(0.15)
+
+
+def test_fallback_without_target(paced_environment):
+    assert pacing()(PacedUser(paced_environment)) == 0
+    assert pacing(fallback=lambda user: 2.5)(PacedUser(paced_environment)) == 2.5
+
+
+def test_wait_keeps_schedule_from_intended_start(paced_environment, clock):
+    wait_time = pacing(100)
+    user = PacedUser(paced_environment)
+
+    assert wait_time(user) == 0
+    # Задача заняла 30 мс из интервала 100 мс: пауза — оставшиеся 70 мс
+    clock.now += 0.03
+    assert wait_time(user) == pytest.approx(0.07)
+    clock.now += 0.07 + 0.12
+    assert wait_time(user) == 0
+
+
+def test_falling_far_behind_resets_schedule(paced_environment, clock):
+    wait_time = pacing(100)
+    user = PacedUser(paced_environment)
+    wait_time(user)
+
+    clock.now += 1.0
+    assert wait_time(user) == 0
+    clock.now += 0.01
+    assert wait_time(user) == pytest.approx(0.09)
+
+
+def test_master_user_counts_override_local_counts(paced_environment, clock):
+    get_pacing_state(paced_environment).user_counts = {"PacedUser": 40}
+    wait_time = pacing(100)
+    user = PacedUser(paced_environment)
+    wait_time(user)
+
+    assert wait_time(user) == pytest.approx(0.4)
+
+
+def test_route_target_from_options(paced_environment, clock):
+    paced_environment.parsed_options = SimpleNamespace(target_rps=100, target_route="GET /users")
+    wait_time = pacing()
+    user = PacedUser(paced_environment)
+    wait_time(user)
+
+    for _ in range(4):
+        paced_environment.events.request.fire(
+            request_type="HTTP", name="GET /users", response_time=1, response_length=0, exception=None, context={}
+        )
+
+    # Две задачи, четыре запроса маршрута: интервал вдвое больше
+    assert wait_time(user) == pytest.approx(0.2)
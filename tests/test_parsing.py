@@ -0,0 +1,80 @@
+import json
+
+import pytest
+from httpx import Response
+from pydantic import ValidationError
+
+from clients.http.gateway.account.schema import GetAccountsResponseSchema
+from clients.http.gateway.operations.schema import GetOperationsResponseSchema
+from clients.http.gateway.users.schema import GetUserResponseSchema, UserSchema
+from clients.http.parsing import construct_model, get_type_adapter, is_construct_faster, parse_response
+
+USER = {
+    "id": "user-1",
+    "email": "user@example.com",
+    "lastName": "Ivanov",
+    "firstName": "Ivan",
+    "middleName": "Ivanovich",
+    "phoneNumber": "+79990000000",
+}
+CARD = {
+    "id": "card-1",
+    "pin": "1234",
+    "cvv": "123",
+    "type": "VIRTUAL",
+    "status": "ACTIVE",
+    "accountId": "account-1",
+    "cardNumber": "4000000000000000",
+    "cardHolder": "Ivan Ivanov",
+    "expiryDate": "2030-01-01",
+    "paymentSystem": "VISA",
+}
+ACCOUNTS = {"accounts": [{"id": "account-1", "type": "DEBIT_CARD", "cards": [CARD], "status": "ACTIVE", "balance": 10}]}
+
+
+def json_response(data) -> Response:
+    return Response(200, content=json.dumps(data).encode())
+
+
+def test_construct_is_faster_only_for_email_schemas():
+    assert is_construct_faster(UserSchema)
+    assert is_construct_faster(GetUserResponseSchema)
+    assert not is_construct_faster(GetAccountsResponseSchema)
+    assert not is_construct_faster(GetOperationsResponseSchema)
+
+
+def test_type_adapter_is_cached():
+    assert get_type_adapter(GetUserResponseSchema) is get_type_adapter(GetUserResponseSchema)
+
+
+def test_parse_response_validates_bytes():
+    response = parse_response(json_response({"user": USER}), GetUserResponseSchema)
+
+    assert response == GetUserResponseSchema.model_validate({"user": USER})
+
+    with pytest.raises(ValidationError):
+        parse_response(json_response({"user": {**USER, "email": "not-an-email"}}), GetUserResponseSchema)
+
+
+def test_trusted_parse_constructs_email_schemas():
+    response = parse_response(json_response({"user": {**USER, "email": "not-an-email"}}), GetUserResponseSchema, True)
+
+    assert isinstance(response.user, UserSchema)
+    assert (response.user.email, response.user.first_name) == ("not-an-email", "Ivan")
+
+
+def test_trusted_parse_still_validates_other_schemas():
+    response = parse_response(json_response(ACCOUNTS), GetAccountsResponseSchema, trusted=True)
+
+    assert response == GetAccountsResponseSchema.model_validate(ACCOUNTS)
+    assert response.accounts[0].balance == 10.0
+
+
+def test_construct_model_builds_nested_lists():
+    response = construct_model(GetAccountsResponseSchema, ACCOUNTS)
+
+    card = response.accounts[0].cards[0]
+    assert card.card_number == "4000000000000000"
+    # Без валидации значения остаются такими, как в JSON
+    assert card.type == "VIRTUAL"
+    assert response.accounts[0].balance == 10
@@ -0,0 +1,101 @@
+import pytest
+
+from clients.grpc.gateway.operations.client import build_operation_fields, contract, operation_pb2
+from clients.http.gateway.operations.client import build_operation_request
+from clients.http.gateway.operations.schema import (
+    MakePurchaseOperationRequestSchema,
+    MakeTopUpOperationRequestSchema,
+    OperationStatus
+)
+from tools.payloads import (
+    OPERATION_STATUSES,
+    OperationPayload,
+    OperationPayloadGenerator,
+    OperationPayloadRingBuffer
+)
+
+PAIRS = [("card-1", "account-1"), ("card-2", "account-2")]
+PAYLOAD = OperationPayload("COMPLETED", 12.5, "taxi", "card-1", "account-1")
+
+
+def test_generator_is_reproducible_with_seed():
+    first = OperationPayloadGenerator(seed=42).generate(100, PAIRS)
+    second = OperationPayloadGenerator(seed=42).generate(100, PAIRS)
+
+    assert first == second
+    assert first != OperationPayloadGenerator(seed=43).generate(100, PAIRS)
+
+
+def test_generated_payloads_use_known_values():
+    payloads = OperationPayloadGenerator(seed=1, amount_min=5, amount_max=50).generate(500, PAIRS)
+
+    assert {payload.status for payload in payloads} == set(OPERATION_STATUSES)
+    assert {(payload.card_id, payload.account_id) for payload in payloads} == set(PAIRS)
+    assert all(5 <= payload.amount <= 50 and round(payload.amount, 2) == payload.amount for payload in payloads)
+    assert all(type(payload.amount) is float for payload in payloads)
+
+
+def test_lognormal_amounts_are_clipped_to_range():
+    generator = OperationPayloadGenerator(seed=1, amount_distribution="lognormal", amount_sigma=5)
+
+    amounts = generator.amounts(1000)
+
+    assert amounts.min() == 1
+    assert amounts.max() == 1000
+
+
+def test_status_weights():
+    generator = OperationPayloadGenerator(seed=1, status_weights=[0, 3, 0, 0])
+
+    assert {payload.status for payload in generator.generate(100, PAIRS)} == {"COMPLETED"}
+
+
+def test_generator_needs_pairs():
+    with pytest.raises(ValueError):
+        OperationPayloadGenerator(seed=1).generate(1, [])
+
+
+def test_ring_buffer_cycles_without_refill():
+    buffer = OperationPayloadRingBuffer(OperationPayloadGenerator(seed=1), PAIRS, size=3, refill=False)
+
+    payloads = [buffer.next() for _ in range(6)]
+
+    assert payloads[:3] == payloads[3:]
+
+
+def test_ring_buffer_refills_after_full_pass():
+    buffer = OperationPayloadRingBuffer(OperationPayloadGenerator(seed=1), PAIRS, size=50)
+
+    first = [buffer.next() for _ in range(50)]
+    second = [buffer.next() for _ in range(50)]
+
+    assert second == buffer.payloads
+    assert first != second
+
+
+def test_http_operation_request_from_payload():
+    request = build_operation_request(MakePurchaseOperationRequestSchema, "card-9", "account-9", PAYLOAD)
+
+    assert (request.status, request.amount, request.category) == (OperationStatus.COMPLETED, 12.5, "taxi")
+    assert (request.card_id, request.account_id) == ("card-9", "account-9")
+
+    # У пополнения нет категории: поле не передаётся
+    request = build_operation_request(MakeTopUpOperationRequestSchema, "card-9", "account-9", PAYLOAD)
+    assert (request.status, request.amount) == (OperationStatus.COMPLETED, 12.5)
+    assert "category" not in request.model_dump()
+
+
+def test_grpc_operation_fields_from_payload():
+    fields = build_operation_fields("card-9", "account-9", PAYLOAD, category=True)
+    request = contract.MakePurchaseOperationRequest(**fields)
+
+    assert request.status == operation_pb2.OperationStatus.OPERATION_STATUS_COMPLETED
+    assert (request.amount, request.category, request.card_id) == (12.5, "taxi", "card-9")
+    assert "category" not in build_operation_fields("card-9", "account-9", PAYLOAD)
+
+
+def test_grpc_operation_fields_without_payload_use_faker():
+    fields = build_operation_fields("card-9", "account-9", category=True)
+
+    assert set(fields) == {"status", "amount", "category", "card_id", "account_id"}
+    assert contract.MakePurchaseOperationRequest(**fields).card_id == "card-9"
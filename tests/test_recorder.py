@@ -0,0 +1,105 @@
+import httpx
+import pytest
+
+from tools.recorder import (
+    MAGIC,
+    NO_RESPONSE,
+    UNKNOWN_METHOD,
+    RecordedRequest,
+    RequestRecorder,
+    decode_jsonl,
+    encode_jsonl,
+    read_capture,
+    read_captures
+)
+
+RECORDS = [
+    RecordedRequest(1.5, 2.0, "http", "POST", "/api/v1/users", "/api/v1/users", b'{"email":"user@example.com"}', 200),
+    RecordedRequest(2.5, 3.0, "http", "GET", "/api/v1/users/1", "/api/v1/users/{user_id}", b"", 404),
+    RecordedRequest(3.5, 4.0, "grpc", "UNARY", "/gateway/GetUser", "/gateway/GetUser", b"\x0a\x01\xff", 0),
+]
+
+
+def write_capture(path, records, format=None) -> RequestRecorder:
+    recorder = RequestRecorder(path, format)
+    for record in records:
+        recorder.put(record)
+    recorder.close()
+    return recorder
+
+
+@pytest.mark.parametrize("name", ["capture.bin", "capture.jsonl"])
+def test_round_trip(tmp_path, name):
+    recorder = write_capture(tmp_path / name, RECORDS)
+
+    assert recorder.format == ("jsonl" if name.endswith(".jsonl") else "binary")
+    assert recorder.written == len(RECORDS)
+    assert (tmp_path / name).read_bytes().startswith(MAGIC) == (recorder.format == "binary")
+    # latency_ms в binary — float32: значения выбраны точно представимыми
+    assert list(read_capture(tmp_path / name)) == RECORDS
+
+
+def test_unknown_method_is_read_as_unknown(tmp_path):
+    record = RECORDS[0]._replace(method="PROPFIND")
+
+    write_capture(tmp_path / "capture.bin", [record])
+
+    assert list(read_capture(tmp_path / "capture.bin")) == [record._replace(method=UNKNOWN_METHOD)]
+
+
+def test_jsonl_keeps_non_utf8_http_payload():
+    record = RECORDS[0]._replace(payload=b"\xff\xfe")
+
+    line = encode_jsonl(record)
+
+    assert b'"payload_base64":true' in line
+    assert decode_jsonl(line) == record
+
+
+def test_unencodable_record_is_skipped(tmp_path):
+    record = RECORDS[1]._replace(target="/" + "a" * 70000)
+
+    recorder = write_capture(tmp_path / "capture.bin", [record, RECORDS[0]])
+
+    assert (recorder.written, recorder.skipped) == (1, 1)
+    assert list(read_capture(tmp_path / "capture.bin")) == [RECORDS[0]]
+
+
+def test_writer_failure_is_raised_from_close(tmp_path):
+    # Каталог на месте файла: поток записи падает при открытии
+    (tmp_path / "capture.bin").mkdir()
+    recorder = RequestRecorder(tmp_path / "capture.bin")
+    recorder.thread.join()
+
+    recorder.put(RECORDS[0])
+    assert not recorder.records
+    with pytest.raises(RuntimeError, match="capture is incomplete"):
+        recorder.close()
+
+
+def test_read_captures_merges_by_timestamp(tmp_path):
+    write_capture(tmp_path / "first.bin", [RECORDS[0], RECORDS[2]])
+    write_capture(tmp_path / "second.jsonl", [RECORDS[1]])
+
+    merged = read_captures([tmp_path / "first.bin", tmp_path / "second.jsonl"])
+
+    assert [record.timestamp for record in merged] == [1.5, 2.5, 3.5]
+
+
+def test_http_exchange_records_response_and_error(tmp_path):
+    recorder = RequestRecorder(tmp_path / "capture.bin")
+    request = httpx.Request("POST", "http://gateway/api/v1/users?limit=1", content=b"{}")
+
+    with recorder.http_exchange("/api/v1/users") as exchange:
+        exchange.response = httpx.Response(201, request=request)
+    with pytest.raises(httpx.ConnectError):
+        with recorder.http_exchange(None):
+            raise httpx.ConnectError("refused", request=request)
+    recorder.close()
+
+    created, failed = read_capture(tmp_path / "capture.bin")
+    assert (created.method, created.target, created.route, created.payload, created.status) == (
+        "POST", "/api/v1/users?limit=1", "/api/v1/users", b"{}", 201
+    )
+    assert (failed.route, failed.status) == ("/api/v1/users?limit=1", NO_RESPONSE)
+    assert created.latency_ms >= 0
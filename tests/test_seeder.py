@@ -0,0 +1,135 @@
+import uuid
+from types import SimpleNamespace
+
+from tools.seeder import RECORD, Checkpoint, ChunkSeeder, RecordProgress, SeedOptions, read_records
+
+
+def test_checkpoint_pending_counts_last_short_chunk():
+    checkpoint = Checkpoint(count=25, chunk_size=10)
+
+    assert list(checkpoint.pending()) == [(0, 10), (1, 10), (2, 5)]
+
+
+def test_checkpoint_partial_chunk_is_resumed_with_missing_records():
+    checkpoint = Checkpoint(count=25, chunk_size=10)
+
+    checkpoint.add(0, records=10, failed=0)
+    checkpoint.add(1, records=7, failed=3)
+
+    assert checkpoint.done == {0}
+    assert checkpoint.partial == {1: 7}
+    assert checkpoint.records == 17
+    assert checkpoint.failed == 3
+    assert list(checkpoint.pending()) == [(1, 3), (2, 5)]
+
+    # Досоздание недостающих записей закрывает чанк
+    checkpoint.add(1, records=3, failed=0)
+    assert checkpoint.done == {0, 1}
+    assert checkpoint.partial == {}
+    assert checkpoint.size == 20 * RECORD.size
+
+
+def test_checkpoint_save_and_load_round_trip(tmp_path):
+    path = tmp_path / "seed.bin.checkpoint"
+    checkpoint = Checkpoint(count=25, chunk_size=10)
+    checkpoint.add(2, records=5, failed=0)
+    checkpoint.add(0, records=4, failed=6)
+
+    checkpoint.save(path)
+
+    assert Checkpoint.load(path) == checkpoint
+    assert not path.with_name(path.name + ".tmp").exists()
+    assert Checkpoint.load(tmp_path / "missing") is None
+
+
+def test_read_records_returns_uuids(tmp_path):
+    ids = [str(uuid.uuid4()) for _ in range(6)]
+    path = tmp_path / "seed.bin"
+    path.write_bytes(b"".join(RECORD.pack(*(uuid.UUID(value).bytes for value in ids[i:i + 3])) for i in (0, 3)))
+
+    assert list(read_records(path)) == [tuple(ids[:3]), tuple(ids[3:])]
+
+
+class FlakyGateway:
+    """
+    Клиенты gateway, которые записывают вызовы и один раз падают на каждом методе из failures.
+    """
+
+    def __init__(self, failures: set[str]):
+        self.failures = failures
+        self.calls: list[str] = []
+
+    def record(self, name: str) -> None:
+        self.calls.append(name)
+        if name in self.failures:
+            self.failures.remove(name)
+            raise ConnectionError(name)
+
+    async def create_user(self):
+        self.record("create_user")
+        return SimpleNamespace(user=SimpleNamespace(id=str(uuid.UUID(int=1))))
+
+    async def open_debit_card_account(self, user_id):
+        self.record("open_debit_card_account")
+        card = SimpleNamespace(id=str(uuid.UUID(int=3)))
+        return SimpleNamespace(account=SimpleNamespace(id=str(uuid.UUID(int=2)), cards=[card]))
+
+    async def issue_virtual_card(self, user_id, account_id):
+        self.record("issue_virtual_card")
+
+    async def make_top_up_operation(self, card_id, account_id):
+        self.record("make_top_up_operation")
+
+
+def build_seeder(gateway: FlakyGateway, **options) -> ChunkSeeder:
+    seeder = ChunkSeeder(SeedOptions(**options))
+    seeder.users_client = seeder.accounts_client = seeder.cards_client = seeder.operations_client = gateway
+    return seeder
+
+
+def test_retry_continues_from_failed_step():
+    gateway = FlakyGateway(failures={"open_debit_card_account", "issue_virtual_card"})
+    seeder = build_seeder(gateway, cards=2, operations=1, retries=2)
+
+    chunk, records, failed, errors = seeder.run(chunk=4, size=1)
+
+    assert (chunk, failed, errors) == (4, 0, [])
+    assert list(RECORD.iter_unpack(records)) == [
+        (uuid.UUID(int=1).bytes, uuid.UUID(int=2).bytes, uuid.UUID(int=3).bytes)
+    ]
+    # Пользователь создан один раз, упавшие шаги повторены, выполненные — нет
+    assert gateway.calls == [
+        "create_user",
+        "open_debit_card_account",
+        "open_debit_card_account",
+        "issue_virtual_card",
+        "issue_virtual_card",
+        "issue_virtual_card",
+        "make_top_up_operation",
+    ]
+
+
+def test_record_fails_after_retries_are_exhausted():
+    gateway = FlakyGateway(failures=set())
+    gateway.create_user = None  # Любой вызов падает с TypeError
+    seeder = build_seeder(gateway, retries=1)
+
+    chunk, records, failed, errors = seeder.run(chunk=0, size=2)
+
+    assert (records, failed) == (b"", 2)
+    assert len(errors) == 2
+    assert all("TypeError" in error for error in errors)
+
+
+def test_record_progress_skips_completed_steps():
+    gateway = FlakyGateway(failures=set())
+    seeder = build_seeder(gateway, operations=2)
+    progress = RecordProgress(
+        user_id=str(uuid.UUID(int=1)), account_id=str(uuid.UUID(int=2)), card_id=str(uuid.UUID(int=3)), operations=1
+    )
+
+    record = seeder.loop.run_until_complete(seeder.create_record(progress))
+
+    assert RECORD.unpack(record)[0] == uuid.UUID(int=1).bytes
+    assert gateway.calls == ["make_top_up_operation"]
+    assert progress.operations == 2
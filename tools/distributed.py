@@ -0,0 +1,222 @@
+"""
+Распределённый запуск сценария Locust на одной машине: мастер и N воркеров, закреплённых за ядрами.
+
+Один процесс Python упирается в одно ядро задолго до того, как насыщается gateway. Лаунчер запускает
+мастер и воркеры отдельными процессами и закрепляет их за ядрами через `os.sched_setaffinity`,
+чтобы планировщик ОС не перекидывал их между ядрами и процессы не делили одно ядро.
+Мастер запросов не шлёт, но агрегирует статистику воркеров: за ним резервируется первое доступное ядро,
+а воркеры распределяются по остальным (по умолчанию — воркер на каждое оставшееся ядро).
+
+В отличие от `locust --processes`, процессы не форкаются от уже запущенного Locust (gRPC после fork
+небезопасен), а логи воркеров пишутся в отдельные файлы.
+
+Аргументы после `--` передаются и мастеру, и воркерам: воркерам нужны параметры сценария,
+которые читаются в `events.init` (--record, --fixtures-file и т.д.).
+
+    python -m tools.distributed locust_get_user_scenario.py -- --headless -u 1000 -r 100 -t 5m
+    python -m tools.distributed grpc_locust_get_user_scenario.py --workers 6 -- --headless -u 600 -t 2m --target-rps 5000
+
+Статистика мастера (объединённая по всем воркерам) сохраняется в reports/<сценарий>_stats.csv
+и reports/<сценарий>.html, а в конце печатается сводка по запросам.
+"""
+import argparse
+import csv
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+REPORTS_DIR = Path("reports")
+
+# Сколько секунд ждать корректного завершения процесса перед SIGKILL
+SHUTDOWN_TIMEOUT = 15.0
+
+SUMMARY_COLUMNS = ("Request Count", "Failure Count", "Median Response Time", "95%", "99%", "Requests/s")
+
+
+def get_free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def get_available_cpus() -> list[int]:
+    """
+    :return: Ядра, доступные процессу; пустой список — закрепление не поддерживается.
+    """
+    if not hasattr(os, "sched_getaffinity"):
+        return []
+
+    return sorted(os.sched_getaffinity(0))
+
+
+def get_cpu_layout(workers: int, cpus: list[int]) -> tuple[int | None, list[int | None]]:
+    """
+    Распределяет ядра: первое — мастеру, остальные — воркерам по кругу.
+
+    :param workers: Число воркеров.
+    :param cpus: Доступные ядра.
+    :return: Ядро мастера и ядро каждого воркера; None — процесс не закрепляется
+        (закрепление не поддерживается или ядро одно, и резервировать нечего).
+    """
+    if len(cpus) < 2:
+        return None, [None] * workers
+
+    master_cpu, worker_cpus = cpus[0], cpus[1:]
+    return master_cpu, [worker_cpus[index % len(worker_cpus)] for index in range(workers)]
+
+
+def start_process(command: list[str], log_path: Path | None, cpu: int | None) -> subprocess.Popen:
+    """
+    Запускает процесс Locust и закрепляет его за ядром (потоки, созданные позже, наследуют закрепление).
+    """
+    output = log_path.open("wb") if log_path else None
+    process = subprocess.Popen(
+        command,
+        stdout=output,
+        stderr=subprocess.STDOUT if output else None,
+        # Ctrl+C в терминале не должен доходить до процессов напрямую: остановкой управляет лаунчер
+        start_new_session=True
+    )
+    if output:
+        output.close()
+    if cpu is not None:
+        os.sched_setaffinity(process.pid, {cpu})
+
+    return process
+
+
+def stop_process(process: subprocess.Popen, sig: int, timeout: float) -> None:
+    """
+    Посылает сигнал и ждёт завершения; не успел — SIGKILL.
+    """
+    if process.poll() is not None:
+        return
+
+    process.send_signal(sig)
+    try:
+        process.wait(timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+def print_summary(stats_path: Path) -> None:
+    if not stats_path.exists():
+        print(f"No stats file at {stats_path}")
+        return
+
+    with stats_path.open(newline="") as file:
+        rows = list(csv.DictReader(file))
+
+    header = f"{'Type':<6} {'Name':<70}" + "".join(f"{column:>22}" for column in SUMMARY_COLUMNS)
+    print(header)
+    for row in rows:
+        values = "".join(f"{float(row[column] or 0):>22.1f}" for column in SUMMARY_COLUMNS)
+        print(f"{row['Type']:<6} {row['Name']:<70}{values}")
+
+
+def raise_interrupt(signum, frame) -> None:
+    raise KeyboardInterrupt
+
+
+def run(
+        locustfile: Path,
+        workers: int,
+        pin: bool,
+        report_name: str,
+        locust_args: list[str]
+) -> int:
+    """
+    Запускает мастер и воркеры, ждёт завершения мастера и останавливает всё, что осталось.
+
+    :return: Код возврата мастера.
+    """
+    # Процессы запущены в своих сессиях, поэтому при SIGTERM лаунчера (timeout, CI) их останавливаем сами
+    signal.signal(signal.SIGTERM, raise_interrupt)
+    REPORTS_DIR.mkdir(exist_ok=True)
+    port = get_free_port()
+    locust = [sys.executable, "-m", "locust", "-f", str(locustfile)]
+
+    master_command = [
+        *locust,
+        "--master",
+        "--master-bind-host", "127.0.0.1",
+        "--master-bind-port", str(port),
+        "--expect-workers", str(workers),
+        "--csv", str(REPORTS_DIR / report_name),
+        "--html", str(REPORTS_DIR / f"{report_name}.html"),
+        *locust_args
+    ]
+    worker_command = [*locust, "--worker", "--master-host", "127.0.0.1", "--master-port", str(port), *locust_args]
+
+    master_cpu, cpus = get_cpu_layout(workers, get_available_cpus()) if pin else (None, [None] * workers)
+    master = start_process(master_command, None, master_cpu)
+    worker_processes = [
+        start_process(worker_command, REPORTS_DIR / f"{report_name}.worker-{index}.log", cpu)
+        for index, cpu in enumerate(cpus)
+    ]
+    pinned = ", ".join(
+        ([f"master: cpu {master_cpu}"] if master_cpu is not None else [])
+        + [f"worker-{index}: cpu {cpu}" for index, cpu in enumerate(cpus) if cpu is not None]
+    )
+    print(f"Master on port {port}, {workers} workers" + (f" ({pinned})" if pinned else ""), flush=True)
+
+    try:
+        while master.poll() is None:
+            for index, process in enumerate(worker_processes):
+                if process.returncode is None and process.poll() is not None:
+                    print(
+                        f"worker-{index} exited with code {process.returncode}, "
+                        f"see {REPORTS_DIR / f'{report_name}.worker-{index}.log'}",
+                        flush=True
+                    )
+            time.sleep(0.5)
+    except KeyboardInterrupt:
+        # Мастер по SIGTERM останавливает воркеры, дописывает CSV и HTML и завершается
+        print("Stopping...", flush=True)
+        stop_process(master, signal.SIGTERM, SHUTDOWN_TIMEOUT)
+    finally:
+        # Воркеры сами завершаются по сообщению мастера; оставшиеся останавливаем явно
+        for process in worker_processes:
+            stop_process(process, signal.SIGTERM, SHUTDOWN_TIMEOUT)
+
+    print_summary(REPORTS_DIR / f"{report_name}_stats.csv")
+    return master.returncode
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Мастер и воркеры Locust на одной машине",
+        usage="python -m tools.distributed LOCUSTFILE [--workers N] [--no-pin] -- [аргументы locust]"
+    )
+    parser.add_argument("locustfile", type=Path)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=max((len(get_available_cpus()) or os.cpu_count() or 1) - 1, 1),
+        help="Число воркеров (по умолчанию — по ядру на каждого, кроме ядра мастера)"
+    )
+    parser.add_argument("--no-pin", action="store_true", help="Не закреплять мастер и воркеры за ядрами")
+    parser.add_argument("--report-name", default="", help="Имя CSV/HTML в reports/ (по умолчанию — имя сценария)")
+
+    argv = sys.argv[1:]
+    locust_args = []
+    if "--" in argv:
+        argv, locust_args = argv[:argv.index("--")], argv[argv.index("--") + 1:]
+    args = parser.parse_args(argv)
+
+    sys.exit(run(
+        args.locustfile,
+        args.workers,
+        not args.no_pin,
+        args.report_name or args.locustfile.stem,
+        locust_args
+    ))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,35 @@
+import itertools
+import os
+import random
 import time
+from typing import Callable, Generic, TypeVar
 
 from faker import Faker
 from faker.providers.python import TEnum
 from google.protobuf.internal.enum_type_wrapper import EnumTypeWrapper
 
+T = TypeVar("T")
+
+# Категории покупок, из которых выбирает Fake.category
+CATEGORIES = (
+    "gas",
+    "taxi",
+    "tolls",
+    "water",
+    "beauty",
+    "mobile",
+    "travel",
+    "parking",
+    "catalog",
+    "internet",
+    "satellite",
+    "education",
+    "government",
+    "healthcare",
+    "restaurants",
+    "electricity",
+    "supermarkets",
+)
 
 
 class Fake:
@@ -44,25 +70,7 @@ class Fake:
 
         :return: Случайная категория (например, 'gas', 'taxi', 'supermarkets' и т.д.).
         """
-        return self.faker.random_element([
-            "gas",
-            "taxi",
-            "tolls",
-            "water",
-            "beauty",
-            "mobile",
-            "travel",
-            "parking",
-            "catalog",
-            "internet",
-            "satellite",
-            "education",
-            "government",
-            "healthcare",
-            "restaurants",
-            "electricity",
-            "supermarkets",
-        ])
+        return self.faker.random_element(CATEGORIES)
 
     def last_name(self) -> str:
         """
@@ -123,5 +131,140 @@ class Fake:
         return self.faker.random_element(list(value.values()))
 
 
+class ValuePool(Generic[T]):
+    """
+    Кольцевой пул заранее сгенерированных значений.
+
+    Значения генерируются порциями (chunk) по мере надобности, пока пул не заполнится,
+    после чего выдаются по кругу. Выдача — O(1): индекс в списке по атомарному счётчику.
+    """
+
+    def __init__(self, generate: Callable[[], T], size: int, chunk_size: int):
+        """
+        :param generate: Функция, генерирующая одно значение.
+        :param size: Максимальный размер пула.
+        :param chunk_size: Сколько значений генерировать за один раз.
+        """
+        self.generate = generate
+        self.size = size
+        self.chunk_size = chunk_size
+        self.values: list[T] = []
+        self.counter = itertools.count()
+
+    def fill(self, count: int | None = None) -> None:
+        """
+        Догенерирует значения в пул.
+
+        :param count: Сколько значений добавить; по умолчанию — до полного размера пула.
+        """
+        count = self.size - len(self.values) if count is None else min(count, self.size - len(self.values))
+        self.values.extend(self.generate() for _ in range(count))
+
+    def next(self) -> T:
+        index = next(self.counter)
+        if index >= len(self.values) and len(self.values) < self.size:
+            self.fill(self.chunk_size)
+
+        return self.values[index % len(self.values)]
+
+
+class PooledFake(Fake):
+    """
+    Вариант Fake для нагрузки: значения Faker генерируются заранее (или порциями)
+    и выдаются из кольцевых пулов, поэтому генерация тестовых данных почти не тратит CPU воркера.
+
+    - email уникален без `time.time()`: префикс процесса + счётчик;
+    - значения enum и proto enum кешируются, а не пересобираются на каждый вызов.
+    """
+
+    def __init__(self, faker: Faker, pool_size: int = 10_000, chunk_size: int = 1_000, prefill: bool = False):
+        """
+        :param faker: Экземпляр класса Faker, который будет использоваться для генерации данных.
+        :param pool_size: Размер пула для каждого поля.
+        :param chunk_size: Сколько значений генерировать за раз при ленивом заполнении.
+        :param prefill: Заполнить все пулы сразу (при старте воркера), а не по мере обращения.
+        """
+        super().__init__(faker)
+
+        self.random = random.Random(faker.random.random())
+        self.pools: dict[str, ValuePool] = {
+            "email": ValuePool(faker.email, pool_size, chunk_size),
+            "last_name": ValuePool(super().last_name, pool_size, chunk_size),
+            "first_name": ValuePool(super().first_name, pool_size, chunk_size),
+            "middle_name": ValuePool(super().middle_name, pool_size, chunk_size),
+            "phone_number": ValuePool(super().phone_number, pool_size, chunk_size),
+            "amount": ValuePool(super().amount, pool_size, chunk_size),
+            "category": ValuePool(super().category, pool_size, chunk_size),
+        }
+        if prefill:
+            for pool in self.pools.values():
+                pool.fill()
+
+        # Уникальность email: префикс процесса и момента запуска + монотонный счётчик
+        self.email_prefix = f"{os.getpid()}-{time.time_ns()}"
+        self.email_counter = itertools.count()
+
+        self.enum_values: dict[type, tuple] = {}
+        self.proto_enum_values: dict[EnumTypeWrapper, tuple[int, ...]] = {}
+
+    def enum(self, value: type[TEnum]) -> TEnum:
+        values = self.enum_values.get(value)
+        if values is None:
+            values = self.enum_values[value] = tuple(value)
+
+        return self.random.choice(values)
+
+    def email(self) -> str:
+        return f"{self.email_prefix}.{next(self.email_counter)}.{self.pools['email'].next()}"
+
+    def category(self) -> str:
+        return self.pools["category"].next()
+
+    def last_name(self) -> str:
+        return self.pools["last_name"].next()
+
+    def first_name(self) -> str:
+        return self.pools["first_name"].next()
+
+    def middle_name(self) -> str:
+        return self.pools["middle_name"].next()
+
+    def phone_number(self) -> str:
+        return self.pools["phone_number"].next()
+
+    def amount(self) -> float:
+        return self.pools["amount"].next()
+
+    def proto_enum(self, value: EnumTypeWrapper) -> int:
+        values = self.proto_enum_values.get(value)
+        if values is None:
+            values = self.proto_enum_values[value] = tuple(value.values())
+
+        return self.random.choice(values)
+
+
+def build_fake() -> Fake:
+    """
+    Создаёт модульный экземпляр Fake.
+
+    Схемы привязывают методы `fake` (например, `default_factory=fake.email`) при импорте,
+    поэтому режим выбирается до импорта через переменные окружения:
+    FAKE_POOL_SIZE — размер пулов PooledFake (0 или не задано — обычный Fake),
+    FAKE_POOL_PREFILL=1 — заполнить пулы сразу при старте.
+
+    :return: Fake или PooledFake.
+    """
+    pool_size = int(os.environ.get("FAKE_POOL_SIZE", "0"))
+    if pool_size > 0:
+        return PooledFake(
+            faker=Faker(),
+            pool_size=pool_size,
+            chunk_size=min(pool_size, 1_000),
+            prefill=os.environ.get("FAKE_POOL_PREFILL") == "1"
+        )
+
+    return Fake(faker=Faker())
+
+
 # Создаем экземпляр класса Fake с использованием Faker
-fake = Fake(faker=Faker())
\ No newline at end of file
+fake = build_fake()
\ No newline at end of file
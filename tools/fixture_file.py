@@ -0,0 +1,238 @@
+"""
+Колоночный файл заранее созданных данных, отображаемый в память.
+
+Файл сидера (tools/seeder.py) хранит записи подряд: user, account, card. Для нагрузочного теста
+они перекладываются в колоночный формат — сначала все user_id, затем все account_id, затем все card_id,
+по 16 байт (`uuid.bytes`) на значение:
+
+    [заголовок 64 байта][user_id × rows][account_id × rows][card_id × rows]
+
+Каждый воркер Locust отображает файл в память только для чтения (mmap): страницы общие для всех
+процессов через page cache, в Python-объекты превращается только выданная строка, а доступ к строке i —
+вычисление смещения, O(1). 10 млн строк — 480 МБ на диске и ноль в куче Python.
+
+Какие строки уже выданы, хранится в общем курсоре `<file>.cursor` (8 байт): процесс забирает
+следующий блок строк под блокировкой fcntl.flock, поэтому воркеры на одной машине никогда не получат
+одну и ту же запись. Курсор только растёт: между запусками теста его сбрасывают командой reset.
+
+    python -m tools.fixture_file build reports/seed.bin reports/seed.fixtures
+    python -m tools.fixture_file info reports/seed.fixtures
+    python -m tools.fixture_file reset reports/seed.fixtures
+
+    locust -f locust_get_user_fixture_scenario.py --fixtures-file reports/seed.fixtures
+"""
+import argparse
+import fcntl
+import mmap
+import os
+import struct
+import uuid
+from pathlib import Path
+
+from tools.fixtures import Fixture, FixtureKind, FixturesExhausted
+
+MAGIC = b"PTFXCOL1"
+# Магия, число строк, число колонок; остаток заголовка зарезервирован
+HEADER = struct.Struct("<8sQQ")
+HEADER_SIZE = 64
+COLUMNS = ("user_id", "account_id", "card_id")
+UUID_SIZE = 16
+
+# Размер записи файла сидера: uuid пользователя, счёта и карты
+SEED_RECORD_SIZE = UUID_SIZE * len(COLUMNS)
+# Сколько строк переносится за один проход при сборке файла
+BUILD_BATCH_ROWS = 65536
+
+CURSOR = struct.Struct("<Q")
+
+
+class FixtureFile:
+    """
+    Колоночный файл, отображённый в память только для чтения.
+    """
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        with self.path.open("rb") as file:
+            # Отображение остаётся валидным после закрытия файла
+            self.map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self.rows, columns = HEADER.unpack_from(self.map)
+        if magic != MAGIC or columns != len(COLUMNS):
+            raise ValueError(f"{self.path} is not a fixture file")
+        if len(self.map) != HEADER_SIZE + self.rows * UUID_SIZE * columns:
+            raise ValueError(f"{self.path} is truncated: expected {self.rows} rows")
+
+        self.column_size = self.rows * UUID_SIZE
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def get_value(self, column: int, index: int) -> bytes:
+        offset = HEADER_SIZE + column * self.column_size + index * UUID_SIZE
+        return self.map[offset:offset + UUID_SIZE]
+
+    def __getitem__(self, index: int) -> Fixture:
+        if not 0 <= index < self.rows:
+            raise IndexError(index)
+
+        user_id, account_id, card_id = (
+            str(uuid.UUID(bytes=self.get_value(column, index))) for column in range(len(COLUMNS))
+        )
+        return Fixture(user_id, account_id, (card_id,))
+
+    def close(self) -> None:
+        self.map.close()
+
+
+class SharedCursor:
+    """
+    Общий для всех процессов машины счётчик выданных строк.
+
+    Процесс забирает сразу блок из block строк и раздаёт его своим пользователям,
+    поэтому файл курсора блокируется один раз на блок, а не на каждого пользователя.
+    """
+
+    def __init__(self, path: Path | str, block: int = 64):
+        self.fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        self.block = block
+        self.next = 0
+        self.end = 0
+
+    def advance(self, count: int) -> int:
+        """
+        Атомарно сдвигает курсор на count строк.
+
+        :return: Значение курсора до сдвига.
+        """
+        fcntl.flock(self.fd, fcntl.LOCK_EX)
+        try:
+            data = os.pread(self.fd, CURSOR.size, 0)
+            # Пустой файл — курсор только что создан
+            start = CURSOR.unpack(data)[0] if len(data) == CURSOR.size else 0
+            os.pwrite(self.fd, CURSOR.pack(start + count), 0)
+        finally:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
+
+        return start
+
+    def claim(self) -> int:
+        """
+        :return: Номер следующей строки, не выданной ни одному процессу.
+        """
+        if self.next == self.end:
+            self.next = self.advance(self.block)
+            self.end = self.next + self.block
+
+        index = self.next
+        self.next += 1
+        return index
+
+    def position(self) -> int:
+        data = os.pread(self.fd, CURSOR.size, 0)
+        return CURSOR.unpack(data)[0] if len(data) == CURSOR.size else 0
+
+    def reset(self) -> None:
+        fcntl.flock(self.fd, fcntl.LOCK_EX)
+        try:
+            os.pwrite(self.fd, CURSOR.pack(0), 0)
+        finally:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
+
+
+def get_cursor_path(path: Path | str) -> Path:
+    path = Path(path)
+    return path.with_name(path.name + ".cursor")
+
+
+class FileFixtureProvider:
+    """
+    Выдача строк колоночного файла пользователям Locust. Интерфейс совпадает с FixtureProvider:
+    строки не возвращаются, поэтому release ничего не делает.
+    """
+
+    def __init__(self, fixture_file: FixtureFile, cursor: SharedCursor, kind: FixtureKind, wrap: bool = False):
+        """
+        :param wrap: После последней строки начинать с первой вместо FixturesExhausted.
+        """
+        self.fixture_file = fixture_file
+        self.cursor = cursor
+        self.kind = kind
+        self.wrap = wrap
+
+    def checkout(self) -> Fixture:
+        index = self.cursor.claim()
+        if index >= len(self.fixture_file):
+            if not self.wrap:
+                raise FixturesExhausted(
+                    f"All {len(self.fixture_file)} rows of {self.fixture_file.path} are checked out; "
+                    f"reset the cursor with `python -m tools.fixture_file reset`"
+                )
+            index %= len(self.fixture_file)
+
+        fixture = self.fixture_file[index]
+        return Fixture(fixture.user_id) if self.kind == FixtureKind.USERS else fixture
+
+    def release(self, fixture: Fixture) -> None:
+        pass
+
+
+def build_fixture_file(seed_path: Path, path: Path) -> int:
+    """
+    Перекладывает записи файла сидера в колоночный файл.
+
+    :return: Число строк.
+    """
+    rows = seed_path.stat().st_size // SEED_RECORD_SIZE
+    with seed_path.open("rb") as source, path.open("w+b") as target:
+        target.truncate(HEADER_SIZE + rows * SEED_RECORD_SIZE)
+        with mmap.mmap(target.fileno(), 0) as output:
+            HEADER.pack_into(output, 0, MAGIC, rows, len(COLUMNS))
+
+            for start in range(0, rows, BUILD_BATCH_ROWS):
+                batch = source.read(min(BUILD_BATCH_ROWS, rows - start) * SEED_RECORD_SIZE)
+                count = len(batch) // SEED_RECORD_SIZE
+                for column in range(len(COLUMNS)):
+                    offset = HEADER_SIZE + column * rows * UUID_SIZE + start * UUID_SIZE
+                    values = b"".join(
+                        batch[position:position + UUID_SIZE]
+                        for position in range(column * UUID_SIZE, count * SEED_RECORD_SIZE, SEED_RECORD_SIZE)
+                    )
+                    output[offset:offset + len(values)] = values
+
+            output.flush()
+
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Колоночный файл заранее созданных данных")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = commands.add_parser("build", help="Собрать из файла сидера (tools/seeder.py)")
+    build_parser.add_argument("seed", type=Path)
+    build_parser.add_argument("output", type=Path)
+
+    info_parser = commands.add_parser("info", help="Число строк и положение курсора")
+    info_parser.add_argument("path", type=Path)
+
+    reset_parser = commands.add_parser("reset", help="Сбросить курсор перед новым запуском теста")
+    reset_parser.add_argument("path", type=Path)
+
+    args = parser.parse_args()
+
+    if args.command == "build":
+        rows = build_fixture_file(args.seed, args.output)
+        print(f"Wrote {rows} rows to {args.output}")
+    elif args.command == "info":
+        fixture_file = FixtureFile(args.path)
+        cursor = SharedCursor(get_cursor_path(args.path))
+        print(f"rows: {len(fixture_file)}, cursor: {cursor.position()}")
+        if len(fixture_file):
+            print(f"first: {fixture_file[0]}")
+    elif args.command == "reset":
+        SharedCursor(get_cursor_path(args.path)).reset()
+
+
+if __name__ == "__main__":
+    main()
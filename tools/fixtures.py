@@ -0,0 +1,268 @@
+"""
+Заранее созданные тестовые данные в Redis.
+
+Сценарии создают пользователя (и счёт) в on_start, поэтому разгон до 10 000 пользователей — это
+10 000 операций записи в gateway до начала измерений. Вместо этого данные создаются заранее
+сидером (tools/seeder.py) и загружаются в Redis-список `fixtures:<kind>:available`:
+
+    python -m tools.seeder seed --count 10000 --output reports/seed.bin
+    python -m tools.seeder fixtures reports/seed.bin                 # debit_card_accounts
+    python -m tools.seeder fixtures reports/seed.bin --kind users    # только пользователи
+
+В нагрузочном тесте FixtureProvider атомарно забирает запись командой LMOVE в список
+`fixtures:<kind>:checked_out`, так что две сессии никогда не получат одного и того же пользователя,
+в том числе на разных воркерах. При остановке пользователя запись возвращается обратно.
+
+    python -m tools.fixtures stats             # сколько записей свободно и выдано
+    python -m tools.fixtures reset users       # вернуть выданные записи после аварийной остановки теста
+    python -m tools.fixtures clear users       # удалить записи
+
+Подключение в locustfile:
+    from tools.fixtures import FixtureKind, build_fixture_provider
+    from tools.scenario import register_scenario_options
+
+    register_scenario_options(fixtures=True)
+
+    def on_start(self):
+        self.fixtures = build_fixture_provider(self.environment, FixtureKind.USERS)
+        self.fixture = None  # checkout может бросить FixturesExhausted
+        self.fixture = self.fixtures.checkout()
+
+    def on_stop(self):
+        if self.fixture is not None:
+            self.fixtures.release(self.fixture)
+
+Для десятков миллионов записей без Redis — колоночный файл в памяти (tools/fixture_file.py, --fixtures-file).
+"""
+import argparse
+import json
+from enum import StrEnum
+from typing import TYPE_CHECKING, Iterable, NamedTuple
+from weakref import WeakKeyDictionary
+
+from locust.env import Environment
+from redis import Redis
+
+if TYPE_CHECKING:
+    from tools.fixture_file import FileFixtureProvider
+
+DEFAULT_REDIS_URL = "redis://localhost:6379/0"
+KEY_PREFIX = "fixtures"
+
+# Сколько записей FixtureStore.push отправляет в Redis одним RPUSH
+SEED_BATCH_SIZE = 500
+
+
+class FixtureKind(StrEnum):
+    """
+    Вид заранее созданных данных.
+    """
+    USERS = "users"  # Только пользователь
+    DEBIT_CARD_ACCOUNTS = "debit_card_accounts"  # Пользователь с дебетовым счётом и картами
+
+
+class Fixture(NamedTuple):
+    """
+    Идентификаторы заранее созданных данных.
+    """
+    user_id: str
+    account_id: str | None = None
+    card_ids: tuple[str, ...] = ()
+
+    def dump(self) -> bytes:
+        return json.dumps(self, separators=(",", ":")).encode()
+
+    @classmethod
+    def load(cls, data: bytes) -> "Fixture":
+        user_id, account_id, card_ids = json.loads(data)
+        return cls(user_id, account_id, tuple(card_ids))
+
+
+class FixturesExhausted(Exception):
+    """
+    Свободных записей не осталось: засейте больше данных или уменьшите число пользователей.
+    """
+
+
+def get_available_key(kind: FixtureKind) -> str:
+    return f"{KEY_PREFIX}:{kind}:available"
+
+
+def get_checked_out_key(kind: FixtureKind) -> str:
+    return f"{KEY_PREFIX}:{kind}:checked_out"
+
+
+class FixtureStore:
+    """
+    Списки заранее созданных данных в Redis.
+
+    Каждая запись хранится ровно в одном из двух списков: свободные (`available`) или выданные (`checked_out`).
+    Переход между ними — одна атомарная команда LMOVE, поэтому выдача не требует блокировок.
+    """
+
+    def __init__(self, redis: Redis):
+        self.redis = redis
+
+    def push(self, kind: FixtureKind, fixtures: Iterable[Fixture]) -> int:
+        """
+        Добавляет записи в список свободных.
+
+        :return: Сколько записей добавлено.
+        """
+        payloads = [fixture.dump() for fixture in fixtures]
+        for offset in range(0, len(payloads), SEED_BATCH_SIZE):
+            self.redis.rpush(get_available_key(kind), *payloads[offset:offset + SEED_BATCH_SIZE])
+
+        return len(payloads)
+
+    def checkout(self, kind: FixtureKind) -> Fixture:
+        """
+        Забирает свободную запись.
+
+        :raises FixturesExhausted: Свободных записей нет.
+        """
+        payload = self.redis.lmove(get_available_key(kind), get_checked_out_key(kind), "LEFT", "RIGHT")
+        if payload is None:
+            raise FixturesExhausted(f"No {kind} fixtures left in {get_available_key(kind)}")
+
+        return Fixture.load(payload)
+
+    def release(self, kind: FixtureKind, fixture: Fixture) -> None:
+        """
+        Возвращает выданную запись в конец списка свободных.
+        """
+        payload = fixture.dump()
+        with self.redis.pipeline(transaction=True) as pipeline:
+            pipeline.lrem(get_checked_out_key(kind), 1, payload)
+            pipeline.rpush(get_available_key(kind), payload)
+            pipeline.execute()
+
+    def reset(self, kind: FixtureKind) -> int:
+        """
+        Возвращает все выданные записи в список свободных (после теста, остановленного без on_stop).
+
+        :return: Сколько записей возвращено.
+        """
+        moved = 0
+        while self.redis.lmove(get_checked_out_key(kind), get_available_key(kind), "LEFT", "RIGHT") is not None:
+            moved += 1
+
+        return moved
+
+    def clear(self, kind: FixtureKind) -> None:
+        self.redis.delete(get_available_key(kind), get_checked_out_key(kind))
+
+    def stats(self, kind: FixtureKind) -> tuple[int, int]:
+        """
+        :return: Число свободных и выданных записей.
+        """
+        with self.redis.pipeline(transaction=False) as pipeline:
+            pipeline.llen(get_available_key(kind))
+            pipeline.llen(get_checked_out_key(kind))
+            available, checked_out = pipeline.execute()
+
+        return available, checked_out
+
+
+class FixtureProvider:
+    """
+    Выдача записей одного вида пользователям Locust.
+    """
+
+    def __init__(self, store: FixtureStore, kind: FixtureKind):
+        self.store = store
+        self.kind = kind
+
+    def checkout(self) -> Fixture:
+        return self.store.checkout(self.kind)
+
+    def release(self, fixture: Fixture) -> None:
+        self.store.release(self.kind, fixture)
+
+
+def add_fixtures_arguments(parser) -> None:
+    """
+    Обработчик `events.init_command_line_parser`: добавляет параметры --fixtures-redis-url,
+    --fixtures-file и --fixtures-wrap.
+    """
+    parser.add_argument(
+        "--fixtures-redis-url",
+        default=DEFAULT_REDIS_URL,
+        help="Redis с заранее созданными тестовыми данными (python -m tools.seeder fixtures)"
+    )
+    parser.add_argument(
+        "--fixtures-file",
+        default="",
+        help="Колоночный файл с данными (python -m tools.fixture_file build) вместо Redis"
+    )
+    parser.add_argument(
+        "--fixtures-wrap",
+        action="store_true",
+        help="Когда строки --fixtures-file закончились, выдавать их по второму кругу"
+    )
+
+
+_fixture_stores: WeakKeyDictionary[Environment, FixtureStore] = WeakKeyDictionary()
+_fixture_files: WeakKeyDictionary[Environment, tuple] = WeakKeyDictionary()
+
+
+def build_fixture_provider(environment: Environment, kind: FixtureKind) -> "FixtureProvider | FileFixtureProvider":
+    """
+    Функция создаёт FixtureProvider для сценария Locust.
+
+    Все пользователи процесса используют одно подключение к Redis (общий пул соединений);
+    адрес берётся из --fixtures-redis-url. Если задан --fixtures-file, записи берутся
+    из колоночного файла, отображённого в память (см. tools/fixture_file.py).
+
+    :param environment: объект окружения Locust.
+    :param kind: вид записей.
+    :return: Провайдер с методами checkout и release.
+    """
+    options = environment.parsed_options
+    fixtures_file = getattr(options, "fixtures_file", "")
+    if fixtures_file:
+        # Импорт здесь: tools.fixture_file сам импортирует Fixture из этого модуля
+        from tools.fixture_file import FileFixtureProvider, FixtureFile, SharedCursor, get_cursor_path
+
+        opened = _fixture_files.get(environment)
+        if opened is None:
+            opened = _fixture_files[environment] = (
+                FixtureFile(fixtures_file), SharedCursor(get_cursor_path(fixtures_file))
+            )
+
+        return FileFixtureProvider(*opened, kind=kind, wrap=getattr(options, "fixtures_wrap", False))
+
+    store = _fixture_stores.get(environment)
+    if store is None:
+        url = getattr(options, "fixtures_redis_url", None) or DEFAULT_REDIS_URL
+        store = _fixture_stores[environment] = FixtureStore(Redis.from_url(url))
+
+    return FixtureProvider(store, kind)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Заранее созданные тестовые данные в Redis")
+    parser.add_argument("--redis-url", default=DEFAULT_REDIS_URL)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("stats", help="Свободные и выданные записи")
+    reset_parser = commands.add_parser("reset", help="Вернуть выданные записи в свободные")
+    reset_parser.add_argument("kind", type=FixtureKind, choices=list(FixtureKind))
+    clear_parser = commands.add_parser("clear", help="Удалить записи")
+    clear_parser.add_argument("kind", type=FixtureKind, choices=list(FixtureKind))
+
+    args = parser.parse_args()
+
+    store = FixtureStore(Redis.from_url(args.redis_url))
+    if args.command == "stats":
+        for kind in FixtureKind:
+            available, checked_out = store.stats(kind)
+            print(f"{kind:<20} available: {available:>8}  checked out: {checked_out:>8}")
+    elif args.command == "reset":
+        print(f"Returned {store.reset(args.kind)} {args.kind}")
+    elif args.command == "clear":
+        store.clear(args.kind)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+"""
+Запись задержек в HDR-гистограммы параллельно со статистикой Locust.
+
+Locust округляет время ответа до корзин (например, 1234 мс хранится как 1200), поэтому p99.9 и p99.99
+в его отчётах неточные. LatencyRecorder подписывается на `events.request`, который вызывают
+`locust_response_event_hook` и `LocustInterceptor`, и пишет время ответа в микросекундах в HDR-гистограммы
+с заданной точностью (3 значащие цифры — погрешность не больше 0.1%) — по одной на маршрут/метод и окно времени.
+Гистограммы и их кодировка — из эталонной реализации `hdrh` (пакет hdrhistogram).
+
+В распределённом режиме воркеры отправляют накопленные гистограммы мастеру вместе со статистикой
+(`report_to_master`), а мастер складывает их по окнам: сложение гистограмм не теряет точности.
+Результат сохраняется в стандартный лог HdrHistogram (.hlog): каждое окно — сжатая бинарная
+кодировка V2 в base64, файл читают HistogramLogProcessor, HdrHistogramVisualizer и `python -m tools.latency`.
+
+Параметры --hdr-log и --hdr-window регистрирует `register_scenario_options()` (tools/scenario.py):
+
+    locust -f scenario.py --hdr-log reports/latency.hlog --hdr-window 10
+
+Чтение лога:
+    python -m tools.latency reports/latency.hlog
+"""
+import argparse
+import math
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable
+
+from hdrh.histogram import HdrHistogram
+from locust.env import Environment
+from locust.runners import WorkerRunner
+
+# Значения пишутся в микросекундах; в логе максимум окна указывается в миллисекундах
+MICROSECONDS_PER_MILLISECOND = 1000
+HOUR_MICROSECONDS = 3_600_000_000
+
+DEFAULT_PERCENTILES = (50, 90, 99, 99.9, 99.99)
+
+# Ключ в данных отчёта воркера
+REPORT_KEY = "hdr_histograms"
+
+
+class LatencyRecorder:
+    """
+    Набор HDR-гистограмм времени ответа: по одной на имя запроса и окно времени.
+
+    Окна выровнены по эпохе (`floor(time / window) * window`), поэтому окна разных воркеров
+    совпадают, и мастер складывает их без пересчёта.
+    """
+
+    def __init__(
+            self,
+            window: float = 10.0,
+            lowest: int = 1,
+            highest: int = HOUR_MICROSECONDS,
+            significant_figures: int = 3
+    ):
+        """
+        :param window: Длительность окна в секундах.
+        :param lowest: Наименьшее различимое время ответа в микросекундах.
+        :param highest: Наибольшее записываемое время ответа в микросекундах.
+        :param significant_figures: Точность гистограмм.
+        """
+        self.window = window
+        self.lowest = lowest
+        self.highest = highest
+        self.significant_figures = significant_figures
+        self.windows: dict[tuple[float, str], HdrHistogram] = {}
+        self.lock = threading.Lock()
+
+    def window_start(self, timestamp: float) -> float:
+        return math.floor(timestamp / self.window) * self.window
+
+    def empty(self) -> HdrHistogram:
+        return HdrHistogram(self.lowest, self.highest, self.significant_figures)
+
+    def get_histogram(self, start: float, name: str) -> HdrHistogram:
+        histogram = self.windows.get((start, name))
+        if histogram is None:
+            histogram = self.windows[(start, name)] = self.empty()
+
+        return histogram
+
+    def record(self, name: str, response_time: float, timestamp: float | None = None) -> None:
+        """
+        :param name: Имя запроса, например "HTTP GET /api/v1/users/{user_id}".
+        :param response_time: Время ответа в миллисекундах (как в событии Locust).
+        :param timestamp: Время завершения запроса; по умолчанию — текущее.
+        """
+        start = self.window_start(time.time() if timestamp is None else timestamp)
+        # Значения вне диапазона hdrh не записывает: прижимаем их к границам
+        value = min(max(round(response_time * MICROSECONDS_PER_MILLISECOND), self.lowest), self.highest)
+        with self.lock:
+            self.get_histogram(start, name).record_value(value)
+
+    def on_request(self, request_type: str, name: str, response_time: float, response_length: int, **kwargs) -> None:
+        # Сигнатура events.request; в гистограмму попадают и успешные, и ошибочные запросы
+        self.record(f"{request_type} {name}", response_time)
+
+    def drain(self) -> list[tuple[float, str, bytes]]:
+        """
+        Забирает накопленные гистограммы в закодированном виде (воркер отправляет их мастеру).
+
+        :return: Список (начало окна, имя запроса, сжатая гистограмма V2 в base64).
+        """
+        with self.lock:
+            windows, self.windows = self.windows, {}
+
+        return [(start, name, histogram.encode()) for (start, name), histogram in windows.items()]
+
+    def merge(self, items: Iterable[tuple[float, str, bytes]]) -> None:
+        """
+        Добавляет гистограммы, полученные от воркера.
+        """
+        for start, name, data in items:
+            histogram = HdrHistogram.decode(data)
+            with self.lock:
+                self.get_histogram(start, name).add(histogram)
+
+    def totals(self) -> dict[str, HdrHistogram]:
+        """
+        :return: Гистограммы за весь прогон по именам запросов.
+        """
+        totals: dict[str, HdrHistogram] = {}
+        with self.lock:
+            for (_, name), histogram in self.windows.items():
+                totals.setdefault(name, self.empty()).add(histogram)
+
+        return totals
+
+    def write_log(self, path: Path) -> None:
+        """
+        Сохраняет окна в лог HdrHistogram (формат 1.3) с тегом — именем запроса.
+        """
+        with self.lock:
+            windows = sorted(self.windows.items())
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w") as file:
+            write_log_header(file, windows[0][0][0] if windows else time.time())
+            for (start, name), histogram in windows:
+                write_log_interval(file, name, start, self.window, histogram)
+
+
+def to_tag(name: str) -> str:
+    # В теге лога не допускаются пробелы и запятые
+    return name.replace(" ", "_").replace(",", ";")
+
+
+def write_log_header(file, start_time: float) -> None:
+    iso = datetime.fromtimestamp(start_time, timezone.utc).isoformat()
+    file.write("#[Histogram log format version 1.3]\n")
+    file.write(f"#[StartTime: {start_time:.3f} (seconds since epoch), {iso}]\n")
+    file.write("#[BaseTime: 0.000 (seconds since epoch)]\n")
+    file.write('"StartTimestamp","Interval_Length","Interval_Max","Interval_Compressed_Histogram"\n')
+
+
+def write_log_interval(file, name: str, start: float, length: float, histogram: HdrHistogram) -> None:
+    encoded = histogram.encode().decode()
+    interval_max = histogram.get_max_value() / MICROSECONDS_PER_MILLISECOND
+    file.write(f"Tag={to_tag(name)},{start:.3f},{length:.3f},{interval_max:.3f},{encoded}\n")
+
+
+def read_log(path: Path) -> dict[str, HdrHistogram]:
+    """
+    Читает лог HdrHistogram и складывает окна по тегам.
+
+    :return: Гистограммы за весь лог по тегам (строки без тега — под ключом "").
+    """
+    totals: dict[str, HdrHistogram] = {}
+    for line in path.read_text().splitlines():
+        if not line or line.startswith(("#", '"')):
+            continue
+
+        tag = ""
+        if line.startswith("Tag="):
+            tag, _, line = line[4:].partition(",")
+
+        histogram = HdrHistogram.decode(line.rsplit(",", 1)[1])
+        if tag in totals:
+            totals[tag].add(histogram)
+        else:
+            totals[tag] = histogram
+
+    return totals
+
+
+def format_summary(totals: dict[str, HdrHistogram], percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> str:
+    """
+    :return: Таблица перцентилей в миллисекундах по именам запросов.
+    """
+    percentiles = tuple(percentiles)
+    header = f"{'Name':60} {'count':>9}" + "".join(f"{'p' + format(p, 'g'):>10}" for p in percentiles) + f"{'max':>10}"
+    lines = [header]
+    for name, histogram in sorted(totals.items()):
+        values = [histogram.get_value_at_percentile(p) / MICROSECONDS_PER_MILLISECOND for p in percentiles]
+        lines.append(
+            f"{name:60} {histogram.get_total_count():9}"
+            + "".join(f"{value:10.2f}" for value in values)
+            + f"{histogram.get_max_value() / MICROSECONDS_PER_MILLISECOND:10.2f}"
+        )
+
+    return "\n".join(lines)
+
+
+def add_latency_recorder_arguments(parser) -> None:
+    """
+    Обработчик `events.init_command_line_parser`: добавляет параметры --hdr-log и --hdr-window.
+    """
+    parser.add_argument("--hdr-log", default="", help="Сохранить HDR-гистограммы задержек в лог (.hlog)")
+    parser.add_argument("--hdr-window", type=float, default=10.0, help="Длительность окна HDR-гистограмм в секундах")
+
+
+def register_latency_recorder(
+        environment: Environment,
+        log_path: Path | str | None = None,
+        window: float | None = None,
+        significant_figures: int = 3
+) -> LatencyRecorder:
+    """
+    Создаёт LatencyRecorder и подписывает его на события Locust.
+
+    Вызывается из обработчика `events.init`. Параметры, не переданные явно, берутся
+    из --hdr-log и --hdr-window (см. add_latency_recorder_arguments).
+
+    :param environment: Окружение Locust.
+    :param log_path: Куда сохранить лог по завершении (на мастере или в одиночном режиме).
+    :param window: Длительность окна в секундах.
+    :param significant_figures: Точность гистограмм.
+    :return: Подключённый LatencyRecorder.
+    """
+    options = environment.parsed_options
+    log_path = log_path or getattr(options, "hdr_log", "") or None
+    window = window or getattr(options, "hdr_window", None) or 10.0
+
+    recorder = LatencyRecorder(window=window, significant_figures=significant_figures)
+    environment.events.request.add_listener(recorder.on_request)
+
+    def on_report_to_master(client_id: str, data: dict, **kwargs) -> None:
+        data[REPORT_KEY] = recorder.drain()
+
+    def on_worker_report(client_id: str, data: dict, **kwargs) -> None:
+        recorder.merge(data.get(REPORT_KEY, ()))
+
+    def on_quitting(environment: Environment, **kwargs) -> None:
+        # Воркер уже отправил свои гистограммы мастеру: итог пишет только мастер (или одиночный процесс)
+        if isinstance(environment.runner, WorkerRunner):
+            return
+
+        totals = recorder.totals()
+        if totals:
+            print(format_summary(totals))
+        if log_path:
+            recorder.write_log(Path(log_path))
+
+    environment.events.report_to_master.add_listener(on_report_to_master)
+    environment.events.worker_report.add_listener(on_worker_report)
+    environment.events.quitting.add_listener(on_quitting)
+    return recorder
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Перцентили задержек из лога HdrHistogram")
+    parser.add_argument("log", type=Path, help="Файл .hlog")
+    parser.add_argument("--percentile", type=float, action="append", help="Перцентиль (можно несколько раз)")
+    args = parser.parse_args()
+
+    print(format_summary(read_log(args.log), args.percentile or DEFAULT_PERCENTILES))
+
+
+if __name__ == "__main__":
+    main()
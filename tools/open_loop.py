@@ -0,0 +1,193 @@
+"""
+Открытая модель нагрузки (constant arrival rate) с поправкой на coordinated omission.
+
+В закрытой модели (`wait_time = between(1, 3)`) следующий запрос уходит только после ответа на предыдущий:
+когда gateway замедляется, нагрузка падает, а задержки, которые пришлись бы на несделанные запросы,
+в статистику не попадают. OpenLoopUser запускает задачи по фиксированному расписанию, не дожидаясь
+ответов, и запоминает плановое время запуска каждой задачи. Если задача стартовала позже плана
+(все слоты max_in_flight заняты), это опоздание прибавляется ко времени ответа первого её запроса
+в `locust_response_event_hook` и `LocustInterceptor`, а время работы сервиса остаётся в `context["service_time_ms"]`.
+Следующие запросы задачи (например, открытие счёта после создания пользователя) ушли бы с тем же
+опозданием и без поправки, поэтому она учитывается один раз.
+
+Подключение в сценарии (параметры регистрирует tools/scenario.py):
+    from locust import task
+    from tools.open_loop import OpenLoopUser
+    from tools.scenario import register_scenario_options
+
+    register_scenario_options()
+
+    class GetUserScenarioUser(OpenLoopUser):
+        @task
+        def get_user(self): ...
+
+    locust -f scenario.py -u 50 --arrival-rate 20   # 50 пользователей по 20 запусков/с = 1000 запусков/с
+
+Без --arrival-rate (и без атрибута arrival_rate) пользователь работает как обычный закрытый цикл с wait_time.
+"""
+import logging
+import random
+import time
+import traceback
+from contextvars import ContextVar
+from typing import Callable, NamedTuple
+
+import gevent
+from gevent.pool import Pool
+from locust import User
+from locust.exception import StopUser
+from locust.user.users import LOCUST_STATE_RUNNING, LOCUST_STATE_STOPPING, LOCUST_STATE_WAITING
+
+logger = logging.getLogger(__name__)
+
+
+class ScheduledStart(NamedTuple):
+    """
+    Плановое и фактическое время запуска задачи по `time.perf_counter_ns()`.
+    """
+    intended: int
+    actual: int
+
+    @property
+    def delay(self) -> int:
+        """
+        Опоздание запуска относительно расписания в наносекундах.
+        """
+        return max(self.actual - self.intended, 0)
+
+
+# Запуск текущей задачи открытой модели; None — запрос выполняется вне расписания
+scheduled_start: ContextVar[ScheduledStart | None] = ContextVar("scheduled_start", default=None)
+
+
+def take_start_delay_ns() -> int:
+    """
+    Забирает опоздание запуска текущей задачи: его получает только первый запрос задачи.
+
+    :return: Опоздание в наносекундах; 0 вне открытой модели и для последующих запросов задачи.
+    """
+    start = scheduled_start.get()
+    if start is None:
+        return 0
+
+    scheduled_start.set(None)
+    return start.delay
+
+
+def add_open_loop_arguments(parser) -> None:
+    """
+    Обработчик `events.init_command_line_parser`: добавляет параметры --arrival-rate и --max-in-flight.
+    """
+    parser.add_argument(
+        "--arrival-rate",
+        type=float,
+        default=0,
+        help="Запусков задач в секунду на одного OpenLoopUser (0 — закрытый цикл с wait_time)"
+    )
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=100,
+        help="Сколько задач одного OpenLoopUser может выполняться одновременно"
+    )
+
+
+class OpenLoopUser(User):
+    """
+    Пользователь Locust, который запускает свои задачи с постоянной частотой.
+
+    Задачи объявляются как обычно, через @task. При создании подкласса они переносятся
+    в `open_loop_tasks`, а Locust получает единственную задачу — планировщик, который по расписанию
+    запускает случайную задачу (с учётом весов) в отдельном greenlet.
+    """
+
+    abstract = True
+
+    # Запусков задач в секунду на пользователя; None — взять из --arrival-rate
+    arrival_rate: float | None = None
+    # Лимит одновременно выполняемых задач; None — взять из --max-in-flight
+    max_in_flight: int | None = None
+    # Сколько секунд ждать завершения начатых задач при остановке пользователя
+    drain_timeout: float = 5.0
+
+    open_loop_tasks: list[Callable] = []
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # UserMeta уже собрал задачи класса и его родителей в cls.tasks
+        added = [task for task in cls.tasks if task is not OpenLoopUser.run_schedule]
+        cls.open_loop_tasks = [*cls.open_loop_tasks, *added]
+        cls.tasks = [OpenLoopUser.run_schedule]
+
+    def get_option(self, name: str, default):
+        value = getattr(self, name)
+        if value is None:
+            value = getattr(self.environment.parsed_options, name, None)
+
+        return default if value is None else value
+
+    def run_schedule(self) -> None:
+        """
+        Единственная задача Locust для OpenLoopUser: выполняется, пока пользователь не остановлен.
+        """
+        if not self.open_loop_tasks:
+            raise Exception(f"No tasks defined on {self.__class__.__name__}. Use the @task decorator")
+
+        rate = self.get_option("arrival_rate", 0)
+        if rate <= 0:
+            # Закрытый цикл: поведение обычного User
+            while True:
+                self.execute(random.choice(self.open_loop_tasks), None)
+                self.wait()
+
+        interval = round(1_000_000_000 / rate)
+        in_flight = Pool(self.get_option("max_in_flight", 100))
+
+        # Случайная фаза, чтобы пользователи, запущенные одновременно, не отправляли запросы пачками
+        intended = time.perf_counter_ns() + random.randrange(interval)
+        try:
+            while True:
+                self.sleep_until(intended)
+                # Если все слоты заняты, spawn ждёт; опоздание учтётся через ScheduledStart
+                in_flight.spawn(self.execute, random.choice(self.open_loop_tasks), intended)
+                intended += interval
+        finally:
+            in_flight.join(timeout=self.drain_timeout)
+            in_flight.kill(block=False)
+
+    def sleep_until(self, deadline: int) -> None:
+        """
+        Ждёт планового времени запуска. Пока пользователь ждёт, Locust может остановить его сразу,
+        как и во время обычного wait().
+        """
+        if self._state == LOCUST_STATE_STOPPING:
+            raise StopUser()
+
+        self._state = LOCUST_STATE_WAITING
+        gevent.sleep(max(deadline - time.perf_counter_ns(), 0) / 1_000_000_000)
+        if self._state == LOCUST_STATE_STOPPING:
+            raise StopUser()
+        self._state = LOCUST_STATE_RUNNING
+
+    def execute(self, task: Callable, intended: int | None) -> None:
+        """
+        Выполняет задачу с плановым временем запуска в контексте (None — вне расписания).
+
+        Ошибки обрабатываются так же, как в TaskSet Locust: событие user_error и запись в лог.
+        """
+        token = scheduled_start.set(None if intended is None else ScheduledStart(intended, time.perf_counter_ns()))
+        try:
+            task(self)
+        except StopUser:
+            if intended is None:
+                raise
+            # Задача открытой модели выполняется в своём greenlet: останавливаем планировщик
+            self._state = LOCUST_STATE_STOPPING
+        except Exception as error:
+            self.environment.events.user_error.fire(user_instance=self, exception=error, tb=error.__traceback__)
+            if not self.environment.catch_exceptions:
+                raise
+            logger.error("%s\n%s", error, traceback.format_exc())
+        finally:
+            scheduled_start.reset(token)
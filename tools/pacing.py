@@ -0,0 +1,218 @@
+"""
+Pacing: wait_time, который держит заданную пропускную способность сценария независимо от числа пользователей.
+
+С `wait_time = between(1, 3)` итоговый RPS зависит от количества пользователей и задержки сервера,
+и его приходится подбирать. `pacing(target_rps)` сам считает паузу: общая цель делится поровну
+между всеми пользователями класса (на всех воркерах), и каждый пользователь запускает задачи
+с интервалом `users * requests_per_task / target_rps`. Пауза отсчитывается от планового
+времени запуска предыдущей задачи, поэтому длительность самой задачи вычитается из сна автоматически.
+
+Цель задаётся:
+  * на запуски задач в секунду — `pacing(500)`;
+  * на запросы конкретного маршрута (имя запроса в статистике Locust) — `pacing(5000, route="GET /api/v1/users/{user_id}")`.
+    Сколько запросов маршрута приходится на одну задачу, PacingController измеряет по `events.request`.
+
+В распределённом режиме мастер раз в секунду рассылает воркерам число пользователей каждого класса
+по всему тесту, поэтому бюджет делится между воркерами без ручного пересчёта.
+
+Подключение в locustfile (параметры и обработчики регистрирует tools/scenario.py):
+    from locust import between
+    from tools.pacing import pacing
+    from tools.scenario import register_scenario_options
+
+    register_scenario_options()
+
+    class GetUserScenarioUser(User):
+        wait_time = pacing(fallback=between(1, 3))
+
+    locust -f scenario.py -u 200 --target-rps 5000 --target-route "GET /api/v1/users/{user_id}"
+"""
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Callable
+from weakref import WeakKeyDictionary
+
+import gevent
+from locust import User
+from locust.env import Environment
+from locust.runners import MasterRunner, WorkerRunner
+
+# Тип сообщения мастера воркерам с числом пользователей по классам
+USER_COUNTS_MESSAGE = "pacing_user_counts"
+# Как часто мастер рассылает число пользователей, в секундах
+BROADCAST_INTERVAL = 1.0
+
+
+class PacingController:
+    """
+    Считает интервал между запусками задач одного класса пользователей в этом процессе.
+
+    Для цели по маршруту подписывается на `events.request` и оценивает,
+    сколько запросов маршрута в среднем делает одна задача.
+    """
+
+    def __init__(self, target_rps: float, route: str | None = None):
+        """
+        :param target_rps: Целевая пропускная способность всего класса пользователей.
+        :param route: Имя запроса, по которому считается цель; None — цель в запусках задач.
+        """
+        self.target_rps = target_rps
+        self.route = route
+        self.requests = 0
+        self.tasks = 0
+
+    def on_request(self, name: str, **kwargs) -> None:
+        # Сигнатура events.request; считаются и успешные, и ошибочные запросы
+        if name == self.route:
+            self.requests += 1
+
+    @property
+    def requests_per_task(self) -> float:
+        """
+        :return: Среднее число запросов маршрута на одну задачу (1, пока задачи не завершались).
+        """
+        if self.route is None or not self.tasks or not self.requests:
+            return 1.0
+
+        return self.requests / self.tasks
+
+    def interval(self, users: int) -> float:
+        """
+        :param users: Число пользователей класса во всём тесте.
+        :return: Интервал между запусками задач одного пользователя в секундах.
+        """
+        return max(users, 1) * self.requests_per_task / self.target_rps
+
+
+@dataclass
+class PacingState:
+    """
+    Состояние pacing в одном процессе Locust.
+
+    `user_counts` — число пользователей по классам во всём тесте, присланное мастером;
+    пустой словарь — сообщений ещё не было (или тест одиночный), берутся локальные счётчики runner.
+    """
+    user_counts: dict[str, int] = field(default_factory=dict)
+    controllers: dict[tuple[str, float, str | None], PacingController] = field(default_factory=dict)
+
+    def get_controller(self, environment: Environment, user_class: str, target_rps: float, route: str | None):
+        key = (user_class, target_rps, route)
+        controller = self.controllers.get(key)
+        if controller is None:
+            controller = self.controllers[key] = PacingController(target_rps, route)
+            if route is not None:
+                environment.events.request.add_listener(controller.on_request)
+
+        return controller
+
+    def get_user_count(self, environment: Environment, user_class: str) -> int:
+        if user_class in self.user_counts:
+            return self.user_counts[user_class]
+
+        return environment.runner.user_classes_count.get(user_class, 1)
+
+
+_pacing_states: WeakKeyDictionary[Environment, PacingState] = WeakKeyDictionary()
+
+
+def get_pacing_state(environment: Environment) -> PacingState:
+    state = _pacing_states.get(environment)
+    if state is None:
+        state = _pacing_states[environment] = PacingState()
+
+    return state
+
+
+def pacing(
+        target_rps: float | None = None,
+        route: str | None = None,
+        fallback: Callable[[User], float] | None = None
+) -> Callable[[User], float]:
+    """
+    Возвращает wait_time, который держит общую пропускную способность класса пользователей.
+
+    :param target_rps: Цель для всего класса на всех воркерах; None — взять из --target-rps.
+    :param route: Имя запроса в статистике Locust, к которому относится цель; None — взять из --target-route
+        (если и он не задан, цель считается в запусках задач).
+    :param fallback: wait_time, если цель не задана ни здесь, ни в командной строке; None — без паузы.
+    :return: Функция для атрибута `wait_time` пользователя.
+    """
+
+    def wait_time(user: User) -> float:
+        environment = user.environment
+        options = environment.parsed_options
+        rps = target_rps or getattr(options, "target_rps", 0)
+        if not rps:
+            return fallback(user) if fallback else 0
+
+        user_class = user.__class__.__name__
+        state = get_pacing_state(environment)
+        controller = state.get_controller(
+            environment, user_class, rps, route or getattr(options, "target_route", "") or None
+        )
+        controller.tasks += 1
+
+        interval = controller.interval(state.get_user_count(environment, user_class))
+        now = time.perf_counter()
+
+        next_start = getattr(user, "_pacing_next_start", None)
+        if next_start is None:
+            # Случайная фаза первой паузы, чтобы пользователи, запущенные одновременно, не шли пачкой
+            next_start = now + random.uniform(0, interval)
+        else:
+            next_start += interval
+            if next_start < now - interval:
+                # Отстали больше чем на интервал: не догоняем пропущенные запуски пачкой
+                next_start = now
+
+        user._pacing_next_start = next_start
+        return max(next_start - now, 0)
+
+    return wait_time
+
+
+def add_pacing_arguments(parser) -> None:
+    """
+    Обработчик `events.init_command_line_parser`: добавляет параметры --target-rps и --target-route.
+    """
+    parser.add_argument(
+        "--target-rps",
+        type=float,
+        default=0,
+        help="Целевая пропускная способность каждого класса пользователей с pacing (0 — обычный wait_time)"
+    )
+    parser.add_argument(
+        "--target-route",
+        default="",
+        help="Имя запроса, к которому относится --target-rps (по умолчанию — запуски задач)"
+    )
+
+
+def register_pacing(environment: Environment) -> None:
+    """
+    Связывает мастер и воркеры: мастер рассылает число пользователей по классам, воркеры его запоминают.
+
+    Вызывается из обработчика `events.init`. В одиночном режиме ничего не делает:
+    pacing берёт число пользователей у локального runner.
+
+    :param environment: Окружение Locust.
+    """
+    runner = environment.runner
+    state = get_pacing_state(environment)
+
+    if isinstance(runner, WorkerRunner):
+        def on_user_counts(msg, **kwargs) -> None:
+            state.user_counts = msg.data
+
+        runner.register_message(USER_COUNTS_MESSAGE, on_user_counts)
+
+    elif isinstance(runner, MasterRunner):
+        def broadcast_user_counts() -> None:
+            while True:
+                # Число пользователей воркеры сообщают мастеру в heartbeat
+                runner.send_message(USER_COUNTS_MESSAGE, dict(runner.reported_user_classes_count))
+                gevent.sleep(BROADCAST_INTERVAL)
+
+        broadcaster = gevent.spawn(broadcast_user_counts)
+        environment.events.quitting.add_listener(lambda **kwargs: broadcaster.kill(block=False))
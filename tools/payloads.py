@@ -0,0 +1,157 @@
+import itertools
+from typing import Literal, NamedTuple, Sequence
+
+import numpy as np
+
+from tools.fakers import CATEGORIES
+
+# Статусы операций в терминах http-gateway; для gRPC имя дополняется префиксом OPERATION_STATUS_
+OPERATION_STATUSES = ("FAILED", "COMPLETED", "IN_PROGRESS", "UNSPECIFIED")
+
+# Распределение сумм операций
+AmountDistribution = Literal["uniform", "lognormal"]
+
+
+class OperationPayload(NamedTuple):
+    """
+    Данные для одной финансовой операции.
+
+    Подходит и для HTTP-схем (MakeOperationRequestSchema принимает имена полей),
+    и для gRPC-сообщений (статус передаётся через `proto_status`).
+    """
+    status: str
+    amount: float
+    category: str
+    card_id: str
+    account_id: str
+
+    @property
+    def proto_status(self) -> str:
+        """
+        Имя значения proto enum OperationStatus: protobuf принимает его в конструкторе сообщения.
+        """
+        return f"OPERATION_STATUS_{self.status}"
+
+
+class OperationPayloadGenerator:
+    """
+    Пакетный генератор данных операций на NumPy.
+
+    Статусы, суммы, категории и пары (card_id, account_id) генерируются сразу для N операций
+    векторными операциями, без вызова Faker на каждое поле. Результат воспроизводим при заданном seed.
+    """
+
+    def __init__(
+            self,
+            seed: int | None = None,
+            amount_distribution: AmountDistribution = "uniform",
+            amount_min: float = 1,
+            amount_max: float = 1000,
+            amount_sigma: float = 1.0,
+            status_weights: Sequence[float] | None = None,
+            categories: Sequence[str] = CATEGORIES
+    ):
+        """
+        :param seed: Seed генератора случайных чисел; None — случайный.
+        :param amount_distribution: "uniform" — равномерно в диапазоне, "lognormal" — много мелких
+            сумм и редкие крупные (медиана в середине диапазона по логарифмической шкале).
+        :param amount_min: Минимальная сумма.
+        :param amount_max: Максимальная сумма.
+        :param amount_sigma: Разброс логнормального распределения.
+        :param status_weights: Веса статусов в порядке OPERATION_STATUSES; None — равновероятно.
+        :param categories: Категории покупок.
+        """
+        self.random = np.random.default_rng(seed)
+        self.amount_distribution = amount_distribution
+        self.amount_min = amount_min
+        self.amount_max = amount_max
+        self.amount_sigma = amount_sigma
+        self.categories = np.array(categories, dtype=object)
+        self.statuses = np.array(OPERATION_STATUSES, dtype=object)
+
+        if status_weights is None:
+            self.status_weights = None
+        else:
+            weights = np.asarray(status_weights, dtype=float)
+            self.status_weights = weights / weights.sum()
+
+    def amounts(self, count: int) -> np.ndarray:
+        """
+        Генерирует суммы операций с точностью до копеек.
+
+        :param count: Количество сумм.
+        :return: Массив float64.
+        """
+        if self.amount_distribution == "lognormal":
+            median = np.sqrt(self.amount_min * self.amount_max)
+            values = self.random.lognormal(np.log(median), self.amount_sigma, count)
+            values = np.clip(values, self.amount_min, self.amount_max)
+        else:
+            values = self.random.uniform(self.amount_min, self.amount_max, count)
+
+        return np.round(values, 2)
+
+    def generate(self, count: int, pairs: Sequence[tuple[str, str]]) -> list[OperationPayload]:
+        """
+        Генерирует пачку данных операций.
+
+        :param count: Количество операций.
+        :param pairs: Пары (card_id, account_id), из которых выбираются карта и счёт операции.
+        :return: Список OperationPayload.
+        """
+        if not pairs:
+            raise ValueError("Нужна хотя бы одна пара (card_id, account_id)")
+
+        pair_array = np.array(pairs, dtype=object)
+
+        statuses = self.random.choice(self.statuses, count, p=self.status_weights)
+        categories = self.random.choice(self.categories, count)
+        selected = pair_array[self.random.integers(0, len(pair_array), count)]
+
+        # tolist() переводит массивы в обычные объекты Python за один проход
+        return list(map(
+            OperationPayload._make,
+            zip(
+                statuses.tolist(),
+                self.amounts(count).tolist(),
+                categories.tolist(),
+                selected[:, 0].tolist(),
+                selected[:, 1].tolist()
+            )
+        ))
+
+
+class OperationPayloadRingBuffer:
+    """
+    Кольцевой буфер заранее сгенерированных данных операций.
+
+    Сценарий берёт данные через `next()` за O(1). Когда буфер пройден целиком,
+    он заполняется новой пачкой (если включён refill) или выдаётся по кругу.
+    """
+
+    def __init__(
+            self,
+            generator: OperationPayloadGenerator,
+            pairs: Sequence[tuple[str, str]],
+            size: int = 10_000,
+            refill: bool = True
+    ):
+        """
+        :param generator: Пакетный генератор данных.
+        :param pairs: Пары (card_id, account_id) пользователя или пула пользователей.
+        :param size: Размер буфера.
+        :param refill: Перегенерировать буфер после полного прохода, чтобы данные не повторялись.
+        """
+        self.generator = generator
+        self.pairs = list(pairs)
+        self.size = size
+        self.refill = refill
+        self.payloads = generator.generate(size, self.pairs)
+        self.counter = itertools.count()
+
+    def next(self) -> OperationPayload:
+        index = next(self.counter)
+        if index and index % self.size == 0 and self.refill:
+            self.payloads = self.generator.generate(self.size, self.pairs)
+
+        return self.payloads[index % self.size]
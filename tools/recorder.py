@@ -0,0 +1,344 @@
+"""
+Запись запросов к gateway для последующего воспроизведения (tools/replay.py).
+
+Когда запись включена, `HTTPClient.get/post` (и асинхронные аналоги) и RecordingInterceptor
+в цепочке gRPC-интерцепторов отдают каждый запрос RequestRecorder: время отправки, транспорт, метод,
+фактический путь и шаблон маршрута, тело запроса, время ответа и статус. Запросы складываются
+в очередь, а файл пишет фоновый поток пачками, поэтому запись не добавляет дисковых операций
+в путь запроса.
+
+Форматы файла:
+  * jsonl — строка JSON на запрос, тело http-запроса — текстом (не UTF-8 — в base64 с "payload_base64": true),
+    gRPC-сообщение — в base64;
+  * binary — заголовок MAGIC и кадры RECORD_HEADER + target + route + payload, в разы компактнее;
+    метод вне METHODS записывается кодом UNKNOWN_METHOD_CODE и читается как UNKNOWN_METHOD.
+По умолчанию формат выбирается по расширению: `.jsonl` — jsonl, иначе binary.
+
+Подключение в locustfile (параметры и обработчики регистрирует tools/scenario.py):
+    from tools.scenario import register_scenario_options
+
+    register_scenario_options()
+
+    locust -f scenario.py --record reports/capture.bin
+
+В распределённом режиме каждый воркер пишет свой файл (`capture.<pid>.bin`), реплеер сливает их по времени.
+"""
+import base64
+import heapq
+import json
+import logging
+import os
+import struct
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Iterable, Iterator, NamedTuple
+
+from httpx import Request, Response
+from locust.env import Environment
+from locust.runners import MasterRunner, WorkerRunner
+
+MAGIC = b"PTREC001"
+# timestamp, latency_ms, транспорт, метод, статус, длины target, route и payload
+RECORD_HEADER = struct.Struct("<dfBBhHHI")
+
+TRANSPORTS = ("http", "grpc")
+# Новые методы добавляются только в конец: в binary-формате хранится индекс метода
+METHODS = ("GET", "POST", "PUT", "PATCH", "DELETE", "UNARY", "HEAD", "OPTIONS")
+UNKNOWN_METHOD = "UNKNOWN"
+UNKNOWN_METHOD_CODE = 255
+
+# Статус запроса, который завершился без ответа (ошибка соединения, таймаут)
+NO_RESPONSE = -1
+
+# Как часто фоновый поток сбрасывает очередь в файл, в секундах
+FLUSH_INTERVAL = 0.2
+
+logger = logging.getLogger(__name__)
+
+
+class RecordedRequest(NamedTuple):
+    """
+    Один записанный запрос.
+
+    timestamp — время отправки по `time.time()`; status — HTTP-статус или код gRPC (0 — OK),
+    NO_RESPONSE — ответа не было.
+    """
+    timestamp: float
+    latency_ms: float
+    transport: str
+    method: str
+    target: str
+    route: str
+    payload: bytes
+    status: int
+
+
+def encode_jsonl(record: RecordedRequest) -> bytes:
+    data = record._asdict()
+    if record.transport == "http":
+        try:
+            data["payload"] = record.payload.decode()
+        except UnicodeDecodeError:
+            data["payload"] = base64.b64encode(record.payload).decode()
+            data["payload_base64"] = True
+    else:
+        data["payload"] = base64.b64encode(record.payload).decode()
+
+    return json.dumps(data, separators=(",", ":")).encode() + b"\n"
+
+
+def decode_jsonl(line: bytes) -> RecordedRequest:
+    data = json.loads(line)
+    if data.pop("payload_base64", False) or data["transport"] != "http":
+        payload = base64.b64decode(data["payload"])
+    else:
+        payload = data["payload"].encode()
+
+    return RecordedRequest(**{**data, "payload": payload})
+
+
+def get_method_code(method: str) -> int:
+    try:
+        return METHODS.index(method)
+    except ValueError:
+        return UNKNOWN_METHOD_CODE
+
+
+def get_method(code: int) -> str:
+    return METHODS[code] if code < len(METHODS) else UNKNOWN_METHOD
+
+
+def encode_binary(record: RecordedRequest) -> bytes:
+    target, route = record.target.encode(), record.route.encode()
+    header = RECORD_HEADER.pack(
+        record.timestamp,
+        record.latency_ms,
+        TRANSPORTS.index(record.transport),
+        get_method_code(record.method),
+        record.status,
+        len(target),
+        len(route),
+        len(record.payload)
+    )
+    return b"".join((header, target, route, record.payload))
+
+
+def read_binary(data: bytes) -> Iterator[RecordedRequest]:
+    offset = len(MAGIC)
+    while offset < len(data):
+        timestamp, latency_ms, transport, method, status, target_length, route_length, payload_length = (
+            RECORD_HEADER.unpack_from(data, offset)
+        )
+        offset += RECORD_HEADER.size
+        target = data[offset:offset + target_length].decode()
+        offset += target_length
+        route = data[offset:offset + route_length].decode()
+        offset += route_length
+        payload = data[offset:offset + payload_length]
+        offset += payload_length
+        yield RecordedRequest(timestamp, latency_ms, TRANSPORTS[transport], get_method(method), target, route, payload, status)
+
+
+def read_capture(path: Path | str) -> Iterator[RecordedRequest]:
+    """
+    Читает файл записи любого формата (формат определяется по первым байтам).
+    """
+    data = Path(path).read_bytes()
+    if data.startswith(MAGIC):
+        yield from read_binary(data)
+        return
+
+    for line in data.splitlines():
+        if line:
+            yield decode_jsonl(line)
+
+
+def read_captures(paths: Iterable[Path | str]) -> Iterator[RecordedRequest]:
+    """
+    Сливает несколько файлов записи (например, от разных воркеров) в один поток по времени отправки.
+    """
+    return heapq.merge(*(read_capture(path) for path in paths), key=lambda record: record.timestamp)
+
+
+class HTTPExchange:
+    """
+    Контекст одного http-запроса для записи: засекает время и по выходу отдаёт запрос в RequestRecorder.
+
+    Используется в HTTPClient: `with recorder.http_exchange(extensions) as exchange: exchange.response = ...`.
+    """
+
+    __slots__ = ("recorder", "route", "timestamp", "start", "response")
+
+    def __init__(self, recorder: "RequestRecorder", route: str | None):
+        self.recorder = recorder
+        self.route = route
+        self.timestamp = time.time()
+        self.start = time.perf_counter()
+        self.response: Response | None = None
+
+    def __enter__(self) -> "HTTPExchange":
+        return self
+
+    def __exit__(self, exc_type, error, traceback) -> bool:
+        latency_ms = (time.perf_counter() - self.start) * 1000
+        if self.response is not None:
+            request, status = self.response.request, self.response.status_code
+        else:
+            request, status = get_error_request(error), NO_RESPONSE
+
+        if request is not None:
+            target = request.url.raw_path.decode("ascii")
+            self.recorder.put(RecordedRequest(
+                self.timestamp, latency_ms, "http", request.method, target, self.route or target, request.content, status
+            ))
+
+        return False
+
+
+def get_error_request(error: BaseException | None) -> Request | None:
+    # У httpx.RequestError свойство request бросает RuntimeError, если запрос не привязан
+    try:
+        return getattr(error, "request", None)
+    except RuntimeError:
+        return None
+
+
+class RequestRecorder:
+    """
+    Очередь записанных запросов и фоновый поток, который пишет её в файл.
+
+    В процессе Locust (gevent) поток становится greenlet: он просыпается раз в FLUSH_INTERVAL
+    и пишет всё накопленное одной операцией.
+
+    Запрос, который не удалось закодировать, пропускается и учитывается в `skipped`. Если поток
+    упал (например, закончилось место на диске), новые запросы больше не копятся в памяти,
+    а `close()` бросает RuntimeError с исходной ошибкой.
+    """
+
+    def __init__(self, path: Path | str, format: str | None = None):
+        """
+        :param path: Файл записи.
+        :param format: "jsonl" или "binary"; None — по расширению файла.
+        """
+        self.path = Path(path)
+        self.format = format or ("jsonl" if self.path.suffix == ".jsonl" else "binary")
+        self.encode = encode_jsonl if self.format == "jsonl" else encode_binary
+        self.records: deque[RecordedRequest] = deque()
+        self.written = 0
+        self.skipped = 0
+        self.closed = False
+        self.error: BaseException | None = None
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.thread = threading.Thread(target=self.write_loop, name="request-recorder", daemon=True)
+        self.thread.start()
+
+    def put(self, record: RecordedRequest) -> None:
+        # deque.append потокобезопасен: блокировка в пути запроса не нужна
+        if self.error is None:
+            self.records.append(record)
+
+    def http_exchange(self, route: str | None) -> HTTPExchange:
+        return HTTPExchange(self, route)
+
+    def drain(self) -> bytes:
+        chunks = []
+        while self.records:
+            record = self.records.popleft()
+            try:
+                chunks.append(self.encode(record))
+            except (ValueError, struct.error) as error:
+                # Например, target длиннее 65535 байт
+                self.skipped += 1
+                logger.warning("Skipped recording %s %s: %r", record.method, record.target[:100], error)
+
+        self.written += len(chunks)
+        return b"".join(chunks)
+
+    def write_loop(self) -> None:
+        try:
+            with self.path.open("wb") as file:
+                if self.format == "binary":
+                    file.write(MAGIC)
+
+                while not self.closed:
+                    time.sleep(FLUSH_INTERVAL)
+                    file.write(self.drain())
+                    file.flush()
+
+                file.write(self.drain())
+        except BaseException as error:
+            self.error = error
+            self.records.clear()
+            logger.error("Request recording to %s stopped: %r", self.path, error)
+
+    def close(self) -> None:
+        """
+        Дописывает оставшиеся запросы и закрывает файл.
+
+        :raises RuntimeError: Фоновый поток упал, запись неполная.
+        """
+        self.closed = True
+        self.thread.join()
+        if self.error is not None:
+            raise RuntimeError(f"Request recording to {self.path} failed, the capture is incomplete") from self.error
+
+
+_active_recorder: RequestRecorder | None = None
+
+
+def get_active_recorder() -> RequestRecorder | None:
+    """
+    :return: Recorder процесса или None, если запись выключена (проверка в пути запроса — одно чтение глобала).
+    """
+    return _active_recorder
+
+
+def set_active_recorder(recorder: RequestRecorder | None) -> None:
+    global _active_recorder
+    _active_recorder = recorder
+
+
+def add_recorder_arguments(parser) -> None:
+    """
+    Обработчик `events.init_command_line_parser`: добавляет параметры --record и --record-format.
+    """
+    parser.add_argument("--record", default="", help="Записать запросы к gateway в файл для tools/replay.py")
+    parser.add_argument(
+        "--record-format",
+        choices=("jsonl", "binary"),
+        default=None,
+        help="Формат записи (по умолчанию — по расширению: .jsonl или binary)"
+    )
+
+
+def register_recorder(environment: Environment, path: Path | str | None = None) -> RequestRecorder | None:
+    """
+    Включает запись запросов в процессе. Вызывается из обработчика `events.init`,
+    до того как пользователи создадут клиентов: gRPC-каналы получают RecordingInterceptor при создании.
+
+    :param environment: Окружение Locust.
+    :param path: Файл записи; None — взять из --record.
+    :return: Включённый RequestRecorder или None, если запись не запрошена (или это мастер: он запросов не шлёт).
+    """
+    options = environment.parsed_options
+    path = Path(path or getattr(options, "record", "") or "")
+    if not path.name or isinstance(environment.runner, MasterRunner):
+        return None
+
+    if isinstance(environment.runner, WorkerRunner):
+        path = path.with_name(f"{path.stem}.{os.getpid()}{path.suffix}")
+
+    recorder = RequestRecorder(path, getattr(options, "record_format", None))
+    set_active_recorder(recorder)
+
+    def on_quitting(**kwargs) -> None:
+        set_active_recorder(None)
+        recorder.close()
+        skipped = f", skipped {recorder.skipped}" if recorder.skipped else ""
+        print(f"Recorded {recorder.written} requests to {recorder.path}{skipped}")
+
+    environment.events.quitting.add_listener(on_quitting)
+    return recorder
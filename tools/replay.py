@@ -0,0 +1,175 @@
+"""
+Воспроизведение записанного трафика (tools/recorder.py) против gateway.
+
+Реплеер отправляет запросы из записи с исходными интервалами между ними: запрос с отметкой t
+уходит через (t - t0) / speed секунд после старта, не дожидаясь ответов на предыдущие.
+--speed 1 — реальный темп, --speed 5 — в пять раз быстрее, --max — без пауз, насколько позволяет
+--concurrency. Http-запросы отправляются по записанному пути с тем же телом, gRPC — теми же байтами
+сообщения, поэтому классы protobuf реплееру не нужны.
+
+В конце печатается сводка по маршрутам: число запросов, ошибки, перцентили времени ответа при
+воспроизведении рядом с записанными, а также отставание от расписания — если оно растёт,
+реплеер (или gateway) не успевает за заданным темпом.
+
+    python -m tools.replay reports/capture.bin
+    python -m tools.replay reports/capture.*.bin --speed 3
+    python -m tools.replay reports/capture.jsonl --max --concurrency 500
+"""
+import os
+
+# Реплеер работает на asyncio: gevent monkey patching (его делает импорт locust в клиентах) здесь не нужен,
+# а grpc.aio с ним несовместим. Переменная должна быть задана до импорта клиентов.
+os.environ.setdefault("LOCUST_SKIP_MONKEY_PATCH", "1")
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from grpc import RpcError
+from httpx import HTTPError
+
+from clients.grpc.gateway.client import build_gateway_async_grpc_client
+from clients.http.encoding import JSON_HEADERS
+from clients.http.gateway.client import build_gateway_async_http_client
+from tools.recorder import RecordedRequest, read_captures
+
+PERCENTILES = (50, 90, 99)
+
+
+class ReplayStats:
+    """
+    Результаты воспроизведения по маршрутам.
+    """
+
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.recorded: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+        self.lags: list[float] = []
+
+    def add(self, record: RecordedRequest, latency_ms: float, failed: bool) -> None:
+        name = f"{record.method} {record.route}"
+        self.latencies[name].append(latency_ms)
+        self.recorded[name].append(record.latency_ms)
+        if failed:
+            self.errors[name] += 1
+
+    def format(self, elapsed: float) -> str:
+        def percentiles(values: list[float]) -> str:
+            if len(values) < 2:
+                return " ".join(f"{values[0] if values else 0:8.1f}" for _ in PERCENTILES)
+            quantiles = statistics.quantiles(values, n=100, method="inclusive")
+            return " ".join(f"{quantiles[percentile - 1]:8.1f}" for percentile in PERCENTILES)
+
+        header = " ".join(f"{'p' + str(percentile):>8}" for percentile in PERCENTILES)
+        lines = [f"{'Request':<60} {'count':>8} {'errors':>7}   replay ms: {header}   recorded ms: {header}"]
+        total = 0
+        for name in sorted(self.latencies):
+            latencies = self.latencies[name]
+            total += len(latencies)
+            lines.append(
+                f"{name:<60} {len(latencies):>8} {self.errors[name]:>7}              "
+                f"{percentiles(latencies)}                {percentiles(self.recorded[name])}"
+            )
+
+        lines.append(f"{total} requests in {elapsed:.1f}s ({total / elapsed:.0f}/s)")
+        if self.lags:
+            lines.append(f"Schedule lag ms: {percentiles(self.lags)} (p50 p90 p99), max {max(self.lags):.1f}")
+
+        return "\n".join(lines)
+
+
+class Replayer:
+    """
+    Отправляет записанные запросы через асинхронные http- и gRPC-каналы gateway.
+    """
+
+    def __init__(self, concurrency: int):
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.http_client = build_gateway_async_http_client()
+        self.grpc_channel = build_gateway_async_grpc_client()
+        self.stats = ReplayStats()
+
+    async def send(self, record: RecordedRequest) -> None:
+        start = time.perf_counter()
+        failed = False
+        try:
+            if record.transport == "grpc":
+                # Без сериализаторов grpc.aio отправляет и возвращает сырые байты
+                await self.grpc_channel.unary_unary(record.target)(record.payload)
+            else:
+                response = await self.http_client.request(
+                    record.method,
+                    record.target,
+                    content=record.payload or None,
+                    headers=JSON_HEADERS if record.payload else None
+                )
+                failed = response.is_error
+        except (RpcError, HTTPError):
+            failed = True
+        finally:
+            self.stats.add(record, (time.perf_counter() - start) * 1000, failed)
+            self.semaphore.release()
+
+    async def replay(self, records, speed: float | None) -> None:
+        """
+        :param speed: Во сколько раз ускорить исходный темп; None — без пауз.
+        """
+        tasks = set()
+        started = time.perf_counter()
+        first_timestamp = None
+
+        for record in records:
+            if speed is not None:
+                if first_timestamp is None:
+                    first_timestamp = record.timestamp
+
+                due = started + (record.timestamp - first_timestamp) / speed
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                self.stats.lags.append(max(time.perf_counter() - due, 0) * 1000)
+
+            await self.semaphore.acquire()
+            task = asyncio.create_task(self.send(record))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+        if tasks:
+            await asyncio.wait(tasks)
+
+    async def close(self) -> None:
+        await self.http_client.aclose()
+        await self.grpc_channel.close()
+
+
+async def run(paths: list[Path], speed: float | None, concurrency: int) -> None:
+    replayer = Replayer(concurrency)
+    started = time.perf_counter()
+    try:
+        await replayer.replay(read_captures(paths), speed)
+    finally:
+        await replayer.close()
+
+    print(replayer.stats.format(time.perf_counter() - started))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Воспроизведение записанного трафика против gateway")
+    parser.add_argument("captures", type=Path, nargs="+", help="Файлы записи (tools/recorder.py)")
+    parser.add_argument("--speed", type=float, default=1.0, help="Ускорение относительно исходного темпа")
+    parser.add_argument("--max", action="store_true", help="Без пауз: отправлять так быстро, как позволяет --concurrency")
+    parser.add_argument("--concurrency", type=int, default=1000, help="Максимум запросов в полёте")
+    args = parser.parse_args()
+
+    if args.speed <= 0:
+        parser.error("--speed must be positive")
+
+    asyncio.run(run(args.captures, None if args.max else args.speed, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
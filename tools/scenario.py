@@ -0,0 +1,69 @@
+"""
+Общие параметры командной строки и обработчики для сценариев Locust.
+
+Каждый locustfile вызывает `register_scenario_options()` один раз на уровне модуля:
+
+    from tools.scenario import register_scenario_options
+
+    register_scenario_options()                # обычный сценарий
+    register_scenario_options(fixtures=True)   # сценарий на заранее созданных данных
+
+Регистрируются:
+- --arrival-rate N, --max-in-flight — открытая модель нагрузки: N запусков задач в секунду на пользователя
+  (tools/open_loop.py, пользователь должен наследоваться от OpenLoopUser);
+- --target-rps N, --target-route — N запросов в секунду на весь сценарий вместо wait_time по умолчанию
+  (tools/pacing.py, wait_time = pacing(...));
+- --record PATH, --record-format — запись запросов для воспроизведения через python -m tools.replay
+  (tools/recorder.py);
+- --hdr-log PATH, --hdr-window — HDR-гистограммы задержек в лог .hlog (tools/latency.py);
+  в распределённом режиме параметр передаётся и мастеру, и воркерам;
+- с fixtures=True — --fixtures-redis-url, --fixtures-file, --fixtures-wrap (tools/fixtures.py).
+"""
+from locust import events
+from locust.env import Environment
+
+from tools.fixtures import add_fixtures_arguments
+from tools.latency import add_latency_recorder_arguments, register_latency_recorder
+from tools.open_loop import add_open_loop_arguments
+from tools.pacing import add_pacing_arguments, register_pacing
+from tools.recorder import add_recorder_arguments, register_recorder
+
+# Повторная регистрация добавила бы одни и те же аргументы в парсер дважды
+_registered: set[str] = set()
+
+
+def add_scenario_arguments(parser) -> None:
+    """
+    Обработчик `events.init_command_line_parser`: добавляет параметры open loop, pacing, записи запросов
+    и HDR-гистограмм.
+    """
+    add_open_loop_arguments(parser)
+    add_pacing_arguments(parser)
+    add_recorder_arguments(parser)
+    add_latency_recorder_arguments(parser)
+
+
+def on_scenario_init(environment: Environment, **kwargs) -> None:
+    """
+    Обработчик `events.init`: подключает pacing, запись запросов и, если задан --hdr-log, HDR-гистограммы.
+    """
+    register_pacing(environment)
+    register_recorder(environment)
+    if getattr(environment.parsed_options, "hdr_log", ""):
+        register_latency_recorder(environment)
+
+
+def register_scenario_options(fixtures: bool = False) -> None:
+    """
+    Регистрирует общие параметры и обработчики сценария в событиях Locust.
+
+    :param fixtures: Добавить параметры источника заранее созданных данных (tools/fixtures.py).
+    """
+    if "scenario" not in _registered:
+        _registered.add("scenario")
+        events.init_command_line_parser.add_listener(add_scenario_arguments)
+        events.init.add_listener(on_scenario_init)
+
+    if fixtures and "fixtures" not in _registered:
+        _registered.add("fixtures")
+        events.init_command_line_parser.add_listener(add_fixtures_arguments)
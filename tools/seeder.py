@@ -0,0 +1,432 @@
+"""
+Массовое создание тестовых данных через gateway: пользователи, дебетовые счета, карты и операции.
+
+Скрипты `api_client_*.py` создают сущности по одной, последовательно. Сидер делит работу на чанки
+и раздаёт их пулу процессов; каждый процесс держит свой event loop с асинхронными клиентами gateway
+(http или grpc) и выполняет до --concurrency цепочек создания одновременно. Общий лимит
+--rate (запросов в секунду) делится поровну между процессами.
+
+Результат — компактный бинарный файл: на каждый созданный счёт одна запись из 48 байт —
+`uuid.bytes` пользователя, счёта и карты. Рядом лежит `<output>.checkpoint` со списком готовых
+чанков, числом уже записанных записей недоделанных чанков и длиной файла: после остановки
+(Ctrl+C, падение, перезапуск машины) или ошибок gateway та же команда досоздаст недостающие записи,
+а недописанный хвост файла будет отброшен. Повтор после ошибки продолжает цепочку с упавшего шага,
+не создавая пользователя заново.
+
+    python -m tools.seeder seed --count 1000000 --output reports/seed.bin --processes 8 --concurrency 64
+    python -m tools.seeder seed --count 1000000 --output reports/seed.bin --transport grpc --rate 20000
+    python -m tools.seeder dump reports/seed.bin | head
+    python -m tools.seeder fixtures reports/seed.bin    # загрузить в Redis для tools/fixtures.py
+    python -m tools.seeder fixtures reports/seed.bin --kind users
+"""
+import os
+
+# Сидер работает на asyncio: gevent monkey patching (его делает импорт locust в клиентах) здесь не нужен,
+# а grpc.aio с ним несовместим. Переменная должна быть задана до импорта клиентов.
+os.environ.setdefault("LOCUST_SKIP_MONKEY_PATCH", "1")
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import signal
+import struct
+import sys
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Iterator
+
+from clients.grpc.gateway.accounts.client import build_accounts_gateway_async_grpc_client
+from clients.grpc.gateway.cards.client import build_cards_gateway_async_grpc_client
+from clients.grpc.gateway.operations.client import build_operations_gateway_async_grpc_client
+from clients.grpc.gateway.users.client import build_users_gateway_async_grpc_client
+from clients.http.gateway.account.client import build_accounts_gateway_async_http_client
+from clients.http.gateway.cards.client import build_cards_gateway_async_http_client
+from clients.http.gateway.operations.client import build_operations_gateway_async_http_client
+from clients.http.gateway.users.client import build_users_gateway_async_http_client
+
+# Запись выходного файла: uuid пользователя, счёта и карты
+RECORD = struct.Struct("16s16s16s")
+
+
+class RateLimiter:
+    """
+    Равномерный лимит запросов в секунду для одного event loop (0 — без лимита).
+    """
+
+    def __init__(self, rate: float):
+        self.interval = 1 / rate if rate > 0 else 0
+        self.next_slot = time.monotonic()
+
+    async def acquire(self) -> None:
+        if not self.interval:
+            return
+
+        now = time.monotonic()
+        delay = self.next_slot - now
+        self.next_slot = max(self.next_slot, now) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+@dataclass(frozen=True)
+class SeedOptions:
+    """
+    Параметры процесса-исполнителя.
+    """
+    transport: str = "http"
+    concurrency: int = 64
+    rate: float = 0  # Запросов в секунду на процесс
+    cards: int = 0  # Дополнительных виртуальных карт на счёт
+    operations: int = 0  # Операций пополнения на счёт
+    retries: int = 2
+
+
+@dataclass
+class RecordProgress:
+    """
+    Уже выполненные шаги цепочки создания одной записи: повтор после ошибки начинается с упавшего шага.
+    """
+    user_id: str | None = None
+    account_id: str | None = None
+    card_id: str | None = None
+    cards: int = 0
+    operations: int = 0
+
+
+class ChunkSeeder:
+    """
+    Создаёт записи одного чанка в процессе пула. Экземпляр живёт весь срок жизни процесса,
+    поэтому соединения с gateway переиспользуются между чанками.
+    """
+
+    def __init__(self, options: SeedOptions):
+        self.options = options
+        self.loop = asyncio.new_event_loop()
+        self.limiter = RateLimiter(options.rate)
+        self.errors: list[str] = []
+        # grpc.aio-каналы привязываются к event loop, в котором созданы
+        self.loop.run_until_complete(self.build_clients())
+
+    async def build_clients(self) -> None:
+        if self.options.transport == "grpc":
+            self.users_client = build_users_gateway_async_grpc_client()
+            self.accounts_client = build_accounts_gateway_async_grpc_client()
+            self.cards_client = build_cards_gateway_async_grpc_client()
+            self.operations_client = build_operations_gateway_async_grpc_client()
+        else:
+            self.users_client = build_users_gateway_async_http_client()
+            self.accounts_client = build_accounts_gateway_async_http_client()
+            self.cards_client = build_cards_gateway_async_http_client()
+            self.operations_client = build_operations_gateway_async_http_client()
+
+    async def call(self, method, *args):
+        await self.limiter.acquire()
+        return await method(*args)
+
+    async def create_record(self, progress: RecordProgress) -> bytes:
+        """
+        Создаёт пользователя, дебетовый счёт (gateway выпускает к нему карту), дополнительные карты и операции.
+
+        :param progress: Выполненные шаги; обновляется после каждого шага, чтобы повтор не создавал дубликатов.
+        :return: Запись RECORD.
+        """
+        if progress.user_id is None:
+            create_user_response = await self.call(self.users_client.create_user)
+            progress.user_id = create_user_response.user.id
+
+        if progress.account_id is None:
+            open_account_response = await self.call(self.accounts_client.open_debit_card_account, progress.user_id)
+            progress.card_id = open_account_response.account.cards[0].id
+            progress.account_id = open_account_response.account.id
+
+        while progress.cards < self.options.cards:
+            await self.call(self.cards_client.issue_virtual_card, progress.user_id, progress.account_id)
+            progress.cards += 1
+        while progress.operations < self.options.operations:
+            await self.call(self.operations_client.make_top_up_operation, progress.card_id, progress.account_id)
+            progress.operations += 1
+
+        return RECORD.pack(
+            uuid.UUID(progress.user_id).bytes, uuid.UUID(progress.account_id).bytes, uuid.UUID(progress.card_id).bytes
+        )
+
+    async def create_record_with_retries(self, semaphore: asyncio.Semaphore) -> bytes | None:
+        async with semaphore:
+            progress = RecordProgress()
+            for attempt in range(self.options.retries + 1):
+                try:
+                    return await self.create_record(progress)
+                except Exception as error:
+                    if attempt == self.options.retries:
+                        self.errors.append(repr(error))
+
+        return None
+
+    async def seed(self, size: int) -> list[bytes | None]:
+        semaphore = asyncio.Semaphore(self.options.concurrency)
+        return await asyncio.gather(*(self.create_record_with_retries(semaphore) for _ in range(size)))
+
+    def run(self, chunk: int, size: int) -> tuple[int, bytes, int, list[str]]:
+        """
+        :return: Номер чанка, записи, число неудачных записей и первые ошибки.
+        """
+        self.errors.clear()
+        records = self.loop.run_until_complete(self.seed(size))
+        created = [record for record in records if record is not None]
+        return chunk, b"".join(created), size - len(created), self.errors[:3]
+
+
+# Исполнитель текущего процесса пула (создаётся в init_worker)
+_seeder: ChunkSeeder | None = None
+
+
+def init_worker(options: SeedOptions) -> None:
+    global _seeder
+    # Ctrl+C получает вся группа процессов: остановкой управляет родитель, процессы пула дописывают свои чанки
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _seeder = ChunkSeeder(options)
+
+
+def seed_chunk(chunk: int, size: int) -> tuple[int, bytes, int, list[str]]:
+    return _seeder.run(chunk, size)
+
+
+@dataclass
+class Checkpoint:
+    """
+    Прогресс сидирования: какие чанки готовы и сколько байт выходного файла им соответствует.
+
+    Чанк готов, только когда созданы все его записи. Записи чанка, созданные до ошибки,
+    учитываются в `partial`, и при продолжении досоздаются только недостающие.
+    """
+    count: int
+    chunk_size: int
+    done: set[int] = field(default_factory=set)
+    partial: dict[int, int] = field(default_factory=dict)  # Чанк -> сколько его записей уже в файле
+    size: int = 0
+    failed: int = 0
+
+    @classmethod
+    def load(cls, path: Path) -> "Checkpoint | None":
+        if not path.exists():
+            return None
+
+        data = json.loads(path.read_text())
+        partial = {int(chunk): created for chunk, created in data.get("partial", {}).items()}
+        return cls(**{**data, "done": set(data["done"]), "partial": partial})
+
+    def save(self, path: Path) -> None:
+        # Запись через временный файл: чекпоинт никогда не остаётся недописанным
+        temp_path = path.with_name(path.name + ".tmp")
+        temp_path.write_text(json.dumps({**asdict(self), "done": sorted(self.done)}))
+        os.replace(temp_path, path)
+
+    def get_chunk_size(self, chunk: int) -> int:
+        return min(self.chunk_size, self.count - chunk * self.chunk_size)
+
+    def pending(self) -> Iterator[tuple[int, int]]:
+        """
+        :return: Номер каждого ещё не готового чанка и сколько записей в нём осталось создать.
+        """
+        for chunk in range(-(-self.count // self.chunk_size)):
+            if chunk not in self.done:
+                yield chunk, self.get_chunk_size(chunk) - self.partial.get(chunk, 0)
+
+    def add(self, chunk: int, records: int, failed: int) -> None:
+        """
+        Учитывает результат чанка: records записей дописаны в файл, failed не удалось создать.
+        """
+        created = self.partial.pop(chunk, 0) + records
+        if created >= self.get_chunk_size(chunk):
+            self.done.add(chunk)
+        else:
+            self.partial[chunk] = created
+
+        self.size += records * RECORD.size
+        self.failed += failed
+
+    @property
+    def records(self) -> int:
+        return self.size // RECORD.size
+
+
+def seed(
+        output: Path,
+        count: int,
+        processes: int,
+        chunk_size: int,
+        rate: float,
+        options: SeedOptions
+) -> None:
+    """
+    Создаёт count записей пулом из processes процессов, продолжая с чекпоинта, если он есть.
+    """
+    checkpoint_path = output.with_name(output.name + ".checkpoint")
+    checkpoint = Checkpoint.load(checkpoint_path)
+    if checkpoint is None:
+        checkpoint = Checkpoint(count=count, chunk_size=chunk_size)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_bytes(b"")
+    elif (checkpoint.count, checkpoint.chunk_size) != (count, chunk_size):
+        sys.exit(
+            f"{checkpoint_path} was created with --count {checkpoint.count} --chunk-size {checkpoint.chunk_size}; "
+            "pass the same values to resume or delete the checkpoint to start over"
+        )
+    else:
+        print(f"Resuming: {len(checkpoint.done)} chunks done, {checkpoint.records} records")
+
+    options = SeedOptions(**{**asdict(options), "rate": rate / processes})
+    pending = checkpoint.pending()
+    started = time.perf_counter()
+    created = 0
+
+    # spawn: grpc и открытые сокеты родителя не переживают fork
+    executor = ProcessPoolExecutor(
+        max_workers=processes,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=init_worker,
+        initargs=(options,)
+    )
+    with executor, output.open("r+b") as file:
+        # Недописанный хвост от прошлого запуска отбрасывается: его чанк не отмечен готовым
+        file.truncate(checkpoint.size)
+        file.seek(checkpoint.size)
+
+        # В полёте не больше двух чанков на процесс, чтобы не держать в памяти результаты всех чанков
+        in_flight: set[Future] = set()
+        stopping = False
+        while True:
+            for chunk, size in () if stopping else pending:
+                in_flight.add(executor.submit(seed_chunk, chunk, size))
+                if len(in_flight) >= processes * 2:
+                    break
+
+            if not in_flight:
+                break
+
+            try:
+                finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            except KeyboardInterrupt:
+                if stopping:
+                    raise
+                # Первый Ctrl+C: новые чанки не запускаются, начатые дописываются в файл и чекпоинт
+                stopping = True
+                in_flight = {future for future in in_flight if not future.cancel()}
+                print("Stopping after running chunks finish (Ctrl+C again to abort); rerun to resume", flush=True)
+                continue
+
+            for future in finished:
+                chunk, records, failed, errors = future.result()
+                file.write(records)
+                file.flush()
+                os.fsync(file.fileno())
+
+                checkpoint.add(chunk, len(records) // RECORD.size, failed)
+                checkpoint.save(checkpoint_path)
+
+                created += len(records) // RECORD.size
+                elapsed = time.perf_counter() - started
+                print(
+                    f"chunk {chunk}: {checkpoint.records}/{count} records, "
+                    f"{created / elapsed:.0f} records/s, failed: {checkpoint.failed}",
+                    flush=True
+                )
+                for error in errors:
+                    print(f"  {error}", flush=True)
+
+    if stopping:
+        sys.exit(f"Stopped at {checkpoint.records}/{count} records; rerun the same command to resume")
+
+    if checkpoint.partial:
+        sys.exit(
+            f"Seeded {checkpoint.records}/{count} records, {len(checkpoint.partial)} chunks have failed records; "
+            "rerun the same command to create the missing ones"
+        )
+
+    print(f"Seeded {checkpoint.records} records in {time.perf_counter() - started:.1f}s into {output}")
+
+
+def read_records(path: Path) -> Iterator[tuple[str, str, str]]:
+    """
+    Читает выходной файл сидера.
+
+    :return: user_id, account_id и card_id каждой записи.
+    """
+    with path.open("rb") as file:
+        while chunk := file.read(RECORD.size * 4096):
+            for user_id, account_id, card_id in RECORD.iter_unpack(chunk):
+                yield str(uuid.UUID(bytes=user_id)), str(uuid.UUID(bytes=account_id)), str(uuid.UUID(bytes=card_id))
+
+
+def load_fixtures(path: Path, redis_url: str, kind: str = "debit_card_accounts") -> None:
+    """
+    Загружает записи в Redis для tools/fixtures.py.
+
+    :param kind: Вид записей (FixtureKind): для "users" загружается только идентификатор пользователя.
+    """
+    from redis import Redis
+
+    from tools.fixtures import Fixture, FixtureKind, FixtureStore
+
+    kind = FixtureKind(kind)
+    store = FixtureStore(Redis.from_url(redis_url))
+    if kind == FixtureKind.USERS:
+        fixtures = (Fixture(user_id) for user_id, _, _ in read_records(path))
+    else:
+        fixtures = (Fixture(user_id, account_id, (card_id,)) for user_id, account_id, card_id in read_records(path))
+    print(f"Loaded {store.push(kind, fixtures)} {kind} fixtures into {redis_url}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Массовое создание тестовых данных через gateway")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    seed_parser = commands.add_parser("seed", help="Создать данные (продолжает с чекпоинта, если он есть)")
+    seed_parser.add_argument("--count", type=int, required=True, help="Сколько пользователей со счётом создать")
+    seed_parser.add_argument("--output", type=Path, required=True, help="Файл с идентификаторами (48 байт на запись)")
+    seed_parser.add_argument("--transport", choices=("http", "grpc"), default="http")
+    seed_parser.add_argument("--processes", type=int, default=os.cpu_count())
+    seed_parser.add_argument("--concurrency", type=int, default=64, help="Одновременных цепочек на процесс")
+    seed_parser.add_argument("--rate", type=float, default=0, help="Лимит запросов в секунду на все процессы (0 — без лимита)")
+    seed_parser.add_argument("--chunk-size", type=int, default=1000, help="Записей в чанке (единица чекпоинта)")
+    seed_parser.add_argument("--cards", type=int, default=0, help="Дополнительных виртуальных карт на счёт")
+    seed_parser.add_argument("--operations", type=int, default=0, help="Операций пополнения на счёт")
+    seed_parser.add_argument("--retries", type=int, default=2, help="Повторов цепочки после ошибки")
+
+    dump_parser = commands.add_parser("dump", help="Напечатать записи файла")
+    dump_parser.add_argument("path", type=Path)
+
+    fixtures_parser = commands.add_parser("fixtures", help="Загрузить записи в Redis для tools/fixtures.py")
+    fixtures_parser.add_argument("path", type=Path)
+    fixtures_parser.add_argument("--redis-url", default="redis://localhost:6379/0")
+    fixtures_parser.add_argument(
+        "--kind",
+        choices=("debit_card_accounts", "users"),
+        default="debit_card_accounts",
+        help="Вид записей в Redis (FixtureKind)"
+    )
+
+    args = parser.parse_args()
+
+    if args.command == "seed":
+        options = SeedOptions(
+            transport=args.transport,
+            concurrency=args.concurrency,
+            cards=args.cards,
+            operations=args.operations,
+            retries=args.retries
+        )
+        seed(args.output, args.count, args.processes, args.chunk_size, args.rate, options)
+    elif args.command == "dump":
+        for record in read_records(args.path):
+            print(*record)
+    elif args.command == "fixtures":
+        load_fixtures(args.path, args.redis_url, args.kind)
+
+
+if __name__ == "__main__":
+    main()